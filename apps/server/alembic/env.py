@@ -3,6 +3,7 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
+from src.db.call_jobs.model import CallJob  # noqa: F401
 from src.db.call_list.model import CallListItem  # noqa: F401
 
 # Import all models to ensure they're registered with Base.metadata
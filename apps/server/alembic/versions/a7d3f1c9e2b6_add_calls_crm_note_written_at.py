@@ -0,0 +1,38 @@
+"""add calls crm note written at
+
+Revision ID: a7d3f1c9e2b6
+Revises: e5c8a2f7d9b4
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3f1c9e2b6"
+down_revision: Union[str, Sequence[str], None] = "e5c8a2f7d9b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable without a default: a metadata-only change, no table rewrite
+    op.add_column(
+        "calls",
+        sa.Column(
+            "crm_note_written_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the call's results note was claimed for the CRM",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("calls", "crm_note_written_at")
@@ -0,0 +1,75 @@
+"""add scheduled group run progress
+
+Revision ID: b2e6f8a4c1d9
+Revises: a7d3f1c9e2b6
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2e6f8a4c1d9"
+down_revision: Union[str, Sequence[str], None] = "a7d3f1c9e2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "run_started_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the in-progress run started (null between runs)",
+        ),
+    )
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "run_locked_by",
+            sa.String(length=255),
+            nullable=True,
+            comment="Scheduler currently running the group",
+        ),
+    )
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "run_lease_expires_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the run's lease lapses and another scheduler may resume it",
+        ),
+    )
+    op.create_index(
+        "idx_scheduled_groups_run_lease",
+        "scheduled_groups",
+        ["run_lease_expires_at"],
+        unique=False,
+        postgresql_where=sa.text("run_locked_by IS NOT NULL"),
+    )
+    op.add_column(
+        "scheduled_group_members",
+        sa.Column(
+            "last_dialed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When a scheduled run last dialed the project",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("scheduled_group_members", "last_dialed_at")
+    op.drop_index("idx_scheduled_groups_run_lease", table_name="scheduled_groups")
+    op.drop_column("scheduled_groups", "run_lease_expires_at")
+    op.drop_column("scheduled_groups", "run_locked_by")
+    op.drop_column("scheduled_groups", "run_started_at")
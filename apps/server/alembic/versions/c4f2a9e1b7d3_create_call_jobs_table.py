@@ -0,0 +1,127 @@
+"""create call jobs table
+
+Revision ID: c4f2a9e1b7d3
+Revises: rename_to_phone_numbers
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f2a9e1b7d3"
+down_revision: Union[str, Sequence[str], None] = "rename_to_phone_numbers"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "call_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "idempotency_key",
+            sa.String(length=255),
+            nullable=False,
+            comment="Deduplication key, one job per call and stage",
+        ),
+        sa.Column(
+            "call_id",
+            sa.String(length=255),
+            nullable=False,
+            comment="Provider call ID",
+        ),
+        sa.Column(
+            "stage",
+            sa.String(length=50),
+            nullable=False,
+            comment="Pipeline stage to run",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            comment="pending, running, succeeded or failed",
+        ),
+        sa.Column(
+            "payload",
+            sa.JSON(),
+            nullable=False,
+            comment="Stage input (call request, user, organization)",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of failed runs so far",
+        ),
+        sa.Column(
+            "max_attempts",
+            sa.Integer(),
+            nullable=False,
+            comment="Failed runs allowed before giving up",
+        ),
+        sa.Column(
+            "last_error",
+            sa.Text(),
+            nullable=True,
+            comment="Error from the most recent failed run",
+        ),
+        sa.Column(
+            "run_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Earliest time the job may run",
+        ),
+        sa.Column(
+            "locked_by",
+            sa.String(length=255),
+            nullable=True,
+            comment="Worker currently holding the lease",
+        ),
+        sa.Column(
+            "lease_expires_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the lease lapses and another worker may reclaim the job",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Record creation timestamp",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Record last update timestamp",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        op.f("ix_call_jobs_call_id"), "call_jobs", ["call_id"], unique=False
+    )
+    op.create_index(
+        "idx_call_jobs_status_run_at", "call_jobs", ["status", "run_at"], unique=False
+    )
+    op.create_index(
+        "idx_call_jobs_status_lease",
+        "call_jobs",
+        ["status", "lease_expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_call_jobs_status_lease", table_name="call_jobs")
+    op.drop_index("idx_call_jobs_status_run_at", table_name="call_jobs")
+    op.drop_index(op.f("ix_call_jobs_call_id"), table_name="call_jobs")
+    op.drop_table("call_jobs")
@@ -0,0 +1,69 @@
+"""add scheduled group timezone and next run
+
+Revision ID: d1b7e3a9c5f2
+Revises: c4f2a9e1b7d3
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1b7e3a9c5f2"
+down_revision: Union[str, Sequence[str], None] = "c4f2a9e1b7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Not backfilled: time_of_day was entered as browser wall-clock time and
+    # neither users nor organizations store a timezone, so existing groups
+    # stay unscheduled until their owner saves one with a timezone
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "timezone",
+            sa.String(length=64),
+            nullable=True,
+            comment="IANA timezone time_of_day is in (groups without one aren't scheduled)",
+        ),
+    )
+    # Active groups with a timezone are given a next run by the scheduler on startup
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "next_run_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Next scheduled run (null while inactive)",
+        ),
+    )
+    op.add_column(
+        "scheduled_groups",
+        sa.Column(
+            "last_run_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the scheduler last fired the group",
+        ),
+    )
+    op.create_index(
+        "idx_scheduled_groups_next_run",
+        "scheduled_groups",
+        ["next_run_at"],
+        unique=False,
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_scheduled_groups_next_run", table_name="scheduled_groups")
+    op.drop_column("scheduled_groups", "last_run_at")
+    op.drop_column("scheduled_groups", "next_run_at")
+    op.drop_column("scheduled_groups", "timezone")
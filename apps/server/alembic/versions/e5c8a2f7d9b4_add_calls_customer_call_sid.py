@@ -0,0 +1,91 @@
+"""add calls customer call sid
+
+Revision ID: e5c8a2f7d9b4
+Revises: d1b7e3a9c5f2
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c8a2f7d9b4"
+down_revision: Union[str, Sequence[str], None] = "d1b7e3a9c5f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows updated per backfill transaction
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "calls",
+        sa.Column(
+            "customer_call_sid",
+            sa.String(length=255),
+            nullable=True,
+            comment="Twilio customer leg call SID (bridged calls only)",
+        ),
+    )
+    # calls is large and written by webhooks throughout the deploy, so the
+    # backfill commits in small batches and the index is built concurrently;
+    # neither holds a lock that blocks writes for long
+    with op.get_context().autocommit_block():
+        _backfill_customer_call_sid(op.get_bind())
+        op.create_index(
+            op.f("ix_calls_customer_call_sid"),
+            "calls",
+            ["customer_call_sid"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def _backfill_customer_call_sid(connection: sa.Connection) -> None:
+    """Copy provider_data.customer_call_sid into the column, by id range."""
+    last_id = 0
+    while True:
+        # Walk to the end of the table, including rows added meanwhile
+        upper_id = connection.execute(
+            sa.text(
+                """
+                SELECT max(id) FROM (
+                    SELECT id FROM calls WHERE id > :last_id
+                    ORDER BY id LIMIT :batch_size
+                ) AS batch
+                """
+            ),
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+        if upper_id is None:
+            return
+        connection.execute(
+            sa.text(
+                """
+                UPDATE calls
+                SET customer_call_sid = provider_data->>'customer_call_sid'
+                WHERE id > :last_id AND id <= :upper_id
+                  AND customer_call_sid IS NULL
+                  AND provider_data->>'customer_call_sid' IS NOT NULL
+                """
+            ),
+            {"last_id": last_id, "upper_id": upper_id},
+        )
+        last_id = upper_id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_calls_customer_call_sid"),
+            table_name="calls",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("calls", "customer_call_sid")
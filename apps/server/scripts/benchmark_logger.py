@@ -0,0 +1,100 @@
+"""
+Micro-benchmark of per-call logging cost on the calling thread.
+
+Runs every case twice, each in a fresh process: with LOG_ASYNC=false, where
+the calling thread formats and writes each record, and with the default
+queued pipeline, where a listener thread does. Calls are timed in bursts,
+and between bursts the listener is left to drain the queue untimed, as it
+does between requests in the server.
+
+Logs go to /dev/null, so this measures formatting and handler overhead, not
+terminal I/O. Usage: python scripts/benchmark_logger.py [--calls N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BURST = 100
+
+
+def measure(calls: int) -> dict[str, float]:
+    """Time each case in this process's logging mode; µs per call."""
+    # The log handler writes to stderr; point it at /dev/null before import
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    sys.stderr = open(os.devnull, "w")
+    from src.utils import logger as logger_module
+
+    logger = logger_module.logger
+    listener = logger_module.Logger._listener
+    payload = {"items": list(range(50))}
+
+    cases = {
+        "info with fields": lambda: logger.info(
+            "[Bench] Event", call_id="abc", status="ringing", attempt=3
+        ),
+        "info with a dict field": lambda: logger.info(
+            "[Bench] Event", call_id="abc", payload=payload
+        ),
+        "error with fields": lambda: logger.error(
+            "[Bench] Failed", call_id="abc", error="timeout"
+        ),
+        "disabled debug, eager field": lambda: logger.debug(
+            "[Bench] Payload", payload=str(payload)
+        ),
+        "disabled debug, lazy field": lambda: logger.debug(
+            "[Bench] Payload", payload=logger_module.lazy(lambda: str(payload))
+        ),
+    }
+
+    results = {}
+    for name, log in cases.items():
+        elapsed = 0.0
+        for burst in range(calls // BURST + 10):
+            start = time.perf_counter()
+            for _ in range(BURST):
+                log()
+            # The first bursts are warm-up
+            if burst >= 10:
+                elapsed += time.perf_counter() - start
+            while listener is not None and not listener.queue.empty():
+                time.sleep(0.0005)
+        results[name] = elapsed / (calls // BURST * BURST) * 1e6
+
+    logger_module.shutdown()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.calls)))
+        return
+
+    runs = {}
+    for mode in ("false", "true"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--calls", str(args.calls), "--child"],
+            env={**os.environ, "LOG_ASYNC": mode, "LOG_LEVEL": "INFO"},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        runs[mode] = json.loads(output)
+
+    print(f"{'µs/call':<30} {'LOG_ASYNC=false':>15} {'queued':>8}")
+    for name, sync_micros in runs["false"].items():
+        queued_micros = runs["true"][name]
+        print(f"{name:<30} {sync_micros:15.2f} {queued_micros:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Micro-benchmark of TimingMiddleware overhead on the healthcheck.
+
+Builds the healthcheck route on an app with the same CORS middleware as
+src.main, with and without TimingMiddleware, and calls each directly over
+ASGI (no sockets). Rounds alternate between the two apps with the garbage
+collector paused, and the median of the per-round differences is reported,
+so the result is the middleware's own cost per request against a healthcheck
+with no network or server overhead.
+
+The healthcheck is a probe path, which the middleware passes straight
+through. The same handler is also served on a route that is timed, to show
+the cost of the histogram and Server-Timing header every other request pays
+(fast requests aren't logged).
+
+Usage: python scripts/benchmark_timing.py [--requests N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def build_app(with_timing: bool):
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from src.utils.timing import TimingMiddleware
+
+    app = FastAPI()
+
+    @app.get("/healthcheck")
+    @app.get(TIMED_PATH)
+    async def healthcheck():
+        return {"status": "ok", "message": "Maive API is running"}
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["Server-Timing"],
+    )
+    if with_timing:
+        app.add_middleware(TimingMiddleware)
+    return app
+
+
+# Requests per app before switching to the other
+CHUNK = 50
+
+# Not a probe path, so TimingMiddleware times it
+TIMED_PATH = "/status"
+
+# GET /healthcheck as an ASGI server would pass it
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/healthcheck",
+    "raw_path": b"/healthcheck",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"localhost")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("localhost", 8080),
+}
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def scope_for(path: str) -> dict:
+    """GET path as an ASGI server would pass it."""
+    return {**SCOPE, "path": path, "raw_path": path.encode()}
+
+
+async def time_requests(app, requests: int, path: str) -> float:
+    """Average seconds per GET request to path."""
+    scope = scope_for(path)
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def response_headers(app, path: str) -> dict[bytes, bytes]:
+    """Headers of one response to GET path."""
+    headers = {}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            headers.update(message["headers"])
+
+    await app(scope_for(path), receive, send)
+    return headers
+
+
+async def compare(baseline_app, timed_app, path: str, requests: int, rounds: int):
+    """Print the median cost of path with and without timing."""
+    # Warm up both apps (route compilation, middleware stack build)
+    await time_requests(baseline_app, 500, path)
+    await time_requests(timed_app, 500, path)
+
+    baseline, timed, overhead = [], [], []
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            # Alternate in short chunks, in both orders, so drift in machine
+            # speed hits both apps alike; each pair of chunks is one sample
+            for chunk in range(requests // CHUNK):
+                if chunk % 2:
+                    timed_chunk = await time_requests(timed_app, CHUNK, path)
+                    baseline_chunk = await time_requests(baseline_app, CHUNK, path)
+                else:
+                    baseline_chunk = await time_requests(baseline_app, CHUNK, path)
+                    timed_chunk = await time_requests(timed_app, CHUNK, path)
+                baseline.append(baseline_chunk)
+                timed.append(timed_chunk)
+                overhead.append(timed_chunk - baseline_chunk)
+            gc.collect()
+    finally:
+        gc.enable()
+
+    baseline_us = statistics.median(baseline) * 1e6
+    timed_us = statistics.median(timed) * 1e6
+    overhead_us = statistics.median(overhead) * 1e6
+    print(f"{path}")
+    print(f"  {'without timing':<28} {baseline_us:7.2f} µs/request")
+    print(f"  {'with timing':<28} {timed_us:7.2f} µs/request")
+    print(
+        f"  {'overhead':<28} {overhead_us:7.2f} µs/request "
+        f"({overhead_us / baseline_us * 100:.2f}%)"
+    )
+
+
+async def run(requests: int, rounds: int) -> None:
+    baseline_app = build_app(with_timing=False)
+    timed_app = build_app(with_timing=True)
+    # Otherwise the second comparison would only compare two identical apps
+    if b"server-timing" not in await response_headers(timed_app, TIMED_PATH):
+        raise SystemExit(f"{TIMED_PATH} bypasses TimingMiddleware; nothing to measure")
+
+    await compare(baseline_app, timed_app, SCOPE["path"], requests, rounds)
+    await compare(baseline_app, timed_app, TIMED_PATH, requests, rounds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=41)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    asyncio.run(run(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 """Base classes for AI provider abstraction."""
 
+import mimetypes
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, AsyncGenerator, Literal, TypeVar
+from typing import IO, Any, AsyncGenerator, Literal, TypeVar
 
 from pydantic import BaseModel
 
+from src.utils.timing import instrument_methods
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -186,6 +191,11 @@ class AIProvider(ABC):
     to enable easy switching between providers.
     """
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Time every provider call as AI time in the request breakdown
+        instrument_methods(cls, "ai")
+
     @abstractmethod
     async def upload_file(self, file_path: str, **kwargs) -> FileMetadata:
         """Upload a file to the provider's storage.
@@ -199,6 +209,31 @@ class AIProvider(ABC):
         """
         pass
 
+    async def upload_fileobj(
+        self, file: IO[bytes], mime_type: str, display_name: str | None = None
+    ) -> FileMetadata:
+        """Upload an open binary file object to the provider's storage.
+
+        Providers that can upload from a stream should override this. The
+        default spills the content to a temporary file and uses upload_file.
+
+        Args:
+            file: Seekable binary file object, read from its start
+            mime_type: MIME type of the content
+            display_name: Optional display name for the file
+
+        Returns:
+            FileMetadata: Metadata of the uploaded file
+        """
+        suffix = mimetypes.guess_extension(mime_type) or ""
+        with tempfile.NamedTemporaryFile(suffix=suffix) as temp_file:
+            file.seek(0)
+            shutil.copyfileobj(file, temp_file)
+            temp_file.flush()
+            return await self.upload_file(
+                temp_file.name, mime_type=mime_type, display_name=display_name
+            )
+
     @abstractmethod
     async def delete_file(self, file_id: str) -> bool:
         """Delete a file from the provider's storage.
@@ -1,16 +1,19 @@
 """Google Gemini API client implementation."""
 
+import asyncio
 import mimetypes
 from pathlib import Path
-from typing import TypeVar
+from typing import IO, TypeVar
 
 from braintrust.wrappers.google_genai import setup_genai
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
 
+from src.ai.gemini.concurrency import get_request_semaphore
 from src.ai.gemini.config import GeminiSettings
 from src.ai.gemini.exceptions import GeminiError
+from src.ai.gemini.files import get_gemini_file_cache
 from src.ai.gemini.schemas import (
     DeleteFileResponse,
     FileMetadata,
@@ -29,6 +32,10 @@ class GeminiClient:
 
     Provides methods to upload files, generate content with optional file inputs,
     and generate structured output. Handles authentication and error handling.
+
+    All API calls go through the SDK's async surface (``client.aio``) so slow
+    generations never block the event loop, and are bounded by
+    ``GeminiSettings.max_concurrent_requests``.
     """
 
     def __init__(
@@ -70,6 +77,10 @@ class GeminiClient:
                 raise GeminiError(f"Failed to authenticate: {e}")
         return self._client
 
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Semaphore to hold while a Gemini API call is in flight."""
+        return get_request_semaphore(self.settings.max_concurrent_requests)
+
     def _handle_api_error(self, error: Exception, operation: str) -> None:
         """Handle API errors and convert to appropriate exceptions."""
         raise GeminiError(f"{operation} failed: {error}")
@@ -104,20 +115,53 @@ class GeminiClient:
             logger.info("Uploading file", file_path=str(file_path), mime_type=mime_type)
 
             # Upload file using the google-genai library
-            uploaded_file = client.files.upload(file=str(file_path))
-
-            # Convert to our metadata format
-            metadata = FileMetadata(
-                name=uploaded_file.name,
-                display_name=getattr(uploaded_file, "display_name", None)
-                or file_path.name,
-                mime_type=getattr(uploaded_file, "mime_type", None),
-                size_bytes=getattr(uploaded_file, "size_bytes", None),
-                sha256_hash=getattr(uploaded_file, "sha256_hash", None),
-                uri=getattr(uploaded_file, "uri", None),
-                state=getattr(uploaded_file, "state", None),
+            async with self._request_slot():
+                uploaded_file = await client.aio.files.upload(file=str(file_path))
+
+            metadata = self._to_file_metadata(uploaded_file, file_path.name)
+            logger.info("File uploaded successfully", file_name=metadata.name)
+            return metadata
+
+        except Exception as e:
+            logger.error("File upload failed", error=str(e))
+            if isinstance(e, GeminiError):
+                raise
+            self._handle_api_error(e, "File upload")
+
+    async def upload_fileobj(
+        self, file: IO[bytes], mime_type: str, display_name: str | None = None
+    ) -> FileMetadata:
+        """Upload an open binary file object to Gemini Files API.
+
+        Lets callers upload from an in-memory or spooled buffer without
+        writing a file to disk first.
+
+        Args:
+            file: Seekable binary file object, read from its start
+            mime_type: MIME type of the content
+            display_name: Optional display name for the file
+
+        Returns:
+            FileMetadata: Metadata of the uploaded file
+
+        Raises:
+            GeminiFileUploadError: If file upload fails
+            GeminiAPIError: For other API errors
+        """
+        try:
+            client = self._get_client()
+            file.seek(0)
+            logger.info(
+                "Uploading file object", display_name=display_name, mime_type=mime_type
             )
 
+            config = types.UploadFileConfig(
+                mime_type=mime_type, display_name=display_name
+            )
+            async with self._request_slot():
+                uploaded_file = await client.aio.files.upload(file=file, config=config)
+
+            metadata = self._to_file_metadata(uploaded_file, display_name)
             logger.info("File uploaded successfully", file_name=metadata.name)
             return metadata
 
@@ -127,6 +171,21 @@ class GeminiClient:
                 raise
             self._handle_api_error(e, "File upload")
 
+    @staticmethod
+    def _to_file_metadata(
+        uploaded_file: types.File, display_name: str | None
+    ) -> FileMetadata:
+        """Convert an uploaded Gemini file to our metadata format."""
+        return FileMetadata(
+            name=uploaded_file.name,
+            display_name=getattr(uploaded_file, "display_name", None) or display_name,
+            mime_type=getattr(uploaded_file, "mime_type", None),
+            size_bytes=getattr(uploaded_file, "size_bytes", None),
+            sha256_hash=getattr(uploaded_file, "sha256_hash", None),
+            uri=getattr(uploaded_file, "uri", None),
+            state=getattr(uploaded_file, "state", None),
+        )
+
     async def generate_content(
         self, request: GenerateContentRequest
     ) -> GenerateContentResponse:
@@ -150,16 +209,20 @@ class GeminiClient:
 
             # Add files if provided
             if request.files:
-                for file_name in request.files:
-                    try:
-                        file_obj = client.files.get(name=file_name)
-                        contents.append(file_obj)
-                        logger.info("Added file to content", file_name=file_name)
-                    except Exception as e:
+                file_objs = await get_gemini_file_cache().get_many(
+                    client, request.files
+                )
+                for file_name, file_obj in zip(request.files, file_objs):
+                    if isinstance(file_obj, BaseException):
                         logger.warning(
-                            "Failed to retrieve file", file_name=file_name, error=str(e)
+                            "Failed to retrieve file",
+                            file_name=file_name,
+                            error=str(file_obj),
                         )
                         # Continue without this file rather than failing completely
+                        continue
+                    contents.append(file_obj)
+                    logger.info("Added file to content", file_name=file_name)
 
             # Prepare generation config
             model_name = request.model_name or self.settings.model_name
@@ -194,13 +257,14 @@ class GeminiClient:
             logger.info("Generating content with model", model_name=model_name)
 
             # Generate content
-            response = client.models.generate_content(
-                model=model_name,
-                contents=contents,
-                config=types.GenerateContentConfig(**generation_config)
-                if generation_config
-                else None,
-            )
+            async with self._request_slot():
+                response = await client.aio.models.generate_content(
+                    model=model_name,
+                    contents=contents,
+                    config=types.GenerateContentConfig(**generation_config)
+                    if generation_config
+                    else None,
+                )
 
             return GenerateContentResponse(
                 text=response.text,
@@ -290,7 +354,8 @@ class GeminiClient:
         """
         try:
             client = self._get_client()
-            file = client.files.get(name=file_name)
+            async with self._request_slot():
+                file = await client.aio.files.get(name=file_name)
 
             return FileMetadata(
                 name=file.name,
@@ -320,7 +385,9 @@ class GeminiClient:
         """
         try:
             client = self._get_client()
-            client.files.delete(name=file_name)
+            async with self._request_slot():
+                await client.aio.files.delete(name=file_name)
+            get_gemini_file_cache().invalidate(file_name)
 
             logger.info("File deleted successfully", file_name=file_name)
             return DeleteFileResponse(
@@ -349,9 +416,10 @@ class GeminiClient:
             client = self._get_client()
             logger.info("Creating File Search store", display_name=display_name)
 
-            store = client.file_search_stores.create(
-                config={"display_name": display_name}
-            )
+            async with self._request_slot():
+                store = await client.aio.file_search_stores.create(
+                    config={"display_name": display_name}
+                )
             store_name = store.name
 
             logger.info("File Search store created", store_name=store_name)
@@ -376,14 +444,15 @@ class GeminiClient:
             client = self._get_client()
             logger.info("Listing File Search stores")
 
-            stores = client.file_search_stores.list()
-            store_list = [
-                {
-                    "name": store.name,
-                    "display_name": getattr(store, "display_name", None),
-                }
-                for store in stores
-            ]
+            async with self._request_slot():
+                stores = await client.aio.file_search_stores.list()
+                store_list = [
+                    {
+                        "name": store.name,
+                        "display_name": getattr(store, "display_name", None),
+                    }
+                    async for store in stores
+                ]
 
             logger.info("Listed File Search stores", count=len(store_list))
             return store_list
@@ -427,11 +496,14 @@ class GeminiClient:
                 display_name=display_name,
             )
 
-            operation = client.file_search_stores.upload_to_file_search_store(
-                file=str(file_path),
-                file_search_store_name=store_name,
-                config={"display_name": display_name},
-            )
+            async with self._request_slot():
+                operation = (
+                    await client.aio.file_search_stores.upload_to_file_search_store(
+                        file=str(file_path),
+                        file_search_store_name=store_name,
+                        config={"display_name": display_name},
+                    )
+                )
 
             logger.info("File upload operation started", operation_name=operation.name)
             return operation
@@ -458,7 +530,8 @@ class GeminiClient:
         """
         try:
             client = self._get_client()
-            updated_operation = client.operations.get(operation)
+            async with self._request_slot():
+                updated_operation = await client.aio.operations.get(operation)
             return updated_operation
 
         except Exception as e:
@@ -0,0 +1,26 @@
+"""Process-wide concurrency limit for Gemini API calls."""
+
+import asyncio
+import weakref
+
+# One semaphore per event loop, shared by every client so the limit applies
+# to all callers in the process
+_request_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_request_semaphore(limit: int) -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent Gemini API calls on the running loop.
+
+    Args:
+        limit: Maximum number of in-flight calls (used on first call per loop)
+
+    Returns:
+        asyncio.Semaphore shared by all Gemini clients on this loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        _request_semaphores[loop] = semaphore
+    return semaphore
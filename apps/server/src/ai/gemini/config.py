@@ -5,6 +5,8 @@ This module handles environment variable configuration and validation
 for Gemini integration using Pydantic settings.
 """
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,6 +28,22 @@ class GeminiSettings(BaseSettings):
     )
     thinking_budget: int = Field(description="Thinking budget for content generation")
     timeout: int = Field(default=600, description="Request timeout in seconds")
+    max_concurrent_requests: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of in-flight Gemini API calls per process",
+    )
+    structured_output_mode: Literal["auto", "two_pass"] = Field(
+        default="auto",
+        description=(
+            "auto: one native JSON-schema call unless File Search is used; "
+            "two_pass: always generate free-form, then parse with a second model"
+        ),
+    )
+    structured_parse_model_name: str = Field(
+        default="gemini-2.5-flash-lite",
+        description="Model used for the parse pass of two-pass structured output",
+    )
 
 
 # Global settings instance
@@ -0,0 +1,135 @@
+"""
+Cache of Gemini file handles used as generation inputs.
+
+Every generation that references uploaded files needs a ``types.File`` handle
+for each one. Handles don't change once uploaded, so they are memoized by file
+name until shortly before Gemini deletes the file (48 hours after upload), and
+a batch of names is resolved concurrently instead of one round trip at a time.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from cachetools import LRUCache
+from google import genai
+from google.genai import types
+
+from src.ai.gemini.concurrency import get_request_semaphore
+from src.ai.gemini.config import get_gemini_settings
+from src.utils.logger import logger
+from src.utils.single_flight import SingleFlight
+
+# Gemini deletes uploaded files after 48 hours
+FILE_HANDLE_TTL_SECONDS = 48 * 60 * 60
+
+# Stop serving a handle this long before the file expires
+FILE_HANDLE_EXPIRY_MARGIN_SECONDS = 60 * 60
+
+FILE_HANDLE_CACHE_MAX_SIZE = 1000
+
+
+class GeminiFileCache:
+    """Expiry-aware, single-flight cache of Gemini file handles by name."""
+
+    def __init__(self, max_concurrent_requests: int, max_size: int):
+        """
+        Initialize the file handle cache.
+
+        Args:
+            max_concurrent_requests: Limit passed to the shared Gemini request semaphore
+            max_size: Maximum number of handles kept before LRU eviction
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self._entries: LRUCache = LRUCache(maxsize=max_size)
+        self._fetches: SingleFlight[str, types.File] = SingleFlight()
+
+    async def get(self, client: genai.Client, file_name: str) -> types.File:
+        """
+        Return the handle for an uploaded file, fetching it on a miss.
+
+        Concurrent misses for the same name share one files.get call.
+
+        Args:
+            client: Gemini SDK client
+            file_name: Gemini file name (files/xxxxx)
+
+        Returns:
+            types.File handle usable as generation content
+        """
+        entry = self._entries.get(file_name)
+        if entry is not None:
+            expires_at, file_obj = entry
+            if expires_at > time.monotonic():
+                return file_obj
+            self._entries.pop(file_name, None)
+
+        return await self._fetches.run(
+            file_name, lambda: self._fetch(client, file_name)
+        )
+
+    async def get_many(
+        self, client: genai.Client, file_names: list[str]
+    ) -> list[types.File | BaseException]:
+        """
+        Resolve several file handles concurrently.
+
+        Args:
+            client: Gemini SDK client
+            file_names: Gemini file names, in content order
+
+        Returns:
+            Handles in the same order; failed lookups are returned as exceptions
+        """
+        return await asyncio.gather(
+            *(self.get(client, name) for name in file_names), return_exceptions=True
+        )
+
+    def invalidate(self, file_name: str) -> None:
+        """
+        Drop a cached handle (e.g. after the file was deleted).
+
+        Args:
+            file_name: Gemini file name
+        """
+        self._entries.pop(file_name, None)
+
+    async def _fetch(self, client: genai.Client, file_name: str) -> types.File:
+        """Fetch a handle from the Files API and cache it until near expiry."""
+        async with get_request_semaphore(self.max_concurrent_requests):
+            file_obj = await client.aio.files.get(name=file_name)
+
+        ttl = FILE_HANDLE_TTL_SECONDS
+        expiration_time = getattr(file_obj, "expiration_time", None)
+        if isinstance(expiration_time, datetime):
+            if expiration_time.tzinfo is None:
+                expiration_time = expiration_time.replace(tzinfo=timezone.utc)
+            remaining = (expiration_time - datetime.now(timezone.utc)).total_seconds()
+            ttl = min(ttl, remaining)
+        ttl -= FILE_HANDLE_EXPIRY_MARGIN_SECONDS
+
+        if ttl > 0:
+            self._entries[file_name] = (time.monotonic() + ttl, file_obj)
+        else:
+            logger.debug("Not caching Gemini file close to expiry", file_name=file_name)
+        return file_obj
+
+
+# Global cache instance
+_file_cache: GeminiFileCache | None = None
+
+
+def get_gemini_file_cache() -> GeminiFileCache:
+    """
+    Get the global Gemini file handle cache.
+
+    Returns:
+        GeminiFileCache: The process-wide cache
+    """
+    global _file_cache
+    if _file_cache is None:
+        _file_cache = GeminiFileCache(
+            max_concurrent_requests=get_gemini_settings().max_concurrent_requests,
+            max_size=FILE_HANDLE_CACHE_MAX_SIZE,
+        )
+    return _file_cache
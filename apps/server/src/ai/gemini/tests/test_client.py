@@ -0,0 +1,85 @@
+"""Tests for the Gemini client's async API usage."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai.gemini.client import GeminiClient
+from src.ai.gemini.config import GeminiSettings
+from src.ai.gemini.schemas import GenerateContentRequest
+
+SLOW_CALL_SECONDS = 0.2
+
+
+@pytest.fixture
+def state():
+    """Calls in flight, and the most seen at once."""
+    return {"in_flight": 0, "max_in_flight": 0}
+
+
+@pytest.fixture
+def max_concurrent_requests():
+    return 10
+
+
+@pytest.fixture
+def client(state, max_concurrent_requests):
+    """Client whose SDK generate_content call takes SLOW_CALL_SECONDS."""
+
+    async def generate_content(**kwargs):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(SLOW_CALL_SECONDS)
+        state["in_flight"] -= 1
+        return SimpleNamespace(text="ok", usage_metadata=SimpleNamespace())
+
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = generate_content
+
+    settings = GeminiSettings(
+        api_key="test",
+        model_name="gemini-test",
+        temperature=0.0,
+        thinking_budget=0,
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    client = GeminiClient(settings)
+    client._client = sdk_client
+    return client
+
+
+@pytest.mark.asyncio
+async def test_slow_generation_does_not_block_event_loop(client):
+    """Other coroutines should keep running while a generation is in flight."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    response = await client.generate_content(GenerateContentRequest(prompt="hi"))
+    ticker_task.cancel()
+
+    assert response.text == "ok"
+    # A blocking call would starve the ticker for the whole call
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent_requests", [2])
+async def test_concurrent_generations_are_bounded(client, state):
+    """No more than max_concurrent_requests calls should be in flight."""
+
+    await asyncio.gather(
+        *(
+            client.generate_content(GenerateContentRequest(prompt="hi"))
+            for _ in range(5)
+        )
+    )
+
+    assert state["max_in_flight"] == 2
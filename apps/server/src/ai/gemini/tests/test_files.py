@@ -0,0 +1,84 @@
+"""Tests for the Gemini file handle cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai.gemini.files import GeminiFileCache
+
+
+@pytest.fixture
+def calls():
+    """Names passed to the SDK's files.get, in call order."""
+    return []
+
+
+@pytest.fixture
+def expires_in():
+    return timedelta(hours=48)
+
+
+@pytest.fixture
+def sdk_client(calls, expires_in):
+    """SDK client whose files.get takes a moment and records each call."""
+
+    async def get(name: str):
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(
+            name=name, expiration_time=datetime.now(timezone.utc) + expires_in
+        )
+
+    client = MagicMock()
+    client.aio.files.get = get
+    return client
+
+
+@pytest.fixture
+def cache():
+    return GeminiFileCache(max_concurrent_requests=10, max_size=100)
+
+
+@pytest.mark.asyncio
+async def test_handles_are_resolved_concurrently_and_memoized(sdk_client, calls, cache):
+    """A batch should resolve in one round trip and repeat lookups hit the cache."""
+    started = asyncio.get_running_loop().time()
+    first = await cache.get_many(sdk_client, ["files/a", "files/b", "files/c"])
+    elapsed = asyncio.get_running_loop().time() - started
+    second = await cache.get_many(sdk_client, ["files/a", "files/b", "files/c"])
+
+    assert [f.name for f in first] == ["files/a", "files/b", "files/c"]
+    assert second == first
+    assert sorted(calls) == ["files/a", "files/b", "files/c"]
+    assert elapsed < 0.1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expires_in", [timedelta(minutes=5)])
+async def test_files_near_expiry_are_not_cached(sdk_client, calls, cache):
+    """Handles for files about to be deleted by Gemini should be refetched."""
+    await cache.get(sdk_client, "files/a")
+    await cache.get(sdk_client, "files/a")
+
+    assert calls == ["files/a", "files/a"]
+
+
+@pytest.mark.asyncio
+async def test_failed_lookups_are_returned_in_place(sdk_client, cache):
+    """One missing file should not prevent resolving the others."""
+    ok_get = sdk_client.aio.files.get
+
+    async def get(name: str):
+        if name == "files/missing":
+            raise ValueError("not found")
+        return await ok_get(name)
+
+    sdk_client.aio.files.get = get
+
+    results = await cache.get_many(sdk_client, ["files/a", "files/missing"])
+
+    assert results[0].name == "files/a"
+    assert isinstance(results[1], ValueError)
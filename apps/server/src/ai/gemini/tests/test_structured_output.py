@@ -0,0 +1,109 @@
+"""Tests for GeminiProvider structured output modes."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.ai.gemini import config as gemini_config
+from src.ai.gemini.config import GeminiSettings
+from src.ai.providers.gemini import (
+    STRUCTURED_MODE_SINGLE_PASS,
+    STRUCTURED_MODE_TWO_PASS,
+    GeminiProvider,
+)
+from src.utils.metrics import render_metrics
+
+
+class Summary(BaseModel):
+    title: str
+
+
+@pytest.fixture(autouse=True)
+def gemini_settings(monkeypatch):
+    """Test settings, restored to the previous global settings afterwards."""
+    monkeypatch.setattr(
+        gemini_config,
+        "_gemini_settings",
+        GeminiSettings(
+            api_key="test",
+            model_name="gemini-test",
+            temperature=0.0,
+            thinking_budget=0,
+        ),
+    )
+
+
+def exported(sample: str) -> float:
+    """Current value of a metric sample as /metrics renders it."""
+    for line in render_metrics().splitlines():
+        if line.startswith(f"{sample} "):
+            return float(line.removeprefix(f"{sample} "))
+    return 0
+
+
+@pytest.fixture
+def generate_content():
+    """SDK generate_content returning a parsed Summary."""
+    return AsyncMock(
+        return_value=SimpleNamespace(
+            text='{"title": "Roof"}',
+            parsed={"title": "Roof"},
+            usage_metadata=SimpleNamespace(total_token_count=10),
+        )
+    )
+
+
+@pytest.fixture
+def provider(generate_content):
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = generate_content
+
+    provider = GeminiProvider()
+    provider._client = sdk_client
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_structured_output_without_tools_uses_one_call(
+    provider, generate_content
+):
+    """Plain structured requests should use native JSON output in one call."""
+    calls = (
+        "gemini_structured_output_duration_seconds_count"
+        f'{{mode="{STRUCTURED_MODE_SINGLE_PASS}"}}'
+    )
+    before = exported(calls)
+
+    result = await provider.generate_structured_content("Summarize", Summary)
+
+    assert result == Summary(title="Roof")
+    assert generate_content.await_count == 1
+    config = generate_content.await_args.kwargs["config"]
+    assert config.response_mime_type == "application/json"
+    assert config.tools is None
+
+    assert exported(calls) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_structured_output_with_file_search_uses_two_calls(
+    provider, generate_content
+):
+    """File Search can't be combined with a schema, so it keeps the parse pass."""
+    tokens = (
+        "gemini_structured_output_tokens_total"
+        f'{{mode="{STRUCTURED_MODE_TWO_PASS}",kind="total"}}'
+    )
+    before = exported(tokens)
+
+    result = await provider.generate_structured_content(
+        "Summarize", Summary, file_search_store_names=["fileSearchStores/abc"]
+    )
+
+    assert result == Summary(title="Roof")
+    assert generate_content.await_count == 2
+    assert generate_content.await_args_list[0].kwargs["config"].tools
+
+    assert exported(tokens) == before + 20
@@ -1,6 +1,8 @@
 """Gemini provider implementation."""
 
-from typing import AsyncGenerator, TypeVar
+import asyncio
+import time
+from typing import IO, AsyncGenerator, TypeVar
 
 from braintrust.wrappers.google_genai import setup_genai
 from google import genai
@@ -20,16 +22,26 @@ from src.ai.base import (
     FileMetadata,
 )
 from src.ai.gemini import get_gemini_client
+from src.ai.gemini.concurrency import get_request_semaphore
 from src.ai.gemini.config import get_gemini_settings
 from src.ai.gemini.exceptions import GeminiError
+from src.ai.gemini.files import get_gemini_file_cache
 from src.ai.gemini.schemas import (
     FileUploadRequest,
     GenerateContentRequest,
 )
 from src.utils.logger import logger
+from src.utils.metrics import (
+    STRUCTURED_OUTPUT_DURATION,
+    STRUCTURED_OUTPUT_FAILURES,
+    STRUCTURED_OUTPUT_TOKENS,
+)
 
 T = TypeVar("T", bound=BaseModel)
 
+STRUCTURED_MODE_SINGLE_PASS = "single_pass"
+STRUCTURED_MODE_TWO_PASS = "two_pass"
+
 
 class GeminiProvider(AIProvider):
     """Gemini provider implementation.
@@ -79,6 +91,10 @@ class GeminiProvider(AIProvider):
                 raise GeminiError(f"Failed to authenticate: {e}")
         return self._client
 
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Semaphore to hold while a Gemini API call is in flight."""
+        return get_request_semaphore(self.settings.max_concurrent_requests)
+
     async def upload_file(self, file_path: str, **kwargs) -> FileMetadata:
         """Upload a file to Gemini Files API.
 
@@ -100,6 +116,25 @@ class GeminiProvider(AIProvider):
             logger.error("File upload failed", error=str(e))
             raise
 
+    async def upload_fileobj(
+        self, file: IO[bytes], mime_type: str, display_name: str | None = None
+    ) -> FileMetadata:
+        """Upload an open binary file object to Gemini Files API.
+
+        Args:
+            file: Seekable binary file object, read from its start
+            mime_type: MIME type of the content
+            display_name: Optional display name for the file
+
+        Returns:
+            FileMetadata: Metadata of the uploaded file
+        """
+        try:
+            return await self.client.upload_fileobj(file, mime_type, display_name)
+        except Exception as e:
+            logger.error("File upload failed", error=str(e))
+            raise
+
     async def delete_file(self, file_id: str) -> bool:
         """Delete a file from Gemini Files API.
 
@@ -178,6 +213,10 @@ class GeminiProvider(AIProvider):
     ) -> T:
         """Generate structured content using a Pydantic model.
 
+        Uses a single native JSON-schema call unless File Search is requested
+        (or GEMINI_STRUCTURED_OUTPUT_MODE=two_pass), in which case the answer
+        is generated free-form and parsed into JSON by a second model call.
+
         Args:
             prompt: Text prompt
             response_schema: Pydantic model for structured output
@@ -207,48 +246,128 @@ class GeminiProvider(AIProvider):
 
             # Add files if provided
             if file_ids:
-                for file_name in file_ids:
-                    file_obj = client.files.get(name=file_name)
+                file_objs = await get_gemini_file_cache().get_many(client, file_ids)
+                for file_name, file_obj in zip(file_ids, file_objs):
+                    if isinstance(file_obj, BaseException):
+                        raise file_obj
                     contents.append(file_obj)
                     logger.info("Added file to content", file_name=file_name)
 
             # Prepare generation config
             model_name = kwargs.get("model") or self.settings.model_name
             temperature = kwargs.get("temperature") or self.settings.temperature
-            tools = None
-            if file_search_store_names:
-                tools = [
-                    Tool(file_search=FileSearch(file_search_store_names=[store_name]))
-                    for store_name in file_search_store_names
-                ]
-
-            generation_config = GenerateContentConfig(
-                temperature=temperature,
-                # response_schema=response_schema,
-                response_schema=response_schema,
-                tools=tools,
+
+            # Tools can't be combined with native JSON output, so File Search
+            # falls back to generating free-form text and parsing it
+            if (
+                file_search_store_names
+                or self.settings.structured_output_mode == "two_pass"
+            ):
+                mode = STRUCTURED_MODE_TWO_PASS
+            else:
+                mode = STRUCTURED_MODE_SINGLE_PASS
+
+            logger.info(
+                "Generating content with model", model_name=model_name, mode=mode
             )
 
-            logger.info("Generating content with model", model_name=model_name)
+            started = time.perf_counter()
+            usages: list = []
+            try:
+                if mode == STRUCTURED_MODE_SINGLE_PASS:
+                    result = await self._generate_structured_single_pass(
+                        client,
+                        model_name,
+                        contents,
+                        temperature,
+                        response_schema,
+                        usages,
+                    )
+                else:
+                    result = await self._generate_structured_two_pass(
+                        client,
+                        model_name,
+                        contents,
+                        temperature,
+                        response_schema,
+                        file_search_store_names,
+                        usages,
+                    )
+            except Exception:
+                self._record_structured_metrics(mode, started, usages, success=False)
+                raise
+
+            self._record_structured_metrics(mode, started, usages)
+            return result
+
+        except Exception as e:
+            logger.error("Content generation failed", error=str(e))
+            raise
 
-            # Generate content
-            response: GenerateContentResponse = client.models.generate_content(
-                model=model_name, contents=contents, config=generation_config
+    async def _generate_structured_single_pass(
+        self,
+        client: genai.Client,
+        model_name: str,
+        contents: list,
+        temperature: float,
+        response_schema: type[T],
+        usages: list,
+    ) -> T:
+        """Generate structured output in one call using native JSON schema."""
+        config = GenerateContentConfig(
+            temperature=temperature,
+            response_json_schema=response_schema.model_json_schema(),
+            response_mime_type="application/json",
+        )
+        async with self._request_slot():
+            response: GenerateContentResponse = (
+                await client.aio.models.generate_content(
+                    model=model_name, contents=contents, config=config
+                )
             )
-            # logger.info("First pass response", response=response)
-            # if not response.text:
-            #     logger.error("Response text is empty", response=response)
-            #     raise ValueError("Response text is empty")
-            # logger.info("First pass response text", text=response.text)
-
-            structured_config = GenerateContentConfig(
-                temperature=temperature,
-                response_json_schema=response_schema.model_json_schema(),
-                response_mime_type="application/json",
+        usages.append(response.usage_metadata)
+        return self._parse_structured_response(response, response_schema)
+
+    async def _generate_structured_two_pass(
+        self,
+        client: genai.Client,
+        model_name: str,
+        contents: list,
+        temperature: float,
+        response_schema: type[T],
+        file_search_store_names: list[str] | None,
+        usages: list,
+    ) -> T:
+        """Generate free-form text (with tools), then parse it with a second call."""
+        tools = None
+        if file_search_store_names:
+            tools = [
+                Tool(file_search=FileSearch(file_search_store_names=[store_name]))
+                for store_name in file_search_store_names
+            ]
+
+        generation_config = GenerateContentConfig(
+            temperature=temperature,
+            response_schema=response_schema,
+            tools=tools,
+        )
+        async with self._request_slot():
+            response: GenerateContentResponse = (
+                await client.aio.models.generate_content(
+                    model=model_name, contents=contents, config=generation_config
+                )
             )
+        usages.append(response.usage_metadata)
+
+        structured_config = GenerateContentConfig(
+            temperature=temperature,
+            response_json_schema=response_schema.model_json_schema(),
+            response_mime_type="application/json",
+        )
+        async with self._request_slot():
             structured_response: GenerateContentResponse = (
-                client.models.generate_content(
-                    model="gemini-2.5-flash-lite",
+                await client.aio.models.generate_content(
+                    model=self.settings.structured_parse_model_name,
                     contents=[
                         "Please parse the following text into a JSON object: ",
                         response.text,
@@ -256,22 +375,54 @@ class GeminiProvider(AIProvider):
                     config=structured_config,
                 )
             )
-            if structured_response.parsed:
-                # logger.info("Have parsed response", parsed=structured_response.parsed)
-                return response_schema.model_validate(structured_response.parsed)
+        usages.append(structured_response.usage_metadata)
+        return self._parse_structured_response(structured_response, response_schema)
 
-            if not structured_response.text:
-                logger.error(
-                    "Structured response text is empty", response=structured_response
+    @staticmethod
+    def _parse_structured_response(
+        response: GenerateContentResponse, response_schema: type[T]
+    ) -> T:
+        """Validate a JSON-mode response against the requested schema."""
+        if response.parsed:
+            return response_schema.model_validate(response.parsed)
+
+        if not response.text:
+            logger.error("Structured response text is empty", response=response)
+            raise GeminiError("Structured response text is empty")
+
+        return response_schema.model_validate_json(response.text)
+
+    @staticmethod
+    def _record_structured_metrics(
+        mode: str, started: float, usages: list, success: bool = True
+    ) -> None:
+        """Record latency and token usage for one structured generation."""
+        latency = time.perf_counter() - started
+        latency_ms = latency * 1000
+        STRUCTURED_OUTPUT_DURATION.observe(latency, mode)
+        if not success:
+            STRUCTURED_OUTPUT_FAILURES.inc(mode)
+        for usage in usages:
+            if usage is None:
+                continue
+            for kind, field in (
+                ("prompt", "prompt_token_count"),
+                ("output", "candidates_token_count"),
+                ("total", "total_token_count"),
+            ):
+                STRUCTURED_OUTPUT_TOKENS.inc(
+                    mode, kind, amount=getattr(usage, field, None) or 0
                 )
-                raise ValueError("Structured response text is empty")
-
-            logger.info("Second pass response text", text=structured_response.parsed)
-            return response_schema(**structured_response.parsed)
-
-        except Exception as e:
-            logger.error("Content generation failed", error=str(e))
-            raise
+        logger.info(
+            "Structured generation finished",
+            mode=mode,
+            success=success,
+            latency_ms=round(latency_ms, 1),
+            round_trips=len(usages),
+            total_tokens=sum(
+                getattr(usage, "total_token_count", None) or 0 for usage in usages
+            ),
+        )
 
     async def stream_chat(
         self,
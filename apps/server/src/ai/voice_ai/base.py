@@ -6,6 +6,7 @@ must implement, ensuring consistent behavior across different voice AI systems.
 """
 
 from abc import ABC, abstractmethod
+from typing import IO
 
 from src.ai.voice_ai.schemas import CallRequest, CallResponse
 
@@ -84,6 +85,29 @@ class VoiceAIProvider(ABC):
         """
         pass
 
+    async def download_recording_to(
+        self, recording_url: str, destination: IO[bytes]
+    ) -> tuple[int, str]:
+        """
+        Download a call recording into a writable file object.
+
+        Providers that can stream the recording should override this; the
+        default buffers it with download_recording.
+
+        Args:
+            recording_url: URL to the call recording
+            destination: Binary file object to write the recording to
+
+        Returns:
+            tuple[int, str]: Tuple of (size_bytes, content_type)
+
+        Raises:
+            VoiceAIError: If the recording cannot be downloaded
+        """
+        file_bytes, content_type = await self.download_recording(recording_url)
+        destination.write(file_bytes)
+        return len(file_bytes), content_type
+
 
 class VoiceAIError(Exception):
     """Base exception for Voice AI-related errors."""
@@ -56,6 +56,24 @@ class VapiSettings(BaseSettings):
         default=True, description="Whether to require webhook verification"
     )
 
+    # Call status polling (see VapiStatusPoller)
+    status_poll_min_interval_seconds: float = Field(
+        default=3.0, gt=0, description="Status poll interval for newly started calls"
+    )
+    status_poll_max_interval_seconds: float = Field(
+        default=30.0, gt=0, description="Upper bound on a call's status poll interval"
+    )
+    status_poll_slowdown_after_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Call age after which its poll interval doubles (repeatedly)",
+    )
+    status_poll_max_requests_per_second: float = Field(
+        default=5.0,
+        gt=0,
+        description="Status requests per second allowed across all in-progress calls",
+    )
+
 
 # Global settings instances
 _voice_ai_settings: VoiceAISettings | None = None
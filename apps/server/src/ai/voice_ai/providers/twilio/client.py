@@ -1,19 +1,27 @@
 """
 Twilio client wrapper for async operations.
 
-This module provides async wrappers around the synchronous Twilio SDK.
+This module provides async wrappers around the Twilio SDK's native async
+methods (backed by the pooled transport in http_client).
 """
 
-import asyncio
-from typing import Any
+import io
+from typing import IO, Any
 
 import httpx
 from twilio.rest import Client
 from twilio.rest.api.v2010.account.call import CallInstance
 
 from src.utils.logger import logger
+from src.utils.timing import instrumented
 
+RECORDING_DOWNLOAD_TIMEOUT_SECONDS = 60.0
 
+# Read size when streaming a recording body
+RECORDING_CHUNK_SIZE = 64 * 1024
+
+
+@instrumented("twilio")
 class TwilioVoiceClient:
     """Async wrapper for Twilio Voice API operations."""
 
@@ -70,10 +78,7 @@ class TwilioVoiceClient:
             if recording_status_callback:
                 call_params["recording_status_callback"] = recording_status_callback
 
-        return await asyncio.to_thread(
-            self.client.calls.create,
-            **call_params,
-        )
+        return await self.client.calls.create_async(**call_params)
 
     async def get_call(self, call_sid: str) -> CallInstance:
         """
@@ -85,7 +90,7 @@ class TwilioVoiceClient:
         Returns:
             CallInstance with current call details
         """
-        return await asyncio.to_thread(self.client.calls(call_sid).fetch)
+        return await self.client.calls(call_sid).fetch_async()
 
     async def update_call(self, call_sid: str, **kwargs: Any) -> CallInstance:
         """
@@ -98,10 +103,7 @@ class TwilioVoiceClient:
         Returns:
             Updated CallInstance
         """
-        return await asyncio.to_thread(
-            self.client.calls(call_sid).update,
-            **kwargs,
-        )
+        return await self.client.calls(call_sid).update_async(**kwargs)
 
     async def end_call(self, call_sid: str) -> CallInstance:
         """
@@ -147,7 +149,9 @@ class TwilioVoiceClient:
 
     async def download_recording(self, recording_url: str) -> tuple[bytes, str]:
         """
-        Download a call recording from Twilio.
+        Download a call recording from Twilio into memory.
+
+        Prefer download_recording_to for large recordings.
 
         Args:
             recording_url: URL to the Twilio recording
@@ -155,6 +159,29 @@ class TwilioVoiceClient:
         Returns:
             Tuple of (file_bytes, content_type)
 
+        Raises:
+            Exception: If download fails
+        """
+        buffer = io.BytesIO()
+        _, content_type = await self.download_recording_to(recording_url, buffer)
+        return buffer.getvalue(), content_type
+
+    async def download_recording_to(
+        self, recording_url: str, destination: IO[bytes]
+    ) -> tuple[int, str]:
+        """
+        Stream a call recording from Twilio into a writable file object.
+
+        The body is written chunk by chunk, so the recording is never held in
+        memory as a whole.
+
+        Args:
+            recording_url: URL to the Twilio recording
+            destination: Binary file object to write the recording to
+
+        Returns:
+            Tuple of (size_bytes, content_type)
+
         Raises:
             Exception: If download fails
         """
@@ -164,21 +191,23 @@ class TwilioVoiceClient:
             # Twilio API requires HTTP Basic Auth
             auth = (self.client.username, self.client.password)
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(recording_url, auth=auth)
+            size_bytes = 0
+            async with get_recording_http_client().stream(
+                "GET", recording_url, auth=auth
+            ) as response:
                 response.raise_for_status()
-
                 content_type = response.headers.get("content-type", "audio/mpeg")
-                file_bytes = response.content
+                async for chunk in response.aiter_bytes(RECORDING_CHUNK_SIZE):
+                    destination.write(chunk)
+                    size_bytes += len(chunk)
 
-                logger.info(
-                    "[TWILIO] Successfully downloaded recording",
-                    url=recording_url,
-                    size_bytes=len(file_bytes),
-                    content_type=content_type,
-                )
-
-                return file_bytes, content_type
+            logger.info(
+                "[TWILIO] Successfully downloaded recording",
+                url=recording_url,
+                size_bytes=size_bytes,
+                content_type=content_type,
+            )
+            return size_bytes, content_type
 
         except Exception as e:
             logger.error(
@@ -187,3 +216,30 @@ class TwilioVoiceClient:
                 error=str(e),
             )
             raise
+
+
+# Shared HTTP client for recording downloads (keeps connections to Twilio warm)
+_recording_http_client: httpx.AsyncClient | None = None
+
+
+def get_recording_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used to download Twilio recordings.
+
+    Returns:
+        httpx.AsyncClient: Pooled client, created on first use
+    """
+    global _recording_http_client
+    if _recording_http_client is None or _recording_http_client.is_closed:
+        _recording_http_client = httpx.AsyncClient(
+            timeout=RECORDING_DOWNLOAD_TIMEOUT_SECONDS
+        )
+    return _recording_http_client
+
+
+async def close_recording_http_client() -> None:
+    """Close the shared recording download client (on shutdown)."""
+    global _recording_http_client
+    if _recording_http_client is not None:
+        await _recording_http_client.aclose()
+        _recording_http_client = None
@@ -28,6 +28,17 @@ class TwilioGlobalConfig(BaseSettings):
     api_key: str = Field(..., description="Twilio API Key (SKxxx) for access tokens")
     api_secret: str = Field(..., description="Twilio API Secret for access tokens")
 
+    # REST API transport
+    max_concurrent_requests: int = Field(
+        default=20, ge=1, description="Twilio API requests allowed in flight at once"
+    )
+    max_retries: int = Field(
+        default=3, ge=0, description="Retries for throttled (429) or failed requests"
+    )
+    request_timeout: float = Field(
+        default=30.0, gt=0, description="Twilio API request timeout in seconds"
+    )
+
 
 class TwilioWebhooks:
     """Twilio webhook URLs for callbacks."""
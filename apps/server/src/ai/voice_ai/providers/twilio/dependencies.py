@@ -2,28 +2,61 @@
 Dependencies for Twilio provider integration.
 """
 
+import threading
+
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from twilio.rest import Client
 
 from src.ai.voice_ai.providers.twilio.client import TwilioVoiceClient
 from src.ai.voice_ai.providers.twilio.config import TwilioGlobalConfig
+from src.ai.voice_ai.providers.twilio.http_client import TwilioHttpClient
 from src.ai.voice_ai.providers.twilio.provider import TwilioProvider
 from src.auth.dependencies import get_current_user
 from src.auth.schemas import User
 from src.db.database import get_db
 from src.db.phone_numbers.service import PhoneNumberService
 
+# Shared account client and its pooled async transport
+_twilio_client: Client | None = None
+# Sync dependencies run in the threadpool, so first requests can race to build it
+_twilio_client_lock = threading.Lock()
+
 
 def get_twilio_client() -> Client:
     """
     Get global Twilio client (singleton, shared account).
 
+    The client uses a pooled async transport, so use the SDK's *_async
+    methods (TwilioVoiceClient does).
+
     Returns:
         Configured Twilio REST client
     """
-    config = TwilioGlobalConfig()
-    return Client(config.account_sid, config.auth_token)
+    global _twilio_client
+    if _twilio_client is None:
+        with _twilio_client_lock:
+            if _twilio_client is None:
+                config = TwilioGlobalConfig()
+                _twilio_client = Client(
+                    config.account_sid,
+                    config.auth_token,
+                    http_client=TwilioHttpClient(
+                        max_concurrent_requests=config.max_concurrent_requests,
+                        max_retries=config.max_retries,
+                        timeout=config.request_timeout,
+                    ),
+                )
+    return _twilio_client
+
+
+async def close_twilio_client() -> None:
+    """Close the global Twilio client's connections (on shutdown)."""
+    global _twilio_client
+    with _twilio_client_lock:
+        client, _twilio_client = _twilio_client, None
+    if client is not None:
+        await client.http_client.close()
 
 
 def get_twilio_voice_client() -> TwilioVoiceClient:
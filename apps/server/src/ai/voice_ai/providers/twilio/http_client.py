@@ -0,0 +1,159 @@
+"""
+Async HTTP transport for the Twilio REST client.
+
+The Twilio SDK's sync methods block on `requests`, so calling them from the
+event loop means a thread per request. TwilioHttpClient implements the SDK's
+AsyncHttpClient interface on a shared httpx connection pool, so the SDK's
+*_async methods (calls.create_async, fetch_async, update_async) run natively
+on the loop. Concurrent requests are bounded, and throttled (429) or failed
+(5xx) requests are retried with exponential backoff and jitter.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Mapping
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+from twilio.http import AsyncHttpClient
+from twilio.http.response import Response as TwilioResponse
+
+from src.utils.logger import logger
+
+# Methods Twilio can safely repeat after a server error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "DELETE"})
+
+
+class TwilioHttpClient(AsyncHttpClient):
+    """Pooled, rate-bounded httpx transport for the Twilio SDK."""
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = 20,
+        max_retries: int = 3,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 8.0,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            max_concurrent_requests: Twilio API requests allowed in flight at once
+            max_retries: Retries after a 429 (any method) or a 5xx/connection
+                error (idempotent methods only)
+            retry_base_seconds: Base delay for exponential retry backoff
+            retry_max_seconds: Upper bound on a single retry delay
+            timeout: Default request timeout in seconds
+            transport: Optional httpx transport (for tests)
+        """
+        super().__init__(
+            logger=logging.getLogger(__name__), is_async=True, timeout=timeout
+        )
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrent_requests,
+                max_keepalive_connections=max_concurrent_requests,
+            ),
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    async def request(
+        self,
+        method: str,
+        uri: str,
+        params: dict[str, object] | None = None,
+        data: dict[str, object] | None = None,
+        headers: dict[str, str] | None = None,
+        auth: tuple[str, str] | None = None,
+        timeout: float | None = None,
+        allow_redirects: bool = False,
+    ) -> TwilioResponse:
+        """
+        Make a Twilio API request, retrying throttled and failed attempts.
+
+        Returns:
+            TwilioResponse: Response in the SDK's format
+        """
+        method = method.upper()
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self.client.request(
+                        method,
+                        uri,
+                        params=params,
+                        data=data,
+                        headers=headers,
+                        auth=auth,
+                        timeout=timeout or self.timeout,
+                        follow_redirects=allow_redirects,
+                    )
+            except httpx.TransportError as e:
+                # A failed connect never reached Twilio, so it is safe to
+                # repeat for any method
+                retryable = isinstance(e, httpx.ConnectError | httpx.ConnectTimeout)
+                if attempt >= self.max_retries or not (
+                    retryable or method in IDEMPOTENT_METHODS
+                ):
+                    raise
+                delay = self._retry_delay(attempt, {})
+                logger.warning(
+                    "[TWILIO] Request failed, retrying",
+                    method=method,
+                    uri=uri,
+                    attempt=attempt + 1,
+                    delay_seconds=round(delay, 2),
+                    error=str(e),
+                )
+            else:
+                if attempt >= self.max_retries or not self._should_retry(
+                    method, response.status_code
+                ):
+                    return TwilioResponse(
+                        response.status_code, response.text, response.headers
+                    )
+                delay = self._retry_delay(attempt, response.headers)
+                logger.warning(
+                    "[TWILIO] Request throttled or failed, retrying",
+                    method=method,
+                    uri=uri,
+                    status_code=response.status_code,
+                    attempt=attempt + 1,
+                    delay_seconds=round(delay, 2),
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    @staticmethod
+    def _should_retry(method: str, status_code: int) -> bool:
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return True
+        return status_code >= HTTPStatus.INTERNAL_SERVER_ERROR and (
+            method in IDEMPOTENT_METHODS
+        )
+
+    def _retry_delay(self, attempt: int, headers: Mapping[str, Any]) -> float:
+        """Honor Retry-After, else exponential backoff with full jitter."""
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.retry_max_seconds)
+            except ValueError:
+                pass
+        ceiling = min(self.retry_max_seconds, self.retry_base_seconds * 2**attempt)
+        return random.uniform(0, ceiling)
@@ -3,7 +3,7 @@ Twilio Voice AI provider implementation.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import IO, Any
 
 from twilio.rest import Client
 from twilio.rest.api.v2010.account.call import CallInstance
@@ -295,3 +295,24 @@ class TwilioProvider(BaseVoiceAIProvider):
                 error=str(e),
             )
             raise VoiceAIError(f"Failed to download Twilio recording: {e}") from e
+
+    async def download_recording_to(
+        self, recording_url: str, destination: IO[bytes]
+    ) -> tuple[int, str]:
+        """
+        Stream a call recording from Twilio into a writable file object.
+
+        Args:
+            recording_url: URL to the Twilio recording
+            destination: Binary file object to write the recording to
+
+        Returns:
+            tuple[int, str]: Tuple of (size_bytes, content_type)
+
+        Raises:
+            VoiceAIError: If the recording cannot be downloaded
+        """
+        try:
+            return await self.client.download_recording_to(recording_url, destination)
+        except Exception as e:
+            raise VoiceAIError(f"Failed to download Twilio recording: {e}") from e
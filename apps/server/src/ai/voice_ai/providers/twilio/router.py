@@ -13,12 +13,15 @@ from twilio.jwt.access_token import AccessToken
 from twilio.jwt.access_token.grants import VoiceGrant
 from twilio.twiml.voice_response import VoiceResponse
 
+from src.ai.voice_ai.constants import CallStatus as InternalCallStatus
 from src.ai.voice_ai.providers.twilio.client import TwilioVoiceClient
 from src.ai.voice_ai.providers.twilio.config import TwilioGlobalConfig, TwilioWebhooks
 from src.ai.voice_ai.providers.twilio.dependencies import get_twilio_voice_client
 from src.ai.voice_ai.providers.twilio.provider import map_twilio_status
 from src.auth.dependencies import get_current_user
 from src.auth.schemas import User
+from src.db.call_jobs.constants import CallJobStage
+from src.db.call_jobs.repository import CallJobRepository
 from src.db.calls.repository import CallRepository
 from src.db.dependencies import get_call_repository
 from src.utils.logger import logger
@@ -55,6 +58,12 @@ async def status_webhook(
         await call_repository.update_call_status(
             call_id=call.call_id, status=internal_status
         )
+        if InternalCallStatus.is_call_ended(internal_status):
+            # Let the post-call pipeline pick the call up now instead of at
+            # its next safety-net status check
+            await CallJobRepository(call_repository.session).wake(
+                call.call_id, CallJobStage.MONITOR_CALL
+            )
         await call_repository.session.commit()
     else:
         logger.warning(
@@ -147,14 +156,7 @@ async def bridge_webhook(
         )
 
         # Update call record with customer call SID
-        # Create a new dict to trigger SQLAlchemy's change detection
-        updated_provider_data = dict(call.provider_data)
-        updated_provider_data["customer_call_sid"] = customer_call.sid
-        call.provider_data = updated_provider_data
-
-        # Explicitly flush and refresh to ensure the change is persisted
-        await call_repository.session.flush()
-        await call_repository.session.refresh(call)
+        await call_repository.set_customer_call_sid(call, customer_call.sid)
         await call_repository.session.commit()
 
     except SQLAlchemyError as e:
@@ -215,6 +217,9 @@ async def recording_webhook(
         await call_repository.update_call_recording(
             call_id=call.call_id, recording_url=recording_url_mp3
         )
+        await CallJobRepository(call_repository.session).wake(
+            call.call_id, CallJobStage.ANALYZE_RECORDING
+        )
         await call_repository.session.commit()
     else:
         logger.warning(
@@ -0,0 +1,264 @@
+"""
+Centralized status poller for in-progress Vapi calls.
+
+Vapi has no call-ended webhook wired into the post-call pipeline, so call
+status has to be polled. Rather than each monitored call polling on its own
+fixed interval, one VapiStatusPoller per process owns every active call ID
+and sweeps the ones that are due:
+
+- Each call's interval starts short and doubles as the call runs longer, so
+  long calls are checked less often.
+- Requests are drawn from a token bucket shared by all calls, so the
+  outbound request rate is capped however many calls are in progress.
+- Results are fanned out to an on_change callback only when a call's status
+  actually changes, and ended calls stop being tracked.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from cachetools import LRUCache
+
+from src.ai.voice_ai.base import VoiceAIProvider
+from src.ai.voice_ai.constants import CallStatus
+from src.ai.voice_ai.schemas import CallResponse
+from src.utils.logger import logger
+
+# Ended-call results kept for the pipeline to read after tracking stops
+FINISHED_CACHE_SIZE = 1024
+
+
+@dataclass
+class _TrackedCall:
+    """Polling state for one in-progress call (times are time.monotonic())."""
+
+    started_at: float
+    next_poll_at: float
+    latest: CallResponse | None = None
+
+
+class VapiStatusPoller:
+    """Polls all tracked Vapi calls from a single loop under a request budget."""
+
+    def __init__(
+        self,
+        provider: VoiceAIProvider,
+        on_change: Callable[[CallResponse], Awaitable[None]] | None = None,
+        min_interval_seconds: float = 3.0,
+        max_interval_seconds: float = 30.0,
+        slowdown_after_seconds: float = 120.0,
+        max_requests_per_second: float = 5.0,
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            provider: Vapi provider used to fetch call status
+            on_change: Awaited with the new status whenever a call's status changes
+            min_interval_seconds: Poll interval for newly started calls
+            max_interval_seconds: Upper bound on a call's poll interval
+            slowdown_after_seconds: Call age after which the interval doubles,
+                and again every further period of this length
+            max_requests_per_second: Status requests allowed per second across
+                all tracked calls
+        """
+        self.provider = provider
+        self.on_change = on_change
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.slowdown_after_seconds = slowdown_after_seconds
+        self.max_requests_per_second = max_requests_per_second
+
+        self._calls: dict[str, _TrackedCall] = {}
+        self._finished: LRUCache = LRUCache(maxsize=FINISHED_CACHE_SIZE)
+        # Requests are whole, so the bucket holds at least one even when the
+        # rate is below one per second
+        self._capacity = max(1.0, max_requests_per_second)
+        self._tokens = self._capacity
+        self._refilled_at = time.monotonic()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def tracked_count(self) -> int:
+        """Number of calls currently being polled."""
+        return len(self._calls)
+
+    def track(self, call_id: str, started_at: datetime | None = None) -> None:
+        """
+        Start polling a call (no-op if it is already tracked).
+
+        Args:
+            call_id: Vapi call ID
+            started_at: When the call started (defaults to now); older calls
+                start at a slower interval
+        """
+        if call_id in self._calls:
+            return
+        age = (datetime.now(UTC) - started_at).total_seconds() if started_at else 0
+        now = time.monotonic()
+        self._calls[call_id] = _TrackedCall(
+            started_at=now - max(age, 0),
+            next_poll_at=now + self.poll_interval(age),
+        )
+        self._wakeup.set()
+
+    def untrack(self, call_id: str) -> None:
+        """Stop polling a call."""
+        self._calls.pop(call_id, None)
+
+    def latest(self, call_id: str) -> CallResponse | None:
+        """
+        Return the most recent polled status for a call.
+
+        Args:
+            call_id: Vapi call ID
+
+        Returns:
+            The last status seen by the poller, or None if it hasn't polled the call
+        """
+        tracked = self._calls.get(call_id)
+        if tracked is not None:
+            return tracked.latest
+        return self._finished.get(call_id)
+
+    def poll_interval(self, age_seconds: float) -> float:
+        """
+        Poll interval for a call that has been running for age_seconds.
+
+        Args:
+            age_seconds: Seconds since the call started
+
+        Returns:
+            float: Seconds until the call should be polled again
+        """
+        doublings = int(max(age_seconds, 0) // self.slowdown_after_seconds)
+        return min(self.max_interval_seconds, self.min_interval_seconds * 2**doublings)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Poll tracked calls until stop is set.
+
+        Args:
+            stop: Event that ends the poller
+        """
+        logger.info("[Vapi Poller] Started")
+        while not stop.is_set():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error("[Vapi Poller] Sweep failed", error=str(e))
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    _first(self._wakeup.wait(), stop.wait()),
+                    timeout=self._seconds_until_next_sweep(),
+                )
+            except TimeoutError:
+                pass
+        logger.info("[Vapi Poller] Stopped")
+
+    async def poll_once(self) -> int:
+        """
+        Poll every due call the request budget allows, oldest-due first.
+
+        Returns:
+            int: Number of status requests made
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        due = sorted(
+            (
+                (tracked.next_poll_at, call_id)
+                for call_id, tracked in self._calls.items()
+                if tracked.next_poll_at <= now
+            ),
+        )
+        batch = [call_id for _, call_id in due[: int(self._tokens)]]
+        if not batch:
+            return 0
+
+        self._tokens -= len(batch)
+        if len(due) > len(batch):
+            logger.debug(
+                "[Vapi Poller] Request budget exhausted, deferring calls",
+                deferred=len(due) - len(batch),
+            )
+
+        results = await asyncio.gather(
+            *(self.provider.get_call_status(call_id) for call_id in batch),
+            return_exceptions=True,
+        )
+        for call_id, result in zip(batch, results, strict=True):
+            await self._handle_result(call_id, result)
+        return len(batch)
+
+    async def _handle_result(
+        self, call_id: str, result: CallResponse | BaseException
+    ) -> None:
+        """Store a poll result, reschedule the call and fan out changes."""
+        tracked = self._calls.get(call_id)
+        if tracked is None:
+            # Untracked while the request was in flight
+            return
+
+        now = time.monotonic()
+        tracked.next_poll_at = now + self.poll_interval(now - tracked.started_at)
+
+        if isinstance(result, BaseException):
+            logger.warning(
+                "[Vapi Poller] Failed to get call status",
+                call_id=call_id,
+                error=str(result),
+            )
+            return
+
+        changed = tracked.latest is None or tracked.latest.status != result.status
+        tracked.latest = result
+
+        if CallStatus.is_call_ended(result.status):
+            self._calls.pop(call_id, None)
+            self._finished[call_id] = result
+
+        if changed and self.on_change is not None:
+            try:
+                await self.on_change(result)
+            except Exception as e:
+                logger.error(
+                    "[Vapi Poller] Status change handler failed",
+                    call_id=call_id,
+                    error=str(e),
+                )
+
+    def _refill(self, now: float) -> None:
+        """Top up the request budget for the time since the last refill."""
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(
+            self._capacity,
+            self._tokens + elapsed * self.max_requests_per_second,
+        )
+
+    def _seconds_until_next_sweep(self) -> float:
+        """Time until the next call is due, or until budget frees up for it."""
+        if not self._calls:
+            return self.max_interval_seconds
+        now = time.monotonic()
+        next_due = min(tracked.next_poll_at for tracked in self._calls.values())
+        until_due = max(next_due - now, 0)
+        until_token = max(1 - self._tokens, 0) / self.max_requests_per_second
+        return max(until_due, until_token)
+
+
+async def _first(*aws: Awaitable) -> None:
+    """Wait until the first of several awaitables completes."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -5,6 +5,8 @@ This module provides the business logic layer for Voice AI operations,
 sitting between the FastAPI routes and the Voice AI providers.
 """
 
+from typing import IO
+
 from src.ai.voice_ai.base import VoiceAIError, VoiceAIProvider
 from src.ai.voice_ai.constants import VoiceAIErrorCode
 from src.ai.voice_ai.schemas import CallRequest, CallResponse, VoiceAIErrorResponse
@@ -168,3 +170,30 @@ class VoiceAIService:
             content_type=result[1],
         )
         return result
+
+    async def download_recording_to(
+        self, recording_url: str, destination: IO[bytes]
+    ) -> tuple[int, str]:
+        """
+        Download a call recording into a writable file object.
+
+        Args:
+            recording_url: URL to the call recording
+            destination: Binary file object to write the recording to
+
+        Returns:
+            tuple[int, str]: Tuple of (size_bytes, content_type)
+
+        Raises:
+            VoiceAIError: If the recording cannot be downloaded
+        """
+        logger.info("Downloading call recording", url=recording_url)
+        size_bytes, content_type = await self.voice_ai_provider.download_recording_to(
+            recording_url, destination
+        )
+        logger.info(
+            "Successfully downloaded recording",
+            size_bytes=size_bytes,
+            content_type=content_type,
+        )
+        return size_bytes, content_type
@@ -0,0 +1,134 @@
+"""Tests for the pooled async Twilio transport."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from twilio.base.exceptions import TwilioRestException
+from twilio.rest import Client
+
+from src.ai.voice_ai.providers.twilio import dependencies
+from src.ai.voice_ai.providers.twilio.client import TwilioVoiceClient
+from src.ai.voice_ai.providers.twilio.http_client import TwilioHttpClient
+
+CALL_JSON = {"sid": "CA123", "status": "queued"}
+
+
+class FakeTwilio:
+    """Answers the voice client's requests with each test's respond function."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.respond = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return await self.respond(request)
+
+
+@pytest.fixture
+def twilio():
+    return FakeTwilio()
+
+
+@pytest.fixture
+def max_concurrent_requests():
+    return 20
+
+
+@pytest.fixture
+def voice_client(twilio, max_concurrent_requests):
+    http_client = TwilioHttpClient(
+        max_concurrent_requests=max_concurrent_requests,
+        retry_base_seconds=0,
+        transport=httpx.MockTransport(twilio.handle),
+    )
+    return TwilioVoiceClient(Client("AC123", "token", http_client=http_client))
+
+
+@pytest.mark.asyncio
+async def test_throttled_create_is_retried(twilio, voice_client):
+    """A 429 means Twilio didn't create the call, so creation is retried."""
+    statuses = iter([429, 429, 201])
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json=CALL_JSON)
+
+    twilio.respond = respond
+    call = await voice_client.create_call(
+        to="+15550001111", from_="+15550002222", url="https://example.com/twiml"
+    )
+
+    assert call.sid == "CA123"
+
+
+@pytest.mark.asyncio
+async def test_server_error_on_create_is_not_retried(twilio, voice_client):
+    """A 5xx on create may have placed the call, so it must not be repeated."""
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"code": 20500, "message": "error"})
+
+    twilio.respond = respond
+    with pytest.raises(TwilioRestException):
+        await voice_client.create_call(
+            to="+15550001111", from_="+15550002222", url="https://example.com/twiml"
+        )
+
+    assert len(twilio.requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent_requests", [3])
+async def test_concurrent_requests_are_bounded(twilio, voice_client):
+    """No more than max_concurrent_requests should be in flight at once."""
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return httpx.Response(200, json=CALL_JSON)
+
+    twilio.respond = respond
+    await asyncio.gather(*(voice_client.get_call("CA123") for _ in range(10)))
+
+    assert state["max_in_flight"] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_lookups_build_one_client(monkeypatch):
+    """Threadpool callers racing on first use share one client and pool."""
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "AC123")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "token")
+    monkeypatch.setenv("TWILIO_API_KEY", "SK123")
+    monkeypatch.setenv("TWILIO_API_SECRET", "secret")
+    monkeypatch.setattr(dependencies, "_twilio_client", None)
+    built = []
+
+    def slow_client(*args, **kwargs):
+        time.sleep(0.01)
+        client = Client(*args, **kwargs)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(dependencies, "Client", slow_client)
+
+    clients = []
+
+    def first_request():
+        clients.append(dependencies.get_twilio_client())
+
+    threads = [threading.Thread(target=first_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(client is built[0] for client in clients)
+    await dependencies.close_twilio_client()
+    assert dependencies._twilio_client is None
@@ -0,0 +1,71 @@
+"""Tests for streaming Twilio recording downloads."""
+
+import io
+import tempfile
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.ai.voice_ai.providers.twilio import client as twilio_client
+from src.ai.voice_ai.providers.twilio.client import TwilioVoiceClient
+
+RECORDING = b"ID3" + bytes(range(256)) * 1024
+
+
+@pytest.fixture
+def recording_http_client(monkeypatch):
+    """Serve RECORDING from a mock transport through the shared client."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, content=RECORDING, headers={"content-type": "audio/mpeg"}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(twilio_client, "_recording_http_client", client)
+    yield requests
+    monkeypatch.setattr(twilio_client, "_recording_http_client", None)
+
+
+@pytest.fixture
+def voice_client():
+    sdk_client = MagicMock()
+    sdk_client.username = "AC123"
+    sdk_client.password = "token"
+    return TwilioVoiceClient(sdk_client)
+
+
+@pytest.mark.asyncio
+async def test_download_streams_into_spooled_buffer(
+    recording_http_client, voice_client
+):
+    """Recordings under the spool threshold should never touch disk."""
+
+    with tempfile.SpooledTemporaryFile(max_size=len(RECORDING) + 1) as buffer:
+        size_bytes, content_type = await voice_client.download_recording_to(
+            "https://api.twilio.com/rec.mp3", buffer
+        )
+        buffer.seek(0)
+
+        assert buffer.read() == RECORDING
+        assert isinstance(buffer._file, io.BytesIO)
+
+    assert size_bytes == len(RECORDING)
+    assert content_type == "audio/mpeg"
+
+
+@pytest.mark.asyncio
+async def test_downloads_reuse_the_shared_client(recording_http_client, voice_client):
+    """Every download should go through the one pooled HTTP client."""
+
+    for _ in range(3):
+        await voice_client.download_recording("https://api.twilio.com/rec.mp3")
+
+    assert len(recording_http_client) == 3
+    assert twilio_client.get_recording_http_client() is (
+        twilio_client._recording_http_client
+    )
+    assert recording_http_client[0].headers["authorization"].startswith("Basic ")
@@ -0,0 +1,114 @@
+"""Tests for the shared Vapi call status poller."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.ai.voice_ai.constants import CallStatus, VoiceAIProvider
+from src.ai.voice_ai.providers.vapi.poller import VapiStatusPoller
+from src.ai.voice_ai.schemas import CallResponse
+
+
+@pytest.fixture
+def statuses() -> dict[str, CallStatus]:
+    """Current status of each call, as the provider reports it."""
+    return {}
+
+
+@pytest.fixture
+def provider(statuses):
+    """Mock provider returning the current status from `statuses`."""
+
+    async def get_call_status(call_id: str) -> CallResponse:
+        return CallResponse(
+            call_id=call_id, status=statuses[call_id], provider=VoiceAIProvider.VAPI
+        )
+
+    provider = MagicMock()
+    provider.get_call_status = AsyncMock(side_effect=get_call_status)
+    return provider
+
+
+def mark_due(poller: VapiStatusPoller) -> None:
+    """Make every tracked call due now."""
+    for tracked in poller._calls.values():
+        tracked.next_poll_at = 0
+
+
+@pytest.mark.asyncio
+async def test_sweep_is_capped_by_request_budget(statuses, provider):
+    """A sweep should make no more requests than the budget allows."""
+    statuses.update({f"call-{i}": CallStatus.IN_PROGRESS for i in range(20)})
+    poller = VapiStatusPoller(provider, max_requests_per_second=5)
+    for call_id in statuses:
+        poller.track(call_id)
+    mark_due(poller)
+
+    requests = await poller.poll_once()
+
+    assert requests == 5
+    assert provider.get_call_status.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_below_one_per_second_still_polls(statuses, provider):
+    """A fractional rate spaces requests out rather than never making one."""
+    statuses["call-1"] = CallStatus.IN_PROGRESS
+    poller = VapiStatusPoller(provider, max_requests_per_second=0.5)
+    poller.track("call-1")
+
+    mark_due(poller)
+    assert await poller.poll_once() == 1
+
+    # The spent request takes two seconds to earn back
+    mark_due(poller)
+    assert await poller.poll_once() == 0
+    assert poller._seconds_until_next_sweep() == pytest.approx(2, abs=0.1)
+
+    poller._refilled_at -= 2
+    mark_due(poller)
+    assert await poller.poll_once() == 1
+    assert provider.get_call_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_status_changes_fan_out_and_ended_calls_stop_polling(statuses, provider):
+    """on_change should fire only on changes, and ended calls are untracked."""
+    statuses["call-1"] = CallStatus.IN_PROGRESS
+    on_change = AsyncMock()
+    poller = VapiStatusPoller(provider, on_change=on_change)
+    poller.track("call-1")
+
+    mark_due(poller)
+    await poller.poll_once()
+    mark_due(poller)
+    await poller.poll_once()
+    statuses["call-1"] = CallStatus.ENDED
+    mark_due(poller)
+    await poller.poll_once()
+
+    assert [c.args[0].status for c in on_change.await_args_list] == [
+        CallStatus.IN_PROGRESS,
+        CallStatus.ENDED,
+    ]
+    assert poller.tracked_count == 0
+    assert poller.latest("call-1").status == CallStatus.ENDED
+
+
+def test_poll_interval_slows_down_for_long_calls():
+    """Older calls should be polled less often, up to the cap."""
+    poller = VapiStatusPoller(
+        MagicMock(),
+        min_interval_seconds=3,
+        max_interval_seconds=30,
+        slowdown_after_seconds=120,
+    )
+
+    assert poller.poll_interval(0) == 3
+    assert poller.poll_interval(130) == 6
+    assert poller.poll_interval(3600) == 30
+
+    poller.track("call-1", started_at=datetime.now(UTC) - timedelta(minutes=5))
+    tracked = poller._calls["call-1"]
+    assert tracked.next_poll_at - tracked.started_at > 300
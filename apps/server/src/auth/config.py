@@ -33,6 +33,17 @@ class AuthSettings(BaseSettings):
         description="Cognito domain (hosted UI base URL)",
     )
 
+    # Token verification
+    auth_jwks_cache_seconds: int = Field(
+        default=3600, description="How long to cache the Cognito JWKS document"
+    )
+    auth_token_cache_seconds: int = Field(
+        default=300, description="How long to cache a verified token's session"
+    )
+    auth_token_cache_size: int = Field(
+        default=10_000, description="Maximum number of verified tokens cached"
+    )
+
     # MFA configuration
     auth_mfa_required: bool = Field(default=True, description="Whether MFA is required")
     auth_mfa_methods: str = Field(
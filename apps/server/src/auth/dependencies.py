@@ -15,6 +15,7 @@ from src.auth.provider_factory import get_auth_provider
 from src.auth.service import AuthProvider
 from src.db.database import get_db
 from src.db.users.service import UserService
+from src.utils.timing import span
 
 # Security scheme for JWT tokens (fallback for API clients)
 security = HTTPBearer(auto_error=False)
@@ -70,7 +71,8 @@ async def get_current_session(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    session = await auth_provider.get_session(session_token)
+    with span("auth", "get_session"):
+        session = await auth_provider.get_session(session_token)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -100,14 +102,15 @@ async def get_current_user(
     """
     user = session.user
 
-    # Look up or create user in database to get persistent org assignment
+    # Look up (cached) or create user in database to get persistent org assignment
     user_service = UserService(db)
-    db_user, db_org = await user_service.get_or_create_user(
-        user_id=user.id, email=user.email
-    )
+    with span("db", "UserService.get_organization_id"):
+        organization_id = await user_service.get_organization_id(
+            user_id=user.id, email=user.email
+        )
 
     # Update the user object with the persistent organization_id
-    user.organization_id = db_org.id
+    user.organization_id = organization_id
 
     return user
 
@@ -6,14 +6,19 @@ for authentication, authorization, and user management.
 """
 
 import base64
+import hashlib
+import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import urljoin
 
 import boto3
+import httpx
+import jwt
 import requests
 from botocore.exceptions import ClientError
+from cachetools import TLRUCache, TTLCache
 
 from src.auth import schemas
 from src.auth.config import get_auth_settings
@@ -24,7 +29,9 @@ from src.auth.constants import (
     TimeInSeconds,
 )
 from src.auth.dataclasses import AuthResult, MFASetupResult, SignUpData
+from src.auth.token_verifier import CognitoTokenVerifier
 from src.utils.logger import logger
+from src.utils.single_flight import SingleFlight
 
 
 class AuthProvider(ABC):
@@ -180,6 +187,31 @@ class CognitoAuthProvider(AuthProvider):
         # and region from environment/profile
         self.cognito_client = boto3.client("cognito-idp", region_name=self.region)
 
+        # Tokens are verified locally against the pool's JWKS; userinfo is only
+        # called for claims the token lacks, once per token: concurrent first
+        # requests with the same token share one lookup
+        self.http_client = httpx.AsyncClient(timeout=10.0)
+        self.token_verifier = CognitoTokenVerifier(
+            self.region,
+            self.user_pool_id,
+            self.client_id,
+            jwks_cache_seconds=settings.auth_jwks_cache_seconds,
+            http_client=self.http_client,
+        )
+        # Verified sessions keyed by token hash
+        self._sessions: TTLCache[str, schemas.Session] = TTLCache(
+            maxsize=settings.auth_token_cache_size,
+            ttl=settings.auth_token_cache_seconds,
+        )
+        self._session_loads: SingleFlight[str, schemas.Session | None] = SingleFlight()
+        # Hashes of tokens signed out here, kept until the token expires: the
+        # JWT itself still verifies locally. Other processes only find out on
+        # a cache miss, when userinfo rejects the revoked token.
+        self._signed_out: TLRUCache[str, float] = TLRUCache(
+            maxsize=settings.auth_token_cache_size,
+            ttu=lambda _key, exp, now: now + max(exp - time.time(), 0),
+        )
+
     async def sign_in(self, email: str, password: str) -> AuthResult:
         """Sign in a user with email and password."""
         # Not implemented - using OAuth2 flow instead
@@ -191,7 +223,14 @@ class CognitoAuthProvider(AuthProvider):
         raise NotImplementedError("Use Cognito hosted UI for user registration")
 
     async def sign_out(self, access_token: str) -> bool:
-        """Sign out a user."""
+        """Sign out a user; the token is rejected here until it expires."""
+        cache_key = self._token_cache_key(access_token)
+        self._sessions.pop(cache_key, None)
+        try:
+            claims = jwt.decode(access_token, options={"verify_signature": False})
+            self._signed_out[cache_key] = float(claims["exp"])
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+            pass  # Not a token get_session would accept anyway
         try:
             self.cognito_client.global_sign_out(AccessToken=access_token)
             return True
@@ -199,38 +238,65 @@ class CognitoAuthProvider(AuthProvider):
             return False
 
     async def get_session(self, access_token: str) -> schemas.Session | None:
-        """Get session information from access token."""
+        """
+        Get session information from access token.
+
+        The token is verified locally (signature, expiry, issuer, client);
+        verified sessions are cached until the token expires or the cache TTL
+        passes, whichever comes first. Tokens signed out through this provider
+        are rejected until they expire.
+        """
+        cache_key = self._token_cache_key(access_token)
+        if cache_key in self._signed_out:
+            return None
+        session = self._sessions.get(cache_key)
+        if session and session.expires_at > datetime.now(UTC):
+            return session
+
+        return await self._session_loads.run(
+            cache_key, lambda: self._load_session(access_token, cache_key)
+        )
+
+    async def _load_session(
+        self, access_token: str, cache_key: str
+    ) -> schemas.Session | None:
+        """Verify a token, fetch missing profile claims and cache the session."""
         try:
-            # Get user info from userinfo endpoint
-            user_info_url = urljoin(
-                self.cognito_domain, OAuthEndpoints.USERINFO_ENDPOINT
-            )
-            user_info_response = requests.get(
-                user_info_url,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            user_info_response.raise_for_status()
-            user_info = user_info_response.json()
+            claims = await self.token_verifier.verify(access_token)
+        except jwt.InvalidTokenError as e:
+            logger.debug("Rejected access token", error=str(e))
+            return None
+        except (httpx.HTTPError, jwt.PyJWKSetError, ValueError) as e:
+            logger.error("Failed to fetch Cognito JWKS", error=str(e))
+            return None
 
-            user = await self._create_user_from_userinfo_response(user_info)
-            if not user:
+        user_info = claims
+        if not claims.get("email"):
+            # Access tokens carry no profile attributes
+            try:
+                user_info = {**claims, **await self._fetch_user_info(access_token)}
+            except (httpx.HTTPError, ValueError) as e:
+                # ValueError covers a userinfo body that isn't JSON
+                logger.warning("Failed to fetch Cognito user info", error=str(e))
                 return None
 
-            # Create session object
-            # Note: We don't have refresh token here, so this is a limited session
-            session = schemas.Session(
-                user=user,
-                access_token=access_token,
-                refresh_token="",  # Not available in this context
-                expires_at=datetime.now(UTC)
-                + timedelta(seconds=TimeInSeconds.ONE_HOUR),
-                id_token=None,
-            )
-
-            return session
+        user = await self._create_user_from_userinfo_response(user_info)
+        if not user:
+            return None
 
-        except (requests.exceptions.RequestException, ClientError):
+        # Note: We don't have refresh token here, so this is a limited session
+        session = schemas.Session(
+            user=user,
+            access_token=access_token,
+            refresh_token="",  # Not available in this context
+            expires_at=datetime.fromtimestamp(claims["exp"], UTC),
+            id_token=None,
+        )
+        if cache_key in self._signed_out:
+            # Signed out while this lookup was in flight
             return None
+        self._sessions[cache_key] = session
+        return session
 
     async def refresh_session(
         self, refresh_token: str, email: str | None = None
@@ -470,6 +536,20 @@ class CognitoAuthProvider(AuthProvider):
 
     # Helper methods
 
+    @staticmethod
+    def _token_cache_key(access_token: str) -> str:
+        """Hash a token so raw tokens aren't used as cache keys."""
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
+    async def _fetch_user_info(self, access_token: str) -> dict[str, Any]:
+        """Fetch the token owner's attributes from the userinfo endpoint."""
+        response = await self.http_client.get(
+            urljoin(self.cognito_domain, OAuthEndpoints.USERINFO_ENDPOINT),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        response.raise_for_status()
+        return response.json()
+
     def _calculate_secret_hash(self, username: str) -> str:
         """Calculate the secret hash for Cognito API calls."""
         if not self.client_secret:
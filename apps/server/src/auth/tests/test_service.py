@@ -0,0 +1,86 @@
+"""Tests for Cognito session lookup."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import jwt
+import pytest
+
+from src.auth.service import CognitoAuthProvider
+
+
+@pytest.fixture
+def provider(monkeypatch) -> CognitoAuthProvider:
+    settings = SimpleNamespace(
+        aws_region="us-east-1",
+        cognito_user_pool_id="us-east-1_pool",
+        cognito_client_id="client-123",
+        cognito_client_secret=None,
+        cognito_domain="https://auth.example.com",
+        oauth_redirect_uri="https://app.example.com/callback",
+        auth_jwks_cache_seconds=3600,
+        auth_token_cache_seconds=300,
+        auth_token_cache_size=100,
+    )
+    monkeypatch.setattr("src.auth.service.get_auth_settings", lambda: settings)
+    return CognitoAuthProvider()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_requests_share_one_userinfo_call(provider):
+    userinfo_calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal userinfo_calls
+        userinfo_calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"sub": "user-1", "email": "user@example.com"})
+
+    provider.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # Access tokens carry no email, so the session needs userinfo
+    provider.token_verifier.verify = AsyncMock(
+        return_value={"sub": "user-1", "exp": int(time.time()) + 3600}
+    )
+
+    sessions = await asyncio.gather(*(provider.get_session("token") for _ in range(5)))
+
+    assert all(session.user.email == "user@example.com" for session in sessions)
+    assert userinfo_calls == 1
+    assert provider.token_verifier.verify.await_count == 1
+
+    # Later requests are served from the session cache
+    await provider.get_session("token")
+    assert userinfo_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_non_json_userinfo_returns_no_session(provider):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<html>bad gateway</html>")
+
+    provider.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider.token_verifier.verify = AsyncMock(
+        return_value={"sub": "user-1", "exp": int(time.time()) + 3600}
+    )
+
+    assert await provider.get_session("token") is None
+
+
+@pytest.mark.asyncio
+async def test_signed_out_token_is_rejected_until_it_expires(provider):
+    exp = int(time.time()) + 3600
+    provider.token_verifier.verify = AsyncMock(
+        return_value={"sub": "user-1", "email": "user@example.com", "exp": exp}
+    )
+    provider.cognito_client = MagicMock()
+    token = jwt.encode({"sub": "user-1", "exp": exp}, "s" * 32, algorithm="HS256")
+    assert await provider.get_session(token) is not None
+
+    assert await provider.sign_out(token)
+
+    # The JWT still verifies locally, so only the sign-out record rejects it
+    assert await provider.get_session(token) is None
+    provider.cognito_client.global_sign_out.assert_called_once_with(AccessToken=token)
@@ -0,0 +1,167 @@
+"""Tests for local Cognito token verification."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.auth.token_verifier import CognitoTokenVerifier
+
+REGION = "us-east-1"
+POOL_ID = "us-east-1_pool"
+CLIENT_ID = "client-123"
+ISSUER = f"https://cognito-idp.{REGION}.amazonaws.com/{POOL_ID}"
+
+
+def public_jwk(private_key: rsa.RSAPrivateKey, kid: str) -> dict:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    return {**jwk, "kid": kid, "alg": "RS256", "use": "sig"}
+
+
+def sign_token(private_key, kid: str, **overrides) -> str:
+    claims = {
+        "sub": "user-1",
+        "iss": ISSUER,
+        "token_use": "access",
+        "client_id": CLIENT_ID,
+        "exp": int(time.time()) + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+class JWKSServer:
+    """Serves a mutable JWKS document and counts fetches."""
+
+    def __init__(self, *jwks: dict):
+        self.keys = list(jwks)
+        self.fetches = 0
+        self.down = False
+        self.garbled = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url == f"{ISSUER}/.well-known/jwks.json"
+        self.fetches += 1
+        if self.down:
+            return httpx.Response(503)
+        if self.garbled:
+            return httpx.Response(200, text="<html>maintenance</html>")
+        return httpx.Response(200, json={"keys": self.keys})
+
+
+@pytest.fixture
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def other_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def server(private_key):
+    """JWKS endpoint publishing private_key as kid k1."""
+    return JWKSServer(public_jwk(private_key, "k1"))
+
+
+@pytest.fixture
+def verifier(server):
+    return CognitoTokenVerifier(
+        REGION,
+        POOL_ID,
+        CLIENT_ID,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_verifies_tokens_with_one_jwks_fetch(private_key, server, verifier):
+    for _ in range(3):
+        claims = await verifier.verify(sign_token(private_key, "k1"))
+        assert claims["sub"] == "user-1"
+
+    id_token = sign_token(
+        private_key, "k1", token_use="id", client_id=None, aud=CLIENT_ID
+    )
+    assert (await verifier.verify(id_token))["token_use"] == "id"
+    assert server.fetches == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"client_id": "other-client"},
+        {"iss": "https://cognito-idp.us-east-1.amazonaws.com/other_pool"},
+        {"exp": int(time.time()) - 10},
+        {"token_use": "refresh"},
+    ],
+)
+async def test_rejects_invalid_tokens(private_key, verifier, overrides):
+    with pytest.raises(jwt.InvalidTokenError):
+        await verifier.verify(sign_token(private_key, "k1", **overrides))
+
+
+@pytest.mark.asyncio
+async def test_rejects_token_signed_by_another_key(other_key, verifier):
+    with pytest.raises(jwt.InvalidTokenError):
+        await verifier.verify(sign_token(other_key, "k1"))
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refreshes_jwks_at_most_once_per_interval(
+    monkeypatch, private_key, other_key, server, verifier
+):
+    await verifier.verify(sign_token(private_key, "k1"))
+
+    # Cognito rotated keys; tokens with the new kid trigger a refetch
+    server.keys.append(public_jwk(other_key, "new"))
+    monkeypatch.setattr("src.auth.token_verifier.MIN_REFRESH_INTERVAL_SECONDS", 0)
+    assert (await verifier.verify(sign_token(other_key, "new")))["sub"] == "user-1"
+    assert server.fetches == 2
+
+    # Within the refresh interval, unknown kids are rejected without a fetch
+    monkeypatch.setattr("src.auth.token_verifier.MIN_REFRESH_INTERVAL_SECONDS", 60)
+    with pytest.raises(jwt.InvalidTokenError):
+        await verifier.verify(sign_token(other_key, "bogus"))
+    assert server.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_jwks_refresh_failure_backs_off(private_key, server, verifier):
+    await verifier.verify(sign_token(private_key, "k1"))
+
+    # Two hours later the cached JWKS is stale and Cognito is down: requests
+    # keep verifying with the cached keys and one refresh is attempted
+    verifier._fetched_at -= 7200
+    verifier._attempted_at -= 7200
+    server.down = True
+    for _ in range(5):
+        assert (await verifier.verify(sign_token(private_key, "k1")))["sub"]
+        await asyncio.sleep(0)
+    assert server.fetches == 2
+
+    # The failed attempt counts towards the interval, unknown kids included
+    with pytest.raises(jwt.InvalidTokenError):
+        await verifier.verify(sign_token(private_key, "unknown"))
+    assert server.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_non_json_jwks_response_rejects_unknown_kid(
+    monkeypatch, private_key, server, verifier
+):
+    await verifier.verify(sign_token(private_key, "k1"))
+
+    # A 200 that isn't JSON is a failed refresh, not an unexpected error
+    server.garbled = True
+    monkeypatch.setattr("src.auth.token_verifier.MIN_REFRESH_INTERVAL_SECONDS", 0)
+    with pytest.raises(jwt.InvalidTokenError):
+        await verifier.verify(sign_token(private_key, "unknown"))
+    assert server.fetches == 2
+    assert (await verifier.verify(sign_token(private_key, "k1")))["sub"] == "user-1"
@@ -0,0 +1,162 @@
+"""
+Local verification of Cognito JWTs.
+
+Tokens are verified in-process against the user pool's JWKS: signature, exp,
+iss, token_use, and the app client (client_id for access tokens, aud for ID
+tokens). The JWKS document is fetched once and cached; a token signed with
+an unknown key ID triggers a refresh, so Cognito key rotation is picked up
+without a restart. Once the cached JWKS is stale it is refreshed in the
+background while requests keep verifying against the keys already held, and
+refresh attempts (successful or not) are at least a minute apart, so a slow
+or unreachable Cognito never holds up requests signed by known keys.
+"""
+
+import time
+from collections.abc import Awaitable
+from typing import Any
+
+import httpx
+import jwt
+
+from src.utils.logger import logger
+from src.utils.single_flight import SingleFlight
+
+# Cognito signs user pool tokens with RS256
+ALGORITHMS = ["RS256"]
+
+# Single-flight key of the JWKS refresh (there is one document per pool)
+_JWKS = "jwks"
+
+# Minimum seconds between JWKS refresh attempts, so tokens with a bogus kid
+# can't make us hammer Cognito and a failed refresh backs off
+MIN_REFRESH_INTERVAL_SECONDS = 60
+
+
+class CognitoTokenVerifier:
+    """Verifies Cognito access and ID tokens against a cached JWKS."""
+
+    def __init__(
+        self,
+        region: str,
+        user_pool_id: str,
+        client_id: str,
+        jwks_cache_seconds: int = 3600,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            region: AWS region of the user pool
+            user_pool_id: Cognito user pool ID
+            client_id: App client ID tokens must have been issued to
+            jwks_cache_seconds: How long to use the JWKS before refetching it
+            http_client: Optional HTTP client (for tests)
+        """
+        self.issuer = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
+        self.jwks_url = f"{self.issuer}/.well-known/jwks.json"
+        self.client_id = client_id
+        self.jwks_cache_seconds = jwks_cache_seconds
+        self.http_client = http_client or httpx.AsyncClient(timeout=10.0)
+
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._refreshes: SingleFlight[str, None] = SingleFlight()
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """
+        Verify a token and return its claims.
+
+        Args:
+            token: Cognito access or ID token
+
+        Returns:
+            dict: The verified claims
+
+        Raises:
+            jwt.InvalidTokenError: If the token is malformed, expired, signed
+                by an unknown key, or issued for another pool or client
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            raise jwt.InvalidTokenError("Token has no key ID")
+        key = await self._get_key(kid)
+
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=ALGORITHMS,
+            issuer=self.issuer,
+            # Access tokens carry client_id instead of aud; checked below
+            options={"verify_aud": False, "require": ["exp", "iss", "sub"]},
+        )
+
+        token_use = claims.get("token_use")
+        if token_use == "access":
+            audience = claims.get("client_id")
+        elif token_use == "id":
+            audience = claims.get("aud")
+        else:
+            raise jwt.InvalidTokenError(f"Unexpected token_use: {token_use}")
+        if audience != self.client_id:
+            raise jwt.InvalidTokenError("Token was issued to another client")
+
+        return claims
+
+    async def _get_key(self, kid: str) -> jwt.PyJWK:
+        """Get the signing key for a key ID, refreshing the JWKS if needed."""
+        key = self._keys.get(kid)
+        if key is not None:
+            # Known key: never wait on Cognito, refresh behind the request
+            if self._is_stale() and self._can_refresh():
+                self._start_refresh()
+            return key
+
+        if _JWKS in self._refreshes or self._can_refresh():
+            await self._refreshes.run(_JWKS, self._begin_refresh)
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
+    def _is_stale(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at > self.jwks_cache_seconds
+        )
+
+    def _can_refresh(self) -> bool:
+        # With no keys yet there is nothing to fall back on; retry every time
+        return (
+            not self._keys
+            or self._attempted_at is None
+            or time.monotonic() - self._attempted_at > MIN_REFRESH_INTERVAL_SECONDS
+        )
+
+    def _start_refresh(self) -> None:
+        """Start a JWKS refresh in the background, unless one is in flight."""
+        self._refreshes.start(_JWKS, self._begin_refresh)
+
+    def _begin_refresh(self) -> Awaitable[None]:
+        """Count the attempt towards the refresh interval and start it."""
+        self._attempted_at = time.monotonic()
+        return self._refresh()
+
+    async def _refresh(self) -> None:
+        """Fetch the pool's JWKS and replace the cached keys."""
+        try:
+            response = await self.http_client.get(self.jwks_url)
+            response.raise_for_status()
+            jwks = jwt.PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, jwt.PyJWKSetError, ValueError) as e:
+            # ValueError covers a response body that isn't JSON
+            if not self._keys:
+                raise
+            # Keep verifying with the keys we have; retried after the interval
+            logger.warning("[Auth] Failed to refresh Cognito JWKS", error=str(e))
+            return
+        self._keys = {key.key_id: key for key in jwks.keys if key.key_id}
+        self._fetched_at = time.monotonic()
+        logger.info("[Auth] Refreshed Cognito JWKS", key_count=len(self._keys))
@@ -0,0 +1,6 @@
+"""Post-call pipeline job queue models and repository."""
+
+from src.db.call_jobs.model import CallJob
+from src.db.call_jobs.repository import CallJobRepository
+
+__all__ = ["CallJob", "CallJobRepository"]
@@ -0,0 +1,23 @@
+"""Constants for the post-call pipeline job queue."""
+
+from enum import StrEnum
+
+# Postgres NOTIFY channel workers LISTEN on for jobs that became due early
+CALL_JOBS_CHANNEL = "call_jobs"
+
+
+class CallJobStage(StrEnum):
+    """Post-call pipeline stages, run in this order for each call."""
+
+    MONITOR_CALL = "monitor_call"
+    ANALYZE_RECORDING = "analyze_recording"
+    WRITE_CRM_NOTE = "write_crm_note"
+
+
+class CallJobStatus(StrEnum):
+    """Lifecycle of a queued job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
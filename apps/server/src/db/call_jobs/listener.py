@@ -0,0 +1,82 @@
+"""
+Postgres LISTEN for call pipeline job wakeups.
+
+Webhooks pull jobs forward with CallJobRepository.wake(), which issues a
+NOTIFY on CALL_JOBS_CHANNEL. Every worker holds one connection listening on
+that channel so it claims the job immediately instead of at its next poll.
+The same listener serves other channels, e.g. bulk dials waiting on
+CALL_ENDED_CHANNEL.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from src.db.call_jobs.constants import CALL_JOBS_CHANNEL
+from src.db.database import get_async_engine
+from src.utils.logger import logger
+
+# How often to check the listening connection is still alive
+HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+# Delay before reconnecting after the listening connection fails
+RECONNECT_DELAY_SECONDS = 5
+
+
+class CallJobListener:
+    """Holds a LISTEN connection and calls on_notify for each notification."""
+
+    def __init__(
+        self, on_notify: Callable[[str], None], channel: str = CALL_JOBS_CHANNEL
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            on_notify: Called with the notification payload (the call ID)
+            channel: Channel to listen on
+        """
+        self.on_notify = on_notify
+        self.channel = channel
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Listen until stop is set, reconnecting if the connection drops.
+
+        Args:
+            stop: Event that ends the listener
+        """
+        while not stop.is_set():
+            try:
+                await self._listen(stop)
+            except Exception as e:
+                logger.warning(
+                    "[CallJobListener] Listen connection failed, reconnecting",
+                    error=str(e),
+                )
+                try:
+                    await asyncio.wait_for(stop.wait(), RECONNECT_DELAY_SECONDS)
+                except TimeoutError:
+                    pass
+
+    async def _listen(self, stop: asyncio.Event) -> None:
+        """Listen on one connection until stop is set or the connection fails."""
+        async with get_async_engine().connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(self.channel, self._callback)
+            logger.info("[CallJobListener] Listening", channel=self.channel)
+            try:
+                while not stop.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            stop.wait(), HEALTH_CHECK_INTERVAL_SECONDS
+                        )
+                    except TimeoutError:
+                        # Raises if the connection died, triggering a reconnect
+                        await driver_connection.execute("SELECT 1")
+            finally:
+                await driver_connection.remove_listener(self.channel, self._callback)
+
+    def _callback(self, connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg notification callback."""
+        self.on_notify(payload)
@@ -0,0 +1,99 @@
+"""
+SQLAlchemy model for post-call pipeline jobs.
+
+Each row is one stage of the post-call pipeline (monitor, analyze, write to
+CRM) for one call. Workers claim due rows with SELECT ... FOR UPDATE SKIP
+LOCKED and hold a time-limited lease while they run them.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.call_jobs.constants import CallJobStatus
+from src.db.database import Base
+
+
+class CallJob(Base):
+    """Durable, leased unit of post-call work."""
+
+    __tablename__ = "call_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    idempotency_key: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        unique=True,
+        comment="Deduplication key, one job per call and stage",
+    )
+    call_id: Mapped[str] = mapped_column(
+        String(255), nullable=False, index=True, comment="Provider call ID"
+    )
+    stage: Mapped[str] = mapped_column(
+        String(50), nullable=False, comment="Pipeline stage to run"
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=CallJobStatus.PENDING.value,
+        comment="pending, running, succeeded or failed",
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON, nullable=False, comment="Stage input (call request, user, organization)"
+    )
+
+    # Retry state
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Number of failed runs so far"
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Failed runs allowed before giving up"
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text, nullable=True, comment="Error from the most recent failed run"
+    )
+
+    # Scheduling and leasing
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment="Earliest time the job may run",
+    )
+    locked_by: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="Worker currently holding the lease"
+    )
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the lease lapses and another worker may reclaim the job",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment="Record creation timestamp",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        comment="Record last update timestamp",
+    )
+
+    __table_args__ = (
+        # Claim query: due pending jobs and running jobs with lapsed leases
+        Index("idx_call_jobs_status_run_at", "status", "run_at"),
+        Index("idx_call_jobs_status_lease", "status", "lease_expires_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CallJob(id={self.id}, call_id={self.call_id}, stage={self.stage}, "
+            f"status={self.status}, attempts={self.attempts})>"
+        )
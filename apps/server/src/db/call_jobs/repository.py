@@ -0,0 +1,308 @@
+"""
+Repository for the post-call pipeline job queue.
+
+Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED so any number of
+workers can poll the same table without blocking each other or running the
+same job twice. A claimed job carries a lease; if its worker dies, the lease
+lapses and another worker reclaims the job.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.call_jobs.constants import (
+    CALL_JOBS_CHANNEL,
+    CallJobStage,
+    CallJobStatus,
+)
+from src.db.call_jobs.model import CallJob
+from src.utils.logger import logger
+
+
+class CallJobRepository:
+    """Repository for enqueuing, claiming and settling call pipeline jobs."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    @staticmethod
+    def idempotency_key(call_id: str, stage: CallJobStage) -> str:
+        """Build the deduplication key for a call's pipeline stage."""
+        return f"{call_id}:{stage.value}"
+
+    async def enqueue(
+        self,
+        call_id: str,
+        stage: CallJobStage,
+        payload: dict[str, Any],
+        max_attempts: int,
+        run_at: datetime | None = None,
+    ) -> bool:
+        """
+        Enqueue a pipeline stage for a call, once.
+
+        Enqueuing the same call and stage again is a no-op, so retries and
+        duplicate webhooks can't schedule the same work twice.
+
+        Args:
+            call_id: Provider call ID
+            stage: Pipeline stage to run
+            payload: Stage input
+            max_attempts: Failed runs allowed before the job is marked failed
+            run_at: Earliest time to run (defaults to now)
+
+        Returns:
+            bool: True if a new job was created, False if it already existed
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            insert(CallJob)
+            .values(
+                idempotency_key=self.idempotency_key(call_id, stage),
+                call_id=call_id,
+                stage=stage.value,
+                status=CallJobStatus.PENDING.value,
+                payload=payload,
+                attempts=0,
+                max_attempts=max_attempts,
+                run_at=run_at or now,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+        )
+        result = await self.session.execute(stmt)
+        created = result.rowcount > 0
+
+        logger.info(
+            "[CallJobRepository] Enqueued job"
+            if created
+            else "[CallJobRepository] Job already enqueued",
+            call_id=call_id,
+            stage=stage.value,
+        )
+        return created
+
+    async def wake(self, call_id: str, stage: CallJobStage) -> bool:
+        """
+        Make a call's pending stage due now and notify listening workers.
+
+        Used by webhooks that know a stage can make progress (e.g. the call
+        ended or its recording is ready). The notification is delivered when
+        the caller commits.
+
+        Args:
+            call_id: Provider call ID
+            stage: Pipeline stage to wake
+
+        Returns:
+            bool: True if a waiting job was pulled forward
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            update(CallJob)
+            .where(CallJob.idempotency_key == self.idempotency_key(call_id, stage))
+            .where(CallJob.status == CallJobStatus.PENDING.value)
+            .where(CallJob.run_at > now)
+            .values(run_at=now, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount == 0:
+            return False
+
+        await self.session.execute(select(func.pg_notify(CALL_JOBS_CHANNEL, call_id)))
+        logger.debug(
+            "[CallJobRepository] Woke job",
+            call_id=call_id,
+            stage=stage.value,
+        )
+        return True
+
+    async def claim_due(
+        self, worker_id: str, limit: int, lease_seconds: int
+    ) -> list[CallJob]:
+        """
+        Claim up to `limit` due jobs for a worker.
+
+        Claims pending jobs whose run_at has passed and running jobs whose
+        lease has lapsed (their worker died). Rows locked by another worker's
+        in-progress claim are skipped rather than waited on.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of jobs to claim
+            lease_seconds: How long the worker may hold each job
+
+        Returns:
+            list[CallJob]: Claimed jobs, now in running status
+        """
+        now = datetime.now(UTC)
+        due = (
+            select(CallJob.id)
+            .where(
+                or_(
+                    and_(
+                        CallJob.status == CallJobStatus.PENDING.value,
+                        CallJob.run_at <= now,
+                    ),
+                    and_(
+                        CallJob.status == CallJobStatus.RUNNING.value,
+                        CallJob.lease_expires_at < now,
+                    ),
+                )
+            )
+            .order_by(CallJob.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(CallJob)
+            .where(CallJob.id.in_(due.scalar_subquery()))
+            .values(
+                status=CallJobStatus.RUNNING.value,
+                locked_by=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=CallJob.attempts + 1,
+                updated_at=now,
+            )
+            .returning(CallJob)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        jobs = list(result.scalars().all())
+
+        if jobs:
+            logger.debug(
+                "[CallJobRepository] Claimed jobs",
+                worker_id=worker_id,
+                count=len(jobs),
+            )
+        return jobs
+
+    async def extend_lease(
+        self, job_id: int, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """
+        Extend the lease on a job the worker still holds.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+            lease_seconds: New lease length from now
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        now = datetime.now(UTC)
+        return await self._settle(
+            job_id,
+            worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=now,
+        )
+
+    async def complete(self, job_id: int, worker_id: str) -> bool:
+        """
+        Mark a job as succeeded.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        return await self._settle(
+            job_id,
+            worker_id,
+            status=CallJobStatus.SUCCEEDED.value,
+            locked_by=None,
+            lease_expires_at=None,
+            last_error=None,
+            updated_at=datetime.now(UTC),
+        )
+
+    async def reschedule(self, job_id: int, worker_id: str, run_at: datetime) -> bool:
+        """
+        Release a job to run again later without counting a failed attempt.
+
+        Used by stages that are waiting on something external (e.g. the call
+        hasn't ended yet).
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+            run_at: When the job should next run
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        return await self._settle(
+            job_id,
+            worker_id,
+            status=CallJobStatus.PENDING.value,
+            locked_by=None,
+            lease_expires_at=None,
+            attempts=CallJob.attempts - 1,
+            run_at=run_at,
+            updated_at=datetime.now(UTC),
+        )
+
+    async def fail(
+        self, job_id: int, worker_id: str, error: str, retry_at: datetime | None
+    ) -> bool:
+        """
+        Record a failed run, scheduling a retry or giving up.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease
+            error: Error message from the run
+            retry_at: When to retry, or None to mark the job failed
+
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        values: dict[str, Any] = {
+            "locked_by": None,
+            "lease_expires_at": None,
+            "last_error": error,
+            "updated_at": datetime.now(UTC),
+        }
+        if retry_at is None:
+            values["status"] = CallJobStatus.FAILED.value
+        else:
+            values["status"] = CallJobStatus.PENDING.value
+            values["run_at"] = retry_at
+        return await self._settle(job_id, worker_id, **values)
+
+    async def _settle(self, job_id: int, worker_id: str, **values: Any) -> bool:
+        """Update a running job only if this worker still holds its lease."""
+        stmt = (
+            update(CallJob)
+            .where(CallJob.id == job_id)
+            .where(CallJob.status == CallJobStatus.RUNNING.value)
+            .where(CallJob.locked_by == worker_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount == 0:
+            logger.warning(
+                "[CallJobRepository] Lost lease on job",
+                job_id=job_id,
+                worker_id=worker_id,
+            )
+            return False
+        return True
@@ -0,0 +1,98 @@
+"""
+Unit tests for CallJobRepository.
+
+Checks the SQL the queue relies on for safe concurrent workers, using mocked
+async sessions.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.call_jobs.constants import CallJobStage
+from src.db.call_jobs.repository import CallJobRepository
+
+
+def compiled_sql(mock_session) -> str:
+    """SQL of the statement passed to the last session.execute call."""
+    stmt = mock_session.execute.await_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock async session whose statements affect one row."""
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.rowcount = 1
+    result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def repository(mock_session):
+    """Create a CallJobRepository with mocked session."""
+    return CallJobRepository(mock_session)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_per_call_and_stage(repository, mock_session):
+    """Enqueue should insert with ON CONFLICT DO NOTHING on the idempotency key."""
+    created = await repository.enqueue(
+        call_id="CA123",
+        stage=CallJobStage.MONITOR_CALL,
+        payload={"user_id": "user-1"},
+        max_attempts=5,
+    )
+
+    assert created is True
+    sql = compiled_sql(mock_session)
+    assert "ON CONFLICT (idempotency_key) DO NOTHING" in sql
+    params = mock_session.execute.await_args.args[0].compile().params
+    assert params["idempotency_key"] == "CA123:monitor_call"
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_rows_locked_by_other_workers(repository, mock_session):
+    """Claiming should lock due rows with SKIP LOCKED and lease them."""
+    await repository.claim_due("worker-1", limit=5, lease_seconds=60)
+
+    sql = compiled_sql(mock_session)
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "lease_expires_at" in sql
+
+
+@pytest.mark.asyncio
+async def test_settling_requires_holding_the_lease(repository, mock_session):
+    """A worker that lost its lease must not be able to settle the job."""
+    mock_session.execute.return_value.rowcount = 0
+
+    completed = await repository.complete(job_id=1, worker_id="worker-1")
+    rescheduled = await repository.reschedule(
+        job_id=1, worker_id="worker-1", run_at=datetime.now(UTC)
+    )
+
+    assert completed is False
+    assert rescheduled is False
+    assert "call_jobs.locked_by" in compiled_sql(mock_session)
+
+
+@pytest.mark.asyncio
+async def test_wake_notifies_workers_only_when_a_job_moved(repository, mock_session):
+    """Wake should NOTIFY workers only if a waiting job was pulled forward."""
+    woke = await repository.wake("CA123", CallJobStage.ANALYZE_RECORDING)
+
+    assert woke is True
+    assert "pg_notify" in compiled_sql(mock_session)
+
+    mock_session.execute.reset_mock()
+    mock_session.execute.return_value.rowcount = 0
+
+    woke = await repository.wake("CA123", CallJobStage.ANALYZE_RECORDING)
+
+    assert woke is False
+    assert mock_session.execute.await_count == 1
@@ -0,0 +1,6 @@
+"""Call list database models and repository."""
+
+from src.db.call_list.model import CallListItem
+from src.db.call_list.repository import CallListRepository
+
+__all__ = ["CallListItem", "CallListRepository"]
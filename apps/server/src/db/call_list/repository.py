@@ -6,8 +6,8 @@ Provides CRUD operations for CallListItem records using SQLAlchemy async session
 
 from datetime import UTC, datetime
 
-from sqlalchemy import delete, desc, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Integer, String, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.call_list.model import CallListItem
@@ -49,49 +49,52 @@ class CallListRepository:
             )
             return []
 
-        # Get current max position for this user
+        # Drop repeats, then read the current max position and which of these
+        # projects are already listed in one query, so only new items take
+        # positions and appended items stay contiguous
+        unique_ids = list(dict.fromkeys(project_ids))
+        stmt = select(
+            func.max(CallListItem.position),
+            func.array_agg(CallListItem.project_id).filter(
+                CallListItem.project_id.in_(unique_ids)
+            ),
+        ).where(CallListItem.user_id == user_id)
+        result = await self.session.execute(stmt)
+        max_position, existing_ids = result.one()
+        next_position = 0 if max_position is None else max_position + 1
+        existing = set(existing_ids or ())
+        new_ids = [
+            project_id for project_id in unique_ids if project_id not in existing
+        ]
+        if not new_ids:
+            logger.info(
+                f"[CallListRepository] Added 0/{len(project_ids)} items to call list for user {user_id}"
+            )
+            return []
+
+        # One INSERT for the new projects; a row added concurrently for the
+        # same (user_id, project_id) is still skipped by the unique constraint
+        now = datetime.now(UTC)
         stmt = (
-            select(CallListItem.position)
-            .where(CallListItem.user_id == user_id)
-            .order_by(desc(CallListItem.position))
-            .limit(1)
+            insert(CallListItem)
+            .values(
+                [
+                    {
+                        "user_id": user_id,
+                        "project_id": project_id,
+                        "call_completed": False,
+                        "position": next_position + i,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for i, project_id in enumerate(new_ids)
+                ]
+            )
+            .on_conflict_do_nothing(constraint="uq_user_project")
+            .returning(CallListItem)
         )
         result = await self.session.execute(stmt)
-        max_position = result.scalar_one_or_none()
-        next_position = (max_position or -1) + 1
-
-        created_items = []
-        for i, project_id in enumerate(project_ids):
-            # Create a savepoint for this item
-            # This allows us to rollback just this item if it's a duplicate,
-            # without affecting items added before it
-            nested = await self.session.begin_nested()
-
-            try:
-                item = CallListItem(
-                    user_id=user_id,
-                    project_id=project_id,
-                    call_completed=False,
-                    position=next_position + i,
-                )
-                self.session.add(item)
-                await self.session.flush()  # Get the ID without committing
-                await self.session.refresh(item)
-                created_items.append(item)
-
-                logger.debug(
-                    f"[CallListRepository] Added item: id={item.id}, user_id={user_id}, project_id={project_id}"
-                )
-
-                # Commit the nested transaction (savepoint)
-                await nested.commit()
-
-            except IntegrityError:
-                # Duplicate (user_id, project_id) - rollback just this item
-                await nested.rollback()
-                logger.debug(
-                    f"[CallListRepository] Skipped duplicate project {project_id} for user {user_id}"
-                )
+        created_items = sorted(result.scalars().all(), key=lambda item: item.position)
 
         logger.info(
             f"[CallListRepository] Added {len(created_items)}/{len(project_ids)} items to call list for user {user_id}"
@@ -190,33 +193,53 @@ class CallListRepository:
         Raises:
             ValueError: If project_id_order contains IDs not in the user's call list
         """
-        # Get all current items
-        current_items = await self.get_call_list(user_id)
-        current_project_ids = {item.project_id for item in current_items}
-
-        # Validate that all provided IDs exist in the call list
-        provided_project_ids = set(project_id_order)
-        if not provided_project_ids.issubset(current_project_ids):
-            invalid_ids = provided_project_ids - current_project_ids
-            raise ValueError(
-                f"Cannot reorder: project IDs not in call list: {invalid_ids}"
+        # Later duplicates would race for the same row; keep the first position
+        project_id_order = list(dict.fromkeys(project_id_order))
+        if not project_id_order:
+            return await self.get_call_list(user_id)
+
+        # Rewrite every position in one statement. The guard makes it a no-op
+        # unless every ID is in the list, so a bad request changes nothing.
+        new_positions = (
+            func.unnest(
+                bindparam("project_ids", project_id_order, type_=ARRAY(String)),
+                bindparam(
+                    "positions",
+                    list(range(len(project_id_order))),
+                    type_=ARRAY(Integer),
+                ),
             )
+            .table_valued("project_id", "position")
+            .render_derived(name="new_positions")
+        )
+        listed_count = (
+            select(func.count())
+            .select_from(CallListItem)
+            .where(CallListItem.user_id == user_id)
+            .where(CallListItem.project_id.in_(project_id_order))
+            .scalar_subquery()
+        )
+        stmt = (
+            update(CallListItem)
+            .where(CallListItem.user_id == user_id)
+            .where(CallListItem.project_id == new_positions.c.project_id)
+            .where(listed_count == len(project_id_order))
+            .values(position=new_positions.c.position, updated_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
 
-        # Update positions
-        for new_position, project_id in enumerate(project_id_order):
-            stmt = (
-                select(CallListItem)
+        if result.rowcount != len(project_id_order):
+            listed_stmt = (
+                select(CallListItem.project_id)
                 .where(CallListItem.user_id == user_id)
-                .where(CallListItem.project_id == project_id)
+                .where(CallListItem.project_id.in_(project_id_order))
+            )
+            listed = set((await self.session.execute(listed_stmt)).scalars().all())
+            invalid_ids = set(project_id_order) - listed
+            raise ValueError(
+                f"Cannot reorder: project IDs not in call list: {invalid_ids}"
             )
-            result = await self.session.execute(stmt)
-            item = result.scalar_one_or_none()
-
-            if item:
-                item.position = new_position
-                item.updated_at = datetime.now(UTC)
-
-        await self.session.flush()
 
         # Return updated list
         updated_items = await self.get_call_list(user_id)
@@ -0,0 +1,111 @@
+"""
+Unit tests for CallListRepository.
+
+Checks that reordering and bulk adds are set-based, using mocked async
+sessions.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.call_list.repository import CallListRepository
+
+
+def compiled(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock async session whose statements affect `rowcount` rows."""
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.rowcount = 0
+    result.scalar_one_or_none.return_value = None
+    result.one.return_value = (None, None)
+    result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def repository(mock_session):
+    """Create a CallListRepository with mocked session."""
+    return CallListRepository(mock_session)
+
+
+@pytest.mark.asyncio
+async def test_reorder_200_items_is_one_update(repository, mock_session):
+    """A 200-item reorder should rewrite positions in a single UPDATE."""
+    order = [f"project-{i}" for i in range(200)]
+    mock_session.execute.return_value.rowcount = 200
+
+    await repository.reorder_items("user-1", order)
+
+    # One UPDATE, then one SELECT to return the reordered list
+    assert mock_session.execute.await_count == 2
+    update_stmt = mock_session.execute.await_args_list[0].args[0]
+    sql = str(compiled(update_stmt))
+    assert sql.startswith("UPDATE call_list_items SET position=new_positions.position")
+    assert "FROM unnest(" in sql
+    params = compiled(update_stmt).params
+    assert params["project_ids"] == order
+    assert params["positions"] == list(range(200))
+
+
+@pytest.mark.asyncio
+async def test_reorder_with_unknown_ids_raises(repository, mock_session):
+    """The guarded UPDATE matches nothing when an ID isn't in the list."""
+    mock_session.execute.return_value.rowcount = 0
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [
+        "project-1"
+    ]
+
+    with pytest.raises(ValueError, match="project-2"):
+        await repository.reorder_items("user-1", ["project-1", "project-2"])
+
+
+@pytest.mark.asyncio
+async def test_add_items_is_one_insert_with_positions(repository, mock_session):
+    """New items should be inserted together after the current last position."""
+    mock_session.execute.return_value.one.return_value = (4, None)
+
+    await repository.add_items("user-1", ["a", "b", "c"])
+
+    assert mock_session.execute.await_count == 2
+    insert_stmt = mock_session.execute.await_args_list[1].args[0]
+    sql = str(compiled(insert_stmt))
+    assert "ON CONFLICT ON CONSTRAINT uq_user_project DO NOTHING" in sql
+    assert "RETURNING" in sql
+    positions = [
+        value
+        for name, value in compiled(insert_stmt).params.items()
+        if name.startswith("position")
+    ]
+    assert sorted(positions) == [5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_add_items_skips_repeats_and_listed_ids(repository, mock_session):
+    """Only new, distinct IDs take positions, so appended items stay contiguous."""
+    mock_session.execute.return_value.one.return_value = (4, ["b"])
+
+    await repository.add_items("user-1", ["a", "b", "a", "c"])
+
+    insert_stmt = mock_session.execute.await_args_list[1].args[0]
+    params = compiled(insert_stmt).params
+    project_ids = [v for k, v in params.items() if k.startswith("project_id")]
+    positions = [v for k, v in params.items() if k.startswith("position")]
+    assert sorted(zip(positions, project_ids)) == [(5, "a"), (6, "c")]
+
+
+@pytest.mark.asyncio
+async def test_add_items_already_listed_skips_insert(repository, mock_session):
+    """Nothing is inserted when every ID is already in the list."""
+    mock_session.execute.return_value.one.return_value = (1, ["a", "b"])
+
+    assert await repository.add_items("user-1", ["a", "b"]) == []
+    assert mock_session.execute.await_count == 1
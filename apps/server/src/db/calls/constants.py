@@ -0,0 +1,5 @@
+"""Constants for call records."""
+
+# Postgres NOTIFY channel carrying the call ID whenever a call's stored status
+# becomes final; bulk dials LISTEN on it to free their slot for the next call
+CALL_ENDED_CHANNEL = "call_ended"
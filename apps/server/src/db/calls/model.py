@@ -39,6 +39,12 @@ class Call(Base):
     call_id: Mapped[str] = mapped_column(
         String(255), nullable=False, unique=True, index=True, comment="Provider call ID"
     )
+    customer_call_sid: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        index=True,
+        comment="Twilio customer leg call SID (bridged calls only)",
+    )
 
     # Call metadata
     provider: Mapped[str] = mapped_column(
@@ -76,6 +82,11 @@ class Call(Base):
     ended_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, comment="Call end timestamp"
     )
+    crm_note_written_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the call's results note was claimed for the CRM",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -138,6 +149,7 @@ class Call(Base):
             "user_id": self.user_id,
             "project_id": self.project_id,
             "call_id": self.call_id,
+            "customer_call_sid": self.customer_call_sid,
             "provider": self.provider,
             "status": self.status,
             "phone_number": self.phone_number,
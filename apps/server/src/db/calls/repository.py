@@ -7,14 +7,17 @@ Provides CRUD operations for Call records using SQLAlchemy async sessions.
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import desc, select, text, update
+from sqlalchemy import desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ai.voice_ai.constants import CallStatus, VoiceAIProvider
+from src.db.calls.constants import CALL_ENDED_CHANNEL
 from src.db.calls.model import Call
 from src.utils.logger import logger
+from src.utils.timing import instrumented
 
 
+@instrumented("db")
 class CallRepository:
     """Repository for managing call records in the database."""
 
@@ -127,26 +130,54 @@ class CallRepository:
         self, customer_call_sid: str
     ) -> Call | None:
         """
-        Get a call by customer call SID stored in provider_data.
+        Get a call by its Twilio customer leg call SID.
 
-        This is used for Twilio calls where the customer call SID is stored
-        in provider_data after the browser-to-customer bridge is established.
+        This is used for Twilio calls, where status and recording webhooks for
+        the customer leg carry the customer call SID rather than the call ID.
+        The lookup uses the indexed customer_call_sid column.
 
         Args:
-            customer_call_sid: Twilio customer call SID from provider_data
+            customer_call_sid: Twilio customer call SID
 
         Returns:
             Call | None: Call record if found, None otherwise
         """
-        # Use PostgreSQL's ->> operator to extract JSON field as text
-        stmt = (
-            select(Call)
-            .where(text("provider_data->>'customer_call_sid' = :call_sid"))
-            .params(call_sid=customer_call_sid)
-        )
+        stmt = select(Call).where(Call.customer_call_sid == customer_call_sid)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def set_customer_call_sid(self, call: Call, customer_call_sid: str) -> Call:
+        """
+        Record the customer leg of a bridged Twilio call.
+
+        Stored in the indexed customer_call_sid column for webhook lookups,
+        and in provider_data for readers that still look there.
+
+        Args:
+            call: Call record for the browser leg
+            customer_call_sid: Twilio call SID of the customer leg
+
+        Returns:
+            Call: Updated call record
+        """
+        call.customer_call_sid = customer_call_sid
+        # Assign a new dict so SQLAlchemy detects the JSON change
+        call.provider_data = {
+            **(call.provider_data or {}),
+            "customer_call_sid": customer_call_sid,
+        }
+        call.updated_at = datetime.now(UTC)
+
+        await self.session.flush()
+        await self.session.refresh(call)
+
+        logger.info(
+            "[CallRepository] Set customer call SID",
+            call_id=call.call_id,
+            customer_call_sid=customer_call_sid,
+        )
+        return call
+
     async def update_call_status(
         self,
         call_id: str,
@@ -199,6 +230,8 @@ class CallRepository:
 
         await self.session.flush()
         await self.session.refresh(call)
+        if CallStatus.is_call_ended(status):
+            await self._notify_ended(call_id)
 
         logger.info(
             "[CallRepository] Updated call status",
@@ -270,6 +303,8 @@ class CallRepository:
 
         await self.session.flush()
         await self.session.refresh(call)
+        if CallStatus.is_call_ended(final_status):
+            await self._notify_ended(call_id)
 
         logger.info(
             "[CallRepository] Ended call",
@@ -396,3 +431,46 @@ class CallRepository:
             call_id=call_id,
         )
         return call
+
+    async def claim_crm_note(self, call_id: str) -> bool:
+        """
+        Claim the right to add the call's results note to the CRM.
+
+        The claim is a conditional UPDATE, so of any number of concurrent
+        writers exactly one gets it.
+
+        Args:
+            call_id: Provider call ID
+
+        Returns:
+            bool: True if this caller claimed the note, False if it was already
+            claimed (and so written or being written)
+        """
+        stmt = (
+            update(Call)
+            .where(Call.call_id == call_id)
+            .where(Call.crm_note_written_at.is_(None))
+            .values(crm_note_written_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+    async def release_crm_note(self, call_id: str) -> None:
+        """
+        Give up a claim on the call's CRM note after the CRM rejected it.
+
+        Args:
+            call_id: Provider call ID
+        """
+        stmt = (
+            update(Call)
+            .where(Call.call_id == call_id)
+            .values(crm_note_written_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def _notify_ended(self, call_id: str) -> None:
+        """NOTIFY listeners that a call ended; delivered when the caller commits."""
+        await self.session.execute(select(func.pg_notify(CALL_ENDED_CHANNEL, call_id)))
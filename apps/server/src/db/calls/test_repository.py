@@ -130,6 +130,43 @@ async def test_get_call_by_call_id(repository, mock_session, sample_call):
     mock_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_call_by_customer_call_sid_uses_column(
+    repository, mock_session, sample_call
+):
+    """Test that customer leg lookups filter on the indexed column, not JSON."""
+    # Setup
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_call
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    # Execute
+    result = await repository.get_call_by_customer_call_sid("CA-customer")
+
+    # Assert
+    assert result == sample_call
+    sql = str(mock_session.execute.call_args.args[0])
+    assert "calls.customer_call_sid = " in sql
+    assert "provider_data" not in sql.split("WHERE")[1]
+
+
+@pytest.mark.asyncio
+async def test_set_customer_call_sid(repository, mock_session, sample_call):
+    """Test that the customer call SID is stored in the column and provider_data."""
+    # Setup
+    mock_session.flush = AsyncMock()
+    mock_session.refresh = AsyncMock()
+
+    # Execute
+    result = await repository.set_customer_call_sid(sample_call, "CA-customer")
+
+    # Assert
+    assert result.customer_call_sid == "CA-customer"
+    assert result.provider_data["customer_call_sid"] == "CA-customer"
+    assert result.provider_data["monitor"] == {"listen_url": "wss://vapi.ai/listen/123"}
+    mock_session.flush.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_update_call_status(repository, mock_session, sample_call):
     """Test updating call status."""
@@ -173,6 +210,24 @@ async def test_update_call_status_not_found(repository, mock_session):
     assert result is None
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "notified"), [(CallStatus.ENDED, True), (CallStatus.RINGING, False)]
+)
+async def test_update_call_status_notifies_when_call_ends(
+    repository, mock_session, sample_call, status, notified
+):
+    """Bulk dials waiting on the call are notified once its status is final."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_call
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await repository.update_call_status(call_id="vapi-call-456", status=status)
+
+    statements = [str(c.args[0]) for c in mock_session.execute.await_args_list]
+    assert any("pg_notify" in sql for sql in statements) is notified
+
+
 @pytest.mark.asyncio
 async def test_end_call(repository, mock_session, sample_call):
     """Test marking call as ended."""
@@ -0,0 +1,35 @@
+"""
+In-process cache of user → organization membership.
+
+Every authenticated request resolves the caller's organization, and the
+mapping almost never changes, so resolved IDs are kept here for a few
+minutes. Deleting an organization invalidates its members once the delete
+commits; other processes pick the change up when their entries expire.
+"""
+
+from cachetools import TTLCache
+
+# In-memory TTL cache: 10000 users max, 5 min TTL (300 seconds)
+_organization_ids: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=300)
+
+
+def get_cached_organization_id(user_id: str) -> str | None:
+    """Get a user's cached organization ID, if present and fresh."""
+    return _organization_ids.get(user_id)
+
+
+def cache_organization_id(user_id: str, organization_id: str) -> None:
+    """Remember a user's organization ID."""
+    _organization_ids[user_id] = organization_id
+
+
+def invalidate_organization(organization_id: str) -> None:
+    """Forget every user cached as a member of an organization."""
+    for user_id, cached_id in list(_organization_ids.items()):
+        if cached_id == organization_id:
+            _organization_ids.pop(user_id, None)
+
+
+def clear() -> None:
+    """Forget all cached memberships."""
+    _organization_ids.clear()
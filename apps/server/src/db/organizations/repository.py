@@ -1,8 +1,9 @@
 """Repository for organization database operations."""
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.organizations import membership_cache
 from src.db.organizations.model import Organization as OrganizationModel
 from src.db.organizations.schemas import OrganizationCreate, OrganizationUpdate
 
@@ -90,6 +91,16 @@ class OrganizationRepository:
 
         await self.session.delete(org)
         await self.session.flush()
+
+        # Members are deleted with the organization. Forget them only once the
+        # delete commits: invalidating earlier lets a concurrent request
+        # re-cache a membership that still exists until then.
+        event.listen(
+            self.session.sync_session,
+            "after_commit",
+            lambda _session: membership_cache.invalidate_organization(org_id),
+            once=True,
+        )
         return True
 
     async def list_all(
@@ -0,0 +1,50 @@
+"""
+Unit tests for OrganizationRepository.
+
+Uses a mocked async session around a real sync session, so commit events fire.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db.organizations import membership_cache
+from src.db.organizations.model import Organization
+from src.db.organizations.repository import OrganizationRepository
+
+
+@pytest.fixture(autouse=True)
+def clear_membership_cache():
+    membership_cache.clear()
+    yield
+    membership_cache.clear()
+
+
+@pytest.fixture
+def sync_session():
+    return Session()
+
+
+@pytest.fixture
+def repository(sync_session):
+    session = MagicMock(sync_session=sync_session)
+    session.delete = AsyncMock()
+    session.flush = AsyncMock()
+    repository = OrganizationRepository(session)
+    repository.get_by_id = AsyncMock(return_value=Organization(id="org-1", name="Acme"))
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_members_only_after_commit(repository, sync_session):
+    """A request before the commit may still re-cache the membership."""
+    membership_cache.cache_organization_id("user-1", "org-1")
+    membership_cache.cache_organization_id("user-2", "org-2")
+
+    assert await repository.delete("org-1")
+    assert membership_cache.get_cached_organization_id("user-1") == "org-1"
+
+    sync_session.commit()
+    assert membership_cache.get_cached_organization_id("user-1") is None
+    assert membership_cache.get_cached_organization_id("user-2") == "org-2"
@@ -0,0 +1,6 @@
+"""Scheduled group database models and repository."""
+
+from src.db.scheduled_groups.model import ScheduledGroup, ScheduledGroupMember
+from src.db.scheduled_groups.repository import ScheduledGroupsRepository
+
+__all__ = ["ScheduledGroup", "ScheduledGroupMember", "ScheduledGroupsRepository"]
@@ -55,6 +55,36 @@ class ScheduledGroup(Base):
     time_of_day: Mapped[time] = mapped_column(
         SQLTime, nullable=False, comment="Time of day to make calls"
     )
+    timezone: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="IANA timezone time_of_day is in (groups without one aren't scheduled)",
+    )
+    next_run_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Next scheduled run (null while inactive)",
+    )
+    last_run_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the scheduler last fired the group",
+    )
+
+    # In-progress run, leased by the scheduler dialing it
+    run_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the in-progress run started (null between runs)",
+    )
+    run_locked_by: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="Scheduler currently running the group"
+    )
+    run_lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the run's lease lapses and another scheduler may resume it",
+    )
 
     # Goal configuration
     goal_type: Mapped[str] = mapped_column(
@@ -105,6 +135,18 @@ class ScheduledGroup(Base):
     __table_args__ = (
         # Find all groups for a user
         Index("idx_scheduled_groups_user_active", "user_id", "is_active"),
+        # Scheduler's due-group lookup, over active groups only
+        Index(
+            "idx_scheduled_groups_next_run",
+            "next_run_at",
+            postgresql_where="is_active = true",
+        ),
+        # Scheduler's lookup of interrupted runs to resume
+        Index(
+            "idx_scheduled_groups_run_lease",
+            "run_lease_expires_at",
+            postgresql_where="run_locked_by IS NOT NULL",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -126,6 +168,12 @@ class ScheduledGroup(Base):
             "name": self.name,
             "frequency": self.frequency,
             "time_of_day": self.time_of_day.isoformat() if self.time_of_day else None,
+            "timezone": self.timezone,
+            "next_run_at": self.next_run_at.isoformat() if self.next_run_at else None,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "run_started_at": (
+                self.run_started_at.isoformat() if self.run_started_at else None
+            ),
             "goal_type": self.goal_type,
             "goal_description": self.goal_description,
             "who_to_call": self.who_to_call,
@@ -176,6 +224,11 @@ class ScheduledGroupMember(Base):
         nullable=True,
         comment="Timestamp when goal was completed",
     )
+    last_dialed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When a scheduled run last dialed the project",
+    )
 
     # Timestamps
     added_at: Mapped[datetime] = mapped_column(
@@ -219,5 +272,8 @@ class ScheduledGroupMember(Base):
             "goal_completed_at": (
                 self.goal_completed_at.isoformat() if self.goal_completed_at else None
             ),
+            "last_dialed_at": (
+                self.last_dialed_at.isoformat() if self.last_dialed_at else None
+            ),
             "added_at": self.added_at.isoformat() if self.added_at else None,
         }
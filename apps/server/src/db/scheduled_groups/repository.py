@@ -4,12 +4,15 @@ Repository for scheduled groups database operations.
 Provides CRUD operations for ScheduledGroup and ScheduledGroupMember records using SQLAlchemy async sessions.
 """
 
-from datetime import UTC, datetime, time
+from datetime import UTC, datetime, time, timedelta
+from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.scheduled_groups.model import ScheduledGroup, ScheduledGroupMember
+from src.db.scheduled_groups.schedule import next_run_after
 from src.utils.logger import logger
 
 
@@ -34,6 +37,7 @@ class ScheduledGroupsRepository:
         goal_type: str,
         goal_description: str | None,
         who_to_call: str,
+        timezone: str,
     ) -> ScheduledGroup:
         """
         Create a new scheduled group.
@@ -46,6 +50,7 @@ class ScheduledGroupsRepository:
             goal_type: Type of goal
             goal_description: Optional goal description
             who_to_call: Who to call
+            timezone: IANA timezone time_of_day is in
 
         Returns:
             ScheduledGroup: Created group
@@ -55,6 +60,7 @@ class ScheduledGroupsRepository:
             name=name,
             frequency=frequency,
             time_of_day=time_of_day,
+            timezone=timezone,
             goal_type=goal_type,
             goal_description=goal_description,
             who_to_call=who_to_call,
@@ -129,6 +135,43 @@ class ScheduledGroupsRepository:
         )
         return groups
 
+    async def list_user_groups_with_member_counts(
+        self, user_id: str
+    ) -> list[tuple[ScheduledGroup, int]]:
+        """
+        List all scheduled groups for a user with their member counts.
+
+        Counts come from a correlated COUNT per group, so listing costs a
+        single round trip and only this user's members are counted (each
+        count is an index scan on uq_group_project's leading group_id).
+
+        Args:
+            user_id: Cognito user ID
+
+        Returns:
+            list[tuple[ScheduledGroup, int]]: Groups (newest first) and member counts
+        """
+        member_count = (
+            select(func.count(ScheduledGroupMember.id))
+            .where(ScheduledGroupMember.group_id == ScheduledGroup.id)
+            .correlate(ScheduledGroup)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(ScheduledGroup, member_count)
+            .where(ScheduledGroup.user_id == user_id)
+            .order_by(ScheduledGroup.created_at.desc())
+        )
+        result = await self.session.execute(stmt)
+        groups = [(group, member_count) for group, member_count in result.all()]
+
+        logger.debug(
+            "[ScheduledGroupsRepository] Retrieved groups for user",
+            count=len(groups),
+            user_id=user_id,
+        )
+        return groups
+
     async def update_group(
         self,
         group_id: int,
@@ -139,6 +182,7 @@ class ScheduledGroupsRepository:
         goal_type: str | None = None,
         goal_description: str | None = None,
         who_to_call: str | None = None,
+        timezone: str | None = None,
     ) -> ScheduledGroup | None:
         """
         Update a scheduled group.
@@ -152,6 +196,7 @@ class ScheduledGroupsRepository:
             goal_type: Optional new goal type
             goal_description: Optional new goal description
             who_to_call: Optional new who_to_call
+            timezone: Optional new timezone
 
         Returns:
             ScheduledGroup | None: Updated group if found, None otherwise
@@ -172,7 +217,11 @@ class ScheduledGroupsRepository:
             group.goal_description = goal_description
         if who_to_call is not None:
             group.who_to_call = who_to_call
+        if timezone is not None:
+            group.timezone = timezone
 
+        if frequency is not None or time_of_day is not None or timezone is not None:
+            self._reschedule(group)
         group.updated_at = datetime.now(UTC)
         await self.session.flush()
         await self.session.refresh(group)
@@ -228,6 +277,13 @@ class ScheduledGroupsRepository:
             return None
 
         group.is_active = is_active
+        self._reschedule(group)
+        if not is_active:
+            # Releasing the run stops it: its scheduler's heartbeat finds the
+            # lease gone and cancels the dial
+            group.run_started_at = None
+            group.run_locked_by = None
+            group.run_lease_expires_at = None
         group.updated_at = datetime.now(UTC)
         await self.session.flush()
         await self.session.refresh(group)
@@ -240,6 +296,214 @@ class ScheduledGroupsRepository:
         )
         return group
 
+    async def claim_due_groups(
+        self,
+        worker_id: str,
+        limit: int,
+        catch_up_seconds: float,
+        lease_seconds: int,
+    ) -> list[ScheduledGroup]:
+        """
+        Claim up to `limit` active groups with a run to start or resume.
+
+        A group is claimed when its next run is due, or when its in-progress
+        run's lease has lapsed (its scheduler stopped mid-run, e.g. across a
+        deploy). Claiming leases the run to `worker_id`; a new run also
+        advances next_run_at past now in the same transaction, so once the
+        caller commits no other scheduler can fire the same run. Rows another
+        scheduler is claiming are skipped rather than waited on. Missed runs
+        fire once if they're within `catch_up_seconds`; older ones are
+        skipped.
+
+        Args:
+            worker_id: Scheduler taking the lease
+            limit: Maximum number of groups to claim
+            catch_up_seconds: How late a run may be and still fire
+            lease_seconds: Lease length from now
+
+        Returns:
+            list[ScheduledGroup]: Groups to run now, with run_started_at set
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            select(ScheduledGroup)
+            .where(ScheduledGroup.is_active == True)  # noqa: E712
+            .where(
+                or_(
+                    and_(
+                        ScheduledGroup.run_locked_by.is_(None),
+                        ScheduledGroup.next_run_at <= now,
+                    ),
+                    and_(
+                        ScheduledGroup.run_locked_by.is_not(None),
+                        ScheduledGroup.run_lease_expires_at <= now,
+                    ),
+                )
+            )
+            # Interrupted runs first, then the most overdue
+            .order_by(
+                ScheduledGroup.run_lease_expires_at.asc().nulls_last(),
+                ScheduledGroup.next_run_at,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+
+        claimed = []
+        for group in result.scalars().all():
+            if group.run_locked_by is not None:
+                logger.info(
+                    "[ScheduledGroupsRepository] Resuming interrupted run",
+                    group_id=group.id,
+                    run_started_at=group.run_started_at.isoformat(),
+                )
+            elif now - group.next_run_at <= timedelta(seconds=catch_up_seconds):
+                group.run_started_at = now
+                group.last_run_at = now
+                self._reschedule(group, after=now)
+            else:
+                logger.warning(
+                    "[ScheduledGroupsRepository] Skipping missed run",
+                    group_id=group.id,
+                    scheduled_for=group.next_run_at.isoformat(),
+                )
+                self._reschedule(group, after=now)
+                continue
+            group.run_locked_by = worker_id
+            group.run_lease_expires_at = now + timedelta(seconds=lease_seconds)
+            claimed.append(group)
+        await self.session.flush()
+
+        if claimed:
+            logger.info(
+                "[ScheduledGroupsRepository] Claimed due groups",
+                group_ids=[group.id for group in claimed],
+            )
+        return claimed
+
+    async def extend_run_lease(
+        self, group_id: int, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """
+        Extend the lease on a group run the scheduler still holds.
+
+        Args:
+            group_id: Group ID
+            worker_id: Scheduler holding the lease
+            lease_seconds: New lease length from now
+
+        Returns:
+            bool: False if the scheduler no longer holds the run
+        """
+        return await self._settle_run(
+            group_id,
+            worker_id,
+            run_lease_expires_at=datetime.now(UTC) + timedelta(seconds=lease_seconds),
+        )
+
+    async def finish_run(self, group_id: int, worker_id: str) -> bool:
+        """
+        Clear a finished group run so the group waits for its next one.
+
+        Args:
+            group_id: Group ID
+            worker_id: Scheduler holding the lease
+
+        Returns:
+            bool: False if the scheduler no longer holds the run
+        """
+        return await self._settle_run(
+            group_id,
+            worker_id,
+            run_started_at=None,
+            run_locked_by=None,
+            run_lease_expires_at=None,
+        )
+
+    async def _settle_run(self, group_id: int, worker_id: str, **values: Any) -> bool:
+        """Update a group run only if this scheduler still holds its lease."""
+        stmt = (
+            update(ScheduledGroup)
+            .where(ScheduledGroup.id == group_id)
+            .where(ScheduledGroup.run_locked_by == worker_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+    async def mark_member_dialed(self, group_id: int, project_id: str) -> None:
+        """
+        Record that a run has dialed (or skipped) a member.
+
+        A resumed run only dials members not dialed since it started.
+
+        Args:
+            group_id: Group ID
+            project_id: Project/job ID
+        """
+        stmt = (
+            update(ScheduledGroupMember)
+            .where(
+                ScheduledGroupMember.group_id == group_id,
+                ScheduledGroupMember.project_id == project_id,
+            )
+            .values(last_dialed_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def get_next_run_at(self) -> datetime | None:
+        """
+        Get the earliest next run across all active groups.
+
+        Returns:
+            datetime | None: Earliest next_run_at, or None if nothing is scheduled
+        """
+        stmt = select(func.min(ScheduledGroup.next_run_at)).where(
+            ScheduledGroup.is_active == True  # noqa: E712
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def schedule_unscheduled_groups(self) -> int:
+        """
+        Give a next run to active groups that don't have one.
+
+        Covers groups activated before next_run_at existed; groups without a
+        timezone stay unscheduled until their owner sets one.
+
+        Returns:
+            int: Number of groups scheduled
+        """
+        stmt = (
+            select(ScheduledGroup)
+            .where(ScheduledGroup.is_active == True)  # noqa: E712
+            .where(ScheduledGroup.next_run_at.is_(None))
+            .where(ScheduledGroup.timezone.is_not(None))
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        groups = list(result.scalars().all())
+        for group in groups:
+            self._reschedule(group)
+        await self.session.flush()
+        return len(groups)
+
+    def _reschedule(self, group: ScheduledGroup, after: datetime | None = None) -> None:
+        """Set the group's next run from its schedule (none while inactive)."""
+        group.next_run_at = (
+            next_run_after(
+                group.frequency,
+                group.time_of_day,
+                group.timezone,
+                after or datetime.now(UTC),
+            )
+            if group.is_active and group.timezone is not None
+            else None
+        )
+
     async def add_members(
         self, group_id: int, user_id: str, project_ids: list[str]
     ) -> list[ScheduledGroupMember]:
@@ -268,45 +532,27 @@ class ScheduledGroupsRepository:
             )
             return []
 
-        # Check for existing members to avoid duplicates
-        existing_stmt = (
-            select(ScheduledGroupMember.project_id)
-            .where(ScheduledGroupMember.group_id == group_id)
-            .where(ScheduledGroupMember.project_id.in_(project_ids))
-        )
-        existing_result = await self.session.execute(existing_stmt)
-        existing_project_ids = {row[0] for row in existing_result.all()}
-
-        created_members = []
-        for project_id in project_ids:
-            # Skip if already exists
-            if project_id in existing_project_ids:
-                logger.debug(
-                    "[ScheduledGroupsRepository] Skipped duplicate project",
-                    project_id=project_id,
-                    group_id=group_id,
-                )
-                continue
-
-            member = ScheduledGroupMember(
-                group_id=group_id,
-                project_id=project_id,
-                goal_completed=False,
-            )
-            self.session.add(member)
-            created_members.append(member)
-
-            logger.debug(
-                "[ScheduledGroupsRepository] Added member",
-                group_id=group_id,
-                project_id=project_id,
+        # One INSERT for every project; rows that already exist are skipped by
+        # the unique constraint and only the new ones come back
+        now = datetime.now(UTC)
+        stmt = (
+            insert(ScheduledGroupMember)
+            .values(
+                [
+                    {
+                        "group_id": group_id,
+                        "project_id": project_id,
+                        "goal_completed": False,
+                        "added_at": now,
+                    }
+                    for project_id in dict.fromkeys(project_ids)
+                ]
             )
-
-        # Flush to get IDs for all members
-        if created_members:
-            await self.session.flush()
-            for member in created_members:
-                await self.session.refresh(member)
+            .on_conflict_do_nothing(constraint="uq_group_project")
+            .returning(ScheduledGroupMember)
+        )
+        result = await self.session.execute(stmt)
+        created_members = list(result.scalars().all())
 
         logger.info(
             "[ScheduledGroupsRepository] Added members to group",
@@ -13,10 +13,16 @@ from src.db.scheduled_groups.schemas import (
 
 
 async def build_group_response(
-    group, repository: ScheduledGroupsRepository
+    group, repository: ScheduledGroupsRepository, member_count: int | None = None
 ) -> ScheduledGroupResponse:
-    """Build a ScheduledGroupResponse from a ScheduledGroup model."""
-    member_count = await repository.get_member_count(group.id)
+    """
+    Build a ScheduledGroupResponse from a ScheduledGroup model.
+
+    Pass member_count when it's already known (e.g. from a listing query) to
+    skip the per-group count query.
+    """
+    if member_count is None:
+        member_count = await repository.get_member_count(group.id)
 
     return ScheduledGroupResponse(
         id=group.id,
@@ -24,10 +30,12 @@ async def build_group_response(
         name=group.name,
         frequency=group.frequency,
         time_of_day=group.time_of_day.strftime("%H:%M:%S"),
+        timezone=group.timezone,
         goal_type=group.goal_type,
         goal_description=group.goal_description,
         who_to_call=group.who_to_call,
         is_active=group.is_active,
+        next_run_at=group.next_run_at,
         member_count=member_count,
         created_at=group.created_at,
         updated_at=group.updated_at,
@@ -42,10 +50,12 @@ async def build_detail_response(group, members) -> ScheduledGroupDetailResponse:
         name=group.name,
         frequency=group.frequency,
         time_of_day=group.time_of_day.strftime("%H:%M:%S"),
+        timezone=group.timezone,
         goal_type=group.goal_type,
         goal_description=group.goal_description,
         who_to_call=group.who_to_call,
         is_active=group.is_active,
+        next_run_at=group.next_run_at,
         members=[
             ScheduledGroupMemberResponse(
                 id=member.id,
@@ -18,6 +18,7 @@ from src.db.scheduled_groups.response_builders import (
     build_detail_response,
     build_group_response,
 )
+from src.db.scheduled_groups.schedule import is_valid_timezone
 from src.db.scheduled_groups.schemas import (
     AddProjectsToGroupRequest,
     CreateScheduledGroupRequest,
@@ -51,6 +52,11 @@ async def create_scheduled_group(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="goal_description is required when goal_type is user_specified",
         )
+    if not is_valid_timezone(request.timezone):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Unknown timezone: {request.timezone}",
+        )
 
     group = await repository.create_group(
         user_id=current_user.id,
@@ -60,6 +66,7 @@ async def create_scheduled_group(
         goal_type=request.goal_type.value,
         goal_description=request.goal_description,
         who_to_call=request.who_to_call.value,
+        timezone=request.timezone,
     )
 
     await repository.session.commit()
@@ -74,10 +81,11 @@ async def list_scheduled_groups(
     repository: ScheduledGroupsRepository = Depends(get_scheduled_groups_repository),
 ) -> ScheduledGroupsListResponse:
     """List all scheduled groups for the user."""
-    groups = await repository.list_user_groups(current_user.id)
+    groups = await repository.list_user_groups_with_member_counts(current_user.id)
 
     group_responses = [
-        await build_group_response(group, repository) for group in groups
+        await build_group_response(group, repository, member_count)
+        for group, member_count in groups
     ]
 
     return ScheduledGroupsListResponse(
@@ -137,6 +145,21 @@ async def update_scheduled_group(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="goal_description is required when goal_type is user_specified",
         )
+    # A new schedule is only meaningful with the timezone it's meant in
+    schedule_changed = request.frequency is not None or request.time_of_day is not None
+    if request.timezone is None and (schedule_changed or group.timezone is None):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=(
+                "timezone is required when changing frequency or time_of_day, "
+                "or when the group has no timezone yet"
+            ),
+        )
+    if request.timezone is not None and not is_valid_timezone(request.timezone):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Unknown timezone: {request.timezone}",
+        )
 
     group = await repository.update_group(
         group_id=group_id,
@@ -147,6 +170,7 @@ async def update_scheduled_group(
         goal_type=request.goal_type.value if request.goal_type else None,
         goal_description=request.goal_description,
         who_to_call=request.who_to_call.value if request.who_to_call else None,
+        timezone=request.timezone,
     )
 
     await repository.session.commit()
@@ -182,11 +206,7 @@ async def toggle_group_active(
     repository: ScheduledGroupsRepository = Depends(get_scheduled_groups_repository),
 ) -> ScheduledGroupResponse:
     """Start or stop a scheduled group."""
-    group = await repository.toggle_group_active(
-        group_id=group_id,
-        user_id=current_user.id,
-        is_active=request.is_active,
-    )
+    group = await repository.get_group(group_id, current_user.id)
 
     if not group:
         raise HTTPException(
@@ -194,6 +214,19 @@ async def toggle_group_active(
             detail=f"Scheduled group {group_id} not found",
         )
 
+    # Groups created before timezones were required have none to run in
+    if request.is_active and group.timezone is None:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Set the group's timezone before starting it",
+        )
+
+    group = await repository.toggle_group_active(
+        group_id=group_id,
+        user_id=current_user.id,
+        is_active=request.is_active,
+    )
+
     await repository.session.commit()
 
     return await build_group_response(group, repository)
@@ -0,0 +1,62 @@
+"""
+Run-time calculation for scheduled groups.
+
+A group runs on each day of the week in its `frequency` at `time_of_day`,
+interpreted as wall-clock time in the group's `timezone`.
+"""
+
+from datetime import UTC, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def is_valid_timezone(timezone: str) -> bool:
+    """Check that a name is a known IANA timezone (e.g. 'America/Chicago')."""
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+def next_run_after(
+    frequency: list[str], time_of_day: time, timezone: str, after: datetime
+) -> datetime | None:
+    """
+    Compute a group's first scheduled run strictly after a moment.
+
+    Args:
+        frequency: Days of the week the group runs on (e.g. ['monday'])
+        time_of_day: Local time of day the group runs at
+        timezone: IANA timezone the time of day is in
+        after: Moment to look after (timezone-aware)
+
+    Returns:
+        datetime | None: Next run in UTC, or None if frequency has no valid days
+    """
+    weekdays = {
+        WEEKDAYS.index(day.lower()) for day in frequency if day.lower() in WEEKDAYS
+    }
+    if not weekdays:
+        return None
+
+    zone = ZoneInfo(timezone)
+    local_after = after.astimezone(zone)
+    # Eight days covers the same weekday next week when today's run has passed
+    for offset in range(8):
+        day = local_after.date() + timedelta(days=offset)
+        if day.weekday() not in weekdays:
+            continue
+        candidate = datetime.combine(day, time_of_day.replace(tzinfo=None), tzinfo=zone)
+        if candidate > local_after:
+            return candidate.astimezone(UTC)
+    return None
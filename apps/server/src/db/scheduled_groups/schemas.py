@@ -40,6 +40,9 @@ class CreateScheduledGroupRequest(BaseModel):
         min_length=1,
     )
     time_of_day: time = Field(..., description="Time of day to make calls")
+    timezone: str = Field(
+        ..., description="IANA timezone time_of_day is in (e.g. America/Chicago)"
+    )
     goal_type: GoalType = Field(..., description="Type of goal for this group")
     goal_description: str | None = Field(
         None,
@@ -58,6 +61,13 @@ class UpdateScheduledGroupRequest(BaseModel):
         None, description="Days of week: ['monday', 'tuesday', etc.]", min_length=1
     )
     time_of_day: time | None = Field(None, description="Time of day to make calls")
+    timezone: str | None = Field(
+        None,
+        description=(
+            "IANA timezone time_of_day is in (e.g. America/Chicago); required "
+            "when frequency or time_of_day change, or the group has none yet"
+        ),
+    )
     goal_type: GoalType | None = Field(None, description="Type of goal for this group")
     goal_description: str | None = Field(
         None, description="User-specified goal description"
@@ -104,10 +114,16 @@ class ScheduledGroupResponse(BaseModel):
     name: str = Field(..., description="Group display name")
     frequency: list[str] = Field(..., description="Days of week")
     time_of_day: str = Field(..., description="Time of day (HH:MM:SS format)")
+    timezone: str | None = Field(
+        None, description="IANA timezone time_of_day is in (null until set)"
+    )
     goal_type: str = Field(..., description="Goal type")
     goal_description: str | None = Field(None, description="Goal description")
     who_to_call: str = Field(..., description="Who to call")
     is_active: bool = Field(..., description="Whether the group is active")
+    next_run_at: datetime | None = Field(
+        None, description="Next scheduled run (null while inactive)"
+    )
     member_count: int = Field(..., description="Number of projects in the group")
     created_at: datetime = Field(..., description="When the group was created")
     updated_at: datetime = Field(..., description="When the group was last updated")
@@ -121,10 +137,16 @@ class ScheduledGroupDetailResponse(BaseModel):
     name: str = Field(..., description="Group display name")
     frequency: list[str] = Field(..., description="Days of week")
     time_of_day: str = Field(..., description="Time of day (HH:MM:SS format)")
+    timezone: str | None = Field(
+        None, description="IANA timezone time_of_day is in (null until set)"
+    )
     goal_type: str = Field(..., description="Goal type")
     goal_description: str | None = Field(None, description="Goal description")
     who_to_call: str = Field(..., description="Who to call")
     is_active: bool = Field(..., description="Whether the group is active")
+    next_run_at: datetime | None = Field(
+        None, description="Next scheduled run (null while inactive)"
+    )
     members: list[ScheduledGroupMemberResponse] = Field(
         ..., description="List of group members"
     )
@@ -0,0 +1,161 @@
+"""
+Unit tests for ScheduledGroupsRepository.
+
+Checks that listing and bulk member inserts each take a single statement,
+and how due groups are claimed, using mocked async sessions.
+"""
+
+from datetime import UTC, datetime, time, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.scheduled_groups.model import ScheduledGroup
+from src.db.scheduled_groups.repository import ScheduledGroupsRepository
+from src.db.scheduled_groups.schedule import WEEKDAYS
+
+
+def compiled_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock async session returning no rows."""
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.all.return_value = []
+    result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def repository(mock_session):
+    """Create a ScheduledGroupsRepository with mocked session."""
+    return ScheduledGroupsRepository(mock_session)
+
+
+@pytest.mark.asyncio
+async def test_listing_counts_members_in_the_same_query(repository, mock_session):
+    """Member counts should be correlated to the user's groups, not table-wide."""
+    await repository.list_user_groups_with_member_counts("user-1")
+
+    assert mock_session.execute.await_count == 1
+    sql = compiled_sql(mock_session.execute.await_args.args[0])
+    assert "(SELECT count(scheduled_group_members.id)" in sql
+    assert "WHERE scheduled_group_members.group_id = scheduled_groups.id" in sql
+    assert "GROUP BY" not in sql
+
+
+@pytest.mark.asyncio
+async def test_add_members_is_one_insert(repository, mock_session):
+    """All projects should be inserted in one ON CONFLICT DO NOTHING RETURNING."""
+    repository.get_group = AsyncMock(return_value=MagicMock(id=1))
+    project_ids = [f"project-{i}" for i in range(500)] + ["project-0"]
+
+    await repository.add_members(1, "user-1", project_ids)
+
+    assert mock_session.execute.await_count == 1
+    stmt = mock_session.execute.await_args.args[0]
+    sql = compiled_sql(stmt)
+    assert "ON CONFLICT ON CONSTRAINT uq_group_project DO NOTHING" in sql
+    assert "RETURNING" in sql
+    # Duplicate IDs are dropped; four bound values per row
+    assert len(stmt.compile(dialect=postgresql.dialect()).params) == 500 * 4
+    mock_session.refresh.assert_not_awaited()
+
+
+def weekday_group(group_id: int) -> ScheduledGroup:
+    return ScheduledGroup(
+        id=group_id,
+        user_id="user-1",
+        frequency=list(WEEKDAYS),
+        time_of_day=time(9, 0),
+        timezone="America/Chicago",
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def group():
+    """An active weekday group; tests set its run state."""
+    return weekday_group(1)
+
+
+@pytest.fixture
+def other_group():
+    return weekday_group(2)
+
+
+@pytest.mark.asyncio
+async def test_claim_fires_recent_runs_and_skips_stale_ones(
+    repository, mock_session, group, other_group
+):
+    """Runs within the catch-up window fire once; older ones only reschedule."""
+    now = datetime.now(UTC)
+    recent, stale = group, other_group
+    recent.next_run_at = now - timedelta(minutes=10)
+    stale.next_run_at = now - timedelta(days=2)
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [
+        recent,
+        stale,
+    ]
+
+    claimed = await repository.claim_due_groups(
+        "worker-1", limit=5, catch_up_seconds=3600, lease_seconds=120
+    )
+
+    assert claimed == [recent]
+    assert recent.run_started_at == recent.last_run_at
+    assert recent.run_started_at >= now
+    assert recent.run_locked_by == "worker-1"
+    assert recent.run_lease_expires_at > recent.run_started_at
+    assert stale.run_started_at is None
+    assert stale.run_locked_by is None
+    # Both are advanced to their next run, so neither fires again now
+    assert recent.next_run_at > now
+    assert stale.next_run_at > now
+
+    sql = compiled_sql(mock_session.execute.await_args.args[0])
+    assert "scheduled_groups.run_lease_expires_at <=" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+
+
+@pytest.mark.asyncio
+async def test_claim_resumes_interrupted_run(repository, mock_session, group):
+    """A run whose lease lapsed is re-leased without starting a new run."""
+    now = datetime.now(UTC)
+    started = now - timedelta(minutes=30)
+    next_run_at = now + timedelta(days=1)
+    interrupted = group
+    interrupted.next_run_at = next_run_at
+    interrupted.run_started_at = started
+    interrupted.run_locked_by = "worker-0"
+    interrupted.run_lease_expires_at = now - timedelta(minutes=1)
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [
+        interrupted
+    ]
+
+    claimed = await repository.claim_due_groups(
+        "worker-1", limit=5, catch_up_seconds=3600, lease_seconds=120
+    )
+
+    assert claimed == [interrupted]
+    assert interrupted.run_started_at == started
+    assert interrupted.run_locked_by == "worker-1"
+    assert interrupted.run_lease_expires_at > now
+    assert interrupted.next_run_at == next_run_at
+
+
+@pytest.mark.asyncio
+async def test_finishing_run_requires_holding_its_lease(repository, mock_session):
+    """A scheduler whose lease was taken over can't clear the new owner's run."""
+    mock_session.execute.return_value.rowcount = 0
+
+    assert not await repository.finish_run(1, "worker-1")
+
+    sql = compiled_sql(mock_session.execute.await_args.args[0])
+    assert "scheduled_groups.run_locked_by = %(run_locked_by_1)s" in sql
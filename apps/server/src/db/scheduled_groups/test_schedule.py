@@ -0,0 +1,45 @@
+"""Unit tests for scheduled group run-time calculation."""
+
+from datetime import UTC, datetime, time
+
+from src.db.scheduled_groups.schedule import is_valid_timezone, next_run_after
+
+
+def test_next_run_is_later_today_or_next_matching_day():
+    """Runs pick today if the time hasn't passed, else the next listed weekday."""
+    # Wednesday 2026-10-14, 14:00 UTC
+    after = datetime(2026, 10, 14, 14, 0, tzinfo=UTC)
+
+    assert next_run_after(["wednesday"], time(15, 0), "UTC", after) == datetime(
+        2026, 10, 14, 15, 0, tzinfo=UTC
+    )
+    assert next_run_after(["monday", "wednesday"], time(9, 0), "UTC", after) == (
+        datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+    )
+    # Same weekday, time already passed: a week later
+    assert next_run_after(["wednesday"], time(9, 0), "UTC", after) == datetime(
+        2026, 10, 21, 9, 0, tzinfo=UTC
+    )
+
+
+def test_next_run_uses_local_time_across_dst():
+    """Time of day is wall-clock time in the group's timezone."""
+    # US DST ends Sunday 2026-11-01
+    before_change = datetime(2026, 10, 30, 0, 0, tzinfo=UTC)
+    after_change = datetime(2026, 11, 2, 0, 0, tzinfo=UTC)
+
+    assert next_run_after(
+        ["friday"], time(9, 0), "America/Chicago", before_change
+    ) == datetime(2026, 10, 30, 14, 0, tzinfo=UTC)
+    assert next_run_after(
+        ["monday"], time(9, 0), "America/Chicago", after_change
+    ) == datetime(2026, 11, 2, 15, 0, tzinfo=UTC)
+
+
+def test_invalid_schedule_inputs():
+    """Unknown days give no run; unknown timezones are rejected."""
+    after = datetime(2026, 10, 14, tzinfo=UTC)
+
+    assert next_run_after(["someday"], time(9, 0), "UTC", after) is None
+    assert is_valid_timezone("America/Chicago")
+    assert not is_valid_timezone("Mars/Olympus")
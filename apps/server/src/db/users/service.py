@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.organizations import membership_cache
 from src.db.organizations.model import Organization
 from src.db.organizations.repository import OrganizationRepository
 from src.db.organizations.schemas import OrganizationCreate
@@ -45,18 +46,9 @@ class UserService:
             ValueError: If email is None and user doesn't exist
         """
         # Check if user already exists
-        result = await self.session.execute(select(User).where(User.id == user_id))
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            # User exists, fetch their organization
-            org_result = await self.session.execute(
-                select(Organization).where(
-                    Organization.id == existing_user.organization_id
-                )
-            )
-            org = org_result.scalar_one()
-            return existing_user, org
+        existing = await self._get_user_with_organization(user_id)
+        if existing:
+            return existing
 
         # User doesn't exist, create user and org
         if not email:
@@ -74,18 +66,9 @@ class UserService:
             await self.session.rollback()
 
             # Re-query for the user (should exist now)
-            result = await self.session.execute(select(User).where(User.id == user_id))
-            existing_user = result.scalar_one_or_none()
-
-            if existing_user:
-                # Fetch their organization
-                org_result = await self.session.execute(
-                    select(Organization).where(
-                        Organization.id == existing_user.organization_id
-                    )
-                )
-                org = org_result.scalar_one()
-                return existing_user, org
+            existing = await self._get_user_with_organization(user_id)
+            if existing:
+                return existing
             else:
                 # User still doesn't exist - something else went wrong
                 logger.error(
@@ -93,6 +76,52 @@ class UserService:
                 )
                 raise
 
+    async def get_organization_id(self, user_id: str, email: str | None = None) -> str:
+        """
+        Resolve a user's organization ID, creating the user and org if needed.
+
+        Existing users are resolved from the membership cache, or with a
+        single indexed lookup that is then cached.
+
+        Args:
+            user_id: Cognito user ID (sub claim)
+            email: User email address (required for new users)
+
+        Returns:
+            The user's organization UUID
+
+        Raises:
+            ValueError: If email is None and user doesn't exist
+        """
+        organization_id = membership_cache.get_cached_organization_id(user_id)
+        if organization_id:
+            return organization_id
+
+        result = await self.session.execute(
+            select(User.organization_id).where(User.id == user_id)
+        )
+        organization_id = result.scalar_one_or_none()
+        if organization_id:
+            membership_cache.cache_organization_id(user_id, organization_id)
+            return organization_id
+
+        # New users are cached on their next request, once the request that
+        # created them has committed
+        _, org = await self.get_or_create_user(user_id, email)
+        return org.id
+
+    async def _get_user_with_organization(
+        self, user_id: str
+    ) -> tuple[User, Organization] | None:
+        """Fetch a user and their organization in one query."""
+        result = await self.session.execute(
+            select(User, Organization)
+            .join(Organization, Organization.id == User.organization_id)
+            .where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
     async def _create_user_and_org(
         self, user_id: str, email: str
     ) -> tuple[User, Organization]:
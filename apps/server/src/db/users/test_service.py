@@ -0,0 +1,57 @@
+"""
+Unit tests for UserService organization resolution.
+
+Uses mocked async sessions.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.organizations import membership_cache
+from src.db.organizations.model import Organization
+from src.db.users.model import User
+from src.db.users.service import UserService
+
+
+@pytest.fixture(autouse=True)
+def clear_membership_cache():
+    membership_cache.clear()
+    yield
+    membership_cache.clear()
+
+
+def scalar_result(value):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+@pytest.mark.asyncio
+async def test_get_organization_id_is_cached_until_invalidated():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = scalar_result("org-1")
+    service = UserService(session)
+
+    assert await service.get_organization_id("user-1") == "org-1"
+    assert await service.get_organization_id("user-1") == "org-1"
+    assert session.execute.await_count == 1
+
+    membership_cache.invalidate_organization("org-1")
+    assert await service.get_organization_id("user-1") == "org-1"
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_user_fetches_user_and_org_in_one_query():
+    session = AsyncMock(spec=AsyncSession)
+    user = User(id="user-1", email="a@acme.io", organization_id="org-1")
+    org = Organization(id="org-1", name="Acme")
+    result = MagicMock()
+    result.one_or_none.return_value = (user, org)
+    session.execute.return_value = result
+
+    assert await UserService(session).get_or_create_user("user-1") == (user, org)
+    assert session.execute.await_count == 1
+    assert "JOIN organizations" in str(session.execute.await_args.args[0])
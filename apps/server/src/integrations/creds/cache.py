@@ -0,0 +1,241 @@
+"""
+Process-wide cache of decrypted CRM credentials.
+
+Credentials live in AWS Secrets Manager, whose boto3 client is synchronous,
+so every fetch runs in a worker thread instead of blocking the event loop.
+On top of a plain TTL cache this adds:
+
+- Single-flight: concurrent misses for an organization share one fetch.
+- Refresh-ahead: reading an entry older than `refresh_after` starts a
+  background refetch, so organizations in steady use never hit a miss and
+  entries don't all expire in one wave.
+- Warm-up: `warm_up` loads many organizations with BatchGetSecretValue,
+  20 secrets per call, e.g. at startup.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.utils.logger import logger
+from src.utils.single_flight import SingleFlight
+
+# Seconds credentials may be served from cache
+CREDENTIALS_TTL_SECONDS = 300
+# Age after which a cache hit also refreshes the entry in the background
+CREDENTIALS_REFRESH_AFTER_SECONDS = 240
+# Maximum number of organizations cached
+CREDENTIALS_CACHE_MAX_SIZE = 1000
+# Secret IDs per BatchGetSecretValue call (the API maximum)
+BATCH_GET_MAX_SECRETS = 20
+
+
+@dataclass
+class _CachedCredentials:
+    """Cached credentials and where they came from."""
+
+    credentials: dict
+    secret_arn: str
+    secrets_client: Any
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class CredentialsCache:
+    """TTL cache of credentials with single-flight and refresh-ahead fetches."""
+
+    def __init__(
+        self,
+        ttl: float = CREDENTIALS_TTL_SECONDS,
+        refresh_after: float = CREDENTIALS_REFRESH_AFTER_SECONDS,
+        max_size: int = CREDENTIALS_CACHE_MAX_SIZE,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry may be served after it was fetched
+            refresh_after: Entry age at which a hit triggers a background refresh
+            max_size: Maximum number of organizations kept
+        """
+        self.ttl = ttl
+        self.refresh_after = refresh_after
+        self.max_size = max_size
+        self._entries: OrderedDict[str, _CachedCredentials] = OrderedDict()
+        self._fetches: SingleFlight[str, dict] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, organization_id: str) -> dict | None:
+        """
+        Get an organization's cached credentials.
+
+        Args:
+            organization_id: Organization UUID
+
+        Returns:
+            dict | None: Credentials, or None if not cached or expired
+        """
+        entry = self._entries.get(organization_id)
+        if entry is None:
+            return None
+
+        age = time.monotonic() - entry.fetched_at
+        if age >= self.ttl:
+            del self._entries[organization_id]
+            return None
+
+        self._entries.move_to_end(organization_id)
+        if age >= self.refresh_after and organization_id not in self._fetches:
+            logger.debug("Refreshing credentials", organization_id=organization_id)
+            self._start_fetch(organization_id, entry.secret_arn, entry.secrets_client)
+        return entry.credentials
+
+    async def fetch(
+        self, organization_id: str, secret_arn: str, secrets_client: Any
+    ) -> dict:
+        """
+        Fetch an organization's credentials from Secrets Manager and cache them.
+
+        Joins the fetch already in flight for the organization, if any.
+
+        Args:
+            organization_id: Organization UUID
+            secret_arn: ARN of the organization's secret
+            secrets_client: boto3 Secrets Manager client
+
+        Returns:
+            dict: Decrypted credentials
+
+        Raises:
+            ClientError: If Secrets Manager rejects the request
+        """
+        return await self._fetches.run(
+            organization_id,
+            lambda: self._fetch(organization_id, secret_arn, secrets_client),
+        )
+
+    async def warm_up(self, secret_arns: dict[str, str], secrets_client: Any) -> int:
+        """
+        Load many organizations' credentials with BatchGetSecretValue.
+
+        Args:
+            secret_arns: Secret ARN per organization UUID
+            secrets_client: boto3 Secrets Manager client
+
+        Returns:
+            int: Number of organizations cached
+        """
+        organization_ids = {arn: org_id for org_id, arn in secret_arns.items()}
+        arns = list(organization_ids)
+        warmed = 0
+        for start in range(0, len(arns), BATCH_GET_MAX_SECRETS):
+            response = await asyncio.to_thread(
+                secrets_client.batch_get_secret_value,
+                SecretIdList=arns[start : start + BATCH_GET_MAX_SECRETS],
+            )
+            for secret in response.get("SecretValues", []):
+                organization_id = organization_ids.get(secret["ARN"])
+                if organization_id is None:
+                    continue
+                self._store(
+                    organization_id,
+                    _CachedCredentials(
+                        credentials=json.loads(secret["SecretString"]),
+                        secret_arn=secret["ARN"],
+                        secrets_client=secrets_client,
+                    ),
+                )
+                warmed += 1
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Failed to warm credentials",
+                    secret_arn=error.get("SecretId"),
+                    error=error.get("Message"),
+                )
+        return warmed
+
+    def invalidate(self, organization_id: str) -> None:
+        """
+        Drop an organization's credentials, e.g. after they were replaced.
+
+        A fetch already in flight for the organization still completes for
+        its callers but is not cached.
+
+        Args:
+            organization_id: Organization UUID
+        """
+        self._entries.pop(organization_id, None)
+        self._fetches.forget(organization_id)
+
+    async def close(self) -> None:
+        """Cancel in-flight fetches and clear the cache."""
+        self._entries.clear()
+        await self._fetches.close()
+
+    def _start_fetch(
+        self, organization_id: str, secret_arn: str, secrets_client: Any
+    ) -> None:
+        self._fetches.start(
+            organization_id,
+            lambda: self._fetch(organization_id, secret_arn, secrets_client),
+        )
+
+    async def _fetch(
+        self, organization_id: str, secret_arn: str, secrets_client: Any
+    ) -> dict:
+        try:
+            response = await asyncio.to_thread(
+                secrets_client.get_secret_value, SecretId=secret_arn
+            )
+            credentials = json.loads(response["SecretString"])
+        except Exception as e:
+            # Callers (if any) get the error; this covers background refreshes
+            logger.warning(
+                "Failed to fetch credentials",
+                organization_id=organization_id,
+                error=str(e),
+            )
+            raise
+        # Skip caching if the organization was invalidated mid-fetch
+        if self._fetches.is_current(organization_id):
+            self._store(
+                organization_id,
+                _CachedCredentials(
+                    credentials=credentials,
+                    secret_arn=secret_arn,
+                    secrets_client=secrets_client,
+                ),
+            )
+        logger.info(
+            "Retrieved credentials from Secrets Manager",
+            organization_id=organization_id,
+            provider=credentials.get("provider"),
+        )
+        return credentials
+
+    def _store(self, organization_id: str, entry: _CachedCredentials) -> None:
+        self._entries[organization_id] = entry
+        self._entries.move_to_end(organization_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+# Global cache instance
+_credentials_cache: CredentialsCache | None = None
+
+
+def get_credentials_cache() -> CredentialsCache:
+    """
+    Get the global credentials cache.
+
+    Returns:
+        CredentialsCache: The process-wide cache
+    """
+    global _credentials_cache
+    if _credentials_cache is None:
+        _credentials_cache = CredentialsCache()
+    return _credentials_cache
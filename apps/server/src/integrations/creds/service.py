@@ -5,7 +5,6 @@ from functools import lru_cache
 
 import boto3
 from botocore.exceptions import ClientError
-from cachetools import TTLCache
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,11 +12,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import get_app_settings
 from src.db.crm_credentials.model import OrganizationCRMCredentials
 from src.db.crm_credentials.schemas import CRMCredentialsCreate
+from src.db.database import get_async_session_local
+from src.integrations.creds.cache import get_credentials_cache
+from src.integrations.crm.provider_pool import get_crm_provider_pool
 from src.utils.logger import logger
 
-# In-memory TTL cache: 1000 orgs max, 5 min TTL (300 seconds)
-_credentials_cache: TTLCache = TTLCache(maxsize=1000, ttl=300)
-
 
 @lru_cache()
 def get_secrets_manager_client():
@@ -174,8 +173,9 @@ class CRMCredentialsService:
         await self.session.flush()
         await self.session.refresh(cred_record)
 
-        # Invalidate cache
-        _credentials_cache.pop(organization_id, None)
+        # Invalidate cache and drop the pooled provider built from old credentials
+        get_credentials_cache().invalidate(organization_id)
+        await get_crm_provider_pool().invalidate(organization_id)
 
         return cred_record
 
@@ -183,8 +183,8 @@ class CRMCredentialsService:
         """
         Get decrypted CRM credentials for an organization.
 
-        Implements request-scoped caching via FastAPI and
-        cross-request TTL caching for performance.
+        Implements request-scoped caching via FastAPI and cross-request
+        caching (single-flight, refreshed ahead of expiry) for performance.
 
         Args:
             organization_id: Organization UUID
@@ -195,10 +195,12 @@ class CRMCredentialsService:
         Raises:
             HTTPException: If credentials not found or decryption fails
         """
-        # Check TTL cache first
-        if organization_id in _credentials_cache:
+        # Check cache first
+        credentials_cache = get_credentials_cache()
+        credentials = credentials_cache.get(organization_id)
+        if credentials is not None:
             logger.debug("Credentials cache hit", organization_id=organization_id)
-            return _credentials_cache[organization_id]
+            return credentials
 
         logger.debug("Credentials cache miss", organization_id=organization_id)
 
@@ -211,23 +213,11 @@ class CRMCredentialsService:
                 detail=f"No CRM credentials configured for organization {organization_id}",
             )
 
-        # Fetch from Secrets Manager
+        # Fetch from Secrets Manager (shared with concurrent misses)
         try:
-            response = self.secrets_client.get_secret_value(
-                SecretId=cred_record.secret_arn
+            return await credentials_cache.fetch(
+                organization_id, cred_record.secret_arn, self.secrets_client
             )
-            credentials = json.loads(response["SecretString"])
-
-            # Cache for 5 minutes
-            _credentials_cache[organization_id] = credentials
-
-            logger.info(
-                "Retrieved credentials from Secrets Manager",
-                organization_id=organization_id,
-                provider=credentials.get("provider"),
-            )
-
-            return credentials
 
         except ClientError as e:
             logger.error(
@@ -305,11 +295,28 @@ class CRMCredentialsService:
         cred_record.is_active = False
         await self.session.flush()
 
-        # Invalidate cache
-        _credentials_cache.pop(organization_id, None)
+        # Invalidate cache and drop the pooled provider built from old credentials
+        get_credentials_cache().invalidate(organization_id)
+        await get_crm_provider_pool().invalidate(organization_id)
 
         return True
 
+    async def warm_cache(self) -> int:
+        """
+        Load every organization's active credentials into the cache.
+
+        Returns:
+            Number of organizations cached
+        """
+        result = await self.session.execute(
+            select(
+                OrganizationCRMCredentials.organization_id,
+                OrganizationCRMCredentials.secret_arn,
+            ).where(OrganizationCRMCredentials.is_active == True)  # noqa: E712
+        )
+        secret_arns = {row.organization_id: row.secret_arn for row in result}
+        return await get_credentials_cache().warm_up(secret_arns, self.secrets_client)
+
     async def _get_active_credentials(
         self, organization_id: str
     ) -> OrganizationCRMCredentials | None:
@@ -343,3 +350,13 @@ class CRMCredentialsService:
         settings = get_app_settings()
         environment = settings.environment.value
         return f"maive/{environment}/crm/{organization_id}"
+
+
+async def warm_credentials_cache() -> None:
+    """Warm the credentials cache for all organizations (run at startup)."""
+    try:
+        async with get_async_session_local()() as session:
+            warmed = await CRMCredentialsService(session).warm_cache()
+        logger.info("Warmed credentials cache", organizations=warmed)
+    except Exception as e:
+        logger.error("Failed to warm credentials cache", error=str(e))
@@ -0,0 +1,109 @@
+"""Tests for the CRM credentials cache."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.integrations.creds.cache import CredentialsCache
+
+
+class FakeSecretsClient:
+    """Secrets Manager stand-in that blocks like boto3 and counts calls."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.version = 1
+        self.get_calls = 0
+        self.batch_calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def get_secret_value(self, SecretId: str) -> dict:
+        with self._lock:
+            self.get_calls += 1
+        time.sleep(self.delay)
+        return {"SecretString": json.dumps({"provider": "p", "v": self.version})}
+
+    def batch_get_secret_value(self, SecretIdList: list[str]) -> dict:
+        self.batch_calls.append(SecretIdList)
+        return {
+            "SecretValues": [
+                {"ARN": arn, "SecretString": json.dumps({"arn": arn})}
+                for arn in SecretIdList
+                if arn != "arn:missing"
+            ],
+            "Errors": [{"SecretId": "arn:missing", "Message": "not found"}]
+            if "arn:missing" in SecretIdList
+            else [],
+        }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch():
+    cache = CredentialsCache()
+    client = FakeSecretsClient()
+
+    results = await asyncio.gather(
+        *(cache.fetch("org-1", "arn:1", client) for _ in range(10))
+    )
+
+    assert client.get_calls == 1
+    assert all(result == {"provider": "p", "v": 1} for result in results)
+    assert cache.get("org-1") == {"provider": "p", "v": 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_refreshes_in_background():
+    cache = CredentialsCache(ttl=60, refresh_after=0)
+    client = FakeSecretsClient(delay=0)
+    await cache.fetch("org-1", "arn:1", client)
+
+    client.version = 2
+    # Served from cache while the refresh runs
+    assert cache.get("org-1") == {"provider": "p", "v": 1}
+    await asyncio.sleep(0.05)
+
+    assert client.get_calls == 2
+    assert cache.get("org-1")["v"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_fetch_skips_caching():
+    cache = CredentialsCache()
+    client = FakeSecretsClient()
+
+    fetch = asyncio.create_task(cache.fetch("org-1", "arn:1", client))
+    await asyncio.sleep(0)
+    cache.invalidate("org-1")
+
+    assert (await fetch)["v"] == 1
+    assert cache.get("org-1") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_propagates_and_is_not_cached():
+    cache = CredentialsCache()
+    client = MagicMock()
+    client.get_secret_value.side_effect = RuntimeError("denied")
+
+    with pytest.raises(RuntimeError):
+        await cache.fetch("org-1", "arn:1", client)
+    assert cache.get("org-1") is None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_batches_secrets():
+    cache = CredentialsCache()
+    client = FakeSecretsClient()
+    secret_arns = {f"org-{i}": f"arn:{i}" for i in range(44)}
+    secret_arns["org-missing"] = "arn:missing"
+
+    assert await cache.warm_up(secret_arns, client) == 44
+
+    assert [len(batch) for batch in client.batch_calls] == [20, 20, 5]
+    assert client.get_calls == 0
+    assert cache.get("org-7") == {"arn": "arn:7"}
+    assert cache.get("org-missing") is None
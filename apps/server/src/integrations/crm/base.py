@@ -10,6 +10,8 @@ provider_data field of each universal schema.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from src.integrations.crm.schemas import (
@@ -21,6 +23,25 @@ from src.integrations.crm.schemas import (
     Project,
     ProjectList,
 )
+from src.utils.timing import instrument_methods
+
+
+@dataclass
+class FileStream:
+    """An open, streaming file download relayed from a CRM."""
+
+    chunks: AsyncIterator[bytes]
+    filename: str
+    content_type: str
+    close: Callable[[], Awaitable[None]]
+    status_code: int = 200
+    content_length: int | None = None
+    content_range: str | None = None
+    accept_ranges: bool = False
+
+
+async def _noop() -> None:
+    pass
 
 
 class CRMProvider(ABC):
@@ -32,6 +53,11 @@ class CRMProvider(ABC):
     as regular (non-abstract) instance methods.
     """
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Time every provider call as CRM time in the request breakdown
+        instrument_methods(cls, "crm")
+
     @abstractmethod
     async def get_job(self, job_id: str) -> Job:
         """
@@ -288,6 +314,47 @@ class CRMProvider(ABC):
             "This CRM provider does not support file operations", "NOT_SUPPORTED"
         )
 
+    async def stream_file(
+        self,
+        file_id: str,
+        filename: str | None = None,
+        content_type: str | None = None,
+        range_header: str | None = None,
+    ) -> FileStream:
+        """
+        Open a file for streaming download.
+
+        The default implementation falls back to download_file() and yields
+        the whole file as a single chunk, ignoring range_header. Providers
+        that can stream from the vendor should override this.
+
+        Args:
+            file_id: The file ID to download
+            filename: Optional filename hint
+            content_type: Optional content type hint
+            range_header: Optional HTTP Range header to forward (e.g. "bytes=0-")
+
+        Returns:
+            FileStream whose chunks must be consumed or closed by the caller
+
+        Raises:
+            CRMError: If the provider doesn't support file operations
+        """
+        content, resolved_filename, resolved_content_type = await self.download_file(
+            file_id, filename, content_type
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield content
+
+        return FileStream(
+            chunks=chunks(),
+            filename=resolved_filename,
+            content_type=resolved_content_type,
+            close=_noop,
+            content_length=len(content),
+        )
+
 
 class CRMError(Exception):
     """Base exception for CRM-related errors."""
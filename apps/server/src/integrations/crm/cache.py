@@ -0,0 +1,448 @@
+"""
+Read-through cache for CRM entity reads.
+
+The MCP tools, workflows and CRM router fetch the same jobs, projects and
+contacts repeatedly within seconds. CachedCRMProvider wraps any CRMProvider
+and serves get_job / get_project / get_contact from a short-lived cache keyed
+by (organization, entity type, id). Writes made through the wrapper
+invalidate the affected entries.
+
+Two backends are available: an in-process LRU (default) and a
+Redis-compatible backend enabled by CRM_CACHE_REDIS_URL.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+from src.integrations.crm.base import CRMProvider, FileStream
+from src.integrations.crm.config import CRMCacheSettings, get_crm_cache_settings
+from src.integrations.crm.schemas import (
+    Contact,
+    ContactList,
+    Job,
+    JobList,
+    Note,
+    Project,
+    ProjectList,
+)
+from src.utils.logger import logger
+from src.utils.metrics import CRM_CACHE_LOOKUPS
+from src.utils.single_flight import SingleFlight
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+ENTITY_JOB = "job"
+ENTITY_PROJECT = "project"
+ENTITY_CONTACT = "contact"
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class CRMCacheBackend(ABC):
+    """Storage backend for cached CRM entities."""
+
+    @abstractmethod
+    async def get(self, key: str, model: type[ModelT]) -> ModelT | None:
+        """Return the cached value for key, or None on a miss."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: BaseModel, ttl: int) -> None:
+        """Store value under key for ttl seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove keys from the cache."""
+        pass
+
+
+class InMemoryCacheBackend(CRMCacheBackend):
+    """
+    Process-local LRU cache with per-entry expiry.
+
+    Values are deep-copied on the way in and out, so, as with Redis, a caller
+    mutating its copy can't change what the cache holds.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self._entries: LRUCache = LRUCache(maxsize=max_entries)
+
+    async def get(self, key: str, model: type[ModelT]) -> ModelT | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value.model_copy(deep=True)
+
+    async def set(self, key: str, value: BaseModel, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value.model_copy(deep=True))
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend(CRMCacheBackend):
+    """Cache backed by any client exposing redis.asyncio's get/set/delete."""
+
+    def __init__(self, client: Any):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            client: Async Redis-compatible client (e.g. redis.asyncio.Redis)
+        """
+        self.client = client
+
+    async def get(self, key: str, model: type[ModelT]) -> ModelT | None:
+        raw = await self.client.get(key)
+        if raw is None:
+            return None
+        return model.model_validate_json(raw)
+
+    async def set(self, key: str, value: BaseModel, ttl: int) -> None:
+        await self.client.set(key, value.model_dump_json(), ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters per entity type, also exported to /metrics."""
+
+    hits: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    misses: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record_hit(self, entity_type: str) -> None:
+        """Count a lookup served from the cache."""
+        self.hits[entity_type] += 1
+        CRM_CACHE_LOOKUPS.inc(entity_type, "hit")
+
+    def record_miss(self, entity_type: str) -> None:
+        """Count a lookup that had to go to the provider."""
+        self.misses[entity_type] += 1
+        CRM_CACHE_LOOKUPS.inc(entity_type, "miss")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and hit rate as a plain dict."""
+        total_hits = sum(self.hits.values())
+        total_misses = sum(self.misses.values())
+        lookups = total_hits + total_misses
+        return {
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "hit_rate": total_hits / lookups if lookups else 0.0,
+        }
+
+
+class CRMCache:
+    """Read-through cache with per-entity TTLs and single-flight loading."""
+
+    def __init__(self, backend: CRMCacheBackend, ttls: dict[str, int]):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend
+            ttls: TTL in seconds per entity type
+        """
+        self.backend = backend
+        self.ttls = ttls
+        self.stats = CacheStats()
+        self._loads: SingleFlight[str, BaseModel] = SingleFlight()
+
+    @staticmethod
+    def key(organization_id: str, entity_type: str, entity_id: str) -> str:
+        """Build the cache key for an entity."""
+        return f"crm:{organization_id}:{entity_type}:{entity_id}"
+
+    async def get_or_load(
+        self,
+        organization_id: str,
+        entity_type: str,
+        entity_id: str,
+        model: type[ModelT],
+        loader: Callable[[], Awaitable[ModelT]],
+    ) -> ModelT:
+        """
+        Return a cached entity, loading it once on a miss.
+
+        Concurrent misses for the same key share a single loader call.
+
+        Args:
+            organization_id: Organization UUID
+            entity_type: Entity type (job, project, contact)
+            entity_id: Entity ID
+            model: Pydantic model of the entity
+            loader: Coroutine factory that fetches the entity from the provider
+
+        Returns:
+            The cached or freshly loaded entity
+        """
+        key = self.key(organization_id, entity_type, entity_id)
+
+        try:
+            cached = await self.backend.get(key, model)
+        except Exception as e:
+            logger.warning("CRM cache read failed", key=key, error=str(e))
+            cached = None
+
+        if cached is not None:
+            self.stats.record_hit(entity_type)
+            return cached
+
+        self.stats.record_miss(entity_type)
+
+        return await self._loads.run(
+            key, lambda: self._load(key, self.ttls[entity_type], loader)
+        )
+
+    async def _load(
+        self, key: str, ttl: int, loader: Callable[[], Awaitable[ModelT]]
+    ) -> ModelT:
+        value = await loader()
+        # A write to the key mid-load detaches the load: its result may
+        # predate the write, so it's returned but not stored
+        if self._loads.is_current(key):
+            try:
+                await self.backend.set(key, value, ttl)
+            except Exception as e:
+                logger.warning("CRM cache write failed", key=key, error=str(e))
+        return value
+
+    async def invalidate(
+        self, organization_id: str, entity_types: list[str], entity_id: str
+    ) -> None:
+        """
+        Drop cached entries for an entity after a write.
+
+        Args:
+            organization_id: Organization UUID
+            entity_types: Entity types to drop for this ID
+            entity_id: Entity ID
+        """
+        keys = [self.key(organization_id, t, entity_id) for t in entity_types]
+        for key in keys:
+            self._loads.forget(key)
+        try:
+            await self.backend.delete(*keys)
+        except Exception as e:
+            logger.warning("CRM cache invalidation failed", keys=keys, error=str(e))
+
+
+# ============================================================================
+# Provider wrapper
+# ============================================================================
+
+
+class CachedCRMProvider(CRMProvider):
+    """
+    CRMProvider decorator that caches single-entity reads.
+
+    List endpoints and provider-specific methods pass straight through to
+    the wrapped provider.
+    """
+
+    def __init__(self, provider: CRMProvider, organization_id: str, cache: CRMCache):
+        """
+        Initialize the cached provider.
+
+        Args:
+            provider: The provider to wrap
+            organization_id: Organization the provider belongs to (cache namespace)
+            cache: Cache instance
+        """
+        self.provider = provider
+        self.organization_id = organization_id
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific methods and attributes (e.g. provider_name)
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def get_job(self, job_id: str) -> Job:
+        return await self.cache.get_or_load(
+            self.organization_id,
+            ENTITY_JOB,
+            job_id,
+            Job,
+            lambda: self.provider.get_job(job_id),
+        )
+
+    async def get_project(self, project_id: str) -> Project:
+        return await self.cache.get_or_load(
+            self.organization_id,
+            ENTITY_PROJECT,
+            project_id,
+            Project,
+            lambda: self.provider.get_project(project_id),
+        )
+
+    async def get_contact(self, contact_id: str) -> Contact:
+        return await self.cache.get_or_load(
+            self.organization_id,
+            ENTITY_CONTACT,
+            contact_id,
+            Contact,
+            lambda: self.provider.get_contact(contact_id),
+        )
+
+    async def get_all_jobs(
+        self,
+        filters: dict[str, Any] | None = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> JobList:
+        return await self.provider.get_all_jobs(filters, page, page_size)
+
+    async def get_all_projects(
+        self,
+        filters: dict[str, Any] | None = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> ProjectList:
+        return await self.provider.get_all_projects(filters, page, page_size)
+
+    async def get_all_contacts(
+        self,
+        filters: dict[str, Any] | None = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> ContactList:
+        return await self.provider.get_all_contacts(filters, page, page_size)
+
+    async def add_note(
+        self,
+        entity_id: str,
+        entity_type: str,
+        text: str,
+        **kwargs: Any,
+    ) -> Note:
+        try:
+            return await self.provider.add_note(entity_id, entity_type, text, **kwargs)
+        finally:
+            await self._invalidate_job(entity_id)
+
+    async def update_job_status(self, job_id: str, status: str, **kwargs: Any) -> None:
+        try:
+            await self.provider.update_job_status(job_id, status, **kwargs)
+        finally:
+            await self._invalidate_job(job_id)
+
+    async def update_project_status(
+        self, project_id: str, status: str, **kwargs: Any
+    ) -> None:
+        try:
+            await self.provider.update_project_status(project_id, status, **kwargs)
+        finally:
+            await self._invalidate_job(project_id)
+
+    async def get_job_files(self, job_id: str, file_filter: str = "all") -> list[Any]:
+        return await self.provider.get_job_files(job_id, file_filter)
+
+    async def download_file(
+        self, file_id: str, filename: str | None = None, content_type: str | None = None
+    ) -> tuple[bytes, str, str]:
+        return await self.provider.download_file(file_id, filename, content_type)
+
+    async def stream_file(
+        self,
+        file_id: str,
+        filename: str | None = None,
+        content_type: str | None = None,
+        range_header: str | None = None,
+    ) -> FileStream:
+        return await self.provider.stream_file(
+            file_id, filename, content_type, range_header
+        )
+
+    async def _invalidate_job(self, entity_id: str) -> None:
+        """Drop both job and project entries (the same record in flat CRMs)."""
+        await self.cache.invalidate(
+            self.organization_id, [ENTITY_JOB, ENTITY_PROJECT], entity_id
+        )
+
+
+def unwrap_provider(provider: CRMProvider) -> CRMProvider:
+    """
+    Return the underlying provider if it is wrapped in a cache.
+
+    Args:
+        provider: A provider, possibly a CachedCRMProvider
+
+    Returns:
+        The concrete provider instance
+    """
+    if isinstance(provider, CachedCRMProvider):
+        return provider.provider
+    return provider
+
+
+def _create_backend(settings: CRMCacheSettings) -> CRMCacheBackend:
+    """Create the configured cache backend, falling back to in-process."""
+    if settings.redis_url:
+        try:
+            import redis.asyncio as redis
+
+            logger.info("Using Redis CRM cache backend")
+            return RedisCacheBackend(redis.from_url(settings.redis_url))
+        except ImportError:
+            logger.warning(
+                "CRM_CACHE_REDIS_URL is set but the redis package is not installed, "
+                "using in-process CRM cache"
+            )
+    return InMemoryCacheBackend(max_entries=settings.max_entries)
+
+
+# Global cache instance
+_crm_cache: CRMCache | None = None
+
+
+def get_crm_cache() -> CRMCache:
+    """
+    Get the global CRM cache instance.
+
+    Returns:
+        CRMCache: The process-wide cache
+    """
+    global _crm_cache
+    if _crm_cache is None:
+        settings = get_crm_cache_settings()
+        _crm_cache = CRMCache(
+            backend=_create_backend(settings),
+            ttls={
+                ENTITY_JOB: settings.job_ttl_seconds,
+                ENTITY_PROJECT: settings.project_ttl_seconds,
+                ENTITY_CONTACT: settings.contact_ttl_seconds,
+            },
+        )
+    return _crm_cache
@@ -47,6 +47,26 @@ class JobNimbusConfig(BaseSettings):
     )
 
 
+class CRMCacheSettings(BaseSettings):
+    """Read-through cache configuration for CRM entity reads."""
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False, extra="ignore", env_prefix="CRM_CACHE_"
+    )
+
+    enabled: bool = Field(default=True, description="Cache CRM entity reads")
+    max_entries: int = Field(
+        default=5000, description="Maximum entries held by the in-process cache"
+    )
+    job_ttl_seconds: int = Field(default=30, description="TTL for cached jobs")
+    project_ttl_seconds: int = Field(default=30, description="TTL for cached projects")
+    contact_ttl_seconds: int = Field(default=300, description="TTL for cached contacts")
+    redis_url: str | None = Field(
+        default=None,
+        description="Redis-compatible URL for a shared cache (in-process if unset)",
+    )
+
+
 class CRMSettings(BaseSettings):
     """Configuration for CRM integrations using Pydantic settings."""
 
@@ -163,3 +183,20 @@ def set_crm_settings(settings: CRMSettings) -> None:
     """
     global _crm_settings
     _crm_settings = settings
+
+
+# Global cache settings instance
+_crm_cache_settings: CRMCacheSettings | None = None
+
+
+def get_crm_cache_settings() -> CRMCacheSettings:
+    """
+    Get the global CRM cache settings instance.
+
+    Returns:
+        CRMCacheSettings: The global cache settings instance
+    """
+    global _crm_cache_settings
+    if _crm_cache_settings is None:
+        _crm_cache_settings = CRMCacheSettings()
+    return _crm_cache_settings
@@ -197,3 +197,11 @@ class JobNimbusEndpoints:
     # Files endpoints
     FILES = "/files"
     FILE_BY_ID = "/files/{jnid}"
+
+
+# Provider pool limits (see src.integrations.crm.provider_pool)
+PROVIDER_POOL_MAX_SIZE = 500
+PROVIDER_POOL_IDLE_TTL_SECONDS = 15 * 60
+
+# Chunk size used when relaying file downloads from a CRM
+FILE_STREAM_CHUNK_SIZE = 64 * 1024
@@ -5,6 +5,9 @@ This module provides dependency injection functions for CRM-related
 FastAPI endpoints with multi-tenant credential management.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,7 +19,10 @@ from src.integrations.creds.service import (
     get_secrets_manager_client,
 )
 from src.integrations.crm.base import CRMProvider
+from src.integrations.crm.cache import CachedCRMProvider, get_crm_cache
+from src.integrations.crm.config import get_crm_cache_settings
 from src.integrations.crm.constants import CRMProvider as CRMProviderEnum
+from src.integrations.crm.provider_pool import get_crm_provider_pool
 from src.integrations.crm.providers.job_nimbus.provider import JobNimbusProvider
 from src.integrations.crm.providers.mock.provider import MockProvider
 from src.integrations.crm.providers.service_titan.provider import ServiceTitanProvider
@@ -63,17 +69,15 @@ async def get_org_crm_credentials(
     return await credentials_service.get_credentials(current_user.organization_id)
 
 
-async def get_crm_provider(
-    credentials: dict = Depends(get_org_crm_credentials),
-) -> CRMProvider:
+def build_crm_provider(credentials: dict) -> CRMProvider:
     """
-    Get CRM provider instance.
+    Build a new CRM provider instance from organization credentials.
 
     For Mock provider (local dev): Uses env var CRM_PROVIDER=mock, no credentials needed
     For real providers: Requires database credentials per organization
 
     Args:
-        credentials: CRM credentials dict from dependency injection
+        credentials: CRM credentials dict with 'provider' and 'credentials' keys
 
     Returns:
         CRMProvider instance
@@ -121,6 +125,65 @@ async def get_crm_provider(
         )
 
 
+async def get_crm_provider(
+    credentials: dict = Depends(get_org_crm_credentials),
+    current_user: User = Depends(get_current_user),
+) -> AsyncIterator[CRMProvider]:
+    """
+    Get the pooled CRM provider for the current user's organization.
+
+    Providers are long-lived and shared across requests for the same
+    organization, so HTTP connections and auth tokens are reused. A new
+    provider is built only when the organization's credentials change.
+    Single-entity reads are served through the CRM read-through cache.
+    The provider is held until the response has been sent.
+
+    Args:
+        credentials: CRM credentials dict from dependency injection
+        current_user: Current authenticated user (guaranteed to have organization_id)
+
+    Yields:
+        CRMProvider instance
+
+    Raises:
+        HTTPException: If credentials not configured for real providers
+    """
+    async with organization_crm_provider(
+        current_user.organization_id, credentials
+    ) as provider:
+        yield provider
+
+
+@asynccontextmanager
+async def organization_crm_provider(
+    organization_id: str, credentials: dict
+) -> AsyncIterator[CRMProvider]:
+    """
+    Hold the pooled, cache-wrapped CRM provider for an organization.
+
+    Used by get_crm_provider and by background workers that run outside a
+    request. The provider is not closed before the block exits.
+
+    Args:
+        organization_id: Organization UUID
+        credentials: CRM credentials dict with 'provider' and 'credentials' keys
+
+    Yields:
+        CRMProvider instance
+    """
+    async with get_crm_provider_pool().lease(
+        organization_id, credentials, build_crm_provider
+    ) as provider:
+        # Mock data lives in memory already; only real CRMs benefit from caching
+        if (
+            credentials.get("provider") == CRMProviderEnum.MOCK
+            or not get_crm_cache_settings().enabled
+        ):
+            yield provider
+        else:
+            yield CachedCRMProvider(provider, organization_id, get_crm_cache())
+
+
 async def get_crm_service(
     crm_provider: CRMProvider = Depends(get_crm_provider),
 ) -> CRMService:
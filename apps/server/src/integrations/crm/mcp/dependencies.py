@@ -4,6 +4,7 @@ MCP server dependencies for multi-tenant authentication.
 Bridges FastMCP JWT authentication with existing REST API credential infrastructure.
 """
 
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import HTTPException
@@ -17,7 +18,8 @@ from src.integrations.creds.service import (
     CRMCredentialsService,
     get_secrets_manager_client,
 )
-from src.integrations.crm.dependencies import get_crm_provider
+from src.integrations.crm.cache import unwrap_provider
+from src.integrations.crm.dependencies import organization_crm_provider
 from src.integrations.crm.providers.job_nimbus.provider import JobNimbusProvider
 from src.utils.logger import logger
 
@@ -111,20 +113,24 @@ async def get_user_from_mcp_token() -> User:
         )
 
 
-async def get_job_nimbus_provider_from_context(ctx: Context) -> JobNimbusProvider:
+@asynccontextmanager
+async def job_nimbus_provider_from_context(
+    ctx: Context,
+) -> AsyncIterator[JobNimbusProvider]:
     """
-    Get JobNimbus provider for authenticated MCP request.
+    Hold the JobNimbus provider for an authenticated MCP request.
 
     This composes existing dependencies:
     1. get_user_from_mcp_token() - Extract user from JWT
     2. CRMCredentialsService.get_credentials() - Fetch org credentials
-    3. get_crm_provider() - Create provider instance
+    3. organization_crm_provider() - Hold the pooled provider instance
 
     Args:
         ctx: FastMCP Context (unused, but required by FastMCP signature)
 
-    Returns:
-        JobNimbusProvider with organization-specific credentials
+    Yields:
+        JobNimbusProvider with organization-specific credentials (possibly
+        wrapped in the CRM read-through cache)
 
     Raises:
         HTTPException: If auth fails or org not configured for JobNimbus
@@ -138,14 +144,13 @@ async def get_job_nimbus_provider_from_context(ctx: Context) -> JobNimbusProvide
         creds_service = CRMCredentialsService(db, get_secrets_manager_client())
         credentials = await creds_service.get_credentials(user.organization_id)
 
-        # Step 3: Create provider using existing factory (reuse REST API logic)
-        provider = await get_crm_provider(credentials)
-
-        # Step 4: Verify type
-        if not isinstance(provider, JobNimbusProvider):
+    # Step 3: Hold pooled provider (reuse REST API logic)
+    async with organization_crm_provider(user.organization_id, credentials) as provider:
+        # Step 4: Verify type (the provider may be wrapped in the read cache)
+        if not isinstance(unwrap_provider(provider), JobNimbusProvider):
             raise HTTPException(
                 400,
                 f"Organization configured for {credentials.get('provider')}, not JobNimbus",
             )
 
-        return provider
+        yield provider
@@ -0,0 +1,229 @@
+"""
+Process-wide pool of CRM provider instances.
+
+Providers own an httpx.AsyncClient (and, for Service Titan, an OAuth token),
+so building one per request pays for a TLS handshake and token fetch every
+time and leaks sockets because nothing closes them. This pool keeps one
+provider per organization, keyed by a fingerprint of its credentials so a
+credential rotation transparently produces a fresh provider.
+
+Callers hold a provider through `lease`. A provider that is evicted,
+replaced or invalidated while leased is closed when its last lease is
+released, so requests already using it are never left with a closed client.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from src.integrations.crm.base import CRMProvider
+from src.integrations.crm.constants import (
+    PROVIDER_POOL_IDLE_TTL_SECONDS,
+    PROVIDER_POOL_MAX_SIZE,
+)
+from src.utils.logger import logger
+
+
+@dataclass
+class _PooledProvider:
+    """A pooled provider and its bookkeeping."""
+
+    provider: CRMProvider
+    fingerprint: str
+    last_used: float = field(default_factory=time.monotonic)
+    # Callers currently holding the provider
+    leases: int = 0
+    # Removed from the pool; closed once the last lease is released
+    retired: bool = False
+
+
+def credentials_fingerprint(credentials: dict) -> str:
+    """
+    Compute a stable fingerprint for a credentials payload.
+
+    Args:
+        credentials: Credentials dict with 'provider' and 'credentials' keys
+
+    Returns:
+        Hex digest identifying this exact set of credentials
+    """
+    payload = json.dumps(credentials, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CRMProviderPool:
+    """Bounded, idle-evicting registry of long-lived CRM providers."""
+
+    def __init__(
+        self,
+        max_size: int = PROVIDER_POOL_MAX_SIZE,
+        idle_ttl: float = PROVIDER_POOL_IDLE_TTL_SECONDS,
+    ):
+        """
+        Initialize the provider pool.
+
+        Args:
+            max_size: Maximum number of organizations kept in the pool
+            idle_ttl: Seconds a provider may sit unused before it is closed
+        """
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._entries: OrderedDict[str, _PooledProvider] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        organization_id: str,
+        credentials: dict,
+        factory: Callable[[dict], CRMProvider],
+    ) -> AsyncIterator[CRMProvider]:
+        """
+        Hold the pooled provider for an organization, creating it if needed.
+
+        The provider stays open until the block exits, even if it is evicted,
+        replaced or invalidated in the meantime.
+
+        Args:
+            organization_id: Organization UUID
+            credentials: Credentials dict with 'provider' and 'credentials' keys
+            factory: Callable that builds a provider from the credentials dict
+
+        Yields:
+            CRMProvider shared by all requests for this organization
+        """
+        entry = await self._acquire(organization_id, credentials, factory)
+        try:
+            yield entry.provider
+        finally:
+            await self._release(entry)
+
+    async def invalidate(self, organization_id: str) -> None:
+        """
+        Drop the pooled provider for an organization.
+
+        It is closed now, or once the callers holding it are done.
+
+        Args:
+            organization_id: Organization UUID
+        """
+        async with self._lock:
+            entry = self._entries.pop(organization_id, None)
+
+        if entry:
+            logger.info(
+                "Invalidated pooled CRM provider", organization_id=organization_id
+            )
+            await self._retire([entry])
+
+    async def close(self) -> None:
+        """Close every pooled provider, leased or not (called on shutdown)."""
+        async with self._lock:
+            providers = [entry.provider for entry in self._entries.values()]
+            self._entries.clear()
+
+        await self._close_all(providers)
+        logger.info("Closed CRM provider pool", closed=len(providers))
+
+    async def _acquire(
+        self,
+        organization_id: str,
+        credentials: dict,
+        factory: Callable[[dict], CRMProvider],
+    ) -> _PooledProvider:
+        fingerprint = credentials_fingerprint(credentials)
+        removed: list[_PooledProvider] = []
+
+        try:
+            async with self._lock:
+                removed.extend(self._evict_idle())
+
+                entry = self._entries.get(organization_id)
+                if entry and entry.fingerprint == fingerprint:
+                    self._entries.move_to_end(organization_id)
+                else:
+                    # Build first: if the factory raises, the current entry stays
+                    provider = factory(credentials)
+                    if entry:
+                        logger.info(
+                            "CRM credentials changed, replacing pooled provider",
+                            organization_id=organization_id,
+                        )
+                        removed.append(self._entries.pop(organization_id))
+
+                    entry = _PooledProvider(provider=provider, fingerprint=fingerprint)
+                    self._entries[organization_id] = entry
+
+                    while len(self._entries) > self.max_size:
+                        _, evicted = self._entries.popitem(last=False)
+                        removed.append(evicted)
+
+                entry.leases += 1
+                entry.last_used = time.monotonic()
+        finally:
+            # Idle providers already evicted are closed even if the factory raised
+            await self._retire(removed)
+        return entry
+
+    async def _release(self, entry: _PooledProvider) -> None:
+        entry.leases -= 1
+        entry.last_used = time.monotonic()
+        if entry.retired and entry.leases == 0:
+            await self._close_all([entry.provider])
+
+    async def _retire(self, entries: list[_PooledProvider]) -> None:
+        """Close removed providers nobody holds; the rest close on release."""
+        for entry in entries:
+            entry.retired = True
+        await self._close_all([entry.provider for entry in entries if not entry.leases])
+
+    def _evict_idle(self) -> list[_PooledProvider]:
+        """Remove unleased entries idle longer than idle_ttl. Caller holds the lock."""
+        cutoff = time.monotonic() - self.idle_ttl
+        expired = [
+            org_id
+            for org_id, entry in self._entries.items()
+            if not entry.leases and entry.last_used < cutoff
+        ]
+        return [self._entries.pop(org_id) for org_id in expired]
+
+    @staticmethod
+    async def _close_all(providers: list[CRMProvider]) -> None:
+        """Close providers that expose an async close(), logging failures."""
+        for provider in providers:
+            close = getattr(provider, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(
+                    "Failed to close pooled CRM provider",
+                    provider=type(provider).__name__,
+                    error=str(e),
+                )
+
+
+# Global pool instance
+_provider_pool: CRMProviderPool | None = None
+
+
+def get_crm_provider_pool() -> CRMProviderPool:
+    """
+    Get the global CRM provider pool.
+
+    Returns:
+        CRMProviderPool: The process-wide pool
+    """
+    global _provider_pool
+    if _provider_pool is None:
+        _provider_pool = CRMProviderPool()
+    return _provider_pool
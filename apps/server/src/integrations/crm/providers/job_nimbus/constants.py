@@ -25,3 +25,13 @@ class JobNimbusEndpoints:
     # Files endpoints
     FILES = "/files"
     FILE_BY_ID = "/files/{jnid}"
+
+
+# Contact enrichment for job listings
+CONTACT_CACHE_TTL_SECONDS = 60
+CONTACT_CACHE_MAX_SIZE = 1000
+CONTACT_FETCH_CONCURRENCY = 5
+
+# File size resolution for files JobNimbus reports as size=0
+FILE_SIZE_CACHE_MAX_SIZE = 5000
+FILE_SIZE_RESOLVE_CONCURRENCY = 5
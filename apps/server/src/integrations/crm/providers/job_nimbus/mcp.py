@@ -11,7 +11,7 @@ from src.ai.openai.exceptions import OpenAIError
 from src.auth.config import get_auth_settings
 from src.config import get_app_settings
 from src.integrations.crm.base import CRMError
-from src.integrations.crm.mcp.dependencies import get_job_nimbus_provider_from_context
+from src.integrations.crm.mcp.dependencies import job_nimbus_provider_from_context
 from src.integrations.crm.schemas import Job, JobList
 from src.utils.logger import logger
 
@@ -211,13 +211,13 @@ async def get_job(job_id: str, ctx: Context) -> dict[str, Any]:
         Exception: If the job is not found or an error occurs
     """
     try:
-        provider = await get_job_nimbus_provider_from_context(ctx)
-        logger.info("[MCP JobNimbus] Getting job", job_id=job_id)
-        job = await provider.get_job(job_id)
+        async with job_nimbus_provider_from_context(ctx) as provider:
+            logger.info("[MCP JobNimbus] Getting job", job_id=job_id)
+            job = await provider.get_job(job_id)
 
-        result = job.model_dump()
-        logger.info("[MCP JobNimbus] Successfully retrieved job", job_id=job_id)
-        return result
+            result = job.model_dump()
+            logger.info("[MCP JobNimbus] Successfully retrieved job", job_id=job_id)
+            return result
 
     except CRMError as e:
         logger.error(
@@ -283,61 +283,61 @@ async def get_all_jobs(
         - Combine filters: search_jobs(customer_name="Smith", status="Completed")
     """
     try:
-        provider = await get_job_nimbus_provider_from_context(ctx)
-        logger.info(
-            "[MCP JobNimbus] Searching jobs with filters",
-            customer_name=customer_name,
-            job_id=job_id,
-            address=address,
-            claim_number=claim_number,
-            status=status,
-        )
+        async with job_nimbus_provider_from_context(ctx) as provider:
+            logger.info(
+                "[MCP JobNimbus] Searching jobs with filters",
+                customer_name=customer_name,
+                job_id=job_id,
+                address=address,
+                claim_number=claim_number,
+                status=status,
+            )
 
-        # Build filters dict for provider
-        filters = {}
-        if customer_name:
-            filters["customer_name"] = customer_name
-        if job_id:
-            filters["job_id"] = job_id
-        if address:
-            filters["address"] = address
-        if claim_number:
-            filters["claim_number"] = claim_number
-        if status:
-            filters["status"] = status
-
-        # Delegate to provider (handles all filtering logic)
-        job_list: JobList = await provider.get_all_jobs(
-            filters=filters if filters else None,
-            page=page,
-            page_size=page_size,
-        )
+            # Build filters dict for provider
+            filters = {}
+            if customer_name:
+                filters["customer_name"] = customer_name
+            if job_id:
+                filters["job_id"] = job_id
+            if address:
+                filters["address"] = address
+            if claim_number:
+                filters["claim_number"] = claim_number
+            if status:
+                filters["status"] = status
+
+            # Delegate to provider (handles all filtering logic)
+            job_list: JobList = await provider.get_all_jobs(
+                filters=filters if filters else None,
+                page=page,
+                page_size=page_size,
+            )
+
+            # Special case: if exactly one job is returned, fetch notes for it
+            if len(job_list.jobs) == 1:
+                job: Job = job_list.jobs[0]
+                logger.info(
+                    "[MCP JobNimbus] Single job result, fetching notes",
+                    job_id=job.id,
+                )
+                job.notes = await provider._get_job_notes(job.id)
+                job_list.jobs[0] = job
+
+            # Convert to dict format for MCP response
+            result = {
+                "jobs": [job.model_dump() for job in job_list.jobs],
+                "total_count": job_list.total_count,
+                "page": job_list.page,
+                "page_size": job_list.page_size,
+                "has_more": job_list.has_more,
+            }
 
-        # Special case: if exactly one job is returned, fetch notes for it
-        if len(job_list.jobs) == 1:
-            job: Job = job_list.jobs[0]
             logger.info(
-                "[MCP JobNimbus] Single job result, fetching notes",
-                job_id=job.id,
+                "[MCP JobNimbus] Search returned jobs",
+                returned_count=len(job_list.jobs),
+                total_count=job_list.total_count,
             )
-            job.notes = await provider._get_job_notes(job.id)
-            job_list.jobs[0] = job
-
-        # Convert to dict format for MCP response
-        result = {
-            "jobs": [job.model_dump() for job in job_list.jobs],
-            "total_count": job_list.total_count,
-            "page": job_list.page,
-            "page_size": job_list.page_size,
-            "has_more": job_list.has_more,
-        }
-
-        logger.info(
-            "[MCP JobNimbus] Search returned jobs",
-            returned_count=len(job_list.jobs),
-            total_count=job_list.total_count,
-        )
-        return result
+            return result
 
     except CRMError as e:
         logger.error(
@@ -387,32 +387,32 @@ async def list_job_files(job_id: str, ctx: Context) -> dict[str, Any]:
         list_job_files(job_id="mhdn17a1ssizgvz8fo0h66r")
     """
     try:
-        provider = await get_job_nimbus_provider_from_context(ctx)
-        logger.info("[MCP JobNimbus] Listing files for job", job_id=job_id)
-        files = await provider.get_job_files(job_id)
-
-        result = {
-            "count": len(files),
-            "files": [
-                {
-                    "id": f.id,
-                    "filename": f.filename,
-                    "content_type": f.content_type,
-                    "size": f.size,
-                    "record_type_name": f.record_type_name,
-                    "description": f.description,
-                    "date_created": f.date_created,
-                    "created_by_name": f.created_by_name,
-                    "is_private": f.is_private,
-                }
-                for f in files
-            ],
-        }
+        async with job_nimbus_provider_from_context(ctx) as provider:
+            logger.info("[MCP JobNimbus] Listing files for job", job_id=job_id)
+            files = await provider.get_job_files(job_id)
+
+            result = {
+                "count": len(files),
+                "files": [
+                    {
+                        "id": f.id,
+                        "filename": f.filename,
+                        "content_type": f.content_type,
+                        "size": f.size,
+                        "record_type_name": f.record_type_name,
+                        "description": f.description,
+                        "date_created": f.date_created,
+                        "created_by_name": f.created_by_name,
+                        "is_private": f.is_private,
+                    }
+                    for f in files
+                ],
+            }
 
-        logger.info(
-            "[MCP JobNimbus] Found files for job", count=len(files), job_id=job_id
-        )
-        return result
+            logger.info(
+                "[MCP JobNimbus] Found files for job", count=len(files), job_id=job_id
+            )
+            return result
 
     except CRMError as e:
         logger.error(
@@ -466,33 +466,32 @@ async def analyze_job_files(
         - Analyze all PDFs: analyze_job_files(job_id="mha5p15...", analysis_prompt="What is the total cost?", file_filter="pdfs")
     """
     try:
-        provider = await get_job_nimbus_provider_from_context(ctx)
+        async with job_nimbus_provider_from_context(ctx) as provider:
+            if specific_file_id:
+                logger.info(
+                    "[MCP JobNimbus] Analyzing specific file for job",
+                    specific_file_id=specific_file_id,
+                    job_id=job_id,
+                )
+            else:
+                logger.info(
+                    "[MCP JobNimbus] Analyzing files for job",
+                    file_filter=file_filter,
+                    job_id=job_id,
+                    analysis_prompt=analysis_prompt,
+                )
 
-        if specific_file_id:
-            logger.info(
-                "[MCP JobNimbus] Analyzing specific file for job",
-                specific_file_id=specific_file_id,
-                job_id=job_id,
-            )
-        else:
-            logger.info(
-                "[MCP JobNimbus] Analyzing files for job",
-                file_filter=file_filter,
+            # Call local mini-agent handler
+            result = await _analyze_job_files_with_mini_agent(
+                provider=provider,
                 job_id=job_id,
                 analysis_prompt=analysis_prompt,
+                file_filter=file_filter,
+                specific_file_id=specific_file_id,
             )
 
-        # Call local mini-agent handler
-        result = await _analyze_job_files_with_mini_agent(
-            provider=provider,
-            job_id=job_id,
-            analysis_prompt=analysis_prompt,
-            file_filter=file_filter,
-            specific_file_id=specific_file_id,
-        )
-
-        logger.info("[MCP JobNimbus] Analysis complete", char_count=len(result))
-        return result
+            logger.info("[MCP JobNimbus] Analysis complete", char_count=len(result))
+            return result
 
     except Exception as e:
         logger.error("[MCP JobNimbus] Error analyzing files", error=str(e))
@@ -7,10 +7,12 @@ handling API communication and data transformation.
 
 import asyncio
 import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
+from cachetools import LRUCache, TTLCache
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -18,9 +20,17 @@ from tenacity import (
     wait_exponential,
 )
 
-from src.integrations.crm.base import CRMError, CRMProvider
+from src.integrations.crm.base import CRMError, CRMProvider, FileStream
+from src.integrations.crm.constants import FILE_STREAM_CHUNK_SIZE
 from src.integrations.crm.constants import CRMProvider as CRMProviderEnum
-from src.integrations.crm.providers.job_nimbus.constants import JobNimbusEndpoints
+from src.integrations.crm.providers.job_nimbus.constants import (
+    CONTACT_CACHE_MAX_SIZE,
+    CONTACT_CACHE_TTL_SECONDS,
+    CONTACT_FETCH_CONCURRENCY,
+    FILE_SIZE_CACHE_MAX_SIZE,
+    FILE_SIZE_RESOLVE_CONCURRENCY,
+    JobNimbusEndpoints,
+)
 from src.integrations.crm.providers.job_nimbus.schemas import (
     FileMetadata,
     JobNimbusActivitiesListResponse,
@@ -83,6 +93,15 @@ class JobNimbusProvider(CRMProvider):
             },
         )
 
+        # Short-lived contact cache for enriching job listings
+        self._contact_cache: TTLCache = TTLCache(
+            maxsize=CONTACT_CACHE_MAX_SIZE, ttl=CONTACT_CACHE_TTL_SECONDS
+        )
+
+        # Resolved sizes for files the API reports as size=0 (file content
+        # is immutable, so entries never go stale)
+        self._file_size_cache: LRUCache = LRUCache(maxsize=FILE_SIZE_CACHE_MAX_SIZE)
+
         logger.info("JobNimbusProvider initialized with dynamic credentials")
 
     @retry(
@@ -369,15 +388,24 @@ class JobNimbusProvider(CRMProvider):
             filters=filters, page=page, page_size=page_size
         )
 
-        # Transform to universal Job schemas (async to optionally fetch contact details)
-        jobs = await asyncio.gather(
-            *[
-                self._transform_jn_job_to_universal_async(
-                    jn_job, include_contact_details=include_contact_details
-                )
-                for jn_job in jn_jobs_list.results
-            ]
-        )
+        # Fetch each distinct primary contact once for the whole page
+        contacts: dict[str, Contact] = {}
+        if include_contact_details:
+            contacts = await self._get_contacts_by_ids(
+                [
+                    jn_job.primary.id
+                    for jn_job in jn_jobs_list.results
+                    if jn_job.primary and jn_job.primary.id
+                ]
+            )
+
+        jobs = [
+            await self._transform_jn_job_to_universal_async(
+                jn_job,
+                contact=contacts.get(jn_job.primary.id) if jn_job.primary else None,
+            )
+            for jn_job in jn_jobs_list.results
+        ]
 
         # Use API total count and results for pagination metadata (server-side filtering)
         total_count = jn_jobs_list.count
@@ -548,6 +576,77 @@ class JobNimbusProvider(CRMProvider):
             )
             raise CRMError(f"Failed to fetch contact: {str(e)}", "UNKNOWN_ERROR")
 
+    async def _get_contacts_by_ids(self, contact_ids: list[str]) -> dict[str, Contact]:
+        """
+        Fetch several contacts, de-duplicated and cached.
+
+        Contacts are served from a short-lived cache when possible. Remaining
+        IDs are fetched in one bulk filter query; any the bulk query misses
+        are fetched individually with bounded concurrency.
+
+        Args:
+            contact_ids: Contact JNIDs (may contain duplicates)
+
+        Returns:
+            Mapping of contact JNID to Contact for every contact found
+        """
+        contacts: dict[str, Contact] = {}
+        missing: list[str] = []
+        for contact_id in dict.fromkeys(contact_ids):
+            cached = self._contact_cache.get(contact_id)
+            if cached is not None:
+                contacts[contact_id] = cached
+            else:
+                missing.append(contact_id)
+
+        if not missing:
+            return contacts
+
+        try:
+            params = {
+                "size": len(missing),
+                "filter": json.dumps({"must": [{"terms": {"jnid": missing}}]}),
+            }
+            response = await self._make_request(
+                "GET", JobNimbusEndpoints.CONTACTS, params=params
+            )
+            jn_contacts_list = JobNimbusContactsListResponse(**response.json())
+            for jn_contact in jn_contacts_list.results:
+                contact = self._transform_jn_contact_to_universal(jn_contact)
+                contacts[contact.id] = contact
+        except Exception as e:
+            logger.warning(
+                "[JobNimbus] Bulk contact fetch failed, fetching individually",
+                contact_count=len(missing),
+                error=str(e),
+            )
+
+        remaining = [contact_id for contact_id in missing if contact_id not in contacts]
+        if remaining:
+            semaphore = asyncio.Semaphore(CONTACT_FETCH_CONCURRENCY)
+
+            async def fetch(contact_id: str) -> Contact | None:
+                async with semaphore:
+                    try:
+                        return await self.get_contact(contact_id)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning(
+                            "[JobNimbus] Failed to fetch contact",
+                            contact_id=contact_id,
+                            error=str(exc),
+                        )
+                        return None
+
+            for contact in await asyncio.gather(*(fetch(c) for c in remaining)):
+                if contact is not None:
+                    contacts[contact.id] = contact
+
+        for contact_id in missing:
+            if contact_id in contacts:
+                self._contact_cache[contact_id] = contacts[contact_id]
+
+        return contacts
+
     async def get_all_contacts(
         self,
         filters: dict[str, Any] | None = None,
@@ -873,7 +972,8 @@ class JobNimbusProvider(CRMProvider):
         Applies additional client-side filtering by file type if requested.
 
         IMPORTANT: JobNimbus API sometimes returns size=0 for files that actually have content.
-        When size=0 is detected, we download the file to determine the actual size.
+        Those sizes are resolved with a one-byte ranged request (see _resolve_file_sizes),
+        so the listing stays metadata-only.
 
         Args:
             job_id: The job JNID to get files for
@@ -901,54 +1001,27 @@ class JobNimbusProvider(CRMProvider):
 
             files_response = JobNimbusFilesListResponse(**data)
 
-            # Transform to FileMetadata objects
-            all_files: list[FileMetadata] = []
-            for file in files_response.results:
-                file_size = file.size
+            # Fix for JobNimbus API bug: resolve sizes reported as 0 without
+            # downloading the file bodies
+            resolved_sizes = await self._resolve_file_sizes(
+                [file.jnid for file in files_response.results if file.size == 0]
+            )
 
-                # Fix for JobNimbus API bug: if size is 0, download file to get actual size
-                if file_size == 0:
-                    logger.warning(
-                        "[JobNimbus] File has size=0, downloading to determine actual size",
-                        file_name=file.filename,
-                        file_id=file.jnid,
-                    )
-                    try:
-                        # Download file to get actual size
-                        file_content, _, _ = await self.download_file(
-                            file.jnid,
-                            filename=file.filename,
-                            content_type=file.content_type,
-                        )
-                        file_size = len(file_content)
-                        logger.info(
-                            "[JobNimbus] Corrected file size from 0 to actual size",
-                            file_name=file.filename,
-                            file_id=file.jnid,
-                            actual_size=file_size,
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "[JobNimbus] Failed to download file to determine size",
-                            file_name=file.filename,
-                            file_id=file.jnid,
-                            error=str(e),
-                        )
-                        # Keep size as 0 if download fails
-
-                all_files.append(
-                    FileMetadata(
-                        id=file.jnid,
-                        filename=file.filename,
-                        content_type=file.content_type,
-                        size=file_size,
-                        record_type_name=file.record_type_name,
-                        description=file.description,
-                        date_created=file.date_created,
-                        created_by_name=file.created_by_name,
-                        is_private=file.is_private,
-                    )
+            # Transform to FileMetadata objects
+            all_files = [
+                FileMetadata(
+                    id=file.jnid,
+                    filename=file.filename,
+                    content_type=file.content_type,
+                    size=resolved_sizes.get(file.jnid, file.size),
+                    record_type_name=file.record_type_name,
+                    description=file.description,
+                    date_created=file.date_created,
+                    created_by_name=file.created_by_name,
+                    is_private=file.is_private,
                 )
+                for file in files_response.results
+            ]
 
             # Apply client-side filtering by type
             if file_filter == "images":
@@ -981,6 +1054,77 @@ class JobNimbusProvider(CRMProvider):
             logger.error("Error fetching files for job", job_id=job_id, error=str(e))
             raise CRMError(f"Failed to fetch files: {str(e)}", "UNKNOWN_ERROR")
 
+    async def _resolve_file_sizes(self, file_ids: list[str]) -> dict[str, int]:
+        """
+        Resolve actual sizes for files JobNimbus reports as size=0.
+
+        Sizes are cached by file ID and resolved concurrently under a bound.
+
+        Args:
+            file_ids: File JNIDs whose size needs resolving
+
+        Returns:
+            Mapping of file JNID to size for every size that could be resolved
+        """
+        sizes: dict[str, int] = {}
+        missing: list[str] = []
+        for file_id in file_ids:
+            if file_id in self._file_size_cache:
+                sizes[file_id] = self._file_size_cache[file_id]
+            else:
+                missing.append(file_id)
+
+        if not missing:
+            return sizes
+
+        semaphore = asyncio.Semaphore(FILE_SIZE_RESOLVE_CONCURRENCY)
+
+        async def resolve(file_id: str) -> tuple[str, int | None]:
+            async with semaphore:
+                return file_id, await self._probe_file_size(file_id)
+
+        for file_id, size in await asyncio.gather(*(resolve(f) for f in missing)):
+            if size is not None:
+                self._file_size_cache[file_id] = size
+                sizes[file_id] = size
+
+        return sizes
+
+    async def _probe_file_size(self, file_id: str) -> int | None:
+        """
+        Determine a file's size without downloading its body.
+
+        Requests the first byte only: the total comes from Content-Range on a
+        206, or from Content-Length if the CDN ignores the range. A ranged GET
+        is used rather than HEAD because the redirect target is a URL signed
+        for GET.
+
+        Args:
+            file_id: The file JNID
+
+        Returns:
+            File size in bytes, or None if it could not be determined
+        """
+        try:
+            file_stream = await self.stream_file(file_id, range_header="bytes=0-0")
+        except CRMError as e:
+            logger.warning(
+                "[JobNimbus] Failed to resolve file size",
+                file_id=file_id,
+                error=e.message,
+            )
+            return None
+
+        await file_stream.close()
+
+        if file_stream.content_range and "/" in file_stream.content_range:
+            total = file_stream.content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                return int(total)
+        if file_stream.status_code == 200:
+            return file_stream.content_length
+        return None
+
     async def download_file(
         self, file_id: str, filename: str | None = None, content_type: str | None = None
     ) -> tuple[bytes, str, str]:
@@ -1030,6 +1174,88 @@ class JobNimbusProvider(CRMProvider):
             )
             raise CRMError(f"Failed to download file: {str(e)}", "UNKNOWN_ERROR")
 
+    async def stream_file(
+        self,
+        file_id: str,
+        filename: str | None = None,
+        content_type: str | None = None,
+        range_header: str | None = None,
+    ) -> FileStream:
+        """
+        Open a JobNimbus file for streaming download with constant memory.
+
+        JobNimbus redirects to CloudFront/S3, which honours Range requests,
+        so range_header is forwarded to support resumable downloads.
+
+        Args:
+            file_id: The file JNID to download
+            filename: Filename from file metadata
+            content_type: Content type from file metadata
+            range_header: Optional HTTP Range header to forward
+
+        Returns:
+            FileStream relaying the upstream body in chunks
+
+        Raises:
+            CRMError: If the file can't be opened
+        """
+        url = f"{self.base_api_url}{JobNimbusEndpoints.FILE_BY_ID.format(jnid=file_id)}"
+        headers = {"Range": range_header} if range_header else None
+        logger.info(
+            "[JobNimbus] Streaming file", file_id=file_id, range_header=range_header
+        )
+
+        try:
+            request = self.client.build_request("GET", url, headers=headers)
+            response = await self.client.send(
+                request, stream=True, follow_redirects=True
+            )
+        except httpx.HTTPError as e:
+            logger.error(
+                "[JobNimbus] Error opening file stream", file_id=file_id, error=str(e)
+            )
+            raise CRMError(f"Failed to download file: {str(e)}", "UNKNOWN_ERROR")
+
+        if response.status_code >= 400:
+            await response.aclose()
+            logger.error(
+                "[JobNimbus] HTTP error streaming file",
+                file_id=file_id,
+                status_code=response.status_code,
+            )
+            error_code = {404: "NOT_FOUND", 416: "RANGE_NOT_SATISFIABLE"}.get(
+                response.status_code, "API_ERROR"
+            )
+            raise CRMError(
+                f"Failed to download file: {response.status_code}", error_code
+            )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes(FILE_STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        # httpx decodes compressed bodies, so the upstream length only holds
+        # for identity-encoded responses
+        content_length = (
+            response.headers.get("Content-Length")
+            if "Content-Encoding" not in response.headers
+            else None
+        )
+        return FileStream(
+            chunks=chunks(),
+            filename=filename or f"download_{file_id}",
+            content_type=content_type
+            or response.headers.get("Content-Type", "application/octet-stream"),
+            close=response.aclose,
+            status_code=response.status_code,
+            content_length=int(content_length) if content_length else None,
+            content_range=response.headers.get("Content-Range"),
+            accept_ranges=response.headers.get("Accept-Ranges") == "bytes",
+        )
+
     # ========================================================================
     # Transformation Methods
     # ========================================================================
@@ -1038,8 +1264,13 @@ class JobNimbusProvider(CRMProvider):
         self,
         jn_job: JobNimbusJobResponse,
         include_contact_details: bool = False,
+        contact: Contact | None = None,
     ) -> Job:
-        """Async transformation to universal Job schema with optional contact enrichment."""
+        """Async transformation to universal Job schema with optional contact enrichment.
+
+        Pass an already-fetched primary contact via ``contact`` to avoid a
+        per-job lookup; ``include_contact_details`` fetches it otherwise.
+        """
         # Gather raw data for provider_data enrichment
         all_data = jn_job.model_dump(mode="json")
 
@@ -1064,18 +1295,16 @@ class JobNimbusProvider(CRMProvider):
         customer_phone = None
         customer_email = None
 
-        if include_contact_details and jn_job.primary and jn_job.primary.id:
+        if (
+            contact is None
+            and include_contact_details
+            and jn_job.primary
+            and jn_job.primary.id
+        ):
             try:
                 contact = await self.get_contact(jn_job.primary.id)
-                customer_email = contact.email
-                customer_phone = (
-                    contact.phone or contact.mobile_phone or contact.work_phone
-                )
                 logger.debug(
-                    "[JobNimbus] Fetched contact",
-                    contact_id=jn_job.primary.id,
-                    phone=customer_phone,
-                    email=customer_email,
+                    "[JobNimbus] Fetched contact", contact_id=jn_job.primary.id
                 )
             except Exception as exc:  # noqa: BLE001
                 logger.warning(
@@ -1084,6 +1313,10 @@ class JobNimbusProvider(CRMProvider):
                     error=str(exc),
                 )
 
+        if contact is not None:
+            customer_email = contact.email
+            customer_phone = contact.phone or contact.mobile_phone or contact.work_phone
+
         provider_data: dict[str, Any] = {
             "recid": jn_job.recid,
             "jnid": jn_job.jnid,
@@ -0,0 +1,160 @@
+"""
+OAuth token management for the Service Titan API.
+
+Service Titan issues client-credentials tokens that expire (typically after
+15 minutes to an hour). A single ServiceTitanTokenManager is shared by every
+provider instance for the same tenant so the token endpoint is hit roughly
+once per token lifetime, and concurrent callers share one in-flight refresh.
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from src.integrations.crm.base import CRMError
+from src.utils.logger import logger
+
+# Refresh this many seconds before the token actually expires
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Used when the token endpoint omits expires_in
+DEFAULT_TOKEN_TTL_SECONDS = 900
+
+
+class ServiceTitanTokenManager:
+    """Expiry-aware, single-flight OAuth token cache for one Service Titan tenant."""
+
+    def __init__(self, client_id: str, client_secret: str, token_url: str):
+        """
+        Initialize the token manager.
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            token_url: OAuth token URL
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_url = token_url
+
+        self._access_token: str | None = None
+        self._expires_at: float = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        """Whether the cached token is usable without a refresh."""
+        return (
+            self._access_token is not None
+            and time.monotonic() < self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+        )
+
+    async def get_token(self, client: httpx.AsyncClient) -> str:
+        """
+        Return a valid access token, refreshing it ahead of expiry.
+
+        Args:
+            client: HTTP client used to call the token endpoint
+
+        Returns:
+            OAuth access token
+
+        Raises:
+            CRMError: If authentication fails
+        """
+        if self._is_fresh():
+            return self._access_token
+
+        async with self._lock:
+            # Another coroutine may have refreshed while we waited
+            if self._is_fresh():
+                return self._access_token
+            return await self._refresh(client)
+
+    def invalidate(self, token: str) -> None:
+        """
+        Discard a token the API rejected so the next caller refreshes.
+
+        Only clears the cache if it still holds the rejected token, so a
+        token refreshed concurrently by another coroutine is kept.
+
+        Args:
+            token: The access token that was rejected
+        """
+        if self._access_token == token:
+            self._access_token = None
+            self._expires_at = 0.0
+
+    async def _refresh(self, client: httpx.AsyncClient) -> str:
+        """Fetch a new token from the token endpoint. Caller must hold the lock."""
+        auth_data = {
+            "grant_type": "client_credentials",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+
+        try:
+            response = await client.post(
+                self.token_url,
+                data=auth_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response.raise_for_status()
+
+            token_response = response.json()
+            expires_in = int(
+                token_response.get("expires_in", DEFAULT_TOKEN_TTL_SECONDS)
+            )
+            self._access_token = token_response["access_token"]
+            self._expires_at = time.monotonic() + expires_in
+
+            logger.info(
+                "Successfully obtained Service Titan access token",
+                expires_in=expires_in,
+            )
+            return self._access_token
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Failed to get access token",
+                status_code=e.response.status_code,
+                response_text=e.response.text,
+            )
+            raise CRMError(
+                error_code="AUTH_FAILED",
+                message=f"Failed to authenticate with Service Titan: {e.response.text}",
+            )
+        except Exception as e:
+            logger.error("Unexpected error getting access token", error=str(e))
+            raise CRMError(
+                error_code="AUTH_ERROR", message=f"Unexpected authentication error: {e}"
+            )
+
+
+# Token managers shared across provider instances, keyed by tenant + client
+_token_managers: dict[tuple[str, str, str], ServiceTitanTokenManager] = {}
+
+
+def get_token_manager(
+    tenant_id: str, client_id: str, client_secret: str, token_url: str
+) -> ServiceTitanTokenManager:
+    """
+    Get the shared token manager for a Service Titan tenant.
+
+    A new manager replaces the old one if the client secret was rotated.
+
+    Args:
+        tenant_id: Service Titan tenant ID
+        client_id: OAuth client ID
+        client_secret: OAuth client secret
+        token_url: OAuth token URL
+
+    Returns:
+        ServiceTitanTokenManager shared by all providers for this tenant
+    """
+    key = (tenant_id, client_id, token_url)
+    manager = _token_managers.get(key)
+    if manager is None or manager.client_secret != client_secret:
+        manager = ServiceTitanTokenManager(client_id, client_secret, token_url)
+        _token_managers[key] = manager
+    return manager
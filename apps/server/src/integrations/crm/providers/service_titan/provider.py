@@ -5,6 +5,8 @@ This module implements the CRMProvider interface for Service Titan,
 handling API communication and data transformation.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -13,6 +15,7 @@ import httpx
 from src.integrations.crm.base import CRMError, CRMProvider
 from src.integrations.crm.constants import CRMProvider as CRMProviderEnum
 from src.integrations.crm.constants import Status
+from src.integrations.crm.providers.service_titan.auth import get_token_manager
 from src.integrations.crm.providers.service_titan.constants import ServiceTitanEndpoints
 from src.integrations.crm.providers.service_titan.schemas import ServiceTitanJob
 from src.integrations.crm.schemas import (
@@ -91,65 +94,51 @@ class ServiceTitanProvider(CRMProvider):
             },
         )
 
+        # OAuth tokens are shared by every provider for this tenant
+        self.token_manager = get_token_manager(
+            tenant_id=self.tenant_id,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            token_url=self.token_url,
+        )
+
         logger.info(
             "ServiceTitanProvider initialized with dynamic credentials",
             tenant_id=self.tenant_id,
         )
-        self._access_token: str | None = None
 
     async def _get_access_token(self) -> str:
         """Get OAuth access token for Service Titan API."""
-        if self._access_token:
-            return self._access_token
-
-        auth_data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-        }
-
-        try:
-            response = await self.client.post(
-                self.token_url,
-                data=auth_data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            response.raise_for_status()
-
-            token_response = response.json()
-            self._access_token = token_response["access_token"]
-
-            logger.info("Successfully obtained Service Titan access token")
-            return self._access_token
-
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "Failed to get access token",
-                status_code=e.response.status_code,
-                response_text=e.response.text,
-            )
-            raise CRMError(
-                error_code="AUTH_FAILED",
-                message=f"Failed to authenticate with Service Titan: {e.response.text}",
-            )
-        except Exception as e:
-            logger.error("Unexpected error getting access token", error=str(e))
-            raise CRMError(
-                error_code="AUTH_ERROR", message=f"Unexpected authentication error: {e}"
-            )
+        return await self.token_manager.get_token(self.client)
 
     async def _make_authenticated_request(
         self, method: str, url: str, **kwargs
     ) -> httpx.Response:
-        """Make an authenticated request to Service Titan API."""
-        token = await self._get_access_token()
+        """
+        Make an authenticated request to Service Titan API.
 
-        headers = kwargs.get("headers", {})
-        headers["Authorization"] = f"Bearer {token}"
+        If the token is rejected with a 401 (e.g. revoked before its expiry),
+        the token is discarded and the request is retried once.
+        """
+        headers = kwargs.pop("headers", {})
         headers["ST-App-Key"] = self.app_key
-        kwargs["headers"] = headers
 
-        return await self.client.request(method, url, **kwargs)
+        token = await self._get_access_token()
+        headers["Authorization"] = f"Bearer {token}"
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+
+        if response.status_code == 401:
+            logger.warning(
+                "Service Titan rejected access token, refreshing and retrying",
+                method=method,
+                url=url,
+            )
+            self.token_manager.invalidate(token)
+            token = await self._get_access_token()
+            headers["Authorization"] = f"Bearer {token}"
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+
+        return response
 
     # ========================================================================
     # Universal CRM Interface Implementation (required abstract methods)
@@ -204,27 +193,8 @@ class ServiceTitanProvider(CRMProvider):
             "Getting all Service Titan projects", page=page, page_size=page_size
         )
 
-        # Build query parameters
-        params = {
-            "page": page,
-            "pageSize": page_size,
-        }
-
-        # Add date filters if provided
-        if filters:
-            if "createdOnOrAfter" in filters:
-                params["createdOnOrAfter"] = filters["createdOnOrAfter"]
-            if "createdBefore" in filters:
-                params["createdBefore"] = filters["createdBefore"]
-
-        logger.debug("Fetching projects with params", params=params)
-
-        # Make direct API call to projects endpoint
         try:
-            url = f"{self.base_api_url}{ServiceTitanEndpoints.PROJECTS.format(tenant_id=self.tenant_id)}"
-            response = await self._make_authenticated_request("GET", url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_projects_page(filters, page, page_size)
 
             # Service Titan returns data in a "data" field with pagination info
             project_data = data.get("data", [])
@@ -252,7 +222,7 @@ class ServiceTitanProvider(CRMProvider):
 
             return ProjectList(
                 projects=projects,
-                total_count=data.get("totalCount") or len(projects),
+                total_count=self._page_total_count(data, page, page_size),
                 provider=CRMProviderEnum.SERVICE_TITAN,
                 page=page,
                 page_size=page_size,
@@ -325,10 +295,11 @@ class ServiceTitanProvider(CRMProvider):
         """
         Get all jobs with optional filtering and pagination.
 
-        Note: Service Titan uses projects endpoint for jobs.
+        Note: Service Titan uses projects endpoint for jobs. Pagination is
+        passed through to the API, so only the requested page is fetched.
 
         Args:
-            filters: Optional dictionary of filters (not yet implemented)
+            filters: Optional dictionary of filters (createdOnOrAfter, createdBefore)
             page: Page number (1-indexed)
             page_size: Number of items per page
 
@@ -337,60 +308,119 @@ class ServiceTitanProvider(CRMProvider):
         """
         logger.info("Getting all Service Titan jobs", page=page, page_size=page_size)
 
-        # Call existing get_all_project_statuses method
-        project_list = await self.get_all_project_statuses()
-
-        # Transform to universal JobList
-        jobs = []
-        for project_status in project_list.projects:
-            # Extract job data from provider_data
-            if project_status.provider_data:
-                job = Job(
-                    id=project_status.project_id,
-                    name=project_status.provider_data.get("name"),
-                    number=project_status.provider_data.get("number"),
-                    status=project_status.status.value,
-                    status_id=project_status.provider_data.get("statusId"),
-                    workflow_type="Project",
-                    description=None,
-                    customer_id=str(project_status.provider_data.get("customerId"))
-                    if project_status.provider_data.get("customerId")
-                    else None,
-                    customer_name=None,  # Not available in project list
-                    address_line1=None,
-                    address_line2=None,
-                    city=None,
-                    state=None,
-                    postal_code=None,
-                    country=None,
-                    created_at=project_status.provider_data.get("createdOn"),
-                    updated_at=project_status.updated_at.isoformat()
-                    if project_status.updated_at
-                    else None,
-                    completed_at=project_status.provider_data.get(
-                        "actualCompletionDate"
-                    ),
-                    sales_rep_id=None,
-                    sales_rep_name=None,
-                    provider=CRMProviderEnum.SERVICE_TITAN,
-                    provider_data=project_status.provider_data,
-                )
-                jobs.append(job)
+        try:
+            data = await self._fetch_projects_page(filters, page, page_size)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "HTTP error getting jobs",
+                status_code=e.response.status_code,
+                response_text=e.response.text,
+            )
+            raise CRMError(
+                f"Failed to get jobs: {e.response.status_code}", "HTTP_ERROR"
+            ) from e
+        except CRMError:
+            raise
+        except Exception as e:
+            logger.error("Error getting jobs", error=str(e))
+            raise CRMError(f"Failed to get jobs: {e}", "UNKNOWN_ERROR") from e
 
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_jobs = jobs[start_idx:end_idx]
+        jobs = [
+            self._transform_project_data_to_job(project_item)
+            for project_item in data.get("data", [])
+        ]
 
         return JobList(
-            jobs=paginated_jobs,
-            total_count=project_list.total_count,
+            jobs=jobs,
+            total_count=self._page_total_count(data, page, page_size),
             provider=CRMProviderEnum.SERVICE_TITAN,
             page=page,
             page_size=page_size,
-            has_more=end_idx < len(jobs),
+            has_more=data.get("hasMore", False),
         )
 
+    async def iter_all_jobs(
+        self,
+        filters: dict[str, Any] | None = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[Job]:
+        """
+        Iterate over every job, page by page, prefetching the next page.
+
+        The request for page N+1 is already in flight while the caller
+        consumes the jobs from page N.
+
+        Args:
+            filters: Optional dictionary of filters (same as get_all_jobs)
+            page_size: Number of items fetched per request
+
+        Yields:
+            Job: Each job in universal schema
+        """
+        page = 1
+        next_page: asyncio.Task[JobList] | None = asyncio.create_task(
+            self.get_all_jobs(filters=filters, page=page, page_size=page_size)
+        )
+        try:
+            while next_page is not None:
+                job_list = await next_page
+                next_page = None
+                if job_list.has_more and job_list.jobs:
+                    page += 1
+                    next_page = asyncio.create_task(
+                        self.get_all_jobs(
+                            filters=filters, page=page, page_size=page_size
+                        )
+                    )
+                for job in job_list.jobs:
+                    yield job
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _fetch_projects_page(
+        self,
+        filters: dict[str, Any] | None,
+        page: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of raw project data from the projects endpoint.
+
+        Pagination is done server-side; includeTotal asks Service Titan to
+        return totalCount so callers get an accurate count across pages.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        params: dict[str, Any] = {
+            "page": page,
+            "pageSize": page_size,
+            "includeTotal": "true",
+        }
+
+        # Add date filters if provided
+        if filters:
+            if "createdOnOrAfter" in filters:
+                params["createdOnOrAfter"] = filters["createdOnOrAfter"]
+            if "createdBefore" in filters:
+                params["createdBefore"] = filters["createdBefore"]
+
+        logger.debug("Fetching projects with params", params=params)
+
+        url = f"{self.base_api_url}{ServiceTitanEndpoints.PROJECTS.format(tenant_id=self.tenant_id)}"
+        response = await self._make_authenticated_request("GET", url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _page_total_count(data: dict[str, Any], page: int, page_size: int) -> int:
+        """Total item count for a page response, with a lower-bound fallback."""
+        total_count = data.get("totalCount")
+        if total_count is not None:
+            return total_count
+        return (page - 1) * page_size + len(data.get("data", []))
+
     async def get_contact(self, contact_id: str) -> Contact:
         """
         Get a specific contact by ID.
@@ -638,6 +668,48 @@ class ServiceTitanProvider(CRMProvider):
     # Helper Methods (transformation functions)
     # ========================================================================
 
+    def _transform_project_data_to_job(self, project_data: dict[str, Any]) -> Job:
+        """
+        Transform a raw Service Titan project list item to a universal Job.
+
+        Args:
+            project_data: Raw project data from the projects endpoint
+
+        Returns:
+            Job: Universal job schema
+        """
+        project_status = self._transform_job_to_project_status(project_data)
+        provider_data = project_status.provider_data or {}
+
+        return Job(
+            id=project_status.project_id,
+            name=provider_data.get("name"),
+            number=provider_data.get("number"),
+            status=project_status.status.value,
+            status_id=provider_data.get("statusId"),
+            workflow_type="Project",
+            description=None,
+            customer_id=str(provider_data.get("customerId"))
+            if provider_data.get("customerId")
+            else None,
+            customer_name=None,  # Not available in project list
+            address_line1=None,
+            address_line2=None,
+            city=None,
+            state=None,
+            postal_code=None,
+            country=None,
+            created_at=provider_data.get("createdOn"),
+            updated_at=project_status.updated_at.isoformat()
+            if project_status.updated_at
+            else None,
+            completed_at=provider_data.get("actualCompletionDate"),
+            sales_rep_id=None,
+            sales_rep_name=None,
+            provider=CRMProviderEnum.SERVICE_TITAN,
+            provider_data=provider_data,
+        )
+
     def _transform_st_project_to_universal_project(
         self, st_project: ProjectResponse
     ) -> Project:
@@ -5,10 +5,9 @@ This module contains all the API endpoints for CRM operations using
 the universal interface that works across all CRM providers.
 """
 
-from io import BytesIO
-
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from src.auth.dependencies import get_current_user, get_current_user_optional
 from src.auth.schemas import User
@@ -257,55 +256,62 @@ async def download_file(
     content_type: str | None = Query(
         None, description="Optional content type from metadata"
     ),
+    range_header: str | None = Header(None, alias="Range"),
     current_user: User = Depends(get_current_user),
     crm_service: CRMService = Depends(get_crm_service),
 ):
     """
     Download a specific file's content.
 
-    This endpoint streams the file content to the client with proper headers
-    for browser download.
+    This endpoint relays the file from the CRM to the client chunk by chunk,
+    so memory use stays constant regardless of file size. Range requests are
+    forwarded to the CRM to support resumable downloads.
 
     Args:
         file_id: The unique identifier for the file
         filename: Optional filename (recommended to provide from file list)
         content_type: Optional content type (recommended to provide from file list)
+        range_header: Optional HTTP Range header (e.g. "bytes=1024-")
         crm_service: The CRM service instance from dependency injection
 
     Returns:
-        StreamingResponse with file content
+        StreamingResponse with file content (206 for range requests)
 
     Raises:
         HTTPException: If the file is not found or an error occurs
     """
     try:
-        (
-            file_content,
-            resolved_filename,
-            resolved_content_type,
-        ) = await crm_service.crm_provider.download_file(
-            file_id, filename, content_type
-        )
-
-        return StreamingResponse(
-            BytesIO(file_content),
-            media_type=resolved_content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{resolved_filename}"'
-            },
+        file_stream = await crm_service.crm_provider.stream_file(
+            file_id, filename, content_type, range_header
         )
     except CRMError as e:
-        status_code = (
-            status.HTTP_501_NOT_IMPLEMENTED
-            if e.error_code == "NOT_SUPPORTED"
-            else status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        status_code = {
+            "NOT_SUPPORTED": status.HTTP_501_NOT_IMPLEMENTED,
+            "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+            "RANGE_NOT_SATISFIABLE": status.HTTP_416_RANGE_NOT_SATISFIABLE,
+        }.get(e.error_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         raise HTTPException(status_code=status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
 
+    headers = {"Content-Disposition": f'attachment; filename="{file_stream.filename}"'}
+    if file_stream.content_length is not None:
+        headers["Content-Length"] = str(file_stream.content_length)
+    if file_stream.content_range:
+        headers["Content-Range"] = file_stream.content_range
+    if file_stream.accept_ranges:
+        headers["Accept-Ranges"] = "bytes"
+
+    return StreamingResponse(
+        file_stream.chunks,
+        status_code=file_stream.status_code,
+        media_type=file_stream.content_type,
+        headers=headers,
+        background=BackgroundTask(file_stream.close),
+    )
+
 
 # ========================================================================
 # Project Endpoints
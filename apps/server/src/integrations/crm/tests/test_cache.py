@@ -0,0 +1,189 @@
+"""Tests for the CRM read-through cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.integrations.crm.cache import (
+    ENTITY_CONTACT,
+    ENTITY_JOB,
+    ENTITY_PROJECT,
+    CachedCRMProvider,
+    CRMCache,
+    InMemoryCacheBackend,
+)
+from src.integrations.crm.constants import CRMProvider as CRMProviderEnum
+from src.integrations.crm.schemas import Job
+from src.utils.metrics import render_metrics
+
+TTLS = {ENTITY_JOB: 60, ENTITY_PROJECT: 60, ENTITY_CONTACT: 60}
+
+
+def scheduled_job(job_id: str) -> Job:
+    return Job(id=job_id, status="Scheduled", provider=CRMProviderEnum.JOB_NIMBUS)
+
+
+@pytest.fixture
+def provider():
+    """Mock provider whose get_job yields control before returning."""
+    mock = MagicMock()
+
+    async def get_job(job_id: str) -> Job:
+        await asyncio.sleep(0)
+        return scheduled_job(job_id)
+
+    mock.get_job = AsyncMock(side_effect=get_job)
+    mock.update_job_status = AsyncMock()
+    mock.provider_name = "job_nimbus"
+    return mock
+
+
+@pytest.fixture
+def cache():
+    return CRMCache(InMemoryCacheBackend(max_entries=100), TTLS)
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_hit_cache(provider, cache):
+    """Second read of the same job should not reach the provider."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    await cached.get_job("job-1")
+    await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 1
+    assert cache.stats.snapshot()["hits"] == {ENTITY_JOB: 1}
+    assert cache.stats.snapshot()["misses"] == {ENTITY_JOB: 1}
+
+
+@pytest.mark.asyncio
+async def test_mutating_a_cached_read_does_not_change_the_cache(provider, cache):
+    """Callers get their own copy, as they would from Redis."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    first = await cached.get_job("job-1")
+    first.status = "Mutated"
+    second = await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 1
+    assert second.status == "Scheduled"
+    second.status = "Mutated again"
+    assert (await cached.get_job("job-1")).status == "Scheduled"
+
+
+def exported_lookups(entity: str, result: str) -> float:
+    """Current value of crm_cache_lookups_total as /metrics renders it."""
+    sample = f'crm_cache_lookups_total{{entity="{entity}",result="{result}"}} '
+    for line in render_metrics().splitlines():
+        if line.startswith(sample):
+            return float(line.removeprefix(sample))
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_exported_as_metrics(provider, cache):
+    """Hits and misses feed the crm_cache_lookups_total counter."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+    hits = exported_lookups(ENTITY_JOB, "hit")
+    misses = exported_lookups(ENTITY_JOB, "miss")
+
+    await cached.get_job("job-1")
+    await cached.get_job("job-1")
+    await cached.get_job("job-1")
+
+    assert exported_lookups(ENTITY_JOB, "hit") == hits + 2
+    assert exported_lookups(ENTITY_JOB, "miss") == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(provider, cache):
+    """Concurrent misses for one key should trigger a single provider call."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    jobs = await asyncio.gather(*(cached.get_job("job-1") for _ in range(5)))
+
+    assert {job.id for job in jobs} == {"job-1"}
+    assert provider.get_job.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_scoped_by_organization(provider, cache):
+    """The same job ID in two orgs must not share a cache entry."""
+    await CachedCRMProvider(provider, "org-1", cache).get_job("job-1")
+    await CachedCRMProvider(provider, "org-2", cache).get_job("job-1")
+
+    assert provider.get_job.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_status_update_invalidates_job(provider, cache):
+    """update_job_status should force the next read back to the provider."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    await cached.get_job("job-1")
+    await cached.update_job_status("job-1", "Completed")
+    await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 2
+
+
+async def write_during_load(provider, cache, writer_org: str, writer_job: str):
+    """Load org-1/job-1 while a status update lands; return the loader's cache."""
+    release = asyncio.Event()
+
+    async def slow_get_job(job_id: str) -> Job:
+        await release.wait()
+        return scheduled_job(job_id)
+
+    provider.get_job.side_effect = slow_get_job
+    cached = CachedCRMProvider(provider, "org-1", cache)
+    load = asyncio.create_task(cached.get_job("job-1"))
+    while not provider.get_job.await_count:
+        await asyncio.sleep(0)
+
+    writer = CachedCRMProvider(provider, writer_org, cache)
+    await writer.update_job_status(writer_job, "Completed")
+    release.set()
+    await load
+    return cached
+
+
+@pytest.mark.asyncio
+async def test_write_during_load_keeps_result_out_of_cache(provider, cache):
+    """A load that overlapped a write to its key may be stale; don't store it."""
+    cached = await write_during_load(provider, cache, "org-1", "job-1")
+
+    await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unrelated_write_during_load_still_caches(provider, cache):
+    """Writes to other keys (here another org's job) don't affect a load."""
+    cached = await write_during_load(provider, cache, "org-2", "job-1")
+
+    await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_reloaded(provider):
+    """Entries past their TTL should be treated as misses."""
+    cache = CRMCache(InMemoryCacheBackend(max_entries=100), {**TTLS, ENTITY_JOB: 0})
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    await cached.get_job("job-1")
+    await cached.get_job("job-1")
+
+    assert provider.get_job.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_attributes_forward_to_provider(provider, cache):
+    """Provider-specific attributes should pass through the wrapper."""
+    cached = CachedCRMProvider(provider, "org-1", cache)
+
+    assert cached.provider_name == "job_nimbus"
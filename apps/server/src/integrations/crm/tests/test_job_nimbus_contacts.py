@@ -0,0 +1,137 @@
+"""Tests for JobNimbus bulk contact lookup used to enrich job listings."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from src.integrations.crm.providers.job_nimbus import provider as job_nimbus
+from src.integrations.crm.providers.job_nimbus.provider import JobNimbusProvider
+
+API_URL = "https://jobnimbus.example.com/api1"
+
+
+def contact_json(jnid: str) -> dict:
+    return {
+        "jnid": jnid,
+        "customer": "customer-1",
+        "type": "contact",
+        "createdBy": "user-1",
+        "dateCreated": 1700000000,
+        "dateUpdated": 1700000000,
+        "displayName": f"Contact {jnid}",
+    }
+
+
+class ContactsAPI:
+    """Fake contacts endpoints recording every request."""
+
+    def __init__(self):
+        self.bulk_status = 200
+        self.bulk_omits: frozenset = frozenset()
+        self.bulk_requests: list[httpx.Request] = []
+        self.single_requests: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api1")
+        if path == "/contacts":
+            self.bulk_requests.append(request)
+            if self.bulk_status != 200:
+                return httpx.Response(self.bulk_status)
+            terms = json.loads(request.url.params["filter"])["must"][0]["terms"]
+            found = [jnid for jnid in terms["jnid"] if jnid not in self.bulk_omits]
+            return httpx.Response(
+                200,
+                json={
+                    "count": len(found),
+                    "results": [contact_json(jnid) for jnid in found],
+                },
+            )
+
+        jnid = path.removeprefix("/contacts/")
+        self.single_requests.append(jnid)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return httpx.Response(200, json=contact_json(jnid))
+
+
+@pytest.fixture
+def api():
+    return ContactsAPI()
+
+
+@pytest.fixture
+def provider(api):
+    provider = JobNimbusProvider(api_key="key", base_api_url=API_URL)
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_duplicate_ids_are_fetched_in_one_terms_query(api, provider):
+    """Duplicates collapse and every contact comes from one bulk request."""
+    contacts = await provider._get_contacts_by_ids(["c1", "c2", "c1", "c3"])
+
+    assert sorted(contacts) == ["c1", "c2", "c3"]
+    assert contacts["c2"].display_name == "Contact c2"
+    assert len(api.bulk_requests) == 1
+    params = api.bulk_requests[0].url.params
+    assert json.loads(params["filter"]) == {
+        "must": [{"terms": {"jnid": ["c1", "c2", "c3"]}}]
+    }
+    assert params["size"] == "3"
+    assert api.single_requests == []
+
+
+@pytest.mark.asyncio
+async def test_contacts_missing_from_bulk_query_are_fetched_individually(api, provider):
+    """Only the contacts the bulk query didn't return are fetched one by one."""
+    api.bulk_omits = frozenset({"c2"})
+
+    contacts = await provider._get_contacts_by_ids(["c1", "c2"])
+
+    assert sorted(contacts) == ["c1", "c2"]
+    assert api.single_requests == ["c2"]
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_query_falls_back_with_bounded_concurrency(
+    monkeypatch, api, provider
+):
+    """If the bulk query fails, individual fetches run at most N at a time."""
+    monkeypatch.setattr(job_nimbus, "CONTACT_FETCH_CONCURRENCY", 2)
+    api.bulk_status = 500
+    contact_ids = [f"c{i}" for i in range(6)]
+
+    contacts = await provider._get_contacts_by_ids(contact_ids)
+
+    assert sorted(contacts) == contact_ids
+    assert sorted(api.single_requests) == contact_ids
+    assert api.peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_contacts_are_served_from_cache_until_ttl_expires(api, provider):
+    """A second lookup within the TTL makes no requests; after it, refetches."""
+    now = [0.0]
+    provider._contact_cache = TTLCache(maxsize=100, ttl=60, timer=lambda: now[0])
+
+    first = await provider._get_contacts_by_ids(["c1", "c2"])
+    second = await provider._get_contacts_by_ids(["c2", "c1"])
+    assert second == first
+    assert len(api.bulk_requests) == 1
+
+    # Only uncached IDs are queried
+    await provider._get_contacts_by_ids(["c1", "c3"])
+    terms = json.loads(api.bulk_requests[-1].url.params["filter"])
+    assert terms["must"][0]["terms"]["jnid"] == ["c3"]
+
+    now[0] = 61
+    await provider._get_contacts_by_ids(["c1"])
+    assert len(api.bulk_requests) == 3
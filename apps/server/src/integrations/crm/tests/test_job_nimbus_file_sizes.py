@@ -0,0 +1,125 @@
+"""Tests for resolving JobNimbus file sizes without downloading the files."""
+
+import httpx
+import pytest
+
+from src.integrations.crm.providers.job_nimbus.provider import JobNimbusProvider
+
+API_URL = "https://jobnimbus.example.com/api1"
+CDN_URL = "https://cdn.example.com"
+FILE_SIZES = {"f1": 2048, "f2": 1_000_000, "f3": 512}
+
+
+def file_json(jnid: str, size: int) -> dict:
+    return {
+        "jnid": jnid,
+        "customer": "customer-1",
+        "type": "attachment",
+        "filename": f"{jnid}.jpg",
+        "contentType": "image/jpeg",
+        "size": size,
+        "dateCreated": 1700000000,
+        "dateUpdated": 1700000000,
+        "createdBy": "user-1",
+        "createdByName": "Jane",
+        "recordType": 1,
+        "recordTypeName": "Photo",
+    }
+
+
+class FilesAPI:
+    """File listing where JobNimbus reports f1 and f2 as size=0."""
+
+    def __init__(self):
+        self.cdn_requests: list[httpx.Request] = []
+        self.cdn_response = self.ranged_response
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "cdn.example.com":
+            self.cdn_requests.append(request)
+            return self.cdn_response(request)
+
+        path = request.url.path.removeprefix("/api1")
+        if path == "/files":
+            files = [
+                file_json("f1", 0),
+                file_json("f2", 0),
+                file_json("f3", FILE_SIZES["f3"]),
+            ]
+            return httpx.Response(200, json={"count": len(files), "files": files})
+        file_id = path.rsplit("/", 1)[1]
+        return httpx.Response(302, headers={"Location": f"{CDN_URL}/{file_id}"})
+
+    @staticmethod
+    def ranged_response(request: httpx.Request) -> httpx.Response:
+        size = FILE_SIZES[request.url.path.lstrip("/")]
+        return httpx.Response(
+            206,
+            headers={"Content-Range": f"bytes 0-0/{size}", "Content-Length": "1"},
+            content=b"x",
+        )
+
+
+@pytest.fixture
+def api():
+    return FilesAPI()
+
+
+@pytest.fixture
+def provider(api):
+    provider = JobNimbusProvider(api_key="key", base_api_url=API_URL)
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_listing_resolves_zero_sizes_with_one_byte_probes(api, provider):
+    """Only size=0 files are probed, each for its first byte, then cached."""
+    files = await provider.get_job_files("job-1")
+
+    assert {f.id: f.size for f in files} == FILE_SIZES
+    assert sorted(r.url.path for r in api.cdn_requests) == ["/f1", "/f2"]
+    assert all(r.headers["Range"] == "bytes=0-0" for r in api.cdn_requests)
+
+    # Sizes never change for a file, so the second listing makes no probes
+    files = await provider.get_job_files("job-1")
+    await provider.close()
+
+    assert {f.id: f.size for f in files} == FILE_SIZES
+    assert len(api.cdn_requests) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "headers", "expected"),
+    [
+        (206, {"Content-Range": "bytes 0-0/4096"}, 4096),
+        # CDN ignored the range: the full length is the size
+        (200, {"Content-Length": "4096"}, 4096),
+        # Total unknown to the CDN
+        (206, {"Content-Range": "bytes 0-0/*"}, None),
+    ],
+)
+async def test_probe_reads_size_from_response_headers(
+    api, provider, status, headers, expected
+):
+    """The size comes from Content-Range, or Content-Length on a plain 200."""
+    api.cdn_response = lambda _request: httpx.Response(status, headers=headers)
+
+    size = await provider._probe_file_size("f1")
+    await provider.close()
+
+    assert size == expected
+
+
+@pytest.mark.asyncio
+async def test_unresolved_sizes_are_not_cached(api, provider):
+    """A failed probe leaves the reported size and is retried next listing."""
+    api.cdn_response = lambda _request: httpx.Response(403)
+
+    files = await provider.get_job_files("job-1")
+    await provider._resolve_file_sizes(["f1"])
+    await provider.close()
+
+    assert {f.id: f.size for f in files}["f1"] == 0
+    assert [r.url.path for r in api.cdn_requests].count("/f1") == 2
@@ -0,0 +1,179 @@
+"""Tests for streaming JobNimbus file downloads and the download route."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.auth.dependencies import get_current_user
+from src.auth.schemas import Role, User
+from src.integrations.crm.base import CRMError
+from src.integrations.crm.dependencies import get_crm_service
+from src.integrations.crm.providers.job_nimbus.provider import JobNimbusProvider
+from src.integrations.crm.router import router
+from src.integrations.crm.service import CRMService
+
+API_URL = "https://jobnimbus.example.com/api1"
+CDN_URL = "https://cdn.example.com"
+CONTENT = b"0123456789" * 100
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    """Upstream body that records whether it was closed."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.closed = False
+
+    async def __aiter__(self):
+        yield self.body
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FilesAPI:
+    """JobNimbus file endpoint redirecting to a CDN that honours Range."""
+
+    def __init__(self):
+        self.cdn_requests: list[httpx.Request] = []
+        self.streams: list[TrackedStream] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host != "cdn.example.com":
+            file_id = request.url.path.rsplit("/", 1)[1]
+            return httpx.Response(302, headers={"Location": f"{CDN_URL}/{file_id}"})
+
+        self.cdn_requests.append(request)
+        file_id = request.url.path.lstrip("/")
+        if file_id == "missing":
+            return self._response(404, b"")
+
+        range_header = request.headers.get("Range")
+        if range_header is None:
+            return self._response(
+                200,
+                CONTENT,
+                {"Content-Length": str(len(CONTENT)), "Accept-Ranges": "bytes"},
+            )
+        start, end = range_header.removeprefix("bytes=").split("-")
+        start, end = int(start), int(end or len(CONTENT) - 1)
+        if start >= len(CONTENT):
+            return self._response(416, b"")
+        body = CONTENT[start : end + 1]
+        return self._response(
+            206,
+            body,
+            {
+                "Content-Length": str(len(body)),
+                "Content-Range": f"bytes {start}-{end}/{len(CONTENT)}",
+                "Accept-Ranges": "bytes",
+            },
+        )
+
+    def _response(self, status: int, body: bytes, headers=None) -> httpx.Response:
+        stream = TrackedStream(body)
+        self.streams.append(stream)
+        return httpx.Response(status, headers=headers, stream=stream)
+
+
+@pytest.fixture
+def api():
+    return FilesAPI()
+
+
+@pytest.fixture
+def provider(api):
+    provider = JobNimbusProvider(api_key="key", base_api_url=API_URL)
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_stream_file_forwards_range_and_passes_206_through(api, provider):
+    """The Range header reaches the CDN and the partial response is relayed."""
+    file_stream = await provider.stream_file("f1", range_header="bytes=100-199")
+    body = b"".join([chunk async for chunk in file_stream.chunks])
+    await provider.close()
+
+    assert api.cdn_requests[0].headers["Range"] == "bytes=100-199"
+    assert file_stream.status_code == 206
+    assert file_stream.content_range == f"bytes 100-199/{len(CONTENT)}"
+    assert file_stream.content_length == 100
+    assert file_stream.accept_ranges is True
+    assert body == CONTENT[100:200]
+    assert api.streams[-1].closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("file_id", "range_header", "error_code"),
+    [
+        ("missing", None, "NOT_FOUND"),
+        ("f1", f"bytes={len(CONTENT)}-", "RANGE_NOT_SATISFIABLE"),
+    ],
+)
+async def test_stream_file_maps_errors_and_closes_upstream(
+    api, provider, file_id, range_header, error_code
+):
+    """404 and 416 become CRM errors, and the upstream response is released."""
+    with pytest.raises(CRMError) as exc_info:
+        await provider.stream_file(file_id, range_header=range_header)
+    await provider.close()
+
+    assert exc_info.value.error_code == error_code
+    assert api.streams[-1].closed
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_early_closes_upstream(api, provider):
+    """A client that disconnects before reading must not leak the connection."""
+    file_stream = await provider.stream_file("f1")
+    await file_stream.close()
+    await provider.close()
+
+    assert api.streams[-1].closed
+
+
+@pytest.fixture
+def client(provider):
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id="user-1", email="user@example.com", role=Role.USER
+    )
+    app.dependency_overrides[get_crm_service] = lambda: CRMService(provider)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_download_route_relays_range_requests(api, client):
+    """The route returns 206 with the upstream Content-Range and body."""
+    response = client.get(
+        "/api/crm/files/f1/download",
+        params={"filename": "roof.jpg", "content_type": "image/jpeg"},
+        headers={"Range": "bytes=0-9"},
+    )
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+    assert response.headers["Content-Range"] == f"bytes 0-9/{len(CONTENT)}"
+    assert response.headers["Content-Length"] == "10"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["Content-Type"] == "image/jpeg"
+    assert 'filename="roof.jpg"' in response.headers["Content-Disposition"]
+    assert api.streams[-1].closed
+
+
+@pytest.mark.parametrize(
+    ("file_id", "range_header", "status_code"),
+    [("missing", None, 404), ("f1", f"bytes={len(CONTENT)}-", 416)],
+)
+def test_download_route_maps_upstream_errors(
+    client, file_id, range_header, status_code
+):
+    """Missing files are 404 and unsatisfiable ranges 416, not 500."""
+    headers = {"Range": range_header} if range_header else {}
+    response = client.get(f"/api/crm/files/{file_id}/download", headers=headers)
+
+    assert response.status_code == status_code
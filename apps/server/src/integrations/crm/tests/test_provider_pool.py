@@ -0,0 +1,131 @@
+"""Tests for the process-wide CRM provider pool."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.integrations.crm.provider_pool import CRMProviderPool
+
+CREDS_A = {"provider": "job_nimbus", "credentials": {"api_key": "key-a"}}
+CREDS_B = {"provider": "job_nimbus", "credentials": {"api_key": "key-b"}}
+
+
+@pytest.fixture
+def factory():
+    """Factory that returns a fresh mock provider with an async close()."""
+
+    def build(credentials: dict):
+        provider = MagicMock()
+        provider.close = AsyncMock()
+        provider.credentials = credentials
+        return provider
+
+    return MagicMock(side_effect=build)
+
+
+@pytest.fixture
+def pool():
+    return CRMProviderPool()
+
+
+async def checkout(pool: CRMProviderPool, organization_id: str, credentials, factory):
+    """Lease a provider and release it straight away."""
+    async with pool.lease(organization_id, credentials, factory) as provider:
+        return provider
+
+
+@pytest.mark.asyncio
+async def test_reuses_provider_for_same_credentials(pool, factory):
+    """Same org and credentials should return the same instance."""
+    first = await checkout(pool, "org-1", CREDS_A, factory)
+    second = await checkout(pool, "org-1", dict(CREDS_A), factory)
+
+    assert first is second
+    assert factory.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_rotated_credentials_replace_and_close_old_provider(pool, factory):
+    """A credential change should build a new provider and close the old one."""
+    old = await checkout(pool, "org-1", CREDS_A, factory)
+    new = await checkout(pool, "org-1", CREDS_B, factory)
+
+    assert old is not new
+    old.close.assert_awaited_once()
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_when_full(factory):
+    """Pool should stay within max_size by closing the LRU provider."""
+    pool = CRMProviderPool(max_size=2)
+
+    p1 = await checkout(pool, "org-1", CREDS_A, factory)
+    await checkout(pool, "org-2", CREDS_A, factory)
+    await checkout(pool, "org-1", CREDS_A, factory)  # touch org-1
+    await checkout(pool, "org-3", CREDS_A, factory)
+
+    assert len(pool) == 2
+    p1.close.assert_not_awaited()
+    assert await checkout(pool, "org-1", CREDS_A, factory) is p1
+
+
+@pytest.mark.asyncio
+async def test_evicts_idle_providers(factory):
+    """Providers unused for longer than idle_ttl are closed on next access."""
+    pool = CRMProviderPool(idle_ttl=0)
+
+    idle = await checkout(pool, "org-1", CREDS_A, factory)
+    await checkout(pool, "org-2", CREDS_A, factory)
+
+    idle.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_close(pool, factory):
+    """invalidate() drops one org; close() drops everything."""
+    p1 = await checkout(pool, "org-1", CREDS_A, factory)
+    p2 = await checkout(pool, "org-2", CREDS_A, factory)
+
+    await pool.invalidate("org-1")
+    p1.close.assert_awaited_once()
+    assert len(pool) == 1
+
+    await pool.close()
+    p2.close.assert_awaited_once()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_leased_provider_is_closed_after_release(pool, factory):
+    """Invalidating or replacing a provider mid-call must not close it early."""
+    async with pool.lease("org-1", CREDS_A, factory) as provider:
+        await pool.invalidate("org-1")
+        provider.close.assert_not_awaited()
+    provider.close.assert_awaited_once()
+
+    async with pool.lease("org-1", CREDS_A, factory) as old:
+        new = await checkout(pool, "org-1", CREDS_B, factory)
+        assert new is not old
+        old.close.assert_not_awaited()
+    old.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failing_factory_keeps_entry_and_closes_evicted(factory):
+    """A factory error must not drop the current provider or leak idle ones."""
+    pool = CRMProviderPool(idle_ttl=60)
+    current = await checkout(pool, "org-1", CREDS_A, factory)
+    idle = await checkout(pool, "org-2", CREDS_A, factory)
+    # org-2 idles out on the next access, but org-1 stays fresh
+    pool._entries["org-2"].last_used -= 120
+
+    with pytest.raises(ValueError, match="bad credentials"):
+        async with pool.lease(
+            "org-1", CREDS_B, MagicMock(side_effect=ValueError("bad credentials"))
+        ):
+            pass
+
+    idle.close.assert_awaited_once()
+    current.close.assert_not_awaited()
+    assert await checkout(pool, "org-1", CREDS_A, factory) is current
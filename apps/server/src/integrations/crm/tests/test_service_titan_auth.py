@@ -0,0 +1,98 @@
+"""Tests for Service Titan OAuth token management."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.integrations.crm.providers.service_titan.auth import (
+    ServiceTitanTokenManager,
+)
+from src.integrations.crm.providers.service_titan.provider import ServiceTitanProvider
+
+TOKEN_URL = "https://auth.example.com/connect/token"
+API_URL = "https://api.example.com"
+
+
+class TokenAPI:
+    """Issues numbered tokens and, if reject_first is set, 401s one API call."""
+
+    def __init__(self):
+        self.token_calls: list[httpx.Request] = []
+        self.expires_in = 3600
+        self.reject_first = False
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if str(request.url) == TOKEN_URL:
+            self.token_calls.append(request)
+            await asyncio.sleep(0)
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": f"token-{len(self.token_calls)}",
+                    "expires_in": self.expires_in,
+                },
+            )
+        if self.reject_first:
+            self.reject_first = False
+            return httpx.Response(401)
+        return httpx.Response(200, json={"auth": request.headers.get("Authorization")})
+
+
+@pytest.fixture
+def api():
+    return TokenAPI()
+
+
+@pytest.fixture
+def transport(api):
+    return httpx.MockTransport(api.handler)
+
+
+@pytest.fixture
+def manager():
+    return ServiceTitanTokenManager("client", "secret", TOKEN_URL)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(api, transport, manager):
+    """Concurrent get_token() calls should hit the token endpoint once."""
+    async with httpx.AsyncClient(transport=transport) as client:
+        tokens = await asyncio.gather(*(manager.get_token(client) for _ in range(10)))
+
+    assert set(tokens) == {"token-1"}
+    assert len(api.token_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_refreshes_ahead_of_expiry(api, transport, manager):
+    """Tokens inside the refresh margin should be replaced."""
+    api.expires_in = 30
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await manager.get_token(client)
+        second = await manager.get_token(client)
+
+    assert (first, second) == ("token-1", "token-2")
+
+
+@pytest.mark.asyncio
+async def test_provider_retries_once_on_401(api, transport):
+    """A 401 should invalidate the token and retry with a fresh one."""
+    api.reject_first = True
+    provider = ServiceTitanProvider(
+        tenant_id="tenant-401",
+        client_id="client",
+        client_secret="secret",
+        app_key="app",
+        base_api_url=API_URL,
+        token_url=TOKEN_URL,
+    )
+    provider.client = httpx.AsyncClient(transport=transport)
+
+    response = await provider._make_authenticated_request("GET", f"{API_URL}/x")
+    await provider.close()
+
+    assert response.status_code == 200
+    assert response.json()["auth"] == "Bearer token-2"
+    assert len(api.token_calls) == 2
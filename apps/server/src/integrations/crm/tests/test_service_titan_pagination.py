@@ -0,0 +1,76 @@
+"""Tests for Service Titan server-side job pagination."""
+
+import httpx
+import pytest
+
+from src.integrations.crm.providers.service_titan.provider import ServiceTitanProvider
+
+TOKEN_URL = "https://auth.example.com/connect/token"
+API_URL = "https://api.example.com"
+TOTAL_PROJECTS = 7
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    """Requests made to the projects endpoint."""
+    return []
+
+
+@pytest.fixture
+def provider(requests):
+    """Provider backed by a fake projects endpoint with TOTAL_PROJECTS items."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == TOKEN_URL:
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 3600})
+
+        requests.append(request)
+        page = int(request.url.params["page"])
+        page_size = int(request.url.params["pageSize"])
+        start = (page - 1) * page_size
+        ids = range(start + 1, min(start + page_size, TOTAL_PROJECTS) + 1)
+        return httpx.Response(
+            200,
+            json={
+                "page": page,
+                "pageSize": page_size,
+                "hasMore": start + page_size < TOTAL_PROJECTS,
+                "totalCount": TOTAL_PROJECTS,
+                "data": [{"id": i, "status": "Scheduled"} for i in ids],
+            },
+        )
+
+    provider = ServiceTitanProvider(
+        tenant_id="tenant-pagination",
+        client_id="client",
+        client_secret="secret",
+        app_key="app",
+        base_api_url=API_URL,
+        token_url=TOKEN_URL,
+    )
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_passes_pagination_to_api(requests, provider):
+    """Each page request should fetch only that page from the API."""
+    job_list = await provider.get_all_jobs(page=2, page_size=3)
+    await provider.close()
+
+    assert [job.id for job in job_list.jobs] == ["4", "5", "6"]
+    assert job_list.total_count == TOTAL_PROJECTS
+    assert job_list.has_more is True
+    assert len(requests) == 1
+    assert requests[0].url.params["page"] == "2"
+    assert requests[0].url.params["pageSize"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_iter_all_jobs_walks_every_page(requests, provider):
+    """iter_all_jobs should yield every job exactly once across pages."""
+    ids = [job.id async for job in provider.iter_all_jobs(page_size=3)]
+    await provider.close()
+
+    assert ids == [str(i) for i in range(1, TOTAL_PROJECTS + 1)]
+    assert [r.url.params["page"] for r in requests] == ["1", "2", "3"]
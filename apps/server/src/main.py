@@ -1,20 +1,36 @@
+import asyncio
 import tomllib
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from src.ai.chat.router import router as chat_router
+from src.ai.voice_ai.providers.twilio.client import close_recording_http_client
+from src.ai.voice_ai.providers.twilio.dependencies import close_twilio_client
 from src.ai.voice_ai.router import router as voice_ai_router
 from src.auth.router import router as auth_router
 from src.config import get_client_base_url
 from src.db.call_list.router import router as call_list_router
 from src.db.phone_numbers.router import router as phone_numbers_router
 from src.db.scheduled_groups.router import router as scheduled_groups_router
+from src.integrations.creds.cache import get_credentials_cache
 from src.integrations.creds.router import router as creds_router
+from src.integrations.creds.service import warm_credentials_cache
 from src.integrations.crm.mcp import get_crm_mcp_server
+from src.integrations.crm.provider_pool import get_crm_provider_pool
 from src.integrations.crm.router import router as crm_router
 from src.utils.logger import logger
+from src.utils.metrics import render_metrics
+from src.utils.timing import TimingMiddleware
+from src.workflows.call_pipeline import get_call_pipeline_worker
+from src.workflows.config import (
+    get_call_monitoring_settings,
+    get_group_scheduler_settings,
+)
+from src.workflows.group_scheduler import get_group_scheduler
 from src.workflows.router import router as workflows_router
 
 
@@ -36,14 +52,44 @@ except Exception as e:
     crm_mcp_app = None
 
 
-# Use MCP app's lifespan directly (per FastMCP docs)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the MCP app lifespan (per FastMCP docs) and background workers."""
+    worker_task = None
+    if get_call_monitoring_settings().worker_enabled:
+        worker_task = asyncio.create_task(get_call_pipeline_worker().run())
+    scheduler_task = None
+    if get_group_scheduler_settings().enabled:
+        scheduler_task = asyncio.create_task(get_group_scheduler().run())
+    warm_up_task = asyncio.create_task(warm_credentials_cache())
+
+    try:
+        if crm_mcp_app:
+            async with crm_mcp_app.lifespan(app):
+                yield
+        else:
+            yield
+    finally:
+        warm_up_task.cancel()
+        if scheduler_task:
+            get_group_scheduler().stop()
+            await scheduler_task
+        if worker_task:
+            get_call_pipeline_worker().stop()
+            await worker_task
+        await get_crm_provider_pool().close()
+        await get_credentials_cache().close()
+        await close_recording_http_client()
+        await close_twilio_client()
+
+
 app = FastAPI(
     title="Maive API",
     description="API for Maive application",
     version=get_version(),
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=crm_mcp_app.lifespan if crm_mcp_app else None,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -52,7 +98,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+# Added last so it runs outermost and times CORS handling too
+app.add_middleware(TimingMiddleware)
 
 # Mount MCP server for CRM tools
 if crm_mcp_app:
@@ -76,6 +125,12 @@ async def root():
     return {"status": "ok", "message": "Maive API is running"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/healthcheck")
 async def healthcheck():
     """Health check endpoint."""
@@ -1,13 +1,136 @@
-import inspect
+"""
+Structured JSON logger.
+
+Call sites log a message plus keyword fields:
+
+    logger.info("[Tag] Something happened", call_id=call_id, status=status)
+
+Records are handed to a queue on the calling thread and serialized and
+written by a background listener thread, so the event loop never waits on
+JSON encoding or stderr. Only records at ERROR and above look up the file and
+line of their call site. Set LOG_ASYNC=false to write synchronously (e.g. in
+one-off scripts that exit with os._exit).
+
+Fields that are expensive to compute can be wrapped in `lazy`; they are only
+evaluated if the record is actually emitted:
+
+    logger.debug("[Tag] Payload", payload=lazy(lambda: payload.model_dump()))
+
+Lines logged on every request use `log_fields`, which serializes plain
+fields straight to JSON and skips the LogRecord machinery:
+
+    logger.log_fields(logging.INFO, "[Timing] Request", {"route": route})
+"""
+
+import atexit
+import copy
+import dataclasses
+import datetime
+import enum
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from pythonjsonlogger.json import JsonFormatter
+
+
+class lazy:  # noqa: N801 - reads as a function at call sites
+    """A log field evaluated only when its record is emitted."""
 
-from pythonjsonlogger import jsonlogger
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+
+class _RenderedRecord:
+    """A record serialized by log_fields; the formatter passes it through."""
+
+    __slots__ = ("levelno", "msg", "args")
+
+    def __init__(self, levelno: int, line: str):
+        self.levelno = levelno
+        self.msg = line
+        self.args = None
+
+
+class _JsonFormatter(JsonFormatter):
+    """JSON formatter adding the call site to error records."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record, _RenderedRecord):
+            return record.msg
+        return super().format(record)
+
+    def add_fields(
+        self, log_data: dict, record: logging.LogRecord, message_dict: dict
+    ) -> None:
+        super().add_fields(log_data, record, message_dict)
+        if record.levelno >= logging.ERROR and "file" not in log_data:
+            log_data["file"] = f"{record.pathname}:{record.lineno}"
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Enqueue each record as it is; the listener formats it."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Logger.process already snapshotted the fields, so only the message
+        # args (which the caller may mutate) need formatting now
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        # Render tracebacks now so queued records don't keep frames alive. The
+        # copy leaves exc_info on the original for other handlers.
+        if record.exc_info:
+            record = copy.copy(record)
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Field values the listener can read as they are
+_IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    bytes,
+    datetime.date,
+    datetime.time,
+    uuid.UUID,
+    enum.Enum,
+    type,
+)
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy a field value so later mutation can't change the logged record."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list | tuple | set | frozenset):
+        return list(value)
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    # Anything else (ORM rows, models) is rendered as str() by the formatter;
+    # do it here so the listener thread never touches live objects
+    return str(value)
 
 
 class Logger(logging.LoggerAdapter):
     _instance = None
     _initialized = False
+    _listener: logging.handlers.QueueListener | None = None
+    # Hands a rendered record to the output: the queue, or the stream handler
+    _write: Callable[[Any], Any]
 
     def __new__(cls) -> "Logger":
         if cls._instance is None:
@@ -31,13 +154,25 @@ class Logger(logging.LoggerAdapter):
             # Set default level to INFO if invalid level specified
             log_level = log_level_map.get(log_level_str, logging.INFO)
 
-            formatter = jsonlogger.JsonFormatter(
+            formatter = _JsonFormatter(
                 "%(asctime)s %(levelname)s %(message)s",
                 rename_fields={"asctime": "@timestamp", "levelname": "log_level"},
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            handler: logging.Handler = stream_handler
+            Logger._write = stream_handler.handle
+            if os.getenv("LOG_ASYNC", "true").lower() != "false":
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                handler = _QueueHandler(log_queue)
+                Logger._write = log_queue.put
+                Logger._listener = logging.handlers.QueueListener(
+                    log_queue, stream_handler
+                )
+                Logger._listener.start()
+                atexit.register(shutdown)
 
             logger = logging.getLogger("maive")
             logger.setLevel(log_level)
@@ -46,31 +181,76 @@ class Logger(logging.LoggerAdapter):
             super().__init__(logger)
             Logger._initialized = True
 
+    def log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Log msg at level with keyword fields.
+
+        Records below ERROR skip the caller lookup (a walk up the stack) that
+        logging.Logger does for every record; only error lines report it.
+        """
+        if not self.isEnabledFor(level):
+            return
+        msg, kwargs = self.process(msg, kwargs)
+        if level >= logging.ERROR or "exc_info" in kwargs or "stack_info" in kwargs:
+            # This frame sits between the caller and logging's own frames
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self.logger.log(level, msg, *args, **kwargs)
+            return
+        self.logger.handle(
+            self.logger.makeRecord(
+                self.logger.name,
+                level,
+                "(unknown file)",
+                0,
+                msg,
+                args,
+                None,
+                extra=kwargs.get("extra"),
+            )
+        )
+
     def error(self, msg: str, *args: tuple, **kwargs: dict) -> None:
-        """Delegate an error call to the underlying logger with file and line info."""
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            file_info = f"{frame.f_back.f_code.co_filename}:{frame.f_back.f_lineno}"
-        else:
-            file_info = "unknown:0"
-
-        kwargs["file"] = file_info
+        """Log an error; the record carries the caller's file and line."""
+        kwargs.setdefault("stacklevel", 2)
         self.log(logging.ERROR, msg, *args, **kwargs)
 
     def exception(
         self, msg: str, *args: tuple, exc_info: bool = True, **kwargs: dict
     ) -> None:
-        """Delegate an exception call to the underlying logger with file and line info."""
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            file_info = f"{frame.f_back.f_code.co_filename}:{frame.f_back.f_lineno}"
-        else:
-            file_info = "unknown:0"
-
-        kwargs["file"] = file_info
+        """Log an error with the current exception and the caller's file and line."""
+        kwargs.setdefault("stacklevel", 2)
         self.log(logging.ERROR, msg, *args, exc_info=exc_info, **kwargs)
 
+    def log_fields(
+        self, level: int, msg: str, fields: dict[str, str | int | float | None]
+    ) -> None:
+        """
+        Log a line of plain fields without building a LogRecord.
+
+        For per-request lines: the fields are JSON-encoded on the calling
+        thread and the finished line goes straight to the output, skipping
+        caller lookup, snapshots and the generic formatter. Handlers added
+        to the logger later (e.g. in tests) don't see these lines.
+
+        Args:
+            level: Logging level (e.g. logging.INFO)
+            msg: Log message
+            fields: Field values; str, int, float or None only
+        """
+        if not self.isEnabledFor(level):
+            return
+        line = json.dumps(
+            {
+                "@timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "log_level": logging.getLevelName(level),
+                "message": msg,
+                **fields,
+            }
+        )
+        Logger._write(_RenderedRecord(level, line))
+
     def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:
+        # Only called for enabled levels, so lazy fields are evaluated here
         # pythonjsonlogger automatically picks up 'extra' fields
         # Extract logging-specific kwargs that shouldn't go into 'extra'
         exc_info = kwargs.pop("exc_info", None)
@@ -79,7 +259,17 @@ class Logger(logging.LoggerAdapter):
 
         result_kwargs = {}
         if kwargs:
-            result_kwargs["extra"] = kwargs
+            result_kwargs["extra"] = {
+                key: value.func() if isinstance(value, lazy) else value
+                for key, value in kwargs.items()
+            }
+            if Logger._listener is not None:
+                # The listener formats the record after this call returns and
+                # the caller may mutate what it logged, so copy it now
+                extra = result_kwargs["extra"]
+                for key, value in extra.items():
+                    if not isinstance(value, _IMMUTABLE_TYPES):
+                        extra[key] = _snapshot(value)
         if exc_info is not None:
             result_kwargs["exc_info"] = exc_info
         if stack_info is not None:
@@ -90,6 +280,13 @@ class Logger(logging.LoggerAdapter):
         return msg, result_kwargs
 
 
+def shutdown() -> None:
+    """Write out queued records and stop the listener thread."""
+    if Logger._listener is not None:
+        Logger._listener.stop()
+        Logger._listener = None
+
+
 # Create a singleton instance
 logger = Logger()
 logger.info(
@@ -0,0 +1,195 @@
+"""
+In-process Prometheus histograms and counters.
+
+A deliberately small subset of the Prometheus client: labelled histograms
+with fixed buckets and labelled counters, rendered in the text exposition
+format for the /metrics endpoint. Observations are a bisect and two
+additions, cheap enough for every request and every instrumented call.
+"""
+
+import bisect
+import math
+from collections.abc import Sequence
+
+# Latency buckets in seconds, from a cached DB read to a slow LLM call
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """A labelled histogram with cumulative buckets, as Prometheus defines it."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name (e.g. 'http_request_duration_seconds')
+            description: Help text shown by Prometheus
+            label_names: Names of the labels every observation carries
+            buckets: Upper bounds of the buckets, ascending (+Inf is implied)
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket counts (last is +Inf), sum, count
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms)
+            *labels: Label values, in label_names order
+        """
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list[str]:
+        """Render the histogram in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (bucket_counts, total, count) in sorted(self._series.items()):
+            label_pairs = _label_pairs(self.label_names, labels)
+            cumulative = 0
+            bounds = [*self.buckets, math.inf]
+            for bound, bucket_count in zip(bounds, bucket_counts, strict=True):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                pairs = ",".join([*label_pairs, f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{pairs}}} {cumulative}")
+            pairs = ",".join(label_pairs)
+            lines.append(f"{self.name}_sum{{{pairs}}} {total}")
+            lines.append(f"{self.name}_count{{{pairs}}} {count}")
+        return lines
+
+
+class Counter:
+    """A labelled counter that only goes up, as Prometheus defines it."""
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str]):
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name, ending in _total (e.g. 'crm_cache_lookups_total')
+            description: Help text shown by Prometheus
+            label_names: Names of the labels every increment carries
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            *labels: Label values, in label_names order
+            amount: How much to add (non-negative)
+        """
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        """Render the counter in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self._values.items()):
+            pairs = ",".join(_label_pairs(self.label_names, labels))
+            lines.append(f"{self.name}{{{pairs}}} {value}")
+        return lines
+
+
+def _label_pairs(names: tuple[str, ...], values: tuple[str, ...]) -> list[str]:
+    return [
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    ]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route", "status"),
+)
+
+DEPENDENCY_DURATION = Histogram(
+    "dependency_call_duration_seconds",
+    "Latency of calls to dependencies (db, crm, ai, twilio, auth)",
+    ("dependency", "operation"),
+)
+
+CRM_CACHE_LOOKUPS = Counter(
+    "crm_cache_lookups_total",
+    "CRM cache lookups by entity type and result (hit or miss)",
+    ("entity", "result"),
+)
+
+STRUCTURED_OUTPUT_DURATION = Histogram(
+    "gemini_structured_output_duration_seconds",
+    "Gemini structured generation latency by mode (single_pass or two_pass)",
+    ("mode",),
+)
+
+STRUCTURED_OUTPUT_FAILURES = Counter(
+    "gemini_structured_output_failures_total",
+    "Failed Gemini structured generations by mode",
+    ("mode",),
+)
+
+STRUCTURED_OUTPUT_TOKENS = Counter(
+    "gemini_structured_output_tokens_total",
+    "Gemini structured generation tokens by mode and kind (prompt, output, total)",
+    ("mode", "kind"),
+)
+
+
+def render_metrics() -> str:
+    """
+    Render all metrics for a Prometheus scrape.
+
+    Returns:
+        str: Metrics in the text exposition format
+    """
+    lines = [
+        *REQUEST_DURATION.render(),
+        *DEPENDENCY_DURATION.render(),
+        *CRM_CACHE_LOOKUPS.render(),
+        *STRUCTURED_OUTPUT_DURATION.render(),
+        *STRUCTURED_OUTPUT_FAILURES.render(),
+        *STRUCTURED_OUTPUT_TOKENS.render(),
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,90 @@
+"""
+Single-flight loading for async caches.
+
+Several caches here fetch something slow (a JWKS document, a session, a
+secret, a CRM entity, a Gemini file handle) and must not fetch it once per
+concurrent caller. SingleFlight runs at most one load per key at a time in
+its own task; concurrent callers for the key await that task.
+
+A caller that is cancelled (e.g. its client disconnected) stops waiting but
+doesn't cancel the load, which still completes for everyone else sharing it.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """At most one in-flight load per key, shared by concurrent callers."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[K, asyncio.Task[T]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def run(self, key: K, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Join the load in flight for key, or start one, and wait for its result.
+
+        Args:
+            key: What is being loaded
+            load: Coroutine factory called only if no load is in flight
+
+        Returns:
+            The load's result (its exception is raised to every caller)
+        """
+        return await asyncio.shield(self.start(key, load))
+
+    def start(self, key: K, load: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """
+        Start a load for key without waiting, or return the one in flight.
+
+        Args:
+            key: What is being loaded
+            load: Coroutine factory called only if no load is in flight
+
+        Returns:
+            asyncio.Task[T]: The in-flight load
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._on_done(key, done))
+        return task
+
+    def is_current(self, key: K) -> bool:
+        """Whether the running task is key's load and hasn't been forgotten."""
+        return self._tasks.get(key) is asyncio.current_task()
+
+    def forget(self, key: K) -> None:
+        """
+        Detach key's in-flight load, e.g. because what it loads has changed.
+
+        The load still completes for callers already waiting on it; later
+        callers start a new one.
+        """
+        self._tasks.pop(key, None)
+
+    async def close(self) -> None:
+        """Cancel every in-flight load and wait for them to finish."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_done(self, key: K, task: asyncio.Task[T]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Callers re-raise it; a load nobody awaited mustn't warn at shutdown
+        if not task.cancelled():
+            task.exception()
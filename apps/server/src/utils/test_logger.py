@@ -0,0 +1,123 @@
+"""Tests for the structured logger."""
+
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from src.utils.logger import Logger, _JsonFormatter, _QueueHandler, lazy, logger
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def records():
+    handler = RecordingHandler()
+    logger.logger.addHandler(handler)
+    yield handler.records
+    logger.logger.removeHandler(handler)
+
+
+def test_lazy_fields_are_only_evaluated_when_emitted(records):
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "value"
+
+    logger.debug("skipped", field=lazy(expensive))
+    logger.info("emitted", field=lazy(expensive))
+
+    assert calls == [1]
+    assert [(r.getMessage(), r.field) for r in records] == [("emitted", "value")]
+
+
+def test_errors_point_at_the_caller(records):
+    logger.error("failed", call_id="c1")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("raised")
+
+    assert [r.pathname for r in records] == [__file__, __file__]
+    assert records[0].call_id == "c1"
+    assert records[1].exc_info is not None
+
+
+def test_only_errors_look_up_the_caller(records):
+    logger.info("routine")
+    logger.warning("odd")
+    logger.log(logging.CRITICAL, "down")
+
+    assert [r.lineno for r in records[:2]] == [0, 0]
+    assert records[2].pathname == __file__
+
+
+def test_queued_fields_are_snapshots(records, monkeypatch):
+    monkeypatch.setattr(Logger, "_listener", object())
+    fields = {"status": "ringing"}
+    items = [1, 2]
+
+    logger.info("call", fields=fields, items=items, row=object(), call_id="c1")
+    fields["status"] = "ended"
+    items.append(3)
+
+    [record] = records
+    assert record.fields == {"status": "ringing"}
+    assert record.items == [1, 2]
+    assert isinstance(record.row, str)
+    assert record.call_id == "c1"
+
+
+def test_queued_records_are_formatted_before_enqueueing():
+    handler = _QueueHandler(queue.SimpleQueue())
+    args = ["c1"]
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logger.logger.makeRecord(
+        "maive", logging.ERROR, __file__, 1, "call %s", (args,), exc_info
+    )
+
+    queued = handler.prepare(record)
+    args.append("c2")
+
+    assert queued.getMessage() == "call ['c1']"
+    assert "ValueError: boom" in queued.exc_text
+    assert queued.exc_info is None
+    # Other handlers still get the traceback
+    assert record.exc_info is exc_info
+
+
+def test_field_lines_are_rendered_like_other_records(monkeypatch):
+    written = []
+    monkeypatch.setattr(Logger, "_write", written.append)
+    formatter = _JsonFormatter(
+        "%(asctime)s %(levelname)s %(message)s",
+        rename_fields={"asctime": "@timestamp", "levelname": "log_level"},
+    )
+
+    logger.log_fields(logging.DEBUG, "skipped", {})
+    logger.log_fields(
+        logging.INFO, "[Timing] Request", {"route": "/jobs/{id}", "status_code": 200}
+    )
+
+    [record] = written
+    line = json.loads(formatter.format(record))
+    assert line.pop("@timestamp")
+    assert line == {
+        "log_level": "INFO",
+        "message": "[Timing] Request",
+        "route": "/jobs/{id}",
+        "status_code": 200,
+    }
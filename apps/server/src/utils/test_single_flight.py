@@ -0,0 +1,72 @@
+"""Tests for the shared single-flight helper."""
+
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_load():
+    loads = 0
+    release = asyncio.Event()
+
+    async def load() -> str:
+        nonlocal loads
+        loads += 1
+        await release.wait()
+        return "value"
+
+    flight: SingleFlight[str, str] = SingleFlight()
+    callers = [asyncio.create_task(flight.run("key", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert "key" in flight
+
+    release.set()
+    assert await asyncio.gather(*callers) == ["value"] * 5
+    assert loads == 1
+    assert "key" not in flight
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_load():
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "value"
+
+    flight: SingleFlight[str, str] = SingleFlight()
+    leaver = asyncio.create_task(flight.run("key", load))
+    stayer = asyncio.create_task(flight.run("key", load))
+    await asyncio.sleep(0)
+
+    leaver.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await stayer == "value"
+    assert leaver.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_forgotten_load_finishes_but_is_not_current():
+    release = asyncio.Event()
+    current = []
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def load() -> str:
+        await release.wait()
+        current.append(flight.is_current("key"))
+        return "value"
+
+    first = asyncio.create_task(flight.run("key", load))
+    await asyncio.sleep(0)
+    flight.forget("key")
+    second = asyncio.create_task(flight.run("key", load))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == "value"
+    assert sorted(current) == [False, True]
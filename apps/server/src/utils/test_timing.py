@@ -0,0 +1,141 @@
+"""Tests for request timing, dependency spans and metrics."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.utils import metrics
+from src.utils.logger import Logger
+from src.utils.timing import TimingMiddleware, instrumented, span
+
+
+@instrumented("crm")
+class FakeCRM:
+    def __init__(self, inner: "FakeCRM | None" = None):
+        self.inner = inner
+
+    async def get_job(self, job_id: str) -> str:
+        if self.inner:
+            return await self.inner.get_job(job_id)
+        await asyncio.sleep(0)
+        return job_id
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware)
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: str):
+        with span("db", "lookup"):
+            pass
+        # A cached provider wrapping a real one counts as one CRM call
+        return {"job": await FakeCRM(inner=FakeCRM()).get_job(job_id)}
+
+    @app.get("/healthcheck")
+    async def healthcheck():
+        return {"status": "ok"}
+
+    @app.get("/metrics")
+    async def scrape():
+        return {"status": "ok"}
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        return await client.get(path)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_breaks_down_dependencies(app):
+    response = await request(app, "/jobs/42")
+
+    assert response.json() == {"job": "42"}
+    entries = {
+        entry.split(";")[0]: entry
+        for entry in response.headers["server-timing"].split(", ")
+    }
+    assert set(entries) == {"db", "crm", "total"}
+    assert 'desc="1 calls"' in entries["crm"]
+
+
+@pytest.mark.asyncio
+async def test_requests_and_dependencies_are_exported_as_histograms(app):
+    await request(app, "/jobs/42")
+    healthcheck = await request(app, "/healthcheck")
+    scrape = await request(app, "/metrics")
+
+    assert "server-timing" not in healthcheck.headers
+    assert "server-timing" not in scrape.headers
+    rendered = metrics.render_metrics()
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/jobs/{job_id}",'
+        'status="200"}' in rendered
+    )
+    # Probes and scrapes bypass timing entirely
+    assert 'route="/healthcheck"' not in rendered
+    assert 'route="/metrics"' not in rendered
+    assert (
+        'dependency_call_duration_seconds_bucket{dependency="crm",'
+        'operation="FakeCRM.get_job",le="+Inf"}' in rendered
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("slow_request_ms", "logged"), [(1000, 0), (0, 1)])
+async def test_only_slow_requests_are_logged(monkeypatch, slow_request_ms, logged):
+    lines = []
+    monkeypatch.setattr(
+        Logger, "_write", lambda record: lines.append(json.loads(record.msg))
+    )
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, slow_request_ms=slow_request_ms)
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: str):
+        with span("db", "lookup"):
+            pass
+        return {"job": job_id}
+
+    await request(app, "/jobs/42")
+
+    assert len(lines) == logged
+    if logged:
+        assert lines[0]["route"] == "/jobs/{job_id}"
+        assert lines[0]["db_calls"] == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("t_seconds", "test", ("kind",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value, "a")
+
+    assert histogram.render()[2:] == [
+        't_seconds_bucket{kind="a",le="0.1"} 2',
+        't_seconds_bucket{kind="a",le="1"} 3',
+        't_seconds_bucket{kind="a",le="+Inf"} 4',
+        't_seconds_sum{kind="a"} 5.65',
+        't_seconds_count{kind="a"} 4',
+    ]
+
+
+def test_counter_renders_one_sample_per_label_set():
+    counter = metrics.Counter("t_total", "test", ("entity", "result"))
+    counter.inc("job", "hit")
+    counter.inc("job", "hit")
+    counter.inc("job", "miss")
+
+    assert counter.render() == [
+        "# HELP t_total test",
+        "# TYPE t_total counter",
+        't_total{entity="job",result="hit"} 2',
+        't_total{entity="job",result="miss"} 1',
+    ]
+    assert "# TYPE crm_cache_lookups_total counter" in metrics.render_metrics()
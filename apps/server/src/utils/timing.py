@@ -0,0 +1,202 @@
+"""
+Per-request timing and dependency spans.
+
+TimingMiddleware times each HTTP request and collects the time spent in
+dependencies (db, crm, ai, twilio, auth) while serving it. The breakdown is
+returned in a Server-Timing header, and both request and dependency
+latencies feed the /metrics histograms. Requests slower than a threshold are
+also logged as one structured line with the breakdown. Probe paths (/,
+/healthcheck, /metrics) bypass the middleware entirely; see
+scripts/benchmark_timing.py.
+
+Dependency time is recorded with `span`, or for whole classes with
+`instrument_methods`, which wraps every public async method. A span nested
+in a span of the same dependency (e.g. a caching CRM provider delegating to
+the real one) is not counted twice.
+"""
+
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.logger import logger
+from src.utils.metrics import DEPENDENCY_DURATION, REQUEST_DURATION
+
+# Probes and scrapes: passed straight through (no timing, log line or header)
+# so load balancer checks pay nothing; see scripts/benchmark_timing.py
+UNTIMED_PATHS = frozenset({"/", "/healthcheck", "/metrics"})
+
+# Dependency -> [seconds, calls] for the request being served
+_request_timings: ContextVar[dict[str, list] | None] = ContextVar(
+    "request_timings", default=None
+)
+# Dependency whose span is currently open
+_active_dependency: ContextVar[str | None] = ContextVar(
+    "active_dependency", default=None
+)
+
+
+@contextmanager
+def span(dependency: str, operation: str = "") -> Iterator[None]:
+    """
+    Time a call to a dependency.
+
+    Args:
+        dependency: Dependency kind (e.g. 'db', 'crm', 'ai', 'twilio')
+        operation: What was called (e.g. 'CallRepository.get_call_by_call_id')
+    """
+    if _active_dependency.get() == dependency:
+        yield
+        return
+
+    token = _active_dependency.set(dependency)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _active_dependency.reset(token)
+        DEPENDENCY_DURATION.observe(elapsed, dependency, operation)
+        timings = _request_timings.get()
+        if timings is not None:
+            totals = timings.setdefault(dependency, [0.0, 0])
+            totals[0] += elapsed
+            totals[1] += 1
+
+
+def instrument_methods(cls: type, dependency: str) -> type:
+    """
+    Wrap the public async methods a class defines in dependency spans.
+
+    Inherited methods are left alone (the defining class instruments them),
+    as are async generators, whose time is spent in the caller's loop.
+
+    Args:
+        cls: Class to instrument
+        dependency: Dependency kind its calls are recorded as
+
+    Returns:
+        type: The same class, so this also works as a decorator
+    """
+    for name, method in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or not inspect.iscoroutinefunction(method)
+            or getattr(method, "__timed__", False)
+        ):
+            continue
+        setattr(cls, name, _timed(method, dependency, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def instrumented(dependency: str) -> Callable[[type], type]:
+    """Class decorator form of instrument_methods."""
+    return functools.partial(instrument_methods, dependency=dependency)
+
+
+def _timed(method: Callable, dependency: str, operation: str) -> Callable:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span(dependency, operation):
+            return await method(*args, **kwargs)
+
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def format_server_timing(timings: dict[str, list], total: float) -> str:
+    """
+    Format a request's breakdown as a Server-Timing header value.
+
+    Args:
+        timings: Dependency -> [seconds, calls]
+        total: Seconds spent on the request so far
+
+    Returns:
+        str: e.g. 'db;dur=4.2;desc="3 calls", total;dur=51.0'
+    """
+    if not timings:
+        return f"total;dur={total * 1000:.1f}"
+    metrics = [
+        f'{dependency};dur={seconds * 1000:.1f};desc="{calls} calls"'
+        for dependency, (seconds, calls) in timings.items()
+    ]
+    metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class TimingMiddleware:
+    """ASGI middleware adding per-request timing, slow request logs and metrics."""
+
+    def __init__(self, app: ASGIApp, slow_request_ms: float = 1000):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            slow_request_ms: Requests taking at least this long are logged
+                with their breakdown; 0 logs every request
+        """
+        self.app = app
+        self.slow_request_seconds = slow_request_ms / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in UNTIMED_PATHS:
+            await self.app(scope, receive, send)
+        else:
+            await self._time_request(scope, receive, send)
+
+    async def _time_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Kept out of __call__ so passing probes through doesn't pay for this
+        # frame's closure cells
+        timings: dict[str, list] = {}
+        token = _request_timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                server_timing = format_server_timing(
+                    timings, time.perf_counter() - start
+                )
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", server_timing.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_timings.reset(token)
+            # Route templates keep the label set bounded; unmatched paths share one
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope["method"]
+            REQUEST_DURATION.observe(elapsed, method, route, str(status_code))
+            if elapsed >= self.slow_request_seconds:
+                _log_request(method, route, status_code, elapsed, timings)
+
+
+def _log_request(
+    method: str, route: str, status_code: int, elapsed: float, timings: dict
+) -> None:
+    fields = {
+        "method": method,
+        "route": route,
+        "status_code": status_code,
+        "duration_ms": round(elapsed * 1000, 1),
+    }
+    for dependency, (seconds, calls) in timings.items():
+        fields[f"{dependency}_ms"] = round(seconds * 1000, 1)
+        fields[f"{dependency}_calls"] = calls
+    logger.log_fields(logging.INFO, "[Timing] Request", fields)
@@ -0,0 +1,554 @@
+"""
+Bulk dialer for call lists and scheduled groups.
+
+Dials every member of a call list or scheduled group through
+CallAndWriteToCRMWorkflow, so each call gets the normal post-call pipeline
+(monitoring, recording analysis, CRM note).
+
+A bulk dial runs in three steps:
+
+1. Prefetch the CRM project (and customer contact, when the project lacks a
+   customer name) for every member concurrently, so dialing never waits on
+   the CRM between calls.
+2. Build a CallRequest per project and place calls in list order, with at
+   most `calls_per_phone_number` calls in progress per caller number. A slot
+   is held until the call ends, not just until it is created; the dial is
+   woken by the call-ended notification rather than polling the calls table.
+3. Record each connected call on its source (call list item or scheduled
+   group member) and emit a progress event for the SSE stream.
+
+Placing a call runs in its own task that a stopped dial never cancels: once
+the provider may have placed the call, its calls row and pipeline job must
+still be written. Stopping a dial cancels only the waits: for a slot, or for a
+placed call to end.
+
+The per-number limit is per process: dials in other processes from the same
+number are not counted.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import phonenumbers
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.voice_ai.constants import CallStatus
+from src.ai.voice_ai.schemas import CallRequest, CallResponse, VoiceAIErrorResponse
+from src.ai.voice_ai.service import VoiceAIService
+from src.db.call_jobs.listener import CallJobListener
+from src.db.call_list.repository import CallListRepository
+from src.db.calls.constants import CALL_ENDED_CHANNEL
+from src.db.calls.repository import CallRepository
+from src.db.database import get_async_session_local
+from src.db.scheduled_groups.repository import ScheduledGroupsRepository
+from src.integrations.crm.schemas import Contact, CRMErrorResponse, Project
+from src.integrations.crm.service import CRMService
+from src.utils.logger import logger
+from src.workflows.call_monitoring import CallAndWriteToCRMWorkflow
+from src.workflows.config import BulkDialerSettings, get_bulk_dialer_settings
+from src.workflows.schemas import BulkDialEvent
+
+# Records that a member's call connected, given a session and project ID
+CompletionRecorder = Callable[[AsyncSession, str], Awaitable[Any]]
+
+
+@dataclass
+class _PhoneNumberSlots:
+    """Call slots for one caller number and the dials sharing them."""
+
+    semaphore: asyncio.Semaphore
+    dials: int = 0
+
+
+# Calls in progress per caller phone number, shared by all bulk dials in this
+# process so two dials from the same number can't overlap. An entry is dropped
+# once no dial uses it, so a changed calls_per_phone_number applies from the
+# number's next dial.
+_phone_number_slots: dict[str, _PhoneNumberSlots] = {}
+
+# Call placements in progress, referenced here so they outlive a stopped dial
+_placements: set[asyncio.Task] = set()
+
+
+@contextmanager
+def _hold_phone_number_slots(caller_id: str, limit: int) -> Iterator[asyncio.Semaphore]:
+    """Share the caller number's slots for the length of a dial."""
+    slots = _phone_number_slots.get(caller_id)
+    if slots is None:
+        slots = _phone_number_slots[caller_id] = _PhoneNumberSlots(
+            asyncio.Semaphore(limit)
+        )
+    slots.dials += 1
+    try:
+        yield slots.semaphore
+    finally:
+        slots.dials -= 1
+        if not slots.dials:
+            del _phone_number_slots[caller_id]
+
+
+class _CallEndWatcher:
+    """
+    Wakes bulk dials when one of their calls ends.
+
+    Holds one LISTEN connection on CALL_ENDED_CHANNEL while any dial in this
+    process is running.
+    """
+
+    def __init__(self) -> None:
+        self._dials = 0
+        self._stop = asyncio.Event()
+        self._listener: asyncio.Task | None = None
+        self._waiters: dict[str, asyncio.Event] = {}
+
+    @contextmanager
+    def listening(self) -> Iterator[None]:
+        """Keep the LISTEN connection open for the length of a dial."""
+        if self._listener is None:
+            self._stop = asyncio.Event()
+            self._listener = asyncio.create_task(
+                CallJobListener(self._on_call_ended, CALL_ENDED_CHANNEL).run(self._stop)
+            )
+        self._dials += 1
+        try:
+            yield
+        finally:
+            self._dials -= 1
+            if not self._dials:
+                self._stop.set()
+                self._listener = None
+
+    @contextmanager
+    def waiter(self, call_id: str) -> Iterator[asyncio.Event]:
+        """Event set whenever the call is reported ended."""
+        event = self._waiters[call_id] = asyncio.Event()
+        try:
+            yield event
+        finally:
+            del self._waiters[call_id]
+
+    def _on_call_ended(self, call_id: str) -> None:
+        event = self._waiters.get(call_id)
+        if event is not None:
+            event.set()
+
+
+_call_end_watcher = _CallEndWatcher()
+
+
+def call_list_completion(user_id: str) -> CompletionRecorder:
+    """Mark a user's call list item as called once its call connects."""
+
+    async def record(session: AsyncSession, project_id: str) -> None:
+        await CallListRepository(session).mark_call_completed(user_id, project_id)
+
+    return record
+
+
+def scheduled_group_completion(group_id: int) -> CompletionRecorder:
+    """
+    Stamp a scheduled group member as dialed once its call connects.
+
+    The member's goal is deliberately left alone: a call that ends normally
+    may have reached voicemail, an IVR or someone who hung up, and nothing
+    here knows the outcome. Goals are marked completed by the user, and the
+    group keeps dialing the member on later runs until then.
+    """
+
+    async def record(session: AsyncSession, project_id: str) -> None:
+        await ScheduledGroupsRepository(session).mark_member_dialed(
+            group_id, project_id
+        )
+
+    return record
+
+
+def build_call_request(
+    project: Project, contact: Contact | None, company_name: str | None
+) -> CallRequest | None:
+    """
+    Build the call request for a project, as the dialer UI does.
+
+    Args:
+        project: CRM project to call about
+        contact: The project's customer contact, if it was fetched
+        company_name: Company name the assistant introduces itself with
+
+    Returns:
+        CallRequest | None: The request, or None if there's no valid number to call
+    """
+    provider_data = project.provider_data or {}
+    adjuster_contact = provider_data.get("adjusterContact") or {}
+
+    phone_number = _to_e164(
+        project.adjuster_phone
+        or provider_data.get("adjusterPhone")
+        or adjuster_contact.get("phone")
+    )
+    if phone_number is None:
+        return None
+
+    address_parts = [
+        project.address_line1,
+        project.address_line2,
+        ", ".join(part for part in (project.city, project.state) if part),
+        project.postal_code,
+        project.country,
+    ]
+    customer_address = (
+        ", ".join(part for part in address_parts if part)
+        if project.address_line1
+        else provider_data.get("address")
+    )
+
+    return CallRequest(
+        phone_number=phone_number,
+        customer_id=project.id,
+        customer_name=project.customer_name
+        or provider_data.get("customerName")
+        or _contact_name(contact),
+        company_name=company_name,
+        customer_address=customer_address,
+        claim_number=project.claim_number or provider_data.get("claimNumber"),
+        date_of_loss=project.date_of_loss,
+        insurance_agency=project.insurance_company
+        or provider_data.get("insuranceAgency"),
+        adjuster_name=project.adjuster_name
+        or provider_data.get("adjusterName")
+        or adjuster_contact.get("name"),
+        adjuster_phone=phone_number,
+        tenant=provider_data.get("tenant"),
+        job_id=project.id,
+    )
+
+
+def _contact_name(contact: Contact | None) -> str | None:
+    """Customer name from a CRM contact, used when the project has none."""
+    if contact is None:
+        return None
+    full_name = " ".join(
+        part for part in (contact.first_name, contact.last_name) if part
+    )
+    return contact.display_name or full_name or None
+
+
+def _to_e164(phone_number: str | None) -> str | None:
+    """Normalize a phone number to E.164 (US by default), or None if invalid."""
+    if not phone_number:
+        return None
+    try:
+        parsed = phonenumbers.parse(phone_number, "US")
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(parsed):
+        return None
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+class BulkDialer:
+    """Dials a list of projects with bounded concurrency and streams progress."""
+
+    def __init__(
+        self,
+        voice_ai_service: VoiceAIService,
+        crm_service: CRMService,
+        settings: BulkDialerSettings | None = None,
+    ):
+        """
+        Initialize the bulk dialer.
+
+        Args:
+            voice_ai_service: Voice AI service for the dialing user
+            crm_service: CRM service for the user's organization
+            settings: Dialer settings (defaults to the global settings)
+        """
+        self.voice_ai_service = voice_ai_service
+        self.crm_service = crm_service
+        self.settings = settings or get_bulk_dialer_settings()
+        self._counts = {"placed": 0, "connected": 0, "failed": 0, "skipped": 0}
+        self._total = 0
+        self._placing: set[asyncio.Task] = set()
+
+    async def dial(
+        self,
+        project_ids: list[str],
+        user_id: str,
+        organization_id: str | None,
+        caller_id: str,
+        record_completion: CompletionRecorder,
+        company_name: str | None = None,
+    ) -> AsyncIterator[BulkDialEvent]:
+        """
+        Dial every project in order, yielding progress events.
+
+        If the consumer stops iterating (e.g. the client disconnects), no
+        further calls are placed. Calls already placed, including ones whose
+        placement is still in flight, still go through the post-call
+        pipeline, but their members aren't marked completed. Close the
+        iterator (e.g. with contextlib.aclosing) so this happens promptly;
+        closing waits for in-flight placements to be recorded.
+
+        Args:
+            project_ids: Projects to dial, in order
+            user_id: User placing the calls
+            organization_id: The user's organization (for CRM note writing)
+            caller_id: Caller phone number (concurrency is limited per number)
+            record_completion: Marks a member done once its call connects
+            company_name: Company name the assistant introduces itself with
+
+        Yields:
+            BulkDialEvent: Progress events, ending with a "done" event
+        """
+        self._total = len(project_ids)
+        projects, contacts = await self._prefetch(project_ids)
+        yield self._event("prefetched")
+
+        with (
+            _hold_phone_number_slots(
+                caller_id, self.settings.calls_per_phone_number
+            ) as slots,
+            _call_end_watcher.listening(),
+        ):
+            events: asyncio.Queue[BulkDialEvent] = asyncio.Queue()
+            tasks = []
+            for project_id in project_ids:
+                project = projects.get(project_id)
+                if isinstance(project, CRMErrorResponse):
+                    events.put_nowait(self._skip(project_id, project.error))
+                    continue
+                request = build_call_request(
+                    project, contacts.get(project.customer_id or ""), company_name
+                )
+                if request is None:
+                    events.put_nowait(self._skip(project_id, "No valid phone number"))
+                    continue
+                tasks.append(
+                    asyncio.create_task(
+                        self._dial_one(
+                            request,
+                            user_id,
+                            organization_id,
+                            slots,
+                            record_completion,
+                            events,
+                        )
+                    )
+                )
+
+            try:
+                remaining = asyncio.gather(*tasks)
+                while not (remaining.done() and events.empty()):
+                    get_event = asyncio.ensure_future(events.get())
+                    await asyncio.wait(
+                        {get_event, remaining}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if get_event.done():
+                        yield get_event.result()
+                    else:
+                        get_event.cancel()
+                yield self._event("done")
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Placements carry on regardless; wait for them (shielded, so
+                # a second cancel can't reach them) so their calls are
+                # recorded before the dial returns
+                await asyncio.shield(
+                    asyncio.gather(*tasks, *self._placing, return_exceptions=True)
+                )
+
+    async def _prefetch(
+        self, project_ids: list[str]
+    ) -> tuple[dict[str, Project | CRMErrorResponse], dict[str, Contact]]:
+        """Fetch all projects, then the contacts they need, concurrently."""
+        semaphore = asyncio.Semaphore(self.settings.prefetch_concurrency)
+
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        project_results = await asyncio.gather(
+            *(bounded(self.crm_service.get_project(pid)) for pid in project_ids)
+        )
+        projects = dict(zip(project_ids, project_results, strict=True))
+
+        contact_ids = {
+            project.customer_id
+            for project in projects.values()
+            if isinstance(project, Project)
+            and project.customer_id
+            and not project.customer_name
+        }
+        contact_results = await asyncio.gather(
+            *(bounded(self.crm_service.get_contact(cid)) for cid in contact_ids)
+        )
+        contacts = {
+            contact.id: contact
+            for contact in contact_results
+            if isinstance(contact, Contact)
+        }
+
+        logger.info(
+            "[Bulk Dialer] Prefetched CRM data",
+            projects=len(projects),
+            contacts=len(contacts),
+        )
+        return projects, contacts
+
+    async def _dial_one(
+        self,
+        request: CallRequest,
+        user_id: str,
+        organization_id: str | None,
+        slots: asyncio.Semaphore,
+        record_completion: CompletionRecorder,
+        events: asyncio.Queue[BulkDialEvent],
+    ) -> None:
+        """Place one call in its turn and hold the slot until it ends."""
+        project_id = str(request.job_id)
+        async with slots:
+            placement = asyncio.create_task(
+                self._place_call(request, user_id, organization_id)
+            )
+            _placements.add(placement)
+            self._placing.add(placement)
+            placement.add_done_callback(_placements.discard)
+            placement.add_done_callback(self._placing.discard)
+            try:
+                # Cancelling the dial stops this wait, never the placement
+                result = await asyncio.shield(placement)
+            except Exception as e:
+                result = VoiceAIErrorResponse(error=str(e))
+
+            if isinstance(result, VoiceAIErrorResponse):
+                self._counts["failed"] += 1
+                events.put_nowait(
+                    self._event(
+                        "call_failed", project_id=project_id, detail=result.error
+                    )
+                )
+                return
+
+            self._counts["placed"] += 1
+            events.put_nowait(
+                self._event(
+                    "call_started", project_id=project_id, call_id=result.call_id
+                )
+            )
+
+            try:
+                status = await self._wait_for_end(result.call_id)
+            except Exception as e:
+                logger.error(
+                    "[Bulk Dialer] Failed waiting for call to end",
+                    call_id=result.call_id,
+                    error=str(e),
+                )
+                self._counts["failed"] += 1
+                events.put_nowait(
+                    self._event(
+                        "call_failed",
+                        project_id=project_id,
+                        call_id=result.call_id,
+                        detail=str(e),
+                    )
+                )
+                return
+
+        connected = status == CallStatus.ENDED.value
+        if connected:
+            self._counts["connected"] += 1
+            try:
+                async with get_async_session_local()() as session:
+                    await record_completion(session, project_id)
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "[Bulk Dialer] Failed to record completed call",
+                    project_id=project_id,
+                    error=str(e),
+                )
+        else:
+            self._counts["failed"] += 1
+
+        events.put_nowait(
+            self._event(
+                "call_ended" if connected else "call_failed",
+                project_id=project_id,
+                call_id=result.call_id,
+                status=status,
+            )
+        )
+
+    async def _place_call(
+        self, request: CallRequest, user_id: str, organization_id: str | None
+    ) -> CallResponse | VoiceAIErrorResponse:
+        """Place the call, store it and enqueue its post-call pipeline."""
+        async with get_async_session_local()() as session:
+            workflow = CallAndWriteToCRMWorkflow(
+                voice_ai_service=self.voice_ai_service,
+                crm_service=None,
+                call_repository=CallRepository(session),
+            )
+            return await workflow.call_and_write_results_to_crm(
+                request=request,
+                user_id=user_id,
+                organization_id=organization_id,
+            )
+
+    async def _wait_for_end(self, call_id: str) -> str | None:
+        """
+        Wait until the call's stored status is final.
+
+        The status is kept current by provider webhooks and the pipeline's
+        status checks, which NOTIFY CALL_ENDED_CHANNEL when a call ends. The
+        calls table is read when notified and, as a safety net, every
+        status_check_interval_seconds; a failed read is retried then.
+
+        Returns:
+            The final status, or None if the call outlasted max_call_seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.max_call_seconds
+        with _call_end_watcher.waiter(call_id) as ended:
+            while True:
+                try:
+                    async with get_async_session_local()() as session:
+                        call = await CallRepository(session).get_call_by_call_id(
+                            call_id
+                        )
+                    if call and CallStatus.is_call_ended(call.status):
+                        return call.status
+                except Exception as e:
+                    logger.warning(
+                        "[Bulk Dialer] Failed to read call status",
+                        call_id=call_id,
+                        error=str(e),
+                    )
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        ended.wait(),
+                        min(remaining, self.settings.status_check_interval_seconds),
+                    )
+                except TimeoutError:
+                    pass
+                ended.clear()
+        logger.warning("[Bulk Dialer] Gave up waiting for call to end", call_id=call_id)
+        return None
+
+    def _skip(self, project_id: str, reason: str) -> BulkDialEvent:
+        self._counts["skipped"] += 1
+        return self._event("skipped", project_id=project_id, detail=reason)
+
+    def _event(self, event_type: str, **fields: Any) -> BulkDialEvent:
+        """Build an event carrying the running totals."""
+        return BulkDialEvent(
+            type=event_type, total=self._total, **self._counts, **fields
+        )
@@ -5,16 +5,18 @@ This module provides workflow orchestration for creating and monitoring
 voice AI calls, and updating CRM systems with call results.
 """
 
-import asyncio
 import mimetypes
 import tempfile
 import textwrap
-from pathlib import Path
+import time
+from datetime import UTC, datetime
+from typing import Any
 
 from src.ai.base import AIProvider
 from src.ai.providers.factory import AIProviderType, create_ai_provider
 from src.ai.voice_ai.constants import CallStatus
 from src.ai.voice_ai.constants import VoiceAIProvider as VoiceAIProviderEnum
+from src.ai.voice_ai.providers.vapi.poller import VapiStatusPoller
 from src.ai.voice_ai.schemas import (
     AnalysisData,
     CallRequest,
@@ -23,32 +25,43 @@ from src.ai.voice_ai.schemas import (
     VoiceAIErrorResponse,
 )
 from src.ai.voice_ai.service import VoiceAIService
+from src.db.call_jobs.constants import CallJobStage
+from src.db.call_jobs.repository import CallJobRepository
 from src.db.calls.repository import CallRepository
 from src.integrations.crm.service import CRMService
 from src.utils.logger import logger
 from src.workflows.config import get_call_monitoring_settings
 
 
+class CallPipelineError(Exception):
+    """A post-call pipeline stage failed and should be retried."""
+
+    pass
+
+
 class CallAndWriteToCRMWorkflow:
     """Orchestrates Voice AI call creation and CRM updates."""
 
     def __init__(
         self,
         voice_ai_service: VoiceAIService,
-        crm_service: CRMService,
+        crm_service: CRMService | None,
         call_repository: CallRepository,
+        status_poller: VapiStatusPoller | None = None,
     ):
         """
         Initialize the call monitoring workflow.
 
         Args:
             voice_ai_service: Service for Voice AI operations
-            crm_service: Service for CRM operations
+            crm_service: Service for CRM operations (only needed to write CRM notes)
             call_repository: Repository for call data persistence
+            status_poller: Shared poller that watches in-progress Vapi calls
         """
         self.voice_ai_service = voice_ai_service
         self.crm_service = crm_service
         self.call_repository = call_repository
+        self.status_poller = status_poller
         self.settings = get_call_monitoring_settings()
         # Initialize AI provider for recording analysis (explicitly use Gemini for audio)
         self.gemini_ai_provider: AIProvider = create_ai_provider(
@@ -59,19 +72,21 @@ class CallAndWriteToCRMWorkflow:
         self,
         request: CallRequest,
         user_id: str | None = None,
+        organization_id: str | None = None,
     ) -> CallResponse | VoiceAIErrorResponse:
         """
         Create an outbound call and start monitoring it and writing results to CRM.
 
         This method orchestrates:
         1. Creating the call via Voice AI service
-        2. Persisting call state to DynamoDB
-        3. Starting background monitoring and writing results to CRM
-        4. Updating CRM when call completes
+        2. Persisting call state to the database
+        3. Queuing the post-call pipeline (monitor, analyze, write to CRM),
+           which runs on any CallPipelineWorker
 
         Args:
             request: The call request with phone number and context
             user_id: The ID of the user creating the call (for audit trails)
+            organization_id: The user's organization (for CRM credentials)
 
         Returns:
             CallResponse or VoiceAIErrorResponse: The result of the operation
@@ -123,7 +138,7 @@ class CallAndWriteToCRMWorkflow:
                 )
 
                 # Explicitly commit the transaction to prevent race condition
-                # The background monitoring task creates its own session and might query
+                # Pipeline workers use their own sessions and might query
                 # the database before the HTTP request handler commits
                 await self.call_repository.session.commit()
 
@@ -138,189 +153,290 @@ class CallAndWriteToCRMWorkflow:
                     exc_info=True,
                 )
 
-        # Start background monitoring
+        # Hand the call to the post-call pipeline. The job is durable, so
+        # monitoring survives deploys and any worker can pick it up.
         try:
-            asyncio.create_task(
-                self._monitor_and_update_crm(
-                    call_id=result.call_id,
+            job_repository = CallJobRepository(self.call_repository.session)
+            await job_repository.enqueue(
+                call_id=result.call_id,
+                stage=CallJobStage.MONITOR_CALL,
+                payload=self.build_job_payload(
                     request=request,
+                    provider=result.provider,
                     user_id=user_id,
-                )
+                    organization_id=organization_id,
+                ),
+                max_attempts=self.settings.job_max_attempts,
             )
+            await self.call_repository.session.commit()
             logger.info(
-                "[Call Monitoring Workflow] Started monitoring for call",
+                "[Call Monitoring Workflow] Queued monitoring for call",
                 call_id=result.call_id,
             )
         except Exception as e:
             logger.error(
-                "[Call Monitoring Workflow] Failed to start monitoring task for call",
+                "[Call Monitoring Workflow] Failed to queue monitoring for call",
                 call_id=result.call_id,
                 error=str(e),
             )
 
         return result
 
-    async def _monitor_and_update_crm(
+    @staticmethod
+    def build_job_payload(
+        request: CallRequest,
+        provider: VoiceAIProviderEnum,
+        user_id: str | None,
+        organization_id: str | None,
+    ) -> dict[str, Any]:
+        """
+        Build the payload carried by every pipeline job for a call.
+
+        Args:
+            request: The original call request
+            provider: Voice AI provider that placed the call
+            user_id: The ID of the user who created the call
+            organization_id: The user's organization (for CRM credentials)
+
+        Returns:
+            JSON-serializable job payload
+        """
+        return {
+            "request": request.model_dump(mode="json"),
+            "provider": provider.value,
+            "user_id": user_id,
+            "organization_id": organization_id,
+        }
+
+    async def monitor_call(
         self,
         call_id: str,
-        request: CallRequest,
         user_id: str | None,
-    ) -> None:
+        monitoring_started_at: datetime,
+        job_repository: CallJobRepository,
+        job_payload: dict[str, Any],
+    ) -> float | None:
         """
-        Monitor call status and update CRM when call completes.
+        Check a call's status once and advance the pipeline if it has ended.
 
-        Polls call status every 10 seconds until the call reaches a terminal state,
-        then extracts structured data and updates the CRM job note.
+        Pipeline stage: MONITOR_CALL.
 
         Args:
             call_id: The call identifier to monitor
-            request: The original call request (contains tenant/job_id)
             user_id: The ID of the user who created the call
+            monitoring_started_at: When monitoring began (for the timeout)
+            job_repository: Job queue repository on the worker's session
+            job_payload: Payload to pass on to the next stage
+
+        Returns:
+            Seconds until the next status check, or None when monitoring is done
+
+        Raises:
+            CallPipelineError: If the call status can't be fetched
         """
-        # Import here to avoid circular dependencies
-        from src.db.database import get_async_session_local
+        elapsed = (datetime.now(UTC) - monitoring_started_at).total_seconds()
+        if elapsed > self.settings.max_monitoring_seconds:
+            logger.warning(
+                "[Call Monitoring Workflow] Monitoring timed out for call",
+                call_id=call_id,
+            )
+            if self.status_poller is not None:
+                self.status_poller.untrack(call_id)
+            return None
+
+        # Reuse the shared poller's latest result when it has one
+        status_result = (
+            self.status_poller.latest(call_id) if self.status_poller else None
+        ) or await self.voice_ai_service.get_call_status(call_id)
+
+        if isinstance(status_result, VoiceAIErrorResponse):
+            raise CallPipelineError(
+                f"Error polling call {call_id}: {status_result.error}"
+            )
 
-        poll_interval_seconds = 3
-        max_polling_duration = 60 * 60 * 24  # 24 hours
-        start_time = asyncio.get_event_loop().time()
+        logger.info(
+            "[Call Monitoring Workflow] Call status",
+            call_id=call_id,
+            status=status_result.status,
+        )
 
-        # Create a new database session for this background task
-        # The session from the HTTP request will be closed, so we need our own
-        session_factory = get_async_session_local()
+        if CallStatus.is_call_ended(status_result.status):
+            logger.info(
+                "[Call Monitoring Workflow] Call ended",
+                call_id=call_id,
+                status=status_result.status,
+            )
 
-        try:
-            async with session_factory() as session:
-                # Create a repository with our own session
-                task_repository = CallRepository(session)
-
-                while True:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed > max_polling_duration:
-                        logger.warning(
-                            "[Call Monitoring Workflow] Monitoring timed out for call",
-                            call_id=call_id,
-                        )
-                        break
-
-                    # Poll call status
-                    status_result = await self.voice_ai_service.get_call_status(call_id)
-
-                    if isinstance(status_result, VoiceAIErrorResponse):
-                        logger.error(
-                            "[Call Monitoring Workflow] Error polling call",
-                            call_id=call_id,
-                            error=status_result.error,
-                        )
-                        break
-
-                    logger.info(
-                        "[Call Monitoring Workflow] Call status",
-                        call_id=call_id,
-                        status=status_result.status,
-                    )
+            # Update call status to ended immediately (for downstream systems)
+            await self.call_repository.update_call_status(
+                call_id=call_id,
+                status=status_result.status,
+                provider_data=status_result.provider_data.model_dump(mode="json")
+                if status_result.provider_data
+                else None,
+            )
+            await job_repository.enqueue(
+                call_id=call_id,
+                stage=CallJobStage.ANALYZE_RECORDING,
+                payload=job_payload,
+                max_attempts=self.settings.job_max_attempts,
+            )
+            await self.call_repository.session.commit()
+            return None
+
+        # Update call status in database (only for non-ended calls)
+        if user_id:
+            try:
+                await self.call_repository.update_call_status(
+                    call_id=call_id,
+                    status=status_result.status,
+                    provider_data=status_result.provider_data.model_dump(mode="json")
+                    if status_result.provider_data
+                    else None,
+                )
+                await self.call_repository.session.commit()
+                logger.debug(
+                    "[Call Monitoring Workflow] Committed status update for call",
+                    call_id=call_id,
+                )
+            except Exception as e:
+                logger.error(
+                    "[Call Monitoring Workflow] Failed to update call status",
+                    error=str(e),
+                )
+                await self.call_repository.session.rollback()
+
+        # Twilio status webhooks (or the shared Vapi poller) wake this job when
+        # the call ends, so only a slow safety-net check is needed
+        if job_payload.get("provider") == VoiceAIProviderEnum.TWILIO.value:
+            return self.settings.webhook_fallback_poll_interval_seconds
+        if self.status_poller is not None:
+            self.status_poller.track(call_id, started_at=monitoring_started_at)
+            return self.settings.webhook_fallback_poll_interval_seconds
+        return self.settings.status_poll_interval_seconds
+
+    async def analyze_recording(
+        self,
+        call_id: str,
+        stage_started_at: datetime,
+        job_repository: CallJobRepository,
+        job_payload: dict[str, Any],
+    ) -> float | None:
+        """
+        Analyze an ended call's recording and persist the final call state.
+
+        Pipeline stage: ANALYZE_RECORDING. Twilio delivers recordings some
+        time after the call ends; until the recording webhook stores the URL
+        (and wakes this job) the stage reschedules itself, giving up on the
+        recording after recording_wait_seconds.
+
+        Args:
+            call_id: The ended call
+            stage_started_at: When this stage was first queued
+            job_repository: Job queue repository on the worker's session
+            job_payload: Payload to pass on to the next stage
+
+        Returns:
+            Seconds until the next check for the recording, or None when done
+
+        Raises:
+            CallPipelineError: If the final call status can't be fetched
+        """
+        recording_url = None
+        if job_payload.get("provider") == VoiceAIProviderEnum.TWILIO.value:
+            call = await self.call_repository.get_call_by_call_id(call_id)
+            recording_url = call.recording_url if call else None
+            waited = (datetime.now(UTC) - stage_started_at).total_seconds()
+            if not recording_url and waited < self.settings.recording_wait_seconds:
+                logger.debug(
+                    "[Call Monitoring Workflow] Waiting for recording webhook",
+                    call_id=call_id,
+                )
+                return self.settings.webhook_fallback_poll_interval_seconds
 
-                    # Check if call has ended
-                    if CallStatus.is_call_ended(status_result.status):
-                        logger.info(
-                            "[Call Monitoring Workflow] Call ended",
-                            call_id=call_id,
-                            status=status_result.status,
-                        )
-
-                        # Process completed call
-                        # At this point, status_result is guaranteed to be CallResponse due to the isinstance check above
-                        assert isinstance(status_result, CallResponse), (
-                            "status_result should be CallResponse at this point"
-                        )
-
-                        # Update call status to ended immediately (for downstream systems)
-                        await task_repository.update_call_status(
-                            call_id=call_id,
-                            status=status_result.status,
-                            provider_data=status_result.provider_data.model_dump(
-                                mode="json"
-                            )
-                            if status_result.provider_data
-                            else None,
-                        )
-                        await session.commit()
-
-                        # Generate structured data from recording using AI (may take several seconds)
-                        await self._generate_structured_data_from_call(
-                            call_id=call_id,
-                            call_response=status_result,
-                            repository=task_repository,
-                        )
-
-                        # Persist complete call data including AI-generated analysis
-                        await self._persist_completed_call(
-                            call_id=call_id,
-                            call_response=status_result,
-                            repository=task_repository,
-                        )
-                        await session.commit()
-                        logger.info(
-                            "[Call Monitoring Workflow] Committed final call state",
-                            call_id=call_id,
-                        )
-
-                        # Update CRM if enabled
-                        if self.settings.enable_crm_write:
-                            logger.info(
-                                "[Call Monitoring Workflow] Updating CRM with call results",
-                                call_id=call_id,
-                            )
-                            await self._update_crm_with_call_results(
-                                call_id=call_id,
-                                call_response=status_result,
-                                request=request,
-                            )
-                        else:
-                            logger.info(
-                                "[Call Monitoring Workflow] CRM write disabled, skipping CRM update",
-                                call_id=call_id,
-                            )
-
-                        break
-
-                    # Update call status in database (only for non-ended calls)
-                    # Ended calls are handled by _persist_completed_call above
-                    if user_id:
-                        try:
-                            await task_repository.update_call_status(
-                                call_id=call_id,
-                                status=status_result.status,
-                                provider_data=status_result.provider_data.model_dump(
-                                    mode="json"
-                                )
-                                if status_result.provider_data
-                                else None,
-                            )
-                            await session.commit()
-                            logger.debug(
-                                "[Call Monitoring Workflow] Committed status update for call",
-                                call_id=call_id,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "[Call Monitoring Workflow] Failed to update call status",
-                                error=str(e),
-                            )
-                            await session.rollback()
-
-                    await asyncio.sleep(poll_interval_seconds)
-
-        except asyncio.CancelledError:
+        status_result = await self.voice_ai_service.get_call_status(call_id)
+        if isinstance(status_result, VoiceAIErrorResponse):
+            raise CallPipelineError(
+                f"Error fetching final status for call {call_id}: {status_result.error}"
+            )
+
+        # Generate structured data from recording using AI (may take several seconds)
+        await self._generate_structured_data_from_call(
+            call_id=call_id,
+            call_response=status_result,
+            recording_url=recording_url,
+        )
+
+        # Persist complete call data including AI-generated analysis
+        await self._persist_completed_call(
+            call_id=call_id,
+            call_response=status_result,
+            repository=self.call_repository,
+        )
+
+        if self.settings.enable_crm_write:
+            await job_repository.enqueue(
+                call_id=call_id,
+                stage=CallJobStage.WRITE_CRM_NOTE,
+                payload=job_payload,
+                max_attempts=self.settings.job_max_attempts,
+            )
+        else:
             logger.info(
-                "[Call Monitoring Workflow] Monitoring task canceled",
+                "[Call Monitoring Workflow] CRM write disabled, skipping CRM update",
                 call_id=call_id,
             )
-        except Exception as e:
-            logger.error(
-                "[Call Monitoring Workflow] Unexpected error monitoring call",
+
+        await self.call_repository.session.commit()
+        logger.info(
+            "[Call Monitoring Workflow] Committed final call state",
+            call_id=call_id,
+        )
+        return None
+
+    async def write_crm_note(self, call_id: str, request: CallRequest) -> None:
+        """
+        Write an analyzed call's results to the CRM.
+
+        Pipeline stage: WRITE_CRM_NOTE. The analysis is read back from the
+        call record persisted by the previous stage. The note is claimed on
+        the call record (and committed) before it is sent, so however many
+        runs of the stage overlap, only one adds it. The claim is released if
+        the CRM rejects the note; if the worker dies mid-write the note is
+        not retried, as the CRM may already have it.
+
+        Args:
+            call_id: The analyzed call
+            request: The original call request (contains job_id)
+
+        Raises:
+            CallPipelineError: If the call is missing or the CRM rejects the note
+        """
+        call = await self.call_repository.get_call_by_call_id(call_id)
+        if call is None:
+            raise CallPipelineError(f"Call {call_id} not found")
+        if call.crm_note_written_at is not None:
+            logger.info(
+                "[Call Monitoring Workflow] CRM note already written, skipping",
                 call_id=call_id,
-                error=str(e),
             )
+            return
+
+        analysis = (
+            AnalysisData.model_validate(call.analysis_data)
+            if call.analysis_data
+            else None
+        )
+
+        logger.info(
+            "[Call Monitoring Workflow] Updating CRM with call results",
+            call_id=call_id,
+        )
+        await self._update_crm_with_call_results(
+            call_id=call_id,
+            analysis=analysis,
+            request=request,
+        )
 
     async def _persist_completed_call(
         self,
@@ -368,98 +484,51 @@ class CallAndWriteToCRMWorkflow:
                 call_id=call_id,
                 error=str(e),
             )
+            raise
 
-    async def _poll_for_recording_url(
-        self,
-        call_id: str,
-        repository: CallRepository,
-        max_attempts: int = 10,
-        poll_interval: int = 3,
-    ) -> str | None:
-        """
-        Poll database for recording URL with timeout.
-
-        Args:
-            call_id: The call identifier
-            repository: The call repository with an active session
-            max_attempts: Maximum number of polling attempts
-            poll_interval: Seconds between polling attempts
-
-        Returns:
-            str | None: Recording URL if found, None otherwise
+    async def _upload_recording(self, call_id: str, recording_url: str) -> str:
         """
-        logger.debug(
-            "[Call Monitoring Workflow] Polling for recording URL",
-            call_id=call_id,
-        )
-
-        # TODO: Change this to be event driven instead of polling
-        for attempt in range(max_attempts):
-            # Expire all cached instances to force fresh database query
-            repository.session.expire_all()
+        Stream a recording from the voice AI provider to the AI provider.
 
-            call = await repository.get_call_by_call_id(call_id)
-            if call and call.recording_url:
-                logger.debug(
-                    "[Call Monitoring Workflow] Found recording URL",
-                    call_id=call_id,
-                    url=call.recording_url,
-                    attempt=attempt + 1,
-                )
-                return call.recording_url
-
-            if attempt < max_attempts - 1:
-                await asyncio.sleep(poll_interval)
-
-        logger.warning(
-            "[Call Monitoring Workflow] Recording URL not available after polling",
-            call_id=call_id,
-            max_attempts=max_attempts,
-        )
-        return None
-
-    async def _download_and_save_recording(
-        self,
-        call_id: str,
-        recording_url: str,
-    ) -> Path:
-        """
-        Download recording from voice AI provider and save to temporary file.
+        The recording is buffered in a spooled file that stays in memory up
+        to recording_spool_max_memory_bytes and only spills to disk above it,
+        so typical recordings are never written to a temporary file.
 
         Args:
             call_id: The call identifier
             recording_url: URL to the recording
 
         Returns:
-            Path: Path to the temporary file
+            str: ID of the uploaded file
 
         Raises:
-            Exception: If download or file creation fails
+            Exception: If download or upload fails
         """
-        logger.debug(
-            "[Call Monitoring Workflow] Downloading recording",
-            call_id=call_id,
-        )
-
-        file_bytes, content_type = await self.voice_ai_service.download_recording(
-            recording_url
-        )
-
-        # Determine file extension from content type using mimetypes
-        extension = mimetypes.guess_extension(content_type) or ".mp3"
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as temp_file:
-            temp_file.write(file_bytes)
-            temp_file_path = Path(temp_file.name)
-
-        logger.debug(
-            "[Call Monitoring Workflow] Created temporary file",
-            call_id=call_id,
-            path=str(temp_file_path),
-        )
+        spool_max_bytes = self.settings.recording_spool_max_memory_bytes
+        with tempfile.SpooledTemporaryFile(max_size=spool_max_bytes) as buffer:
+            started = time.perf_counter()
+            (
+                size_bytes,
+                content_type,
+            ) = await self.voice_ai_service.download_recording_to(recording_url, buffer)
+            downloaded = time.perf_counter()
+
+            extension = mimetypes.guess_extension(content_type) or ".mp3"
+            file_metadata = await self.gemini_ai_provider.upload_fileobj(
+                buffer, mime_type=content_type, display_name=f"{call_id}{extension}"
+            )
+            uploaded = time.perf_counter()
 
-        return temp_file_path
+            logger.info(
+                "[Call Monitoring Workflow] Uploaded recording to AI provider",
+                call_id=call_id,
+                file_id=file_metadata.name,
+                size_bytes=size_bytes,
+                spilled_to_disk=size_bytes > spool_max_bytes,
+                download_seconds=round(downloaded - started, 3),
+                upload_seconds=round(uploaded - downloaded, 3),
+            )
+        return file_metadata.name
 
     def _create_analysis_prompt(self) -> str:
         """
@@ -491,34 +560,15 @@ class CallAndWriteToCRMWorkflow:
     async def _cleanup_recording_files(
         self,
         call_id: str,
-        temp_file_path: Path | None,
         uploaded_file_id: str | None,
     ) -> None:
         """
-        Clean up temporary file and uploaded file from AI provider.
+        Delete the uploaded recording from the AI provider.
 
         Args:
             call_id: The call identifier (for logging)
-            temp_file_path: Path to temporary file to delete
             uploaded_file_id: ID of uploaded file to delete from AI provider
         """
-        # Clean up temporary file
-        if temp_file_path and temp_file_path.exists():
-            try:
-                temp_file_path.unlink()
-                logger.debug(
-                    "[Call Monitoring Workflow] Deleted temporary file",
-                    call_id=call_id,
-                    path=str(temp_file_path),
-                )
-            except Exception as e:
-                logger.warning(
-                    "[Call Monitoring Workflow] Failed to delete temporary file",
-                    path=str(temp_file_path),
-                    error=str(e),
-                )
-
-        # Delete uploaded file from AI provider
         if uploaded_file_id:
             try:
                 await self.gemini_ai_provider.delete_file(uploaded_file_id)
@@ -538,19 +588,17 @@ class CallAndWriteToCRMWorkflow:
         self,
         call_id: str,
         call_response: CallResponse,
-        repository: CallRepository,
+        recording_url: str | None,
     ) -> None:
         """
         Generate structured data from call recording using AI analysis.
 
         This method orchestrates the full recording analysis pipeline:
-        1. Checks if provider is Twilio (returns early if not)
-        2. Polls database for recording URL (with timeout)
-        3. Downloads recording from voice AI provider
-        4. Uploads to AI provider (Gemini)
-        5. Generates structured analysis data
-        6. Updates call_response.analysis in-place
-        7. Cleans up temporary files
+        1. Checks if provider is Twilio and a recording exists (returns early if not)
+        2. Streams the recording from the voice AI provider to the AI provider (Gemini)
+        3. Generates structured analysis data
+        4. Updates call_response.analysis in-place
+        5. Deletes the uploaded file
 
         Note: This function updates call_response.analysis but does NOT persist to database.
         The caller should persist the updated call_response after this returns.
@@ -558,47 +606,28 @@ class CallAndWriteToCRMWorkflow:
         Args:
             call_id: The call identifier
             call_response: The call response to update with analysis data
-            repository: The call repository with an active session
+            recording_url: URL of the call recording, if one was delivered
         """
         # Check if provider is Twilio
         if call_response.provider != VoiceAIProviderEnum.TWILIO:
             return
 
+        if not recording_url:
+            logger.warning(
+                "[Call Monitoring Workflow] Recording URL not available, skipping analysis",
+                call_id=call_id,
+            )
+            return
+
         logger.info(
             "[Call Monitoring Workflow] Processing Twilio recording with AI",
             call_id=call_id,
         )
 
         uploaded_file_id: str | None = None
-        temp_file_path: Path | None = None
 
         try:
-            # Poll for recording URL
-            recording_url = await self._poll_for_recording_url(call_id, repository)
-            if not recording_url:
-                return
-
-            # Download and save recording to temporary file
-            temp_file_path = await self._download_and_save_recording(
-                call_id, recording_url
-            )
-
-            # Upload to AI provider
-            logger.debug(
-                "[Call Monitoring Workflow] Uploading recording to AI provider",
-                call_id=call_id,
-            )
-
-            file_metadata = await self.gemini_ai_provider.upload_file(
-                str(temp_file_path)
-            )
-            uploaded_file_id = file_metadata.name
-
-            logger.debug(
-                "[Call Monitoring Workflow] Uploaded recording to AI provider",
-                call_id=call_id,
-                file_id=uploaded_file_id,
-            )
+            uploaded_file_id = await self._upload_recording(call_id, recording_url)
 
             prompt = self._create_analysis_prompt()
             analysis_data: AnalysisData = (
@@ -634,14 +663,12 @@ class CallAndWriteToCRMWorkflow:
             )
 
         finally:
-            await self._cleanup_recording_files(
-                call_id, temp_file_path, uploaded_file_id
-            )
+            await self._cleanup_recording_files(call_id, uploaded_file_id)
 
     async def _update_crm_with_call_results(
         self,
         call_id: str,
-        call_response: CallResponse,
+        analysis: AnalysisData | None,
         request: CallRequest,
     ) -> None:
         """
@@ -651,67 +678,83 @@ class CallAndWriteToCRMWorkflow:
 
         Args:
             call_id: The call identifier
-            call_response: The final call response with analysis data
+            analysis: The call's analysis data
             request: The original call request (contains tenant/job_id)
+
+        Raises:
+            CallPipelineError: If the CRM rejects the note (the stage is retried)
         """
-        try:
-            # Extract typed analysis data from provider response
-            analysis = call_response.analysis
+        if analysis is None or analysis.structured_data is None:
+            logger.info(
+                "[Call Monitoring Workflow] No analysis available for call, skipping CRM update",
+                call_id=call_id,
+            )
+            return
 
-            if analysis is None or analysis.structured_data is None:
-                logger.info(
-                    "[Call Monitoring Workflow] No analysis available for call, skipping CRM update",
-                    call_id=call_id,
-                )
-                return
+        logger.info(
+            "[Call Monitoring Workflow] Extracted structured data for call",
+            call_id=call_id,
+        )
+
+        # Update CRM if we have job_id
+        job_id = request.job_id
 
+        if job_id is None:
             logger.info(
-                "[Call Monitoring Workflow] Extracted structured data for call",
+                "[Call Monitoring Workflow] Missing tenant/job_id for call; skipping CRM note",
                 call_id=call_id,
             )
+            return
 
-            # Update CRM if we have job_id
-            job_id = request.job_id
+        if self.crm_service is None:
+            raise CallPipelineError(f"No CRM configured for call {call_id}")
 
-            if job_id is None:
-                logger.info(
-                    "[Call Monitoring Workflow] Missing tenant/job_id for call; skipping CRM note",
-                    call_id=call_id,
-                )
-                return
+        # Format note text from structured data
+        note_text = self._format_crm_note(analysis)
 
-            # Format note text from structured data
-            note_text = self._format_crm_note(analysis)
+        if not await self.call_repository.claim_crm_note(call_id):
+            logger.info(
+                "[Call Monitoring Workflow] CRM note already claimed, skipping",
+                call_id=call_id,
+            )
+            return
+        await self.call_repository.session.commit()
 
-            # Add note to CRM job via service
+        # Add note to CRM job via service
+        try:
             crm_result = await self.crm_service.add_note(
                 entity_id=job_id,
                 entity_type="job",
                 text=note_text,
                 pin_to_top=True,  # Pin important call results
             )
+        except Exception:
+            await self._release_crm_note(call_id)
+            raise
 
-            if hasattr(crm_result, "error"):
-                logger.error(
-                    "[Call Monitoring Workflow] Failed to add job note",
-                    job_id=job_id,
-                    error=crm_result.error,
-                )
-            else:
-                logger.info(
-                    "[Call Monitoring Workflow] Successfully added CRM note",
-                    job_id=job_id,
-                )
-
-            # Status updates disabled for JobNimbus - will be re-enabled later
-            # TODO: Re-enable status updates once status name mapping is implemented
-
-        except Exception as e:
+        if hasattr(crm_result, "error"):
+            await self._release_crm_note(call_id)
             logger.error(
-                "[Call Monitoring Workflow] Error updating CRM with call results",
-                call_id=call_id,
-                error=str(e),
+                "[Call Monitoring Workflow] Failed to add job note",
+                job_id=job_id,
+                error=crm_result.error,
             )
+            raise CallPipelineError(
+                f"Failed to add CRM note for job {job_id}: {crm_result.error}"
+            )
+
+        logger.info(
+            "[Call Monitoring Workflow] Successfully added CRM note",
+            job_id=job_id,
+        )
+
+        # Status updates disabled for JobNimbus - will be re-enabled later
+        # TODO: Re-enable status updates once status name mapping is implemented
+
+    async def _release_crm_note(self, call_id: str) -> None:
+        """Release the call's note claim so a retry of the stage can write it."""
+        await self.call_repository.release_crm_note(call_id)
+        await self.call_repository.session.commit()
 
     def _format_crm_note(self, analysis: AnalysisData | None) -> str:
         """
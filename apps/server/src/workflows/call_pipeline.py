@@ -0,0 +1,450 @@
+"""
+Worker for the durable post-call pipeline.
+
+Calls placed through CallAndWriteToCRMWorkflow enqueue a MONITOR_CALL job in
+the call_jobs table. Workers claim due jobs with SELECT ... FOR UPDATE SKIP
+LOCKED, run the stage, and settle the job:
+
+    MONITOR_CALL  -> re-checks status until the call ends, then enqueues
+    ANALYZE_RECORDING -> analyzes the recording, persists the final call, then
+    WRITE_CRM_NOTE -> writes the result note to the CRM
+
+Twilio webhooks wake the relevant job (call ended, recording ready) through
+Postgres NOTIFY. Vapi calls are watched by one shared VapiStatusPoller per
+worker, which wakes the job the same way when a call ends. Either way,
+in-progress calls are only re-checked by their job on a slow safety-net
+interval.
+
+Each stage is enqueued at most once per call (idempotency key), and a
+claimed job is leased to one worker at a time with a heartbeat, so workers
+scale horizontally without writing duplicate CRM notes. Failed stages are
+retried with exponential backoff; a job whose worker died is reclaimed once
+its lease lapses.
+
+Run a standalone worker with:
+
+    python -m src.workflows.call_pipeline
+"""
+
+import asyncio
+import os
+import random
+import signal
+import socket
+import uuid
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.voice_ai.base import VoiceAIProvider
+from src.ai.voice_ai.config import get_vapi_settings
+from src.ai.voice_ai.constants import CallStatus
+from src.ai.voice_ai.constants import VoiceAIProvider as VoiceAIProviderEnum
+from src.ai.voice_ai.providers.factory import get_voice_ai_provider
+from src.ai.voice_ai.providers.twilio.dependencies import get_twilio_client
+from src.ai.voice_ai.providers.twilio.provider import TwilioProvider
+from src.ai.voice_ai.providers.vapi.poller import VapiStatusPoller
+from src.ai.voice_ai.schemas import CallRequest, CallResponse
+from src.ai.voice_ai.service import VoiceAIService
+from src.db.call_jobs.constants import CallJobStage
+from src.db.call_jobs.listener import CallJobListener
+from src.db.call_jobs.model import CallJob
+from src.db.call_jobs.repository import CallJobRepository
+from src.db.calls.repository import CallRepository
+from src.db.database import get_async_session_local
+from src.db.phone_numbers.service import PhoneNumberService
+from src.integrations.creds.service import CRMCredentialsService
+from src.integrations.crm.dependencies import organization_crm_provider
+from src.integrations.crm.service import CRMService
+from src.utils.logger import logger
+from src.workflows.call_monitoring import CallAndWriteToCRMWorkflow
+from src.workflows.config import (
+    CallMonitoringWorkflowSettings,
+    get_call_monitoring_settings,
+)
+
+# How long a stopping worker waits for in-flight jobs before abandoning them
+SHUTDOWN_GRACE_SECONDS = 30
+
+
+class CallPipelineWorker:
+    """Claims and runs post-call pipeline jobs with bounded concurrency."""
+
+    def __init__(
+        self,
+        settings: CallMonitoringWorkflowSettings | None = None,
+        worker_id: str | None = None,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            settings: Pipeline settings (defaults to the global settings)
+            worker_id: Lease owner name (defaults to host, pid and a random suffix)
+        """
+        self.settings = settings or get_call_monitoring_settings()
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._running: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._status_poller: VapiStatusPoller | None = None
+        self._status_poller_task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        """Claim and run jobs until stop() is called."""
+        logger.info("[Call Pipeline] Worker started", worker_id=self.worker_id)
+        listener = asyncio.create_task(
+            CallJobListener(lambda _call_id: self.wake()).run(self._stopping)
+        )
+        while not self._stopping.is_set():
+            claimed = 0
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(
+                    "[Call Pipeline] Failed to claim jobs",
+                    worker_id=self.worker_id,
+                    error=str(e),
+                )
+
+            # Go straight back for more while the queue has due work and we
+            # have free slots; otherwise sleep until the next poll or wakeup
+            if claimed and len(self._running) < self.settings.worker_concurrency:
+                continue
+            await self._wait(self.settings.worker_poll_interval_seconds)
+
+        await self._drain()
+        await listener
+        if self._status_poller_task is not None:
+            await self._status_poller_task
+        logger.info("[Call Pipeline] Worker stopped", worker_id=self.worker_id)
+
+    async def run_once(self) -> int:
+        """
+        Claim as many due jobs as there are free slots and start them.
+
+        Returns:
+            int: Number of jobs claimed
+        """
+        free_slots = self.settings.worker_concurrency - len(self._running)
+        if free_slots <= 0:
+            return 0
+
+        async with get_async_session_local()() as session:
+            jobs = await CallJobRepository(session).claim_due(
+                self.worker_id, free_slots, self.settings.job_lease_seconds
+            )
+            await session.commit()
+
+        for job in jobs:
+            task = asyncio.create_task(self._run_job(job))
+            self._running.add(task)
+            task.add_done_callback(self._on_job_done)
+        return len(jobs)
+
+    def wake(self) -> None:
+        """Wake an idle worker so it checks for due jobs immediately."""
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop claiming jobs; run() returns once in-flight jobs finish."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    def retry_delay(self, attempts: int) -> float:
+        """
+        Exponential backoff with full jitter for a failed run.
+
+        Args:
+            attempts: Number of runs so far, including the failed one
+
+        Returns:
+            float: Seconds to wait before retrying
+        """
+        ceiling = min(
+            self.settings.job_retry_max_seconds,
+            self.settings.job_retry_base_seconds * 2 ** max(attempts - 1, 0),
+        )
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _on_job_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        # A slot just freed up; let the loop claim more work
+        self._wakeup.set()
+
+    async def _wait(self, timeout: float) -> None:
+        """Sleep until timeout, a wakeup or stop()."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _drain(self) -> None:
+        """Wait for in-flight jobs; cancel stragglers (their leases will lapse)."""
+        if not self._running:
+            return
+        _, pending = await asyncio.wait(
+            set(self._running), timeout=SHUTDOWN_GRACE_SECONDS
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_job(self, job: CallJob) -> None:
+        """Run one claimed job and settle it."""
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, asyncio.current_task()))
+        try:
+            if job.attempts > job.max_attempts:
+                # Reclaimed after its worker died mid-run too many times
+                await self._settle_failure(job, "Exceeded max attempts", retry=False)
+                return
+
+            async with get_async_session_local()() as session:
+                next_run_in = await self._execute(job, session)
+
+            async with get_async_session_local()() as session:
+                jobs = CallJobRepository(session)
+                if next_run_in is None:
+                    await jobs.complete(job.id, self.worker_id)
+                else:
+                    await jobs.reschedule(
+                        job.id,
+                        self.worker_id,
+                        datetime.now(UTC) + timedelta(seconds=next_run_in),
+                    )
+                await session.commit()
+
+        except asyncio.CancelledError:
+            # Shutting down or lost the lease; another worker (re)claims it
+            raise
+        except Exception as e:
+            logger.error(
+                "[Call Pipeline] Job failed",
+                job_id=job.id,
+                call_id=job.call_id,
+                stage=job.stage,
+                attempts=job.attempts,
+                error=str(e),
+            )
+            await self._settle_failure(
+                job, str(e), retry=job.attempts < job.max_attempts
+            )
+        finally:
+            heartbeat.cancel()
+
+    async def _settle_failure(self, job: CallJob, error: str, retry: bool) -> None:
+        """Schedule a retry with backoff, or mark the job failed."""
+        retry_at = (
+            datetime.now(UTC) + timedelta(seconds=self.retry_delay(job.attempts))
+            if retry
+            else None
+        )
+        try:
+            async with get_async_session_local()() as session:
+                await CallJobRepository(session).fail(
+                    job.id, self.worker_id, error, retry_at
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                "[Call Pipeline] Failed to record job failure",
+                job_id=job.id,
+                error=str(e),
+            )
+
+    async def _heartbeat(self, job_id: int, run: asyncio.Task | None) -> None:
+        """Renew the job's lease at a third of its length; cancel the job if lost."""
+        interval = self.settings.job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with get_async_session_local()() as session:
+                    held = await CallJobRepository(session).extend_lease(
+                        job_id, self.worker_id, self.settings.job_lease_seconds
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.warning(
+                    "[Call Pipeline] Failed to extend job lease",
+                    job_id=job_id,
+                    error=str(e),
+                )
+                continue
+            if not held:
+                # The lease lapsed and another worker may be running the job
+                logger.warning("[Call Pipeline] Lost job lease", job_id=job_id)
+                if run is not None:
+                    run.cancel()
+                return
+
+    async def _execute(self, job: CallJob, session: AsyncSession) -> float | None:
+        """
+        Run the job's stage.
+
+        Returns:
+            Seconds until the job should run again, or None when it's done
+        """
+        payload = job.payload
+        stage = CallJobStage(job.stage)
+        async with AsyncExitStack() as resources:
+            workflow = await self._build_workflow(session, payload, stage, resources)
+            return await self._run_stage(job, stage, workflow, session)
+
+    async def _run_stage(
+        self,
+        job: CallJob,
+        stage: CallJobStage,
+        workflow: CallAndWriteToCRMWorkflow,
+        session: AsyncSession,
+    ) -> float | None:
+        """Run a job's stage with its rebuilt workflow."""
+        payload = job.payload
+        job_repository = CallJobRepository(session)
+
+        logger.info(
+            "[Call Pipeline] Running job",
+            job_id=job.id,
+            call_id=job.call_id,
+            stage=stage.value,
+            attempt=job.attempts,
+        )
+
+        if stage == CallJobStage.MONITOR_CALL:
+            return await workflow.monitor_call(
+                call_id=job.call_id,
+                user_id=payload.get("user_id"),
+                monitoring_started_at=job.created_at,
+                job_repository=job_repository,
+                job_payload=payload,
+            )
+        if stage == CallJobStage.ANALYZE_RECORDING:
+            return await workflow.analyze_recording(
+                call_id=job.call_id,
+                stage_started_at=job.created_at,
+                job_repository=job_repository,
+                job_payload=payload,
+            )
+        if stage == CallJobStage.WRITE_CRM_NOTE:
+            await workflow.write_crm_note(
+                call_id=job.call_id,
+                request=CallRequest.model_validate(payload["request"]),
+            )
+            return None
+        raise ValueError(f"Unknown call pipeline stage: {job.stage}")
+
+    async def _build_workflow(
+        self,
+        session: AsyncSession,
+        payload: dict,
+        stage: CallJobStage,
+        resources: AsyncExitStack,
+    ) -> CallAndWriteToCRMWorkflow:
+        """
+        Rebuild the workflow and its services for a job outside a request.
+
+        Resources the services hold (the pooled CRM provider) are released
+        when `resources` closes.
+        """
+        user_id = payload.get("user_id")
+
+        status_poller = None
+        if payload.get("provider") == VoiceAIProviderEnum.TWILIO.value:
+            phone_number = None
+            if user_id:
+                config = await PhoneNumberService(session).get_phone_number(user_id)
+                phone_number = config.phone_number if config else None
+            # Status checks only need the shared account client
+            voice_ai_provider = TwilioProvider(
+                get_twilio_client(), phone_number or "", user_id or ""
+            )
+        else:
+            voice_ai_provider = get_voice_ai_provider()
+            status_poller = self._get_status_poller(voice_ai_provider)
+
+        # Only the CRM stage needs (and pays for) credential lookup
+        crm_service = None
+        organization_id = payload.get("organization_id")
+        if stage == CallJobStage.WRITE_CRM_NOTE and organization_id:
+            credentials = await CRMCredentialsService(session).get_credentials(
+                organization_id
+            )
+            crm_service = CRMService(
+                await resources.enter_async_context(
+                    organization_crm_provider(organization_id, credentials)
+                )
+            )
+
+        return CallAndWriteToCRMWorkflow(
+            voice_ai_service=VoiceAIService(voice_ai_provider),
+            crm_service=crm_service,
+            call_repository=CallRepository(session),
+            status_poller=status_poller,
+        )
+
+    def _get_status_poller(self, provider: VoiceAIProvider) -> VapiStatusPoller:
+        """Start the shared Vapi status poller on first use."""
+        if self._status_poller is None:
+            settings = get_vapi_settings()
+            self._status_poller = VapiStatusPoller(
+                provider,
+                on_change=self._on_polled_status_change,
+                min_interval_seconds=settings.status_poll_min_interval_seconds,
+                max_interval_seconds=settings.status_poll_max_interval_seconds,
+                slowdown_after_seconds=settings.status_poll_slowdown_after_seconds,
+                max_requests_per_second=settings.status_poll_max_requests_per_second,
+            )
+            self._status_poller_task = asyncio.create_task(
+                self._status_poller.run(self._stopping)
+            )
+        return self._status_poller
+
+    async def _on_polled_status_change(self, call: CallResponse) -> None:
+        """Record a polled status change and wake the monitor job once it ends."""
+        async with get_async_session_local()() as session:
+            await CallRepository(session).update_call_status(
+                call_id=call.call_id,
+                status=call.status,
+                provider_data=call.provider_data.model_dump(mode="json")
+                if call.provider_data
+                else None,
+            )
+            if CallStatus.is_call_ended(call.status):
+                await CallJobRepository(session).wake(
+                    call.call_id, CallJobStage.MONITOR_CALL
+                )
+            await session.commit()
+
+
+# Worker running inside this process (started from the app lifespan)
+_call_pipeline_worker: CallPipelineWorker | None = None
+
+
+def get_call_pipeline_worker() -> CallPipelineWorker:
+    """
+    Get the global call pipeline worker instance.
+
+    Returns:
+        CallPipelineWorker: The in-process worker
+    """
+    global _call_pipeline_worker
+    if _call_pipeline_worker is None:
+        _call_pipeline_worker = CallPipelineWorker()
+    return _call_pipeline_worker
+
+
+async def main() -> None:
+    """Run a standalone pipeline worker until SIGINT/SIGTERM."""
+    worker = get_call_pipeline_worker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -87,6 +87,7 @@ class CallMonitoringWorkflowSettings(BaseSettings):
 
     Attributes:
         enable_crm_write: Enable writing call results to CRM after call completion
+        worker_*, job_*: Post-call pipeline job queue tuning
     """
 
     model_config = SettingsConfigDict(
@@ -100,6 +101,72 @@ class CallMonitoringWorkflowSettings(BaseSettings):
         description="Enable writing call results to CRM after call completion",
     )
 
+    # Post-call pipeline job queue
+    worker_enabled: bool = Field(
+        default=True,
+        description="Run a post-call pipeline worker inside this API process",
+    )
+    worker_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of pipeline jobs a worker runs at once",
+    )
+    worker_poll_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="How often an idle worker checks the queue for due jobs",
+    )
+    job_lease_seconds: int = Field(
+        default=300,
+        ge=30,
+        description="Lease length on a claimed job; renewed while the job runs",
+    )
+    job_max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="Failed runs allowed per pipeline stage before giving up",
+    )
+    job_retry_base_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Base delay for exponential retry backoff",
+    )
+    job_retry_max_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        description="Upper bound on retry backoff",
+    )
+    status_poll_interval_seconds: float = Field(
+        default=3.0,
+        gt=0,
+        description="Delay between call status checks while a call is in progress",
+    )
+    webhook_fallback_poll_interval_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Delay between safety-net checks for stages that webhooks wake "
+            "(Twilio call end, recording ready)"
+        ),
+    )
+    recording_wait_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long to wait for the recording webhook before analyzing without it",
+    )
+    recording_spool_max_memory_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description=(
+            "Recordings up to this size are buffered in memory on their way to "
+            "the AI provider; larger ones spill to a temporary file"
+        ),
+    )
+    max_monitoring_seconds: int = Field(
+        default=60 * 60 * 24,
+        description="Stop monitoring calls that haven't ended after this long",
+    )
+
 
 @lru_cache
 def get_call_monitoring_settings() -> CallMonitoringWorkflowSettings:
@@ -109,3 +176,91 @@ def get_call_monitoring_settings() -> CallMonitoringWorkflowSettings:
         CallMonitoringWorkflowSettings: Cached settings instance
     """
     return CallMonitoringWorkflowSettings()
+
+
+class BulkDialerSettings(BaseSettings):
+    """Settings for dialing call lists and scheduled groups in bulk."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="WORKFLOWS_BULK_DIALER_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    calls_per_phone_number: int = Field(
+        default=1,
+        ge=1,
+        description="Calls allowed in progress at once from one caller phone number",
+    )
+    prefetch_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="CRM project/contact lookups run at once while prefetching",
+    )
+    status_check_interval_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Delay between safety-net checks of whether a placed call has ended "
+            "(the call-ended notification normally wakes the dial first)"
+        ),
+    )
+    max_call_seconds: int = Field(
+        default=60 * 60,
+        description="Stop waiting on a call (and free its slot) after this long",
+    )
+
+
+@lru_cache
+def get_bulk_dialer_settings() -> BulkDialerSettings:
+    """Get cached bulk dialer settings.
+
+    Returns:
+        BulkDialerSettings: Cached settings instance
+    """
+    return BulkDialerSettings()
+
+
+class GroupSchedulerSettings(BaseSettings):
+    """Settings for the scheduler that fires active scheduled groups."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="WORKFLOWS_GROUP_SCHEDULER_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(
+        default=False,
+        description="Run a group scheduler inside each API process",
+    )
+    max_concurrent_groups: int = Field(
+        default=5,
+        ge=1,
+        description="Scheduled groups one scheduler dials at once",
+    )
+    max_sleep_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Longest the scheduler sleeps before re-checking for due groups",
+    )
+    catch_up_window_seconds: int = Field(
+        default=6 * 60 * 60,
+        ge=0,
+        description="How late a missed run may be and still fire (older ones are skipped)",
+    )
+    run_lease_seconds: int = Field(
+        default=120,
+        ge=30,
+        description="How long a group run is held without a heartbeat before another scheduler resumes it",
+    )
+
+
+@lru_cache
+def get_group_scheduler_settings() -> GroupSchedulerSettings:
+    """Get cached group scheduler settings.
+
+    Returns:
+        GroupSchedulerSettings: Cached settings instance
+    """
+    return GroupSchedulerSettings()
@@ -13,6 +13,7 @@ from src.db.calls.repository import CallRepository
 from src.db.dependencies import get_call_repository
 from src.integrations.crm.dependencies import get_crm_service
 from src.integrations.crm.service import CRMService
+from src.workflows.bulk_dialer import BulkDialer
 from src.workflows.call_monitoring import CallAndWriteToCRMWorkflow
 from src.workflows.project_summary import ProjectSummaryWorkflow
 
@@ -57,3 +58,20 @@ def get_project_summary_workflow(
         ProjectSummaryWorkflow: The workflow instance
     """
     return ProjectSummaryWorkflow(crm_service=crm_service)
+
+
+def get_bulk_dialer(
+    voice_ai_service: VoiceAIService = Depends(get_voice_ai_service),
+    crm_service: CRMService = Depends(get_crm_service),
+) -> BulkDialer:
+    """
+    FastAPI dependency for getting the bulk dialer.
+
+    Args:
+        voice_ai_service: The Voice AI service from dependency injection
+        crm_service: The CRM service from dependency injection
+
+    Returns:
+        BulkDialer: The bulk dialer instance
+    """
+    return BulkDialer(voice_ai_service=voice_ai_service, crm_service=crm_service)
@@ -0,0 +1,377 @@
+"""
+Scheduler that fires active scheduled groups.
+
+Every active group stores its next run (next_run_at, computed from its
+frequency, time of day and timezone) behind a partial index over active
+groups. The scheduler never scans the table:
+
+- It claims due groups oldest-first with SELECT ... FOR UPDATE SKIP LOCKED
+  and advances their next_run_at in the same transaction, so with any number
+  of API tasks running a scheduler, each run fires exactly once.
+- Between claims it sleeps until the earliest next_run_at (an indexed MIN),
+  capped at max_sleep_seconds so schedule edits are picked up.
+- Runs missed while no scheduler was up (e.g. across a deploy) are still
+  overdue on startup and fire once, if within catch_up_window_seconds.
+
+Each claimed group is dialed through the BulkDialer, at most
+max_concurrent_groups at a time per scheduler. Only members whose goal isn't
+completed yet are called; a call ending doesn't complete the goal (it may
+have reached voicemail), so members are called again on every run until the
+user marks their goal completed.
+
+Runs are durable. The claim leases the run to this scheduler (renewed by a
+heartbeat), and every member is stamped as dialed when its call is placed
+or it's skipped. If the scheduler stops mid-run (e.g. a deploy cancels it),
+the lease lapses and the next scheduler to check resumes the run, dialing
+only the members it hadn't reached yet.
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from contextlib import aclosing
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.voice_ai.config import get_voice_ai_settings
+from src.ai.voice_ai.constants import VoiceAIProvider as VoiceAIProviderEnum
+from src.ai.voice_ai.providers.factory import get_voice_ai_provider
+from src.ai.voice_ai.providers.twilio.dependencies import get_twilio_client
+from src.ai.voice_ai.providers.twilio.provider import TwilioProvider
+from src.ai.voice_ai.service import VoiceAIService
+from src.db.database import get_async_session_local
+from src.db.phone_numbers.service import PhoneNumberService
+from src.db.scheduled_groups.repository import ScheduledGroupsRepository
+from src.db.users.model import User
+from src.integrations.creds.service import CRMCredentialsService
+from src.integrations.crm.dependencies import organization_crm_provider
+from src.integrations.crm.service import CRMService
+from src.utils.logger import logger
+from src.workflows.bulk_dialer import BulkDialer, scheduled_group_completion
+from src.workflows.config import GroupSchedulerSettings, get_group_scheduler_settings
+
+# How long a stopping scheduler waits for in-progress group runs before
+# leaving them to be resumed elsewhere
+SHUTDOWN_GRACE_SECONDS = 30
+
+# Dial events after which a member counts as dialed for the current run
+_DIALED_EVENTS = frozenset({"call_started", "call_failed", "skipped"})
+
+
+class GroupScheduler:
+    """Claims due scheduled groups and dials them with bounded concurrency."""
+
+    def __init__(
+        self,
+        settings: GroupSchedulerSettings | None = None,
+        worker_id: str | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            settings: Scheduler settings (defaults to the global settings)
+            worker_id: Run lease owner name (defaults to host, pid and a random suffix)
+        """
+        self.settings = settings or get_group_scheduler_settings()
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._running: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+
+    async def run(self) -> None:
+        """Fire due groups until stop() is called."""
+        logger.info("[Group Scheduler] Started")
+        try:
+            async with get_async_session_local()() as session:
+                scheduled = await ScheduledGroupsRepository(
+                    session
+                ).schedule_unscheduled_groups()
+                await session.commit()
+            if scheduled:
+                logger.info("[Group Scheduler] Scheduled groups", count=scheduled)
+        except Exception as e:
+            logger.error("[Group Scheduler] Failed to schedule groups", error=str(e))
+
+        while not self._stopping.is_set():
+            claimed = 0
+            sleep_seconds = self.settings.max_sleep_seconds
+            try:
+                claimed = await self.run_once()
+                sleep_seconds = await self._seconds_until_next_run()
+            except Exception as e:
+                logger.error("[Group Scheduler] Failed to claim groups", error=str(e))
+
+            if claimed and len(self._running) < self.settings.max_concurrent_groups:
+                continue
+            await self._wait(sleep_seconds)
+
+        await self._drain()
+        logger.info("[Group Scheduler] Stopped")
+
+    async def run_once(self) -> int:
+        """
+        Claim as many due groups as there are free slots and start them.
+
+        Returns:
+            int: Number of groups claimed
+        """
+        free_slots = self.settings.max_concurrent_groups - len(self._running)
+        if free_slots <= 0:
+            return 0
+
+        async with get_async_session_local()() as session:
+            groups = await ScheduledGroupsRepository(session).claim_due_groups(
+                self.worker_id,
+                free_slots,
+                self.settings.catch_up_window_seconds,
+                self.settings.run_lease_seconds,
+            )
+            await session.commit()
+
+        for group in groups:
+            task = asyncio.create_task(
+                self._run_group(group.id, group.user_id, group.run_started_at)
+            )
+            self._running.add(task)
+            task.add_done_callback(self._on_group_done)
+        return len(groups)
+
+    def stop(self) -> None:
+        """Stop firing groups; run() returns once in-progress runs finish."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    def _on_group_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._wakeup.set()
+
+    async def _seconds_until_next_run(self) -> float:
+        """Seconds until the earliest scheduled run, capped at max_sleep_seconds."""
+        if len(self._running) >= self.settings.max_concurrent_groups:
+            # A finishing run wakes the loop
+            return self.settings.max_sleep_seconds
+
+        async with get_async_session_local()() as session:
+            next_run_at = await ScheduledGroupsRepository(session).get_next_run_at()
+        if next_run_at is None:
+            return self.settings.max_sleep_seconds
+        until_next = (next_run_at - datetime.now(UTC)).total_seconds()
+        return min(max(until_next, 0), self.settings.max_sleep_seconds)
+
+    async def _wait(self, timeout: float) -> None:
+        """Sleep until timeout, a finished run or stop()."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _drain(self) -> None:
+        """
+        Wait for in-progress runs; cancel stragglers (their leases will lapse).
+
+        A cancelled run stops dialing but still waits for calls it's placing.
+        """
+        if not self._running:
+            return
+        _, pending = await asyncio.wait(
+            set(self._running), timeout=SHUTDOWN_GRACE_SECONDS
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_group(
+        self, group_id: int, user_id: str, run_started_at: datetime
+    ) -> None:
+        """Run a claimed group under its lease, then release it."""
+        heartbeat = asyncio.create_task(
+            self._heartbeat(group_id, asyncio.current_task())
+        )
+        try:
+            await self._dial_group(group_id, user_id, run_started_at)
+        except asyncio.CancelledError:
+            # Stopping or lost the lease; the run resumes from its progress
+            raise
+        except Exception as e:
+            logger.error(
+                "[Group Scheduler] Group run failed", group_id=group_id, error=str(e)
+            )
+        finally:
+            heartbeat.cancel()
+
+        try:
+            async with get_async_session_local()() as session:
+                await ScheduledGroupsRepository(session).finish_run(
+                    group_id, self.worker_id
+                )
+                await session.commit()
+        except Exception as e:
+            # The lease lapses and the run resumes with nothing left to dial
+            logger.error(
+                "[Group Scheduler] Failed to finish group run",
+                group_id=group_id,
+                error=str(e),
+            )
+
+    async def _heartbeat(self, group_id: int, run: asyncio.Task | None) -> None:
+        """Renew the run's lease at a third of its length; cancel the run if lost."""
+        interval = self.settings.run_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with get_async_session_local()() as session:
+                    held = await ScheduledGroupsRepository(session).extend_run_lease(
+                        group_id, self.worker_id, self.settings.run_lease_seconds
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.warning(
+                    "[Group Scheduler] Failed to extend run lease",
+                    group_id=group_id,
+                    error=str(e),
+                )
+                continue
+            if not held:
+                # Deactivated, or resumed elsewhere after a missed heartbeat
+                logger.warning(
+                    "[Group Scheduler] Lost group run lease", group_id=group_id
+                )
+                if run is not None:
+                    run.cancel()
+                return
+
+    async def _dial_group(
+        self, group_id: int, user_id: str, run_started_at: datetime
+    ) -> None:
+        """Dial the members this run hasn't reached yet, as the group's owner."""
+        async with get_async_session_local()() as session:
+            members = await ScheduledGroupsRepository(session).get_group_members(
+                group_id, user_id
+            )
+            # A resumed run skips members it already reached
+            pending = [
+                m.project_id
+                for m in members
+                if not m.goal_completed
+                and (m.last_dialed_at is None or m.last_dialed_at < run_started_at)
+            ]
+            if not pending:
+                logger.info("[Group Scheduler] No pending members", group_id=group_id)
+                return
+
+            user = await session.get(User, user_id)
+            if user is None:
+                logger.warning(
+                    "[Group Scheduler] Group owner not found",
+                    group_id=group_id,
+                    user_id=user_id,
+                )
+                return
+            organization_id = user.organization_id
+
+            phone_number, voice_ai_service = await self._build_voice_ai_service(
+                session, user_id
+            )
+            if voice_ai_service is None:
+                logger.warning(
+                    "[Group Scheduler] No phone number configured for group owner",
+                    group_id=group_id,
+                    user_id=user_id,
+                )
+                return
+
+            credentials = await CRMCredentialsService(session).get_credentials(
+                organization_id
+            )
+
+        logger.info(
+            "[Group Scheduler] Running group",
+            group_id=group_id,
+            members=len(pending),
+        )
+        async with organization_crm_provider(
+            organization_id, credentials
+        ) as crm_provider:
+            dialer = BulkDialer(voice_ai_service, CRMService(crm_provider))
+            # Closed even when the run is cancelled, so calls still being
+            # placed are recorded before the run ends
+            async with aclosing(
+                dialer.dial(
+                    project_ids=pending,
+                    user_id=user_id,
+                    organization_id=organization_id,
+                    caller_id=phone_number or "default",
+                    record_completion=scheduled_group_completion(group_id),
+                )
+            ) as events:
+                async for event in events:
+                    if event.type in _DIALED_EVENTS and event.project_id:
+                        await self._mark_dialed(group_id, event.project_id)
+                    elif event.type == "done":
+                        logger.info(
+                            "[Group Scheduler] Group run finished",
+                            group_id=group_id,
+                            placed=event.placed,
+                            connected=event.connected,
+                            failed=event.failed,
+                            skipped=event.skipped,
+                        )
+
+    async def _mark_dialed(self, group_id: int, project_id: str) -> None:
+        """Record the run's progress so a resumed run doesn't dial the member again."""
+        try:
+            async with get_async_session_local()() as session:
+                await ScheduledGroupsRepository(session).mark_member_dialed(
+                    group_id, project_id
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                "[Group Scheduler] Failed to record dialed member",
+                group_id=group_id,
+                project_id=project_id,
+                error=str(e),
+            )
+
+    async def _build_voice_ai_service(
+        self, session: AsyncSession, user_id: str
+    ) -> tuple[str | None, VoiceAIService | None]:
+        """
+        Build the owner's Voice AI service, as get_voice_ai_service does.
+
+        Returns:
+            The caller phone number (None for Vapi) and the service, or None for
+            the service if Twilio is configured but the user has no number
+        """
+        if get_voice_ai_settings().provider != VoiceAIProviderEnum.TWILIO:
+            return None, VoiceAIService(get_voice_ai_provider())
+
+        config = await PhoneNumberService(session).get_phone_number(user_id)
+        if not config:
+            return None, None
+        provider = TwilioProvider(get_twilio_client(), config.phone_number, user_id)
+        return config.phone_number, VoiceAIService(provider)
+
+
+# Scheduler running inside this process (started from the app lifespan)
+_group_scheduler: GroupScheduler | None = None
+
+
+def get_group_scheduler() -> GroupScheduler:
+    """
+    Get the global group scheduler instance.
+
+    Returns:
+        GroupScheduler: The in-process scheduler
+    """
+    global _group_scheduler
+    if _group_scheduler is None:
+        _group_scheduler = GroupScheduler()
+    return _group_scheduler
@@ -5,21 +5,39 @@ This module contains API endpoints for multi-service workflows,
 including call monitoring and CRM integration.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
+from src.ai.base import SSEEvent
+from src.ai.voice_ai.providers.twilio.dependencies import get_user_phone_number
 from src.ai.voice_ai.schemas import CallRequest, CallResponse, VoiceAIErrorResponse
 from src.auth.dependencies import get_current_user
 from src.auth.schemas import User
+from src.db.call_list.repository import CallListRepository
+from src.db.dependencies import (
+    get_call_list_repository,
+    get_scheduled_groups_repository,
+)
+from src.db.scheduled_groups.repository import ScheduledGroupsRepository
 from src.integrations.crm.schemas import CRMErrorResponse
+from src.workflows.bulk_dialer import (
+    BulkDialer,
+    CompletionRecorder,
+    call_list_completion,
+    scheduled_group_completion,
+)
 from src.workflows.call_monitoring import CallAndWriteToCRMWorkflow
 from src.workflows.dependencies import (
+    get_bulk_dialer,
     get_call_monitoring_workflow,
     get_project_summary_workflow,
 )
 from src.workflows.project_summary import ProjectSummaryWorkflow
-from src.workflows.schemas import ProjectSummary
+from src.workflows.schemas import BulkDialRequest, ProjectSummary
 
 router = APIRouter(prefix="/workflows", tags=["Workflows"])
 
@@ -37,8 +55,8 @@ async def call_and_write_results_to_crm(
 
     This workflow endpoint orchestrates:
     1. Creating the call via Voice AI provider
-    2. Starting background call monitoring and writing results to CRM
-    3. Updating CRM with call results when complete
+    2. Queuing durable call monitoring and writing results to CRM
+    3. Updating CRM with call results when complete (via pipeline workers)
 
     Args:
         request: The call request with phone number and context
@@ -54,6 +72,7 @@ async def call_and_write_results_to_crm(
     result = await workflow.call_and_write_results_to_crm(
         request=request,
         user_id=current_user.id,
+        organization_id=current_user.organization_id,
     )
 
     if isinstance(result, VoiceAIErrorResponse):
@@ -103,3 +122,129 @@ async def generate_project_summary(
             )
 
     return result
+
+
+@router.post("/bulk-dial/call-list")
+async def bulk_dial_call_list(
+    request: BulkDialRequest,
+    current_user: User = Depends(get_current_user),
+    phone_number: str | None = Depends(get_user_phone_number),
+    repository: CallListRepository = Depends(get_call_list_repository),
+    dialer: BulkDialer = Depends(get_bulk_dialer),
+) -> StreamingResponse:
+    """
+    Dial every pending item in the user's call list, streaming progress.
+
+    Items are dialed in list order. Each connected call marks its item as
+    called; each call also runs through the normal post-call pipeline.
+
+    Args:
+        request: Optional subset of projects and the company name to use
+        current_user: The authenticated user
+        phone_number: The user's caller phone number (None for Vapi users)
+        repository: Call list repository from dependency injection
+        dialer: The bulk dialer from dependency injection
+
+    Returns:
+        StreamingResponse: SSE stream of BulkDialEvent JSON payloads
+    """
+    items = await repository.get_call_list(current_user.id)
+    pending = [item.project_id for item in items if not item.call_completed]
+
+    return _stream_bulk_dial(
+        dialer,
+        _select_projects(pending, request.project_ids),
+        current_user,
+        phone_number,
+        call_list_completion(current_user.id),
+        request.company_name,
+    )
+
+
+@router.post("/bulk-dial/scheduled-groups/{group_id}")
+async def bulk_dial_scheduled_group(
+    group_id: int,
+    request: BulkDialRequest,
+    current_user: User = Depends(get_current_user),
+    phone_number: str | None = Depends(get_user_phone_number),
+    repository: ScheduledGroupsRepository = Depends(get_scheduled_groups_repository),
+    dialer: BulkDialer = Depends(get_bulk_dialer),
+) -> StreamingResponse:
+    """
+    Dial every member of a scheduled group whose goal isn't completed yet.
+
+    Each connected call stamps the member as dialed. Goals are left for the
+    user to mark completed, since a call that ends normally may have reached
+    voicemail; see scheduled_group_completion.
+
+    Args:
+        group_id: The scheduled group to dial
+        request: Optional subset of projects and the company name to use
+        current_user: The authenticated user
+        phone_number: The user's caller phone number (None for Vapi users)
+        repository: Scheduled groups repository from dependency injection
+        dialer: The bulk dialer from dependency injection
+
+    Returns:
+        StreamingResponse: SSE stream of BulkDialEvent JSON payloads
+
+    Raises:
+        HTTPException: If the group is not found
+    """
+    group = await repository.get_group(group_id, current_user.id)
+    if group is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Group not found")
+
+    members = await repository.get_group_members(group_id, current_user.id)
+    pending = [member.project_id for member in members if not member.goal_completed]
+
+    return _stream_bulk_dial(
+        dialer,
+        _select_projects(pending, request.project_ids),
+        current_user,
+        phone_number,
+        scheduled_group_completion(group_id),
+        request.company_name,
+    )
+
+
+def _select_projects(pending: list[str], requested: list[str] | None) -> list[str]:
+    """Pending projects in list order, limited to the requested ones if given."""
+    if requested is None:
+        return pending
+    wanted = set(requested)
+    return [project_id for project_id in pending if project_id in wanted]
+
+
+def _stream_bulk_dial(
+    dialer: BulkDialer,
+    project_ids: list[str],
+    current_user: User,
+    phone_number: str | None,
+    record_completion: CompletionRecorder,
+    company_name: str | None,
+) -> StreamingResponse:
+    """Run a bulk dial and stream its events as SSE."""
+
+    async def stream() -> AsyncIterator[str]:
+        # Closed as soon as the client disconnects, so calls still being
+        # placed are recorded and no further calls are placed
+        async with aclosing(
+            dialer.dial(
+                project_ids=project_ids,
+                user_id=current_user.id,
+                organization_id=current_user.organization_id,
+                # Users without their own number (Vapi) share the provider's number
+                caller_id=phone_number or "default",
+                record_completion=record_completion,
+                company_name=company_name,
+            )
+        ) as events:
+            async for event in events:
+                yield SSEEvent(data=event.model_dump_json(exclude_none=True)).format()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
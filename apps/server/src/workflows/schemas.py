@@ -4,6 +4,8 @@ Workflow-specific Pydantic schemas.
 This module contains schemas for workflow requests and responses.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -21,3 +23,37 @@ class ProjectSummary(BaseModel):
         default_factory=list,
         description="List of recommended next steps (2-3 bullet points)",
     )
+
+
+class BulkDialRequest(BaseModel):
+    """Request to dial every pending project in a call list or scheduled group."""
+
+    company_name: str | None = Field(
+        None, description="Company name the assistant introduces itself with"
+    )
+    project_ids: list[str] | None = Field(
+        None,
+        description="Only dial these members (defaults to all pending members, in order)",
+    )
+
+
+class BulkDialEvent(BaseModel):
+    """Progress event streamed while a bulk dial runs."""
+
+    type: Literal[
+        "prefetched",
+        "skipped",
+        "call_started",
+        "call_ended",
+        "call_failed",
+        "done",
+    ] = Field(..., description="Event type")
+    project_id: str | None = Field(None, description="Project the event is about")
+    call_id: str | None = Field(None, description="Call ID once the call is placed")
+    status: str | None = Field(None, description="Final call status")
+    detail: str | None = Field(None, description="Reason for a skip or failure")
+    total: int = Field(0, description="Members in this bulk dial")
+    placed: int = Field(0, description="Calls placed so far")
+    connected: int = Field(0, description="Calls that connected and ended normally")
+    failed: int = Field(0, description="Calls that failed or weren't answered")
+    skipped: int = Field(0, description="Members skipped before dialing")
@@ -0,0 +1,265 @@
+"""Tests for the call list / scheduled group bulk dialer."""
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.ai.voice_ai.constants import CallStatus, VoiceAIProvider
+from src.ai.voice_ai.schemas import CallResponse
+from src.db.calls.constants import CALL_ENDED_CHANNEL
+from src.integrations.crm.schemas import CRMErrorResponse, Project
+from src.workflows import bulk_dialer
+from src.workflows.bulk_dialer import BulkDialer, build_call_request
+from src.workflows.config import BulkDialerSettings
+
+
+def open_project(project_id: str, **fields) -> Project:
+    return Project(id=project_id, status="open", provider="job_nimbus", **fields)
+
+
+def test_build_call_request_mirrors_dialer_ui():
+    """Phone falls back through provider data and is normalized to E.164."""
+    project = open_project(
+        "p1",
+        customer_name="Jane Doe",
+        address_line1="1 Main St",
+        city="Austin",
+        state="TX",
+        provider_data={"adjusterContact": {"phone": "(512) 555-0143", "name": "Al"}},
+    )
+
+    request = build_call_request(project, None, "Acme Roofing")
+
+    assert request.phone_number == "+15125550143"
+    assert request.customer_address == "1 Main St, Austin, TX"
+    assert request.adjuster_name == "Al"
+    assert request.job_id == "p1"
+    assert build_call_request(open_project("p2"), None, None) is None
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """
+    Fake call placement and storage.
+
+    Placed calls end after 50ms and are reported through the call-ended
+    notification; lookups of call IDs in `failing` raise.
+    """
+    state = SimpleNamespace(
+        statuses={}, in_progress=0, peak=0, failing=set(), listeners=[]
+    )
+
+    class FakeWorkflow:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def call_and_write_results_to_crm(self, request, **_kwargs):
+            state.in_progress += 1
+            state.peak = max(state.peak, state.in_progress)
+            call_id = f"call-{request.job_id}"
+            state.statuses[call_id] = CallStatus.IN_PROGRESS
+            asyncio.get_running_loop().call_later(0.05, end_call, call_id)
+            return CallResponse(
+                call_id=call_id,
+                status=CallStatus.QUEUED,
+                provider=VoiceAIProvider.TWILIO,
+            )
+
+    def end_call(call_id: str) -> None:
+        state.in_progress -= 1
+        state.statuses[call_id] = CallStatus.ENDED
+        for notify in state.listeners:
+            notify(call_id)
+
+    class FakeCallRepository:
+        def __init__(self, _session):
+            pass
+
+        async def get_call_by_call_id(self, call_id):
+            if call_id in state.failing:
+                raise ConnectionError("connection reset")
+            return SimpleNamespace(status=state.statuses[call_id].value)
+
+    class FakeListener:
+        def __init__(self, on_notify, channel):
+            assert channel == CALL_ENDED_CHANNEL
+            self.on_notify = on_notify
+
+        async def run(self, stop):
+            state.listeners.append(self.on_notify)
+            await stop.wait()
+            state.listeners.remove(self.on_notify)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield MagicMock(commit=AsyncMock())
+
+    monkeypatch.setattr(bulk_dialer, "CallAndWriteToCRMWorkflow", FakeWorkflow)
+    monkeypatch.setattr(bulk_dialer, "CallRepository", FakeCallRepository)
+    monkeypatch.setattr(bulk_dialer, "CallJobListener", FakeListener)
+    monkeypatch.setattr(bulk_dialer, "get_async_session_local", lambda: fake_session)
+    monkeypatch.setattr(bulk_dialer, "_phone_number_slots", {})
+    monkeypatch.setattr(bulk_dialer, "_placements", set())
+    monkeypatch.setattr(bulk_dialer, "_call_end_watcher", bulk_dialer._CallEndWatcher())
+    return state
+
+
+@pytest.fixture
+def crm_service():
+    """CRM service serving every project except "missing"."""
+    crm_service = MagicMock()
+
+    async def get_project(project_id):
+        if project_id == "missing":
+            return CRMErrorResponse(error="Not found")
+        return open_project(project_id, adjuster_phone="512-555-0143")
+
+    crm_service.get_project = AsyncMock(side_effect=get_project)
+    return crm_service
+
+
+@pytest.mark.asyncio
+async def test_calls_are_limited_per_phone_number(calls, crm_service):
+    """Only calls_per_phone_number calls should be in progress at once."""
+    record_completion = AsyncMock()
+    # Status checks are far apart: call-ended notifications drive the dial
+    dialer = BulkDialer(
+        MagicMock(),
+        crm_service,
+        BulkDialerSettings(calls_per_phone_number=2, status_check_interval_seconds=30),
+    )
+
+    events = [
+        event
+        async for event in dialer.dial(
+            ["p1", "missing", "p2", "p3", "p4"],
+            user_id="user-1",
+            organization_id="org-1",
+            caller_id="+15125550100",
+            record_completion=record_completion,
+        )
+    ]
+
+    assert calls.peak == 2
+    assert events[-1].type == "done"
+    assert (events[-1].connected, events[-1].skipped) == (4, 1)
+    assert sorted(c.args[1] for c in record_completion.await_args_list) == [
+        "p1",
+        "p2",
+        "p3",
+        "p4",
+    ]
+    # Slots and the LISTEN connection are released with the dial
+    assert bulk_dialer._phone_number_slots == {}
+    await asyncio.sleep(0)
+    assert calls.listeners == []
+
+
+@pytest.mark.asyncio
+async def test_failing_status_lookup_fails_only_its_call(calls, crm_service):
+    """A call whose status can't be read must not end the other calls."""
+    calls.failing.add("call-p1")
+    record_completion = AsyncMock()
+    dialer = BulkDialer(
+        MagicMock(),
+        crm_service,
+        BulkDialerSettings(
+            calls_per_phone_number=2,
+            status_check_interval_seconds=0.2,
+            max_call_seconds=1,
+        ),
+    )
+
+    events = [
+        event
+        async for event in dialer.dial(
+            ["p1", "p2"],
+            user_id="user-1",
+            organization_id="org-1",
+            caller_id="+15125550100",
+            record_completion=record_completion,
+        )
+    ]
+
+    ended = {e.project_id: e.type for e in events if e.type.startswith("call_")}
+    assert ended == {"p1": "call_failed", "p2": "call_ended"}
+    assert events[-1].type == "done"
+    assert (events[-1].connected, events[-1].failed) == (1, 1)
+    record_completion.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_mid_placement_still_records_the_call(
+    calls, crm_service, monkeypatch
+):
+    """A call the provider may have placed is stored even if the client leaves."""
+    placing = asyncio.Event()
+    provider_responded = asyncio.Event()
+    recorded = []
+
+    class SlowWorkflow:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def call_and_write_results_to_crm(self, request, **_kwargs):
+            # The provider has the request; storing the call is still to come
+            placing.set()
+            await provider_responded.wait()
+            recorded.append(request.job_id)
+            return CallResponse(
+                call_id=f"call-{request.job_id}",
+                status=CallStatus.QUEUED,
+                provider=VoiceAIProvider.TWILIO,
+            )
+
+    monkeypatch.setattr(bulk_dialer, "CallAndWriteToCRMWorkflow", SlowWorkflow)
+    dialer = BulkDialer(
+        MagicMock(), crm_service, BulkDialerSettings(calls_per_phone_number=1)
+    )
+
+    async def stream():
+        async with aclosing(
+            dialer.dial(
+                ["p1", "p2"],
+                user_id="user-1",
+                organization_id="org-1",
+                caller_id="+15125550100",
+                record_completion=AsyncMock(),
+            )
+        ) as events:
+            async for _event in events:
+                pass
+
+    # The SSE response task is cancelled when the client disconnects
+    consumer = asyncio.create_task(stream())
+    await placing.wait()
+    consumer.cancel()
+    await asyncio.sleep(0.01)
+    assert not consumer.done()  # closing waits for the placement
+
+    provider_responded.set()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    # p1 was stored; p2, still waiting for the slot, was never placed
+    assert recorded == ["p1"]
+    assert bulk_dialer._placements == set()
+
+
+@pytest.mark.asyncio
+async def test_group_calls_stamp_members_without_completing_goals(monkeypatch):
+    """A normally ended call may have hit voicemail; the goal stays open."""
+    repository = MagicMock(
+        mark_member_dialed=AsyncMock(), mark_goal_completed=AsyncMock()
+    )
+    monkeypatch.setattr(
+        bulk_dialer, "ScheduledGroupsRepository", lambda _session: repository
+    )
+
+    await bulk_dialer.scheduled_group_completion(7)(MagicMock(), "p1")
+
+    repository.mark_member_dialed.assert_awaited_once_with(7, "p1")
+    repository.mark_goal_completed.assert_not_awaited()
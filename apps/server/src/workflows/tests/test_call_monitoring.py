@@ -0,0 +1,90 @@
+"""Tests for the post-call CRM note stage."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.ai.voice_ai.schemas import CallRequest
+from src.workflows import call_monitoring
+from src.workflows.call_monitoring import CallAndWriteToCRMWorkflow, CallPipelineError
+
+
+@pytest.fixture
+def call():
+    """A stored call with its analysis and no CRM note yet."""
+    return SimpleNamespace(
+        crm_note_written_at=None,
+        analysis_data={
+            "summary": "Adjuster confirmed payment",
+            "structured_data": {"call_outcome": "success"},
+        },
+    )
+
+
+@pytest.fixture
+def workflow(monkeypatch, call):
+    monkeypatch.setattr(call_monitoring, "create_ai_provider", MagicMock())
+    crm_service = MagicMock()
+    crm_service.add_note = AsyncMock(return_value=SimpleNamespace(id="note-1"))
+    call_repository = MagicMock()
+    call_repository.get_call_by_call_id = AsyncMock(return_value=call)
+    call_repository.claim_crm_note = AsyncMock(return_value=True)
+    call_repository.release_crm_note = AsyncMock()
+    call_repository.session.commit = AsyncMock()
+    return CallAndWriteToCRMWorkflow(MagicMock(), crm_service, call_repository)
+
+
+REQUEST = CallRequest(phone_number="+15125550143", job_id="job-1")
+
+
+@pytest.mark.asyncio
+async def test_crm_note_is_claimed_before_it_is_written(workflow):
+    """The claim is committed before the note is sent to the CRM."""
+    committed_before_write = []
+
+    def add_note(**_kwargs):
+        commits = workflow.call_repository.session.commit.await_count
+        committed_before_write.append(commits == 1)
+        return SimpleNamespace(id="note-1")
+
+    workflow.crm_service.add_note.side_effect = add_note
+
+    await workflow.write_crm_note("call-1", REQUEST)
+
+    workflow.call_repository.claim_crm_note.assert_awaited_once_with("call-1")
+    assert committed_before_write == [True]
+    workflow.call_repository.release_crm_note.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_that_loses_the_claim_does_not_write(workflow):
+    """Two runs that both saw no note yet: only the claim winner writes."""
+    workflow.call_repository.claim_crm_note.return_value = False
+
+    await workflow.write_crm_note("call-1", REQUEST)
+
+    workflow.crm_service.add_note.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rejected_note_releases_its_claim_for_the_retry(workflow):
+    """If the CRM rejects the note, the retried stage may claim it again."""
+    workflow.crm_service.add_note.return_value = SimpleNamespace(error="Bad gateway")
+
+    with pytest.raises(CallPipelineError):
+        await workflow.write_crm_note("call-1", REQUEST)
+
+    workflow.call_repository.release_crm_note.assert_awaited_once_with("call-1")
+
+
+@pytest.mark.asyncio
+async def test_reclaimed_job_does_not_write_the_note_again(workflow, call):
+    """A job retried after the note was written must not add a duplicate."""
+    call.crm_note_written_at = datetime.now(UTC)
+
+    await workflow.write_crm_note("call-1", REQUEST)
+
+    workflow.crm_service.add_note.assert_not_awaited()
+    workflow.call_repository.claim_crm_note.assert_not_awaited()
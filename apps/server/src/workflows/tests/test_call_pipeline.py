@@ -0,0 +1,50 @@
+"""Tests for the post-call pipeline worker."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.workflows import call_pipeline
+from src.workflows.call_pipeline import CallPipelineWorker
+from src.workflows.config import CallMonitoringWorkflowSettings
+
+
+async def hang(*_args) -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_losing_the_lease_cancels_the_job(monkeypatch):
+    """A job reclaimed by another worker stops running here and isn't settled."""
+    jobs = MagicMock()
+    jobs.extend_lease = AsyncMock(return_value=False)
+    jobs.complete = AsyncMock()
+    jobs.fail = AsyncMock()
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr(call_pipeline, "get_async_session_local", lambda: session_scope)
+    monkeypatch.setattr(call_pipeline, "CallJobRepository", lambda _session: jobs)
+    settings = CallMonitoringWorkflowSettings().model_copy(
+        update={"job_lease_seconds": 0.03}
+    )
+    worker = CallPipelineWorker(settings, worker_id="worker-1")
+    worker._execute = AsyncMock(side_effect=hang)
+    job = SimpleNamespace(
+        id=1, call_id="call-1", stage="write_crm_note", attempts=1, max_attempts=3
+    )
+
+    run = asyncio.create_task(worker._run_job(job))
+    await asyncio.wait({run}, timeout=1)
+
+    assert run.cancelled()
+    jobs.extend_lease.assert_awaited_with(1, "worker-1", 0.03)
+    jobs.complete.assert_not_awaited()
+    jobs.fail.assert_not_awaited()
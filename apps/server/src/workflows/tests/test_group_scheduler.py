@@ -0,0 +1,186 @@
+"""Tests for the scheduler that fires active scheduled groups."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from src.workflows import group_scheduler
+from src.workflows.config import GroupSchedulerSettings
+from src.workflows.group_scheduler import GroupScheduler
+from src.workflows.schemas import BulkDialEvent
+
+RUN_STARTED_AT = datetime(2026, 10, 16, 14, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Replace the groups repository (and its sessions) with one shared mock."""
+    repository = MagicMock()
+    repository.schedule_unscheduled_groups = AsyncMock(return_value=0)
+    repository.claim_due_groups = AsyncMock(return_value=[])
+    repository.get_next_run_at = AsyncMock(return_value=None)
+    repository.extend_run_lease = AsyncMock(return_value=True)
+    repository.finish_run = AsyncMock(return_value=True)
+    repository.mark_member_dialed = AsyncMock()
+    repository.get_group_members = AsyncMock(return_value=[])
+
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.get = AsyncMock(return_value=SimpleNamespace(organization_id="org-1"))
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr(
+        group_scheduler, "get_async_session_local", lambda: session_scope
+    )
+    monkeypatch.setattr(
+        group_scheduler, "ScheduledGroupsRepository", lambda _session: repository
+    )
+    return repository
+
+
+@pytest.fixture
+def settings_update():
+    """Settings a test overrides, past validation (e.g. sub-second leases)."""
+    return {}
+
+
+@pytest.fixture
+def scheduler(settings_update):
+    settings = GroupSchedulerSettings(
+        max_concurrent_groups=2, max_sleep_seconds=0.01
+    ).model_copy(update=settings_update)
+    return GroupScheduler(settings, worker_id="worker-1")
+
+
+def claimed_once(*groups):
+    """Claims that return the groups once, then nothing."""
+    claims = iter([list(groups)])
+    return lambda *_args: next(claims, [])
+
+
+def group(group_id: int) -> SimpleNamespace:
+    return SimpleNamespace(id=group_id, user_id="user-1", run_started_at=RUN_STARTED_AT)
+
+
+async def hang(*_args) -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_loop_runs_claimed_groups_and_releases_their_leases(
+    repository, scheduler
+):
+    """Claims fill the free slots; each finished run clears its lease."""
+    repository.claim_due_groups.side_effect = claimed_once(group(1), group(2))
+    scheduler._dial_group = AsyncMock()
+
+    task = asyncio.create_task(scheduler.run())
+    while repository.finish_run.await_count < 2:
+        await asyncio.sleep(0.01)
+    scheduler.stop()
+    await task
+
+    assert repository.claim_due_groups.await_args_list[0] == call(
+        "worker-1", 2, scheduler.settings.catch_up_window_seconds, 120
+    )
+    scheduler._dial_group.assert_has_awaits(
+        [call(1, "user-1", RUN_STARTED_AT), call(2, "user-1", RUN_STARTED_AT)]
+    )
+    repository.finish_run.assert_has_awaits(
+        [call(1, "worker-1"), call(2, "worker-1")], any_order=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_cut_off_by_shutdown_is_left_to_resume(
+    repository, scheduler, monkeypatch
+):
+    """A run still going after the grace period keeps its lease to lapse."""
+    monkeypatch.setattr(group_scheduler, "SHUTDOWN_GRACE_SECONDS", 0.01)
+    repository.claim_due_groups.side_effect = claimed_once(group(1))
+    scheduler._dial_group = AsyncMock(side_effect=hang)
+
+    task = asyncio.create_task(scheduler.run())
+    while not scheduler._dial_group.await_count:
+        await asyncio.sleep(0.01)
+    scheduler.stop()
+    await task
+
+    repository.finish_run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("settings_update", [{"run_lease_seconds": 0.03}])
+async def test_losing_the_lease_cancels_the_run(repository, scheduler):
+    """If the group is deactivated or resumed elsewhere, this run stops dialing."""
+    repository.claim_due_groups.side_effect = claimed_once(group(1))
+    repository.extend_run_lease.return_value = False
+    scheduler._dial_group = AsyncMock(side_effect=hang)
+
+    await scheduler.run_once()
+    runs = set(scheduler._running)
+    await asyncio.wait(runs, timeout=1)
+
+    assert all(run.cancelled() for run in runs)
+    repository.extend_run_lease.assert_awaited_with(1, "worker-1", 0.03)
+    repository.finish_run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_dials_only_members_it_has_not_reached(
+    repository, scheduler, monkeypatch
+):
+    """Members dialed since the run started or already done are not called again."""
+    before_run = RUN_STARTED_AT - timedelta(days=7)
+    during_run = RUN_STARTED_AT + timedelta(minutes=5)
+    repository.get_group_members.return_value = [
+        SimpleNamespace(project_id="p1", goal_completed=False, last_dialed_at=None),
+        SimpleNamespace(
+            project_id="p2", goal_completed=False, last_dialed_at=during_run
+        ),
+        SimpleNamespace(
+            project_id="p3", goal_completed=False, last_dialed_at=before_run
+        ),
+        SimpleNamespace(project_id="p4", goal_completed=True, last_dialed_at=None),
+    ]
+    dialed = []
+
+    class FakeDialer:
+        def __init__(self, *_args):
+            pass
+
+        async def dial(self, project_ids, **_kwargs):
+            for project_id in project_ids:
+                dialed.append(project_id)
+                yield BulkDialEvent(
+                    type="call_started", project_id=project_id, call_id="call-1"
+                )
+            yield BulkDialEvent(type="done")
+
+    @asynccontextmanager
+    async def crm_provider(*_args):
+        yield MagicMock()
+
+    monkeypatch.setattr(group_scheduler, "BulkDialer", FakeDialer)
+    monkeypatch.setattr(group_scheduler, "CRMService", MagicMock())
+    monkeypatch.setattr(group_scheduler, "organization_crm_provider", crm_provider)
+    monkeypatch.setattr(
+        group_scheduler,
+        "CRMCredentialsService",
+        lambda _session: SimpleNamespace(get_credentials=AsyncMock()),
+    )
+    scheduler._build_voice_ai_service = AsyncMock(
+        return_value=("+15125550100", MagicMock())
+    )
+
+    await scheduler._dial_group(1, "user-1", RUN_STARTED_AT)
+
+    assert dialed == ["p1", "p3"]
+    repository.mark_member_dialed.assert_has_awaits([call(1, "p1"), call(1, "p3")])
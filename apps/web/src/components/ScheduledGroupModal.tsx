@@ -30,6 +30,7 @@ import {
   DAYS_OF_WEEK,
   GOAL_TYPE_OPTIONS,
   WHO_TO_CALL_OPTIONS,
+  browserTimeZone,
   timeToInputFormat,
   timeToApiFormat,
 } from '@/lib/scheduledGroupsUtils';
@@ -53,6 +54,7 @@ export function ScheduledGroupModal({
   const [name, setName] = useState('');
   const [frequency, setFrequency] = useState<string[]>([]);
   const [timeOfDay, setTimeOfDay] = useState('09:00');
+  const [timeZone, setTimeZone] = useState(browserTimeZone());
   const [goalType, setGoalType] = useState<GoalType>('status_check');
   const [goalDescription, setGoalDescription] = useState('');
   const [whoToCall, setWhoToCall] = useState<WhoToCall>('adjuster');
@@ -66,6 +68,8 @@ export function ScheduledGroupModal({
       setName(group.name);
       setFrequency(group.frequency);
       setTimeOfDay(timeToInputFormat(group.time_of_day));
+      // Groups saved before timezones were recorded pick up the browser's
+      setTimeZone(group.timezone ?? browserTimeZone());
       setGoalType(group.goal_type as GoalType);
       setGoalDescription(group.goal_description || '');
       setWhoToCall(group.who_to_call as WhoToCall);
@@ -74,6 +78,7 @@ export function ScheduledGroupModal({
       setName('');
       setFrequency([]);
       setTimeOfDay('09:00');
+      setTimeZone(browserTimeZone());
       setGoalType('status_check');
       setGoalDescription('');
       setWhoToCall('adjuster');
@@ -126,6 +131,7 @@ export function ScheduledGroupModal({
             name,
             frequency,
             time_of_day: timeWithSeconds,
+            timezone: timeZone,
             goal_type: goalType,
             goal_description: goalDescription || null,
             who_to_call: whoToCall,
@@ -137,6 +143,7 @@ export function ScheduledGroupModal({
           name,
           frequency,
           time_of_day: timeWithSeconds,
+          timezone: timeZone,
           goal_type: goalType,
           goal_description: goalDescription || null,
           who_to_call: whoToCall,
@@ -214,6 +221,7 @@ export function ScheduledGroupModal({
               onChange={(e) => setTimeOfDay(e.target.value)}
               className="w-32"
             />
+            <p className="text-sm text-gray-500">Time zone: {timeZone}</p>
           </div>
 
           {/* Goal Type */}
@@ -71,6 +71,14 @@ export function timeToApiFormat(timeWithoutSeconds: string): string {
   return `${timeWithoutSeconds}:00`;
 }
 
+/**
+ * Get the browser's IANA timezone, which time inputs are entered in.
+ * @returns Timezone name (e.g., 'America/Chicago')
+ */
+export function browserTimeZone(): string {
+  return Intl.DateTimeFormat().resolvedOptions().timeZone;
+}
+
 /**
  * Format an array of day strings into abbreviated day names.
  * @param frequency - Array of day strings (e.g., ['monday', 'wednesday'])
@@ -127,9 +127,14 @@ function Schedule() {
                 onToggleExpanded={() => toggleGroupExpanded(group.id)}
                 onEdit={() => setEditingGroup(group)}
                 onDelete={() => handleDeleteGroup(group.id)}
-                onToggleActive={() =>
-                  handleToggleActive(group.id, !group.is_active)
-                }
+                onToggleActive={() => {
+                  if (!group.is_active && !group.timezone) {
+                    // Groups need a timezone to run; saving records it
+                    setEditingGroup(group);
+                  } else {
+                    void handleToggleActive(group.id, !group.is_active);
+                  }
+                }}
                 onRemoveProject={(projectId) =>
                   handleRemoveProject(group.id, projectId)
                 }
@@ -1120,7 +1120,15 @@ secrets_manager_policy = iam.RolePolicy(
                         "secretsmanager:RestoreSecret",
                     ],
                     "Resource": f"arn:aws:secretsmanager:*:*:secret:maive/{environment}/crm/*",
-                }
+                },
+                {
+                    # Credentials cache warm-up. The action takes no resource
+                    # ARN; each secret it returns is still checked against
+                    # GetSecretValue above
+                    "Effect": "Allow",
+                    "Action": "secretsmanager:BatchGetSecretValue",
+                    "Resource": "*",
+                },
             ],
         }
     ),
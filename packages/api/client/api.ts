@@ -857,6 +857,12 @@ export interface CreateScheduledGroupRequest {
      * @memberof CreateScheduledGroupRequest
      */
     'time_of_day': string;
+    /**
+     * IANA timezone time_of_day is in (e.g. America/Chicago)
+     * @type {string}
+     * @memberof CreateScheduledGroupRequest
+     */
+    'timezone': string;
     /**
      * Type of goal for this group
      * @type {GoalType}
@@ -1793,6 +1799,12 @@ export interface ScheduledGroupDetailResponse {
      * @memberof ScheduledGroupDetailResponse
      */
     'time_of_day': string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ScheduledGroupDetailResponse
+     */
+    'timezone'?: string | null;
     /**
      * Goal type
      * @type {string}
@@ -1817,6 +1829,12 @@ export interface ScheduledGroupDetailResponse {
      * @memberof ScheduledGroupDetailResponse
      */
     'is_active': boolean;
+    /**
+     * 
+     * @type {string}
+     * @memberof ScheduledGroupDetailResponse
+     */
+    'next_run_at'?: string | null;
     /**
      * List of group members
      * @type {Array<ScheduledGroupMemberResponse>}
@@ -1915,6 +1933,12 @@ export interface ScheduledGroupResponse {
      * @memberof ScheduledGroupResponse
      */
     'time_of_day': string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ScheduledGroupResponse
+     */
+    'timezone'?: string | null;
     /**
      * Goal type
      * @type {string}
@@ -1939,6 +1963,12 @@ export interface ScheduledGroupResponse {
      * @memberof ScheduledGroupResponse
      */
     'is_active': boolean;
+    /**
+     * 
+     * @type {string}
+     * @memberof ScheduledGroupResponse
+     */
+    'next_run_at'?: string | null;
     /**
      * Number of projects in the group
      * @type {number}
@@ -2059,6 +2089,12 @@ export interface UpdateScheduledGroupRequest {
      * @memberof UpdateScheduledGroupRequest
      */
     'time_of_day'?: string | null;
+    /**
+     * IANA timezone time_of_day is in (e.g. America/Chicago)
+     * @type {string}
+     * @memberof UpdateScheduledGroupRequest
+     */
+    'timezone': string;
     /**
      * 
      * @type {GoalType}